@@ -14,6 +14,8 @@ from app.core.settings import settings  # noqa: E402
 from app.database import Base  # noqa: E402
 
 # Import all models to ensure they are registered with Base.metadata
+from app.models.giver_daily_summary import GiverDailySummary  # noqa: E402, F401
+from app.models.recurrence_rule import RecurrenceRule  # noqa: E402, F401
 from app.models.schedule import Schedule  # noqa: E402, F401
 from app.models.user import User  # noqa: E402, F401
 
@@ -0,0 +1,40 @@
+"""新增 schedules.version 欄位（樂觀鎖版本號）
+
+Revision ID: 3f9c2b7d1a64
+Revises: 845a270e5e19
+Create Date: 2026-10-16 10:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '3f9c2b7d1a64'
+down_revision: Union[str, Sequence[str], None] = '845a270e5e19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 既有資料以 server_default 填入版本 1
+    op.add_column(
+        'schedules',
+        sa.Column(
+            'version',
+            mysql.INTEGER(unsigned=True),
+            nullable=False,
+            server_default='1',
+            comment='版本號（樂觀鎖），每次更新遞增',
+        ),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('schedules', 'version')
@@ -0,0 +1,40 @@
+"""新增時段列表驗證器（條件式 GET）的涵蓋索引
+
+Revision ID: 7b4e1d9a2c35
+Revises: 3f9c2b7d1a64
+Create Date: 2026-10-16 11:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '7b4e1d9a2c35'
+down_revision: Union[str, Sequence[str], None] = '3f9c2b7d1a64'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # 依 Giver、Taker 篩選的 COUNT、MAX(updated_at)、SUM(version) 只掃描索引
+    op.create_index(
+        'idx_schedule_giver_changes',
+        'schedules',
+        ['giver_id', 'deleted_at', 'status', 'updated_at', 'version'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_schedule_taker_changes',
+        'schedules',
+        ['taker_id', 'deleted_at', 'status', 'updated_at', 'version'],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('idx_schedule_taker_changes', table_name='schedules')
+    op.drop_index('idx_schedule_giver_changes', table_name='schedules')
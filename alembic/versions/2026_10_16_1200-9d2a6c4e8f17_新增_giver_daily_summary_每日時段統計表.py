@@ -0,0 +1,72 @@
+"""新增 giver_daily_summary 資料表（Giver 每日時段狀態統計）
+
+Revision ID: 9d2a6c4e8f17
+Revises: 7b4e1d9a2c35
+Create Date: 2026-10-16 12:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '9d2a6c4e8f17'
+down_revision: Union[str, Sequence[str], None] = '7b4e1d9a2c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+STATUSES = (
+    'DRAFT',
+    'AVAILABLE',
+    'PENDING',
+    'ACCEPTED',
+    'REJECTED',
+    'CANCELLED',
+    'COMPLETED',
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'giver_daily_summary',
+        sa.Column(
+            'giver_id',
+            mysql.INTEGER(unsigned=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            primary_key=True,
+            comment='Giver ID',
+        ),
+        sa.Column('date', sa.Date(), primary_key=True, comment='日期'),
+        *(
+            sa.Column(
+                f'{status.lower()}_count',
+                mysql.INTEGER(unsigned=True),
+                nullable=False,
+                server_default='0',
+                comment=f'{status} 時段數量',
+            )
+            for status in STATUSES
+        ),
+        comment='Giver 每日時段狀態統計',
+    )
+
+    # 以既有的時段建立統計，之後由時段寫入在同一個交易中維護
+    counts = ', '.join(
+        f"SUM(CASE WHEN status = '{status}' THEN 1 ELSE 0 END)" for status in STATUSES
+    )
+    columns = ', '.join(f'{status.lower()}_count' for status in STATUSES)
+    op.execute(
+        f'INSERT INTO giver_daily_summary (giver_id, date, {columns}) '
+        f'SELECT giver_id, date, {counts} FROM schedules '
+        'WHERE deleted_at IS NULL GROUP BY giver_id, date'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('giver_daily_summary')
@@ -0,0 +1,154 @@
+"""新增 schedule_recurrence_rules 資料表（Giver 週期性可預約時段規則）
+
+Revision ID: 5c8e2f4a7b90
+Revises: 9d2a6c4e8f17
+Create Date: 2026-10-16 13:00:00.000000
+
+"""
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import mysql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '5c8e2f4a7b90'
+down_revision: Union[str, Sequence[str], None] = '9d2a6c4e8f17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ROLES = ('GIVER', 'TAKER', 'SYSTEM')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        'schedule_recurrence_rules',
+        sa.Column(
+            'id',
+            mysql.INTEGER(unsigned=True),
+            primary_key=True,
+            autoincrement=True,
+            comment='週期規則 ID',
+        ),
+        sa.Column(
+            'giver_id',
+            mysql.INTEGER(unsigned=True),
+            sa.ForeignKey('users.id', ondelete='CASCADE'),
+            nullable=False,
+            comment='Giver ID',
+        ),
+        sa.Column(
+            'frequency',
+            sa.Enum('DAILY', 'WEEKLY', name='recurrencefrequencyenum'),
+            nullable=False,
+            comment='頻率：DAILY 每天、WEEKLY 每週',
+        ),
+        sa.Column(
+            'interval',
+            sa.SmallInteger(),
+            nullable=False,
+            server_default='1',
+            comment='間隔：每幾天（DAILY）或每幾週（WEEKLY）一次',
+        ),
+        sa.Column(
+            'weekdays',
+            sa.SmallInteger(),
+            nullable=False,
+            server_default='0',
+            comment='星期位元遮罩（WEEKLY 使用）：bit 0 為星期一，bit 6 為星期日',
+        ),
+        sa.Column('start_time', sa.Time(), nullable=False, comment='每次的開始時間'),
+        sa.Column('end_time', sa.Time(), nullable=False, comment='每次的結束時間'),
+        sa.Column('starts_on', sa.Date(), nullable=False, comment='規則開始日期（含）'),
+        sa.Column(
+            'ends_on',
+            sa.Date(),
+            nullable=True,
+            comment='規則結束日期（含），可為 NULL（表示不結束）',
+        ),
+        sa.Column(
+            'exceptions',
+            sa.JSON(),
+            nullable=False,
+            comment='例外日期（ISO 格式日期字串陣列），這些日期不發生',
+        ),
+        sa.Column(
+            'note',
+            sa.String(length=255),
+            nullable=True,
+            comment='備註，展開的時段沿用此備註',
+        ),
+        sa.Column(
+            'materialized_until',
+            sa.Date(),
+            nullable=True,
+            comment='已展開成時段的最後日期（含），可為 NULL（表示尚未展開）',
+        ),
+        sa.Column(
+            'created_at',
+            sa.DateTime(),
+            nullable=False,
+            comment='建立時間（本地時間）',
+        ),
+        sa.Column(
+            'created_by',
+            mysql.INTEGER(unsigned=True),
+            sa.ForeignKey('users.id', ondelete='SET NULL'),
+            nullable=True,
+            comment='建立者的 ID，可為 NULL（表示系統自動建立）',
+        ),
+        sa.Column(
+            'created_by_role',
+            sa.Enum(*ROLES, name='userroleenum'),
+            nullable=False,
+            comment='建立者角色，展開的時段沿用此角色',
+        ),
+        sa.Column(
+            'updated_at',
+            sa.DateTime(),
+            nullable=False,
+            comment='更新時間（本地時間）',
+        ),
+        sa.Column(
+            'deleted_at',
+            sa.DateTime(),
+            nullable=True,
+            comment='軟刪除標記（本地時間）',
+        ),
+        sa.Column(
+            'deleted_by',
+            mysql.INTEGER(unsigned=True),
+            sa.ForeignKey('users.id', ondelete='SET NULL'),
+            nullable=True,
+            comment='刪除者的 ID，可為 NULL（表示系統自動刪除）',
+        ),
+        sa.Column(
+            'deleted_by_role',
+            sa.Enum(*ROLES, name='userroleenum'),
+            nullable=True,
+            comment='刪除者角色，可為 NULL（未刪除時）',
+        ),
+        comment='Giver 週期性可預約時段規則',
+    )
+    op.create_index(
+        'idx_recurrence_rule_giver',
+        'schedule_recurrence_rules',
+        ['giver_id', 'deleted_at'],
+    )
+    op.create_index(
+        'idx_recurrence_rule_materialized',
+        'schedule_recurrence_rules',
+        ['deleted_at', 'materialized_until'],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(
+        'idx_recurrence_rule_materialized', table_name='schedule_recurrence_rules'
+    )
+    op.drop_index('idx_recurrence_rule_giver', table_name='schedule_recurrence_rules')
+    op.drop_table('schedule_recurrence_rules')
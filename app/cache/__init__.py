@@ -0,0 +1,22 @@
+"""快取模組。
+
+提供讀取快取使用的後端：
+- 行程內的 LRU + TTL 後端
+- 多個 worker 共用的 Redis 後端
+"""
+
+# ===== 本地模組 =====
+from .backends import (
+    CacheBackend,
+    create_cache_backend,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+
+__all__ = [
+    # 快取後端
+    "CacheBackend",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "create_cache_backend",
+]
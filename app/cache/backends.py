@@ -0,0 +1,151 @@
+"""快取後端模組。
+
+提供讀取快取共用的後端介面與兩種實作：
+- MemoryCacheBackend：行程內的 LRU + TTL，不需要外部服務，每個 worker 各自一份
+- RedisCacheBackend：多個 worker 共用的 Redis，寫入失效對所有 worker 立即生效
+
+值一律為 bytes，序列化由呼叫端負責，兩種後端的行為因此相同。
+世代計數器（generation）以 bump 遞增：不存在時先設為唯一的初始值再遞增，
+計數器被淘汰後重建時不會回到舊值，避免舊世代記錄的快取項目被誤判為最新。
+計數器有很長的存活時間，每次遞增時延長，長期沒有寫入的範圍不會在後端永久留下鍵。
+"""
+
+# ===== 標準函式庫 =====
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+import threading
+import time as time_module
+from typing import Any, Iterable, Sequence
+
+# ===== 第三方套件 =====
+import redis.asyncio as redis
+
+# ===== 本地模組 =====
+from app.core import Settings
+
+# 世代計數器的存活時間：遠長於快取項目，過期後以新的初始值重建，只會讓舊項目失效
+GENERATION_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def _initial_generation() -> int:
+    """世代計數器的初始值：目前的奈秒時間，每次重建都不同。"""
+    return time_module.time_ns()
+
+
+class CacheBackend(ABC):
+    """快取後端介面。"""
+
+    @abstractmethod
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        """依序取得多個鍵的值，不存在或已過期時為 None。"""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None) -> None:
+        """寫入值，ttl_seconds 為 None 表示不過期。"""
+
+    @abstractmethod
+    async def bump(self, keys: Iterable[str]) -> None:
+        """遞增多個世代計數器，不存在時先建立，並將存活時間重設為 GENERATION_TTL_SECONDS。"""
+
+
+class MemoryCacheBackend(CacheBackend):
+    """行程內的快取後端（LRU + TTL）。"""
+
+    def __init__(self, max_entries: int = 10000) -> None:
+        self.max_entries = max_entries
+        # 值與到期時間（monotonic），None 表示不過期
+        self._entries: OrderedDict[str, tuple[bytes, float | None]] = OrderedDict()
+        # 可能同時被事件迴圈與執行緒池中的程式使用，字典的讀寫一律在 _lock 內進行
+        self._lock = threading.Lock()
+
+    def _get(self, key: str, now: float) -> bytes | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at is not None and now >= expires_at:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def _put(self, key: str, value: bytes, expires_at: float | None) -> None:
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        now = time_module.monotonic()
+        with self._lock:
+            return [self._get(key, now) for key in keys]
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None) -> None:
+        expires_at = (
+            time_module.monotonic() + ttl_seconds if ttl_seconds is not None else None
+        )
+        with self._lock:
+            self._put(key, value, expires_at)
+
+    async def bump(self, keys: Iterable[str]) -> None:
+        now = time_module.monotonic()
+        with self._lock:
+            for key in keys:
+                current = self._get(key, now)
+                generation = int(current) if current else _initial_generation()
+                self._put(
+                    key, str(generation + 1).encode(), now + GENERATION_TTL_SECONDS
+                )
+
+    def clear(self) -> None:
+        """清空所有項目。"""
+        with self._lock:
+            self._entries.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """Redis 快取後端，使用 redis.asyncio 用戶端，等待回應時讓出事件迴圈。"""
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    @classmethod
+    def from_url(cls, url: str, timeout_seconds: float = 0.5) -> "RedisCacheBackend":
+        """以連線字串建立後端。"""
+        return cls(
+            redis.Redis.from_url(
+                url,
+                socket_timeout=timeout_seconds,
+                socket_connect_timeout=timeout_seconds,
+            )
+        )
+
+    async def get_many(self, keys: Sequence[str]) -> list[bytes | None]:
+        return list(await self.client.mget(list(keys)))
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None) -> None:
+        if ttl_seconds is None:
+            await self.client.set(key, value)
+        else:
+            await self.client.set(key, value, px=max(int(ttl_seconds * 1000), 1))
+
+    async def bump(self, keys: Iterable[str]) -> None:
+        # SET NX、INCR 與 PEXPIRE 各自是原子操作，放在同一個 pipeline 只需一次往返
+        ttl_ms = GENERATION_TTL_SECONDS * 1000
+        async with self.client.pipeline(transaction=False) as pipe:
+            for key in keys:
+                pipe.set(key, _initial_generation(), nx=True, px=ttl_ms)
+                pipe.incr(key)
+                pipe.pexpire(key, ttl_ms)
+            await pipe.execute()
+
+
+def create_cache_backend(settings: Settings) -> CacheBackend | None:
+    """依設定建立讀取快取後端，未啟用時回傳 None。"""
+    match settings.schedule_read_cache_backend:
+        case "memory":
+            return MemoryCacheBackend(settings.schedule_read_cache_max_entries)
+        case "redis":
+            return RedisCacheBackend.from_url(settings.redis_connection_string)
+        case _:
+            return None
@@ -7,7 +7,7 @@
 import logging
 from pathlib import Path
 import tomllib
-from typing import Any
+from typing import Any, Literal
 
 # ===== 第三方套件 =====
 from pydantic import Field, SecretStr
@@ -109,6 +109,10 @@ class Settings(BaseSettings):
         default=False, description="是否記錄靜態資源請求日誌"
     )
     log_file: str = Field(default="logs/app.log", description="日誌檔案路徑")
+    server_timing_enabled: bool = Field(
+        default=False,
+        description="是否在回應加上 Server-Timing 標頭，並記錄資料庫、服務層、序列化的時間分解",
+    )
 
     # ===== 資料庫配置 =====
     # MySQL 配置
@@ -124,6 +128,125 @@ class Settings(BaseSettings):
     )
     mysql_database: str = Field(default="scheduler_db", description="MySQL 資料庫名稱")
     mysql_charset: str = Field(default="utf8mb4", description="MySQL 字符集")
+    mysql_auto_increment_increment: int = Field(
+        default=1,
+        description="MySQL auto_increment_increment，批次寫入時用來從第一列 id 推算其餘 id",
+    )
+
+    # 連線池配置（同步與非同步引擎共用）
+    database_pool_size: int = Field(default=10, description="資料庫連線池大小")
+    database_max_overflow: int = Field(
+        default=10,
+        description="資料庫連線池最大溢出連線數（通常是 pool_size 的 1-2 倍）",
+    )
+    database_pool_pre_ping: bool = Field(
+        default=False,
+        description=(
+            "借出連線時是否先 ping 資料庫；False 表示不做逐次檢查，"
+            "改由斷線錯誤觸發連線池失效重連，並搭配 pool_recycle 定期回收"
+        ),
+    )
+
+    # 唯讀副本配置：GET 時段與健康檢查的讀取改送到副本，寫入與寫入後的讀取仍使用主資料庫
+    database_replica_urls: str = Field(
+        default="",
+        description=(
+            "唯讀副本的同步連線字串（逗號分隔，例如 mysql+pymysql://...），"
+            "非同步連線字串由此推導；空字串表示不使用副本"
+        ),
+    )
+    database_replica_failure_cooldown_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="副本連線失敗後暫停使用的秒數，之後再嘗試；健康檢查成功時提前恢復",
+    )
+    database_replica_sticky_seconds: float = Field(
+        default=5.0,
+        ge=0,
+        description=(
+            "客戶端寫入後改讀主資料庫的秒數（read-your-writes），應大於副本的複寫延遲；"
+            "0 表示不使用"
+        ),
+    )
+
+    # 阻塞呼叫執行緒池配置：在 async def 路由中執行同步資料庫呼叫
+    blocking_executor_max_workers: int | None = Field(
+        default=None,
+        description="阻塞呼叫執行緒池大小，None 表示與連線池容量（pool_size + max_overflow）一致",
+    )
+    blocking_executor_max_queue: int = Field(
+        default=100,
+        description="阻塞呼叫等待佇列上限，佇列已滿時立即回應 503，而不是讓請求無限排隊",
+    )
+
+    # 時段區間索引配置：在行程內快取 Giver 每日時段，加速重疊檢查
+    schedule_interval_index_enabled: bool = Field(
+        default=False,
+        description="是否啟用行程內的時段區間索引，重疊檢查改由記憶體回答",
+    )
+    schedule_interval_index_ttl_seconds: float | None = Field(
+        default=60.0,
+        description="索引中每個 Giver 日的存活秒數，限制其他 worker 寫入造成的過期時間；None 表示不過期",
+    )
+    schedule_interval_index_verify: bool = Field(
+        default=False,
+        description="一致性檢查模式：每次查詢索引時同時查詢資料庫比對，不一致時以資料庫為準",
+    )
+
+    # 時段匯出配置：以伺服器端游標分批讀取，記憶體用量與匯出筆數無關
+    schedule_export_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        description="串流匯出時段時每批從伺服器端游標讀取的筆數（yield_per）",
+    )
+
+    # 行事曆訂閱快取配置：在行程內快取每位使用者的 iCalendar 內容，輪詢時不查詢資料庫
+    schedule_calendar_cache_ttl_seconds: float | None = Field(
+        default=300.0,
+        description="行事曆訂閱快取的存活秒數，限制其他 worker 寫入造成的過期時間；None 表示不過期",
+    )
+    schedule_calendar_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="行事曆訂閱快取最多保留的使用者數，超過時淘汰最久未使用的訂閱",
+    )
+
+    # 時段讀取快取配置：快取時段列表與單一時段的回應內容，寫入 commit 後依 Giver、Taker 失效
+    schedule_read_cache_backend: Literal["none", "memory", "redis"] = Field(
+        default="none",
+        description=(
+            "讀取快取後端：none 不快取、memory 行程內快取（各 worker 各自一份）、"
+            "redis 多個 worker 共用（使用 Redis 配置）"
+        ),
+    )
+    schedule_read_cache_ttl_seconds: float = Field(
+        default=30.0,
+        gt=0,
+        description="快取內容的新鮮秒數，也限制 memory 後端在其他 worker 寫入後的過期時間",
+    )
+    schedule_read_cache_stale_while_revalidate_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="超過新鮮秒數後仍可先回傳舊內容、同時在背景重新查詢的秒數，0 表示不使用",
+    )
+    schedule_read_cache_stale_if_error_seconds: float = Field(
+        default=0.0,
+        ge=0,
+        description="資料庫查詢失敗時，仍可回傳舊內容（包含已失效的內容）的秒數，0 表示不使用",
+    )
+    schedule_read_cache_max_entries: int = Field(
+        default=10000,
+        ge=1,
+        description="memory 後端最多保留的項目數，超過時淘汰最久未使用的項目",
+    )
+
+    # 週期規則配置：規則只展開未來一段滾動期間的時段寫入 schedules，其餘以規則本身參與重疊檢查
+    schedule_recurrence_horizon_days: int = Field(
+        default=28,
+        ge=1,
+        le=366,
+        description="週期規則展開成時段的滾動期間天數（從今天起算），由定期排程延伸",
+    )
 
     # SQLite 配置（用於測試環境）
     sqlite_database: str = Field(
@@ -219,6 +342,23 @@ class Settings(BaseSettings):
         """是否為測試環境。"""
         return self.app_env == "staging"
 
+    @property
+    def database_pool_capacity(self) -> int:
+        """資料庫連線池可同時借出的連線數上限。"""
+        return self.database_pool_size + self.database_max_overflow
+
+    @property
+    def database_replica_url_list(self) -> list[str]:
+        """取得唯讀副本連線字串列表。"""
+        return [
+            url.strip() for url in self.database_replica_urls.split(",") if url.strip()
+        ]
+
+    @property
+    def blocking_executor_workers(self) -> int:
+        """阻塞呼叫執行緒池大小，預設與連線池容量一致，避免執行緒空等連線。"""
+        return self.blocking_executor_max_workers or self.database_pool_capacity
+
     @property
     def mysql_connection_string(self) -> str:
         """Mysql 連接字串。"""
@@ -233,11 +373,23 @@ class Settings(BaseSettings):
             f"?charset={self.mysql_charset}"
         )
 
+    @property
+    def mysql_async_connection_string(self) -> str:
+        """Mysql 非同步連接字串（aiomysql 驅動）。"""
+        return self.mysql_connection_string.replace(
+            "mysql+pymysql://", "mysql+aiomysql://", 1
+        )
+
     @property
     def sqlite_connection_string(self) -> str:
         """SQLite 連接字串（用於測試環境）。"""
         return f"sqlite:///{self.sqlite_database}"
 
+    @property
+    def sqlite_async_connection_string(self) -> str:
+        """SQLite 非同步連接字串（aiosqlite 驅動，用於測試環境）。"""
+        return f"sqlite+aiosqlite:///{self.sqlite_database}"
+
     @property
     def redis_connection_string(self) -> str:
         """Redis 連接字串。"""
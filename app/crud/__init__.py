@@ -11,11 +11,12 @@
 from app.enums.operations import OperationContext
 
 # 相對路徑導入（同模組）
-from .schedule import schedule_crud
+from .schedule import async_schedule_crud, schedule_crud
 
 __all__ = [
     # CRUD 操作實例
     "schedule_crud",
+    "async_schedule_crud",
     # 操作相關 ENUM
     "OperationContext",
 ]
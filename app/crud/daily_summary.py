@@ -0,0 +1,162 @@
+"""Giver 每日時段狀態統計 CRUD 操作模組。
+
+提供 giver_daily_summary 資料表的維護與查詢：
+- refresh：在時段寫入的交易中，依 schedules 重新計算受影響的 Giver 日
+- rebuild：依 schedules 批次重建整張表（或單一 Giver）
+- list_summaries：查詢 Giver 在日期範圍內的統計
+"""
+
+# ===== 標準函式庫 =====
+from collections import defaultdict
+from datetime import date
+import logging
+from typing import Any, Iterable
+
+# ===== 第三方套件 =====
+from sqlalchemy import (
+    and_,
+    case,
+    ColumnElement,
+    delete,
+    func,
+    insert,
+    or_,
+    Result,
+    select,
+    Select,
+)
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.models.giver_daily_summary import GiverDailySummary, STATUS_COUNT_COLUMNS
+from app.models.schedule import Schedule
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+# giver_daily_summary 的欄位順序，與彙總查詢的欄位一一對應
+SUMMARY_COLUMNS = ("giver_id", "date", *STATUS_COUNT_COLUMNS.values())
+
+
+def _summary_statement() -> Select:
+    """依 Giver、日期彙總未刪除時段的各狀態數量。"""
+    counts = [
+        func.sum(case((Schedule.status == status, 1), else_=0))  # type: ignore
+        for status in STATUS_COUNT_COLUMNS
+    ]
+    return (
+        select(Schedule.giver_id, Schedule.date, *counts)
+        .where(Schedule.deleted_at.is_(None))  # type: ignore
+        .group_by(Schedule.giver_id, Schedule.date)
+    )
+
+
+def _giver_days_condition(
+    giver_days: Iterable[tuple[int, date]],
+    model: type[Schedule] | type[GiverDailySummary] = Schedule,
+) -> ColumnElement[bool]:
+    """指定 Giver 日的 WHERE 條件：依 Giver 分組，每個 Giver 以 date IN (...) 比對。"""
+    dates_by_giver: dict[int, set[date]] = defaultdict(set)
+    for giver_id, day in giver_days:
+        dates_by_giver[giver_id].add(day)
+    return or_(
+        *(
+            and_(model.giver_id == giver_id, model.date.in_(sorted(dates)))  # type: ignore
+            for giver_id, dates in dates_by_giver.items()
+        )
+    )
+
+
+class GiverDailySummaryCRUD:
+    """Giver 每日時段狀態統計 CRUD 操作類別。"""
+
+    def refresh(
+        self,
+        db: Session,
+        giver_days: Iterable[tuple[int, date]] = (),
+        schedule_ids: Iterable[int] = (),
+    ) -> None:
+        """重新計算指定 Giver 日的統計，不 commit，由呼叫端與時段寫入一起 commit。
+
+        以刪除後重新彙總（DELETE + INSERT ... SELECT）取代逐筆加減：
+        條件式 UPDATE 不會讀取寫入前的狀態，重新彙總只需要知道受影響的 Giver 日，
+        且彙總查詢走 (giver_id, date) 索引，只讀取這些日期的時段。
+
+        Args:
+            giver_days: 受影響的 (Giver ID, 日期)，呼叫前需已 flush 時段的寫入
+            schedule_ids: 只知道時段 ID 時（例如不支援 RETURNING 的軟刪除），
+                由時段目前的 Giver 日推得
+        """
+        giver_days = set(giver_days)
+        schedule_ids = list(schedule_ids)
+        if schedule_ids:
+            rows: Result[Any] = db.execute(
+                select(Schedule.giver_id, Schedule.date).where(
+                    Schedule.id.in_(schedule_ids)  # type: ignore
+                )
+            )
+            giver_days.update((row.giver_id, row.date) for row in rows)
+        if not giver_days:
+            return
+
+        db.execute(
+            delete(GiverDailySummary)
+            .where(_giver_days_condition(giver_days, GiverDailySummary))
+            .execution_options(synchronize_session=False)
+        )
+        db.execute(
+            insert(GiverDailySummary).from_select(
+                SUMMARY_COLUMNS,
+                _summary_statement().where(_giver_days_condition(giver_days)),
+            )
+        )
+
+    def rebuild(self, db: Session, giver_id: int | None = None) -> int:
+        """依 schedules 批次重建統計並 commit，用於初次建立或修復資料。
+
+        Args:
+            giver_id: 只重建指定的 Giver，None 表示重建整張表
+
+        Returns:
+            int: 重建後的資料列數
+        """
+        clear = delete(GiverDailySummary)
+        summary = _summary_statement()
+        if giver_id is not None:
+            clear = clear.where(GiverDailySummary.giver_id == giver_id)  # type: ignore
+            summary = summary.where(Schedule.giver_id == giver_id)  # type: ignore
+
+        db.execute(clear.execution_options(synchronize_session=False))
+        db.execute(insert(GiverDailySummary).from_select(SUMMARY_COLUMNS, summary))
+        db.commit()
+
+        count_statement = select(func.count()).select_from(GiverDailySummary)
+        if giver_id is not None:
+            count_statement = count_statement.where(
+                GiverDailySummary.giver_id == giver_id  # type: ignore
+            )
+        count = db.scalar(count_statement) or 0
+        logger.info(f"重建 Giver 每日時段統計: giver_id={giver_id}, 共 {count} 筆")
+        return count
+
+    def list_summaries(
+        self,
+        db: Session,
+        giver_id: int,
+        date_from: date,
+        date_to: date,
+    ) -> list[GiverDailySummary]:
+        """查詢 Giver 在日期範圍（包含起訖日）內有時段的日期統計，依日期排序。"""
+        statement = (
+            select(GiverDailySummary)
+            .where(
+                GiverDailySummary.giver_id == giver_id,  # type: ignore
+                GiverDailySummary.date.between(date_from, date_to),  # type: ignore
+            )
+            .order_by(GiverDailySummary.date)
+        )
+        return list(db.scalars(statement))
+
+
+# 建立 CRUD 實例，供其他模組使用
+giver_daily_summary_crud = GiverDailySummaryCRUD()
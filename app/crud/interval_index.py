@@ -0,0 +1,258 @@
+"""時段區間索引模組。
+
+在行程內為每個 (giver_id, date) 保存依開始時間排序的區間陣列，以 bisect 回答重疊查詢，
+讓熱門 Giver 的重疊檢查不必每次查詢資料庫，只有最後的寫入才送到資料庫。
+
+- 延遲載入：第一次查詢某個 Giver 某天時才從資料庫載入
+- 寫入失效：ScheduleCRUD 建立、更新、刪除時段並 commit 後，使對應的 Giver 日失效
+- 存活時間：多個 worker 行程各自持有索引，以 TTL 限制其他行程寫入造成的過期時間
+- 一致性檢查：同時查詢資料庫比對結果，不一致時記錄錯誤並以資料庫為準
+"""
+
+# ===== 標準函式庫 =====
+from array import array
+from bisect import bisect_left, bisect_right
+from datetime import date, time
+import logging
+import threading
+import time as time_module
+from typing import Any, Iterable, NamedTuple
+
+# ===== 第三方套件 =====
+from sqlalchemy import tuple_
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.enums.models import ScheduleStatusEnum
+from app.models.schedule import Schedule
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+GiverDay = tuple[int, date]
+
+
+class ScheduleInterval(NamedTuple):
+    """重疊檢查用的時段區間，只保留檢查與錯誤回報需要的欄位。
+
+    id 為 None 表示尚未寫入資料庫的新時段。
+    """
+
+    id: int | None
+    giver_id: int
+    date: date
+    start_time: time
+    end_time: time
+    status: ScheduleStatusEnum | None = None
+
+
+def load_schedule_intervals(
+    db: Session, giver_days: Iterable[GiverDay]
+) -> list[ScheduleInterval]:
+    """以單一查詢載入多個 Giver 日的未刪除時段區間。
+
+    只查詢 id、時間欄位與狀態，不載入任何關聯。
+    """
+    giver_days = sorted(set(giver_days))
+    if not giver_days:
+        return []
+
+    rows: list[Any] = (
+        db.query(
+            Schedule.id,
+            Schedule.giver_id,
+            Schedule.date,
+            Schedule.start_time,
+            Schedule.end_time,
+            Schedule.status,
+        )
+        .filter(
+            tuple_(Schedule.giver_id, Schedule.date).in_(giver_days),
+            Schedule.deleted_at.is_(None),  # type: ignore  # 排除已軟刪除的時段
+        )
+        .all()
+    )
+    return [ScheduleInterval._make(row) for row in rows]
+
+
+def _seconds(value: time) -> int:
+    """將時間轉換成當天的秒數，作為陣列中的排序鍵。"""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+class _GiverDayIntervals:
+    """單一 Giver 單日的區間：依開始時間排序的開始、結束秒數陣列。"""
+
+    __slots__ = ("starts", "ends", "intervals", "disjoint", "loaded_at")
+
+    def __init__(self, intervals: Iterable[ScheduleInterval], loaded_at: float) -> None:
+        self.intervals = sorted(
+            intervals, key=lambda i: (_seconds(i.start_time), i.id or 0)
+        )
+        self.starts = array("l", (_seconds(i.start_time) for i in self.intervals))
+        self.ends = array("l", (_seconds(i.end_time) for i in self.intervals))
+        # 區間彼此不重疊時，結束時間也是遞增的，可以對結束時間二分搜尋
+        self.disjoint = all(
+            self.ends[i] <= self.starts[i + 1] for i in range(len(self.intervals) - 1)
+        )
+        self.loaded_at = loaded_at
+
+    def overlapping(
+        self, start_time: time, end_time: time, exclude_id: int | None
+    ) -> list[ScheduleInterval]:
+        """找出與 [start_time, end_time) 重疊的區間。"""
+        start, end = _seconds(start_time), _seconds(end_time)
+        # 開始時間早於新區間結束時間的候選：[0, hi)
+        hi = bisect_left(self.starts, end)
+        # 結束時間晚於新區間開始時間的候選：[lo, hi)（資料本身有重疊時退回線性掃描）
+        lo = bisect_right(self.ends, start, 0, hi) if self.disjoint else 0
+        return [
+            self.intervals[i]
+            for i in range(lo, hi)
+            if self.ends[i] > start and self.intervals[i].id != exclude_id
+        ]
+
+
+class ScheduleIntervalIndex:
+    """行程內的 Giver 時段區間索引。"""
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        ttl_seconds: float | None = None,
+        verify: bool = False,
+    ) -> None:
+        self.enabled = enabled
+        self.ttl_seconds = ttl_seconds
+        self.verify = verify
+        self._days: dict[GiverDay, _GiverDayIntervals] = {}
+        # 同步服務可能在多個執行緒中執行，字典的讀寫一律在 _lock 內進行
+        self._lock = threading.Lock()
+        # 每次失效遞增：載入期間若有寫入失效，載入結果只回傳、不寫回索引，避免快取舊資料
+        self._generation = 0
+
+        # 統計資料
+        self._hits = 0
+        self._misses = 0
+        self._mismatches = 0
+
+    def _is_fresh(self, day: _GiverDayIntervals, now: float) -> bool:
+        """檢查快取的 Giver 日是否仍在存活時間內。"""
+        return self.ttl_seconds is None or now - day.loaded_at < self.ttl_seconds
+
+    def _get_days(
+        self, db: Session, giver_days: Iterable[GiverDay]
+    ) -> dict[GiverDay, _GiverDayIntervals]:
+        """取得多個 Giver 日的區間，缺少或過期的部分以單一查詢載入。"""
+        now = time_module.monotonic()
+        found: dict[GiverDay, _GiverDayIntervals] = {}
+        missing: set[GiverDay] = set()
+
+        with self._lock:
+            generation = self._generation
+            for key in set(giver_days):
+                day = self._days.get(key)
+                if day is not None and self._is_fresh(day, now):
+                    found[key] = day
+                    self._hits += 1
+                else:
+                    missing.add(key)
+                    self._misses += 1
+
+        if missing:
+            loaded: dict[GiverDay, list[ScheduleInterval]] = {k: [] for k in missing}
+            for interval in load_schedule_intervals(db, missing):
+                loaded[(interval.giver_id, interval.date)].append(interval)
+
+            with self._lock:
+                cacheable = generation == self._generation
+                for key, intervals in loaded.items():
+                    found[key] = _GiverDayIntervals(intervals, now)
+                    if cacheable:
+                        self._days[key] = found[key]
+
+        return found
+
+    def find_overlapping(
+        self,
+        db: Session,
+        giver_id: int,
+        schedule_date: date,
+        start_time: time,
+        end_time: time,
+        exclude_schedule_id: int | None = None,
+    ) -> list[ScheduleInterval]:
+        """查詢與指定時段重疊的現有時段。"""
+        key = (giver_id, schedule_date)
+        day = self._get_days(db, [key])[key]
+        overlapping = day.overlapping(start_time, end_time, exclude_schedule_id)
+
+        if self.verify:
+            expected = _GiverDayIntervals(
+                load_schedule_intervals(db, [key]), time_module.monotonic()
+            ).overlapping(start_time, end_time, exclude_schedule_id)
+            if {i.id for i in overlapping} != {i.id for i in expected}:
+                with self._lock:
+                    self._mismatches += 1
+                logger.error(
+                    f"時段區間索引與資料庫不一致: giver_id={giver_id}, "
+                    f"date={schedule_date}, time={start_time}-{end_time}, "
+                    f"索引={sorted(i.id for i in overlapping if i.id is not None)}, "
+                    f"資料庫={sorted(i.id for i in expected if i.id is not None)}"
+                )
+                self.invalidate([key])
+                return expected
+
+        return overlapping
+
+    def get_intervals(
+        self, db: Session, giver_days: Iterable[GiverDay]
+    ) -> list[ScheduleInterval]:
+        """取得多個 Giver 日的所有區間，供批次重疊檢查使用。"""
+        days = self._get_days(db, giver_days)
+        return [interval for day in days.values() for interval in day.intervals]
+
+    def invalidate(self, giver_days: Iterable[GiverDay]) -> None:
+        """使指定的 Giver 日失效，下次查詢時重新從資料庫載入。"""
+        with self._lock:
+            self._generation += 1
+            for key in giver_days:
+                self._days.pop(key, None)
+
+    def invalidate_schedule(self, schedule_id: int) -> None:
+        """使包含指定時段的 Giver 日失效，用於寫入時無法取得 Giver 日的情況。"""
+        with self._lock:
+            self._generation += 1
+            stale = [
+                key
+                for key, day in self._days.items()
+                if any(interval.id == schedule_id for interval in day.intervals)
+            ]
+            for key in stale:
+                del self._days[key]
+
+    def clear(self) -> None:
+        """清空索引。"""
+        with self._lock:
+            self._generation += 1
+            self._days.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """取得索引統計資料。"""
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "giver_days": len(self._days),
+                "hits": self._hits,
+                "misses": self._misses,
+                "mismatches": self._mismatches,
+            }
+
+
+# 全域時段區間索引：預設關閉，由設定開啟
+schedule_interval_index = ScheduleIntervalIndex(
+    enabled=settings.schedule_interval_index_enabled,
+    ttl_seconds=settings.schedule_interval_index_ttl_seconds,
+    verify=settings.schedule_interval_index_verify,
+)
@@ -0,0 +1,279 @@
+"""週期規則 CRUD 操作模組。
+
+提供 schedule_recurrence_rules 資料表的建立、查詢、展開進度與軟刪除，
+以及重疊檢查用的週期規則載入：
+- RecurrencePattern：只保留計算發生日期需要的欄位
+- RecurrencePatternCache：在行程內以 Giver 為單位快取，規則寫入 commit 後失效
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+import logging
+import threading
+import time as time_module
+from typing import Any, cast, Iterable, NamedTuple
+
+# ===== 第三方套件 =====
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.enums.models import RecurrenceFrequencyEnum, UserRoleEnum
+from app.errors import create_recurrence_rule_not_found_error
+from app.models.recurrence_rule import RecurrenceRule
+from app.utils.timezone import get_local_now_naive
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+class RecurrencePattern(NamedTuple):
+    """重疊檢查與展開用的週期規則，只保留計算發生日期需要的欄位。"""
+
+    id: int | None
+    giver_id: int
+    frequency: RecurrenceFrequencyEnum
+    interval: int
+    weekdays: int  # 星期位元遮罩：bit 0 為星期一
+    start_time: time
+    end_time: time
+    starts_on: date
+    ends_on: date | None
+    exceptions: frozenset[date]
+    materialized_until: date | None = None
+
+    @classmethod
+    def from_rule(cls, rule: Any) -> "RecurrencePattern":
+        """由週期規則（ORM 物件或查詢結果列）建立。"""
+        return cls(
+            id=rule.id,
+            giver_id=rule.giver_id,
+            frequency=rule.frequency,
+            interval=rule.interval,
+            weekdays=rule.weekdays,
+            start_time=rule.start_time,
+            end_time=rule.end_time,
+            starts_on=rule.starts_on,
+            ends_on=rule.ends_on,
+            exceptions=frozenset(
+                date.fromisoformat(value) for value in rule.exceptions or ()
+            ),
+            materialized_until=rule.materialized_until,
+        )
+
+
+def load_recurrence_patterns(
+    db: Session, giver_ids: Iterable[int]
+) -> list[RecurrencePattern]:
+    """以單一查詢載入多個 Giver 未刪除、尚有未展開發生日期的週期規則。
+
+    只查詢計算發生日期需要的欄位，不載入 ORM 物件。
+    """
+    giver_ids = sorted(set(giver_ids))
+    if not giver_ids:
+        return []
+
+    rows: list[Any] = (
+        db.query(
+            RecurrenceRule.id,
+            RecurrenceRule.giver_id,
+            RecurrenceRule.frequency,
+            RecurrenceRule.interval,
+            RecurrenceRule.weekdays,
+            RecurrenceRule.start_time,
+            RecurrenceRule.end_time,
+            RecurrenceRule.starts_on,
+            RecurrenceRule.ends_on,
+            RecurrenceRule.exceptions,
+            RecurrenceRule.materialized_until,
+        )
+        .filter(
+            RecurrenceRule.giver_id.in_(giver_ids),  # type: ignore
+            RecurrenceRule.deleted_at.is_(None),  # type: ignore  # 排除已軟刪除的規則
+            # 排除已全部展開的規則：之後的發生日期都已是時段
+            or_(
+                RecurrenceRule.ends_on.is_(None),  # type: ignore
+                RecurrenceRule.materialized_until.is_(None),  # type: ignore
+                RecurrenceRule.materialized_until < RecurrenceRule.ends_on,  # type: ignore
+            ),
+        )
+        .all()
+    )
+    return [RecurrencePattern.from_rule(row) for row in rows]
+
+
+class _GiverRules(NamedTuple):
+    """單一 Giver 的週期規則與載入時間。"""
+
+    patterns: list[RecurrencePattern]
+    loaded_at: float
+
+
+class RecurrencePatternCache:
+    """行程內的 Giver 週期規則快取。
+
+    與時段區間索引一同啟用（由服務層判斷），存活時間相同：
+    多個 worker 行程各自持有快取，以 TTL 限制其他行程寫入造成的過期時間。
+    """
+
+    def __init__(self, ttl_seconds: float | None = None) -> None:
+        self.ttl_seconds = ttl_seconds
+        self._rules: dict[int, _GiverRules] = {}
+        # 同步服務可能在多個執行緒中執行，字典的讀寫一律在 _lock 內進行
+        self._lock = threading.Lock()
+        # 每次失效遞增：載入期間若有寫入失效，載入結果只回傳、不寫回快取
+        self._generation = 0
+
+        # 統計資料
+        self._hits = 0
+        self._misses = 0
+
+    def _is_fresh(self, rules: _GiverRules, now: float) -> bool:
+        """檢查快取的 Giver 規則是否仍在存活時間內。"""
+        return self.ttl_seconds is None or now - rules.loaded_at < self.ttl_seconds
+
+    def get_rule_patterns(
+        self, db: Session, giver_ids: Iterable[int]
+    ) -> list[RecurrencePattern]:
+        """取得多個 Giver 的週期規則，缺少或過期的部分以單一查詢載入。"""
+        now = time_module.monotonic()
+        found: list[RecurrencePattern] = []
+        missing: set[int] = set()
+
+        with self._lock:
+            generation = self._generation
+            for giver_id in set(giver_ids):
+                rules = self._rules.get(giver_id)
+                if rules is not None and self._is_fresh(rules, now):
+                    found.extend(rules.patterns)
+                    self._hits += 1
+                else:
+                    missing.add(giver_id)
+                    self._misses += 1
+
+        if missing:
+            loaded: dict[int, list[RecurrencePattern]] = {g: [] for g in missing}
+            for pattern in load_recurrence_patterns(db, missing):
+                loaded[pattern.giver_id].append(pattern)
+
+            with self._lock:
+                cacheable = generation == self._generation
+                for giver_id, patterns in loaded.items():
+                    found.extend(patterns)
+                    if cacheable:
+                        self._rules[giver_id] = _GiverRules(patterns, now)
+
+        return found
+
+    def invalidate_rules(self, giver_ids: Iterable[int]) -> None:
+        """使指定 Giver 的週期規則失效，於規則建立、刪除或展開後呼叫。"""
+        with self._lock:
+            self._generation += 1
+            for giver_id in giver_ids:
+                self._rules.pop(giver_id, None)
+
+    def clear(self) -> None:
+        """清空快取。"""
+        with self._lock:
+            self._generation += 1
+            self._rules.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """取得快取統計資料。"""
+        with self._lock:
+            return {
+                "giver_rules": len(self._rules),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+class RecurrenceRuleCRUD:
+    """週期規則 CRUD 操作類別。"""
+
+    def create_rule(self, db: Session, rule: RecurrenceRule) -> RecurrenceRule:
+        """建立週期規則，flush 取得 ID 但不 commit，由呼叫端與展開的時段一起 commit。"""
+        db.add(rule)
+        db.flush()
+        return rule
+
+    def get_rule(self, db: Session, rule_id: int) -> RecurrenceRule:
+        """根據 ID 查詢單一週期規則，排除已軟刪除的記錄。"""
+        rule = (
+            db.query(RecurrenceRule)
+            .filter(RecurrenceRule.id == rule_id, RecurrenceRule.deleted_at.is_(None))  # type: ignore
+            .first()
+        )
+        if not rule:
+            raise create_recurrence_rule_not_found_error(rule_id)
+        return rule
+
+    def list_giver_rules(self, db: Session, giver_id: int) -> list[RecurrenceRule]:
+        """查詢 Giver 未刪除的週期規則，依開始日期與時間排序。"""
+        return (
+            db.query(RecurrenceRule)
+            .filter(
+                RecurrenceRule.giver_id == giver_id,  # type: ignore
+                RecurrenceRule.deleted_at.is_(None),  # type: ignore
+            )
+            .order_by(
+                RecurrenceRule.starts_on,
+                RecurrenceRule.start_time,
+                RecurrenceRule.id,
+            )
+            .all()
+        )
+
+    def list_rules_to_materialize(
+        self,
+        db: Session,
+        until: date,
+        rule_ids: Iterable[int] | None = None,
+    ) -> list[RecurrenceRule]:
+        """查詢展開進度落後於 until、且還有發生日期可展開的未刪除規則。
+
+        Args:
+            rule_ids: 只查詢這些規則，None 表示所有規則
+        """
+        query = db.query(RecurrenceRule).filter(
+            RecurrenceRule.deleted_at.is_(None),  # type: ignore
+            RecurrenceRule.starts_on <= until,  # type: ignore
+            or_(
+                RecurrenceRule.materialized_until.is_(None),  # type: ignore
+                RecurrenceRule.materialized_until < until,  # type: ignore
+            ),
+            or_(
+                RecurrenceRule.ends_on.is_(None),  # type: ignore
+                RecurrenceRule.materialized_until.is_(None),  # type: ignore
+                RecurrenceRule.materialized_until < RecurrenceRule.ends_on,  # type: ignore
+            ),
+        )
+        if rule_ids is not None:
+            query = query.filter(RecurrenceRule.id.in_(sorted(set(rule_ids))))  # type: ignore
+        return query.order_by(RecurrenceRule.id).all()
+
+    def delete_rule(
+        self,
+        db: Session,
+        rule: RecurrenceRule,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> None:
+        """軟刪除週期規則並 commit；已展開的時段保留為一般時段。"""
+        giver_id = cast(int, rule.giver_id)
+        rule.deleted_at = get_local_now_naive()  # type: ignore
+        rule.deleted_by = deleted_by  # type: ignore
+        rule.deleted_by_role = deleted_by_role  # type: ignore
+        db.commit()
+        recurrence_pattern_cache.invalidate_rules([giver_id])
+        logger.info(f"已軟刪除週期規則: ID={rule.id}, giver_id={giver_id}")
+
+
+# 全域週期規則 CRUD 實例
+recurrence_rule_crud = RecurrenceRuleCRUD()
+
+# 全域週期規則快取：存活時間與時段區間索引相同
+recurrence_pattern_cache = RecurrencePatternCache(
+    ttl_seconds=settings.schedule_interval_index_ttl_seconds,
+)
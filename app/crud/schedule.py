@@ -4,26 +4,117 @@
 """
 
 # ===== 標準函式庫 =====
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import date, time
 import logging
-from typing import Any
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    cast,
+    Iterable,
+    Iterator,
+    Sequence,
+)
 
 # ===== 第三方套件 =====
-from sqlalchemy import and_
-from sqlalchemy.orm import joinedload, Session
+from sqlalchemy import (
+    and_,
+    ColumnElement,
+    CursorResult,
+    func,
+    insert,
+    inspect,
+    or_,
+    Row,
+    Select,
+    select,
+    update,
+)
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import (
+    InstanceState,
+    InstrumentedAttribute,
+    joinedload,
+    lazyload,
+    load_only,
+    noload,
+    Query,
+    Session,
+)
+from sqlalchemy.orm.attributes import set_committed_value
+from sqlalchemy.orm.exc import StaleDataError
 
 # ===== 本地模組 =====
+from app.core import settings
+from app.crud.daily_summary import giver_daily_summary_crud
+from app.crud.interval_index import (
+    GiverDay,
+    schedule_interval_index,
+    ScheduleInterval,
+)
 from app.enums.models import ScheduleStatusEnum, UserRoleEnum
 from app.enums.operations import DeletionResult
 from app.errors import (
     create_bad_request_error,
     create_schedule_not_found_error,
+    create_schedule_precondition_failed_error,
 )
 from app.models.schedule import Schedule
+from app.models.user import User
+from app.utils.fieldsets import SCHEDULE_FIELDS, SCHEDULE_RELATIONS, ScheduleFieldset
+from app.utils.pagination import ScheduleCursor
 from app.utils.timezone import get_local_now_naive
 
 # 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
 logger = logging.getLogger(__name__)
 
+# 無法刪除的時段狀態
+# ACCEPTED: 雙方已確認面談時間，刪除會影響約定
+# COMPLETED: 面談已完成，屬於歷史記錄，不應刪除
+UNDELETABLE_STATUSES = (ScheduleStatusEnum.ACCEPTED, ScheduleStatusEnum.COMPLETED)
+
+# 批次寫入時每個 INSERT 陳述式的最大列數，避免超過資料庫的參數數量或封包大小上限
+BULK_INSERT_BATCH_SIZE = 500
+
+# 指定 fields 時仍一律讀取的欄位：排序鍵與分頁游標（date、start_time、id）、
+# ETag（version），以及服務層日誌使用的欄位
+READ_REQUIRED_FIELDS = (
+    "id",
+    "giver_id",
+    "taker_id",
+    "status",
+    "date",
+    "start_time",
+    "version",
+)
+
+# Session.info 中批次交易的鍵：存在時表示寫入只 flush，由 batch_transaction 統一 commit
+BATCH_TRANSACTION_KEY = "schedule_batch_transaction"
+
+# 會改變 Giver 每日狀態統計的更新欄位：只更新備註、時間等欄位時不需要重新計算
+DAILY_SUMMARY_FIELDS = frozenset({"giver_id", "status", "schedule_date", "date"})
+
+
+def _giver_day(schedule: Schedule) -> GiverDay:
+    """時段所屬的 Giver 日，以 int 與 date 表示，作為區間索引與每日統計的鍵。"""
+    return cast(int, schedule.giver_id), cast(date, schedule.date)
+
+
+@dataclass
+class _PendingInvalidation:
+    """批次交易中延後到 commit 之後才失效的區間索引項目與 commit 後回呼。
+
+    每日狀態統計則延後到 commit 之前，整批只重新計算一次。
+    """
+
+    giver_days: set[tuple[int, date]] = field(default_factory=set)
+    schedule_ids: set[int] = field(default_factory=set)
+    summary_giver_days: set[tuple[int, date]] = field(default_factory=set)
+    summary_schedule_ids: set[int] = field(default_factory=set)
+    callbacks: list[Callable[[], None]] = field(default_factory=list)
+
 
 class ScheduleCRUD:
     """時段 CRUD 操作類別。"""
@@ -31,20 +122,156 @@ class ScheduleCRUD:
     def __init__(self) -> None:
         """初始化 CRUD 實例。"""
 
+    def in_batch(self, db: Session) -> bool:
+        """檢查 Session 是否處於批次交易中。"""
+        return BATCH_TRANSACTION_KEY in db.info
+
+    @contextmanager
+    def batch_transaction(self, db: Session) -> Iterator[None]:
+        """在同一個交易中執行多個寫入操作，結束時只 commit 一次。
+
+        期間的寫入方法只 flush 不 commit，後續操作（例如重疊檢查）可看到先前的寫入；
+        區間索引的失效延後到 commit 之後，避免其他請求在 commit 前載入並快取舊資料。
+        任一操作拋出錯誤時整批回滾。
+        """
+        pending = _PendingInvalidation()
+        db.info[BATCH_TRANSACTION_KEY] = pending
+        try:
+            yield
+            giver_daily_summary_crud.refresh(
+                db, pending.summary_giver_days, pending.summary_schedule_ids
+            )
+        except BaseException:
+            db.info.pop(BATCH_TRANSACTION_KEY, None)
+            db.rollback()
+            raise
+
+        db.info.pop(BATCH_TRANSACTION_KEY, None)
+        self._commit(db, pending.giver_days, pending.schedule_ids, summary=False)
+        for callback in pending.callbacks:
+            callback()
+
+    def on_commit(self, db: Session, callback: Callable[[], None]) -> None:
+        """在寫入 commit 之後執行回呼，例如使服務層的快取失效。
+
+        寫入方法返回時已經 commit，回呼立即執行；批次交易中則延到整批 commit 之後，
+        整批回滾時不執行。
+        """
+        pending = db.info.get(BATCH_TRANSACTION_KEY)
+        if pending is None:
+            callback()
+        else:
+            pending.callbacks.append(callback)
+
+    def _commit(
+        self,
+        db: Session,
+        giver_days: Iterable[tuple[int, date]] = (),
+        schedule_ids: Iterable[int] = (),
+        summary: bool = True,
+    ) -> None:
+        """commit 並使區間索引中受影響的 Giver 日失效。
+
+        批次交易中改為 flush，失效項目留到 batch_transaction 結束時處理。
+        呼叫端需在呼叫前取得 Giver 日：同步 Session 在 commit 後會使物件屬性過期。
+
+        Args:
+            summary: 寫入是否可能改變 Giver 每日狀態統計，是則在 commit 前於同一交易中
+                重新計算受影響的 Giver 日
+        """
+        giver_days = list(giver_days)
+        schedule_ids = list(schedule_ids)
+
+        pending = db.info.get(BATCH_TRANSACTION_KEY)
+        if pending is not None:
+            db.flush()
+            pending.giver_days.update(giver_days)
+            pending.schedule_ids.update(schedule_ids)
+            if summary:
+                pending.summary_giver_days.update(giver_days)
+                pending.summary_schedule_ids.update(schedule_ids)
+            return
+
+        if summary:
+            db.flush()
+            giver_daily_summary_crud.refresh(db, giver_days, schedule_ids)
+        db.commit()
+        schedule_interval_index.invalidate(giver_days)
+        for schedule_id in schedule_ids:
+            schedule_interval_index.invalidate_schedule(schedule_id)
+
     def create_schedules(
         self,
         db: Session,
         schedules: list[Schedule],
     ) -> list[Schedule]:
-        """建立多個時段。"""
-        db.add_all(schedules)
-        db.commit()
+        """建立多個時段。
+
+        新建立（transient）的時段走批次寫入：單一多列 INSERT 取回所有 id，
+        不再逐筆 refresh；已加入 Session 的物件則維持原本的 ORM 寫入流程。
+        """
+        # 寫入後使區間索引中對應的 Giver 日失效
+        giver_days = [_giver_day(s) for s in schedules]
+
+        states: list[InstanceState[Schedule]] = [inspect(s) for s in schedules]
+        if states and all(state.transient for state in states):
+            self._bulk_insert_schedules(db, schedules)
+            self._commit(db, giver_days=giver_days)
+        else:
+            db.add_all(schedules)
+            self._commit(db, giver_days=giver_days)
 
-        for schedule in schedules:
-            db.refresh(schedule)
+            for schedule in schedules:
+                db.refresh(schedule)
 
         return schedules
 
+    def _insert_values(self, schedule: Schedule) -> dict[str, Any]:
+        """取得時段的 INSERT 欄位值，並將欄位預設值寫回物件。
+
+        預設值（狀態、建立與更新時間等）在 Python 端計算，
+        寫入後物件本身就有完整的欄位值，不必再從資料庫讀回。
+        """
+        values = {}
+        for column in Schedule.__table__.columns:
+            if column.primary_key:
+                continue
+            value = getattr(schedule, column.key)
+            if value is None and column.default is not None:
+                default = column.default
+                value = default.arg(None) if default.is_callable else default.arg
+                setattr(schedule, column.key, value)
+            values[column.key] = value
+        return values
+
+    def _bulk_insert_schedules(self, db: Session, schedules: list[Schedule]) -> None:
+        """以多列 INSERT 寫入時段（每批一個陳述式），並將產生的 id 設定回物件。
+
+        自動遞增主鍵在同一個陳述式內依 VALUES 順序遞增配置，因此：
+        - 支援 RETURNING 的資料庫（SQLite、MariaDB 等）：取回 id 後排序即對應輸入順序
+        - MySQL：InnoDB 對單一「簡單 INSERT」配置連續的自動遞增值，
+          以 LAST_INSERT_ID()（第一列的 id）加上 auto_increment_increment 推算其餘 id
+        """
+        supports_returning = db.get_bind().dialect.insert_returning
+
+        for offset in range(0, len(schedules), BULK_INSERT_BATCH_SIZE):
+            batch = schedules[offset : offset + BULK_INSERT_BATCH_SIZE]
+            statement = insert(Schedule).values(
+                [self._insert_values(schedule) for schedule in batch]
+            )
+
+            ids: list[int]
+            if supports_returning:
+                ids = sorted(db.scalars(statement.returning(Schedule.id)))
+            else:
+                result: CursorResult[Any] = db.execute(statement)  # type: ignore[assignment]
+                step = settings.mysql_auto_increment_increment
+                ids = [result.lastrowid + i * step for i in range(len(batch))]
+
+            # 主鍵直接寫入已提交狀態：物件不會被視為有待寫入的變更
+            for schedule, schedule_id in zip(batch, ids):
+                set_committed_value(schedule, "id", schedule_id)
+
     def get_schedule_query_options(
         self, include_relations: list[str] | None = None
     ) -> list[Any]:
@@ -104,6 +331,41 @@ class ScheduleCRUD:
         # 這些選項會被傳遞給 SQLAlchemy 查詢，實現 eager loading
         return options
 
+    def get_read_query_options(
+        self, fieldset: ScheduleFieldset | None = None
+    ) -> list[Any]:
+        """取得查詢時段 API 的查詢選項。
+
+        - 未指定 include 的關聯一律 noload，預設查詢只讀取 schedules 資料表，
+          不 JOIN users（包含模型上 lazy="joined" 的 giver、taker）
+        - include 指定的關聯以 joinedload 載入，且只讀取回應需要的 id、name
+        - fields 指定的欄位以 load_only 讀取，另加上 READ_REQUIRED_FIELDS
+
+        Args:
+            fieldset: 查詢參數指定的欄位與關聯，None 表示所有欄位、不附加關聯
+
+        Returns:
+            list[Any]: SQLAlchemy 查詢選項列表
+        """
+        include = fieldset.include if fieldset else ()
+        options: list[Any] = [
+            (
+                joinedload(getattr(Schedule, relation)).load_only(User.id, User.name)
+                if relation in include
+                else noload(getattr(Schedule, relation))
+            )
+            for relation in SCHEDULE_RELATIONS
+        ]
+
+        if fieldset is not None and fieldset.fields is not None:
+            columns = dict.fromkeys(READ_REQUIRED_FIELDS + fieldset.fields)
+            attributes: list[InstrumentedAttribute[Any]] = [
+                getattr(Schedule, column) for column in columns
+            ]
+            options.append(load_only(*attributes))
+
+        return options
+
     def _apply_filters(
         self,
         query: Any,
@@ -111,9 +373,11 @@ class ScheduleCRUD:
         taker_id: int | None = None,
         status_filter: str | None = None,
         include_deleted: bool = False,
+        date_from: date | None = None,
+        date_to: date | None = None,
     ) -> Any:
-        """套用篩選條件到查詢。"""
-        filters = []
+        """套用篩選條件到查詢，date_from、date_to 為包含兩端的日期範圍。"""
+        filters: list[ColumnElement[bool]] = []
 
         # 排除已軟刪除的記錄
         if not include_deleted:
@@ -127,6 +391,10 @@ class ScheduleCRUD:
         if status_filter is not None:
             status_enum = ScheduleStatusEnum(status_filter)
             filters.append(Schedule.status == status_enum)  # type: ignore
+        if date_from is not None:
+            filters.append(Schedule.date >= date_from)  # type: ignore
+        if date_to is not None:
+            filters.append(Schedule.date <= date_to)  # type: ignore
 
         # 如果 filters 列表不為空時，使用 and_ 組合所有篩選條件
         if filters:
@@ -140,9 +408,22 @@ class ScheduleCRUD:
         giver_id: int | None = None,
         taker_id: int | None = None,
         status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fieldset: ScheduleFieldset | None = None,
     ) -> list[Schedule]:
-        """查詢時段列表，排除已軟刪除的記錄。"""
-        query = db.query(Schedule).options(*self.get_schedule_query_options())
+        """查詢時段列表，排除已軟刪除的記錄。
+
+        依 (date, start_time, id) 排序，與 idx_schedule_giver_date、
+        idx_schedule_taker_date 索引的欄位順序一致（InnoDB 次要索引隱含主鍵 id）。
+        提供 after 時，以鍵集條件從游標之後開始查詢，深頁與第一頁的成本相同。
+
+        Args:
+            limit: 最多回傳筆數，None 表示不限制
+            after: 上一頁最後一筆的排序鍵
+            fieldset: 要讀取的欄位與要附加的關聯，None 表示所有欄位、不附加關聯
+        """
+        query = db.query(Schedule).options(*self.get_read_query_options(fieldset))
 
         query = self._apply_filters(
             query,
@@ -151,17 +432,254 @@ class ScheduleCRUD:
             status_filter=status_filter,
         )
 
+        query = self._apply_keyset(query, limit, after)
+
         schedules = query.all()
 
         return schedules
 
+    def _apply_keyset(
+        self, query: Any, limit: int | None, after: ScheduleCursor | None
+    ) -> Any:
+        """套用鍵集分頁：游標之後的條件、(date, start_time, id) 排序與筆數上限。"""
+        if after is not None:
+            # 展開成 OR 條件而非 row value 比較，讓 MySQL 穩定地使用索引範圍掃描
+            query = query.filter(
+                or_(
+                    Schedule.date > after.date,  # type: ignore
+                    and_(
+                        Schedule.date == after.date,  # type: ignore
+                        or_(
+                            Schedule.start_time > after.start_time,  # type: ignore
+                            and_(
+                                Schedule.start_time == after.start_time,  # type: ignore
+                                Schedule.id > after.id,  # type: ignore
+                            ),
+                        ),
+                    ),
+                )
+            )
+
+        query = query.order_by(Schedule.date, Schedule.start_time, Schedule.id)
+
+        if limit is not None:
+            query = query.limit(limit)
+
+        return query
+
+    def schedule_rows_statement(
+        self,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fields: tuple[str, ...] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+    ) -> Select:
+        """建立查詢時段資料列的 Core select()，排除已軟刪除的記錄。
+
+        與 list_schedules 相同的篩選與排序，但只查詢需要的欄位，
+        執行後直接得到資料列，不建立 ORM 物件、不經過 identity map，也不載入任何關聯。
+
+        Args:
+            fields: 要查詢的回應欄位，None 表示所有欄位；
+                一律另外查詢分頁游標需要的 id、date、start_time
+            date_from: 日期範圍起日（包含）
+            date_to: 日期範圍迄日（包含）
+
+        Returns:
+            Select: 以回應欄位名稱為鍵的查詢
+        """
+        names = SCHEDULE_FIELDS if fields is None else fields
+        columns = dict.fromkeys(("id", "date", "start_time") + names)
+        statement = select(*(Schedule.__table__.c[name] for name in columns))
+
+        statement = self._apply_filters(
+            statement,
+            giver_id=giver_id,
+            taker_id=taker_id,
+            status_filter=status_filter,
+            date_from=date_from,
+            date_to=date_to,
+        )
+        return self._apply_keyset(statement, limit, after)
+
+    def list_schedule_rows(
+        self,
+        db: Session,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Row]:
+        """以 Core select() 查詢時段列表的資料列，排除已軟刪除的記錄。
+
+        查詢條件見 schedule_rows_statement。
+
+        Returns:
+            list[Row]: 以回應欄位名稱為鍵的資料列
+        """
+        statement = self.schedule_rows_statement(
+            giver_id, taker_id, status_filter, limit, after, fields
+        )
+        return list(db.execute(statement).all())
+
+    def list_range_intervals(
+        self,
+        db: Session,
+        date_from: date,
+        date_to: date,
+        start_time: time,
+        end_time: time,
+        giver_ids: Iterable[int] | None = None,
+    ) -> list[ScheduleInterval]:
+        """以單一查詢載入日期範圍內、與每日時間範圍重疊的未刪除時段區間，供空檔搜尋使用。
+
+        Args:
+            giver_ids: 只載入這些 Giver 的時段，None 表示所有 Giver
+        """
+        query: Query[Any] = db.query(
+            Schedule.id,
+            Schedule.giver_id,
+            Schedule.date,
+            Schedule.start_time,
+            Schedule.end_time,
+            Schedule.status,
+        ).filter(
+            Schedule.date.between(date_from, date_to),  # type: ignore
+            Schedule.start_time < end_time,  # type: ignore
+            Schedule.end_time > start_time,  # type: ignore
+            Schedule.deleted_at.is_(None),  # type: ignore  # 排除已軟刪除的時段
+        )
+        if giver_ids is not None:
+            query = query.filter(Schedule.giver_id.in_(sorted(set(giver_ids))))  # type: ignore
+        return [ScheduleInterval._make(row) for row in query.all()]
+
+    def _interval_query(self, db: Session, *criteria: Any) -> Any:
+        """未刪除時段區間的查詢，依日期、開始時間、結束時間排序。"""
+        return (
+            db.query(
+                Schedule.id,
+                Schedule.giver_id,
+                Schedule.date,
+                Schedule.start_time,
+                Schedule.end_time,
+                Schedule.status,
+            )
+            .filter(*criteria, Schedule.deleted_at.is_(None))  # type: ignore  # 排除已軟刪除的時段
+            .order_by(Schedule.date, Schedule.start_time, Schedule.end_time)
+        )
+
+    def list_giver_openings(self, db: Session, giver_id: int) -> list[ScheduleInterval]:
+        """載入 Giver 的可預約（AVAILABLE）時段區間，依日期與開始時間排序。"""
+        rows = self._interval_query(
+            db,
+            Schedule.giver_id == giver_id,
+            Schedule.status == ScheduleStatusEnum.AVAILABLE,
+        ).all()
+        return [ScheduleInterval._make(row) for row in rows]
+
+    def list_taker_proposals(
+        self, db: Session, taker_ids: Iterable[int]
+    ) -> dict[int, list[ScheduleInterval]]:
+        """以單一查詢載入多個 Taker 提出的（PENDING）時段區間，依 Taker 分組並排序。
+
+        包含 Taker 向所有 Giver 提出的時段，代表 Taker 有空的時間。
+        """
+        taker_ids = sorted(set(taker_ids))
+        proposals: dict[int, list[ScheduleInterval]] = {i: [] for i in taker_ids}
+        if not taker_ids:
+            return proposals
+
+        rows = (
+            self._interval_query(
+                db,
+                Schedule.taker_id.in_(taker_ids),  # type: ignore
+                Schedule.status == ScheduleStatusEnum.PENDING,
+            )
+            .add_columns(Schedule.taker_id)
+            .all()
+        )
+        for *interval, taker_id in rows:
+            proposals[taker_id].append(ScheduleInterval._make(interval))
+        return proposals
+
+    def list_inbox_taker_ids(self, db: Session, giver_id: int) -> list[int]:
+        """Giver 收件匣中的 Taker：向 Giver 提出尚未回覆（PENDING）時段的 Taker。"""
+        rows: list[Any] = (
+            db.query(Schedule.taker_id)
+            .filter(
+                Schedule.giver_id == giver_id,  # type: ignore
+                Schedule.status == ScheduleStatusEnum.PENDING,  # type: ignore
+                Schedule.taker_id.is_not(None),  # type: ignore
+                Schedule.deleted_at.is_(None),  # type: ignore
+            )
+            .distinct()
+            .all()
+        )
+        return sorted(taker_id for (taker_id,) in rows)
+
+    def get_list_validator(
+        self,
+        db: Session,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+    ) -> Row:
+        """以聚合查詢取得時段列表的驗證器，用於條件式 GET，排除已軟刪除的記錄。
+
+        新增（筆數、最大 ID）、更新（版本號遞增）與軟刪除（筆數）都會改變其中至少一個值；
+        idx_schedule_giver_changes、idx_schedule_taker_changes 涵蓋需要的欄位，
+        依 Giver 或 Taker 篩選時只掃描索引，不讀取資料列。
+
+        Returns:
+            Row: count、max_id、max_updated_at、version_sum
+        """
+        statement: Select = select(
+            func.count().label("count"),
+            func.max(Schedule.id).label("max_id"),
+            func.max(Schedule.updated_at).label("max_updated_at"),
+            func.coalesce(func.sum(Schedule.version), 0).label("version_sum"),
+        )
+        statement = self._apply_filters(
+            statement,
+            giver_id=giver_id,
+            taker_id=taker_id,
+            status_filter=status_filter,
+        )
+        return db.execute(statement).one()
+
+    def get_schedule_version(self, db: Session, schedule_id: int) -> int | None:
+        """只查詢時段的版本號，用於條件式 GET，時段不存在或已軟刪除時回傳 None。"""
+        statement = self._apply_filters(select(Schedule.version)).filter(
+            Schedule.id == schedule_id
+        )
+        return db.execute(statement).scalar_one_or_none()
+
+    def get_schedule_owners(self, db: Session, schedule_id: int) -> Row | None:
+        """只查詢時段的 giver_id、taker_id（包含已軟刪除的時段），不存在時回傳 None。"""
+        return db.execute(
+            select(Schedule.giver_id, Schedule.taker_id).where(
+                Schedule.id == schedule_id  # type: ignore
+            )
+        ).first()
+
     def get_schedule(
         self,
         db: Session,
         schedule_id: int,
+        fieldset: ScheduleFieldset | None = None,
     ) -> Schedule:
-        """根據 ID 查詢單一時段，排除已軟刪除的記錄。"""
-        query = db.query(Schedule).options(*self.get_schedule_query_options())
+        """根據 ID 查詢單一時段，排除已軟刪除的記錄。
+
+        Args:
+            fieldset: 要讀取的欄位與要附加的關聯，None 表示所有欄位、不附加關聯
+        """
+        query = db.query(Schedule).options(*self.get_read_query_options(fieldset))
 
         query = self._apply_filters(query).filter(Schedule.id == schedule_id)
 
@@ -196,9 +714,9 @@ class ScheduleCRUD:
         """更新時段欄位並返回更新的欄位記錄。"""
         updated_fields = []
 
-        for field, value in kwargs.items():
+        for field_name, value in kwargs.items():
             # 檢查 API 傳入的參數名稱，是否為 schedule_date 別名，如果是則更新資料庫模型 date 欄位的值
-            if field == "schedule_date":
+            if field_name == "schedule_date":
                 # 取得欄位更新前的舊值（如果不存在則為 None）
                 old_value = getattr(schedule, "date", None)
                 # 設定欄位的新值到資料庫模型的 date 屬性
@@ -206,31 +724,83 @@ class ScheduleCRUD:
                 # 記錄欄位變更日誌：格式為 "欄位名: 舊值 -> 新值"
                 updated_fields.append(f"date: {old_value} -> {value}")
             # 檢查欄位是否在 Schedule 模型中存在
-            elif hasattr(schedule, field):
+            elif hasattr(schedule, field_name):
                 # 取得欄位更新前的舊值（如果不存在則為 None）
-                old_value = getattr(schedule, field, None)
+                old_value = getattr(schedule, field_name, None)
                 # 設定欄位的新值到資料庫模型
-                setattr(schedule, field, value)
+                setattr(schedule, field_name, value)
                 # 記錄欄位變更日誌：格式為 "欄位名: 舊值 -> 新值"
-                updated_fields.append(f"{field}: {old_value} -> {value}")
+                updated_fields.append(f"{field_name}: {old_value} -> {value}")
             # 如果欄位不存在於 Schedule 模型中
             else:
                 # 記錄警告日誌，忽略無效的欄位
-                logger.warning(f"忽略無效的欄位: {field}")
+                logger.warning(f"忽略無效的欄位: {field_name}")
 
         return updated_fields
 
+    def get_schedule_for_update(
+        self,
+        db: Session,
+        schedule_id: int,
+        expected_version: int | None = None,
+    ) -> Schedule:
+        """根據 ID 查詢單一時段供更新使用，排除已軟刪除的記錄。
+
+        - 未指定版本號（悲觀鎖）：SELECT ... FOR UPDATE 鎖定到本次交易 commit 為止，
+          讓驗證、重疊檢查與寫入看到同一份資料
+        - 指定版本號（樂觀鎖）：不鎖定，版本不符時立即拋出 412 錯誤；
+          讀取後的並行修改由寫入時的 WHERE version=? 偵測
+
+        不載入任何關聯：Giver、Taker 的 JOIN 會連帶鎖定使用者資料列。
+
+        Raises:
+            ScheduleNotFoundError: 時段不存在或已刪除
+            SchedulePreconditionFailedError: 版本不符
+        """
+        query = (
+            db.query(Schedule)
+            .options(lazyload("*"))
+            .filter(Schedule.id == schedule_id, Schedule.deleted_at.is_(None))  # type: ignore
+        )
+        if expected_version is None:
+            query = query.with_for_update(of=Schedule)
+
+        schedule = query.first()
+
+        if not schedule:
+            raise create_schedule_not_found_error(schedule_id)
+
+        current_version = cast(int, schedule.version)
+        if expected_version is not None and current_version != expected_version:
+            raise create_schedule_precondition_failed_error(
+                schedule_id, expected_version, current_version
+            )
+
+        return schedule
+
     def update_schedule(
         self,
         db: Session,
         schedule_id: int,
         updated_by: int,
         updated_by_role: UserRoleEnum,
+        schedule: Schedule | None = None,
+        expected_version: int | None = None,
         **kwargs: Any,
     ) -> Schedule:
-        """更新時段。"""
+        """更新時段。
+
+        Args:
+            schedule: 已由 get_schedule_for_update 載入的時段，
+                None 時由本方法載入，避免同一請求重複查詢同一筆資料
+            expected_version: If-Match 指定的版本號，None 表示不檢查版本
+
+        Raises:
+            SchedulePreconditionFailedError: 版本不符，或讀取後已被其他請求修改
+        """
         # 驗證時段是否存在
-        schedule = self.get_schedule(db, schedule_id)
+        if schedule is None:
+            schedule = self.get_schedule_for_update(db, schedule_id, expected_version)
 
         # 驗證時間邏輯（只有在更新時間欄位時才檢查）
         if "start_time" in kwargs or "end_time" in kwargs:
@@ -240,6 +810,9 @@ class ScheduleCRUD:
             if start_time and end_time and start_time >= end_time:
                 raise create_bad_request_error("開始時間必須早於結束時間")
 
+        # 記錄更新前的 Giver 日：更新日期後，舊日期的區間也必須失效
+        original_giver_day = _giver_day(schedule)
+
         # 只有當時段存在時，才設定更新者資訊
         if updated_by is not None:
             schedule.updated_by = updated_by  # type: ignore
@@ -247,56 +820,498 @@ class ScheduleCRUD:
             schedule.updated_by_role = updated_by_role  # type: ignore
 
         self._update_schedule_fields(schedule, **kwargs)
+        # 在 commit 前取得：同步 Session 在 commit 後會使物件屬性過期，讀取時需要重新查詢
+        giver_days = [original_giver_day, _giver_day(schedule)]
 
-        db.commit()
-        db.refresh(schedule)
+        # 不再 refresh：updated_at 由 Python 端的 onupdate 產生，flush 時已寫回物件，
+        # 其餘欄位即為剛寫入的值，重新查詢只會多一次往返
+        # UPDATE 帶有 WHERE version=?：讀取後被其他請求修改時影響 0 列，拋出 StaleDataError
+        try:
+            self._commit(
+                db,
+                giver_days=giver_days,
+                summary=bool(DAILY_SUMMARY_FIELDS & kwargs.keys()),
+            )
+        except StaleDataError:
+            db.rollback()
+            raise create_schedule_precondition_failed_error(
+                schedule_id, expected_version
+            )
 
         return schedule
 
+    def _column_values(self, **kwargs: Any) -> dict[str, Any]:
+        """將更新欄位轉換為 UPDATE 陳述式的欄位值，忽略不存在的欄位。"""
+        columns = Schedule.__table__.columns
+        values = {}
+        for field_name, value in kwargs.items():
+            # API 傳入的 schedule_date 對應資料庫模型的 date 欄位
+            column = "date" if field_name == "schedule_date" else field_name
+            if column in columns:
+                values[column] = value
+            else:
+                logger.warning(f"忽略無效的欄位: {field_name}")
+        return values
+
+    def update_schedule_if_version(
+        self,
+        db: Session,
+        schedule_id: int,
+        expected_version: int,
+        updated_by: int,
+        updated_by_role: UserRoleEnum,
+        **kwargs: Any,
+    ) -> Schedule:
+        """以單一條件式 UPDATE 更新時段：UPDATE ... WHERE id=? AND version=?。
+
+        不先讀取、不鎖定，並行寫入者互不等待；版本不符時影響 0 列並拋出 412 錯誤。
+        只適用於不需要依現有資料驗證的欄位（時間欄位需要重疊檢查，請使用 update_schedule）。
+
+        Raises:
+            ScheduleNotFoundError: 時段不存在或已刪除
+            SchedulePreconditionFailedError: 版本不符
+        """
+        values = self._column_values(**kwargs)
+
+        # 改變 Giver 時，原 Giver 當天的區間與統計也受影響：UPDATE 不會讀取舊值，先在交易中查詢
+        original_giver_day = None
+        if "giver_id" in values:
+            original_giver_day = db.execute(
+                select(Schedule.giver_id, Schedule.date).where(
+                    Schedule.id == schedule_id  # type: ignore
+                )
+            ).first()
+
+        values["version"] = Schedule.version + 1
+        if updated_by is not None:
+            values["updated_by"] = updated_by
+        if updated_by_role is not None:
+            values["updated_by_role"] = updated_by_role
+
+        # updated_at 由欄位的 onupdate 產生
+        statement = (
+            update(Schedule)
+            .where(
+                Schedule.id == schedule_id,  # type: ignore
+                Schedule.version == expected_version,  # type: ignore
+                Schedule.deleted_at.is_(None),  # type: ignore
+            )
+            .values(values)
+            .execution_options(synchronize_session=False)
+        )
+
+        # 支援 RETURNING 的資料庫直接取回更新後的資料列，MySQL 則在同一交易中再查詢一次
+        if db.get_bind().dialect.update_returning:
+            schedule = db.scalars(statement.returning(Schedule)).first()
+        elif cast(CursorResult[Any], db.execute(statement)).rowcount:
+            schedule = db.get(Schedule, schedule_id, populate_existing=True)
+        else:
+            schedule = None
+
+        if schedule is None:
+            # 只有失敗時才查詢原因：不存在（404）或版本不符（412）
+            current_version = (
+                db.query(Schedule.version)
+                .filter(Schedule.id == schedule_id, Schedule.deleted_at.is_(None))  # type: ignore
+                .scalar()
+            )
+            db.rollback()
+            if current_version is None:
+                raise create_schedule_not_found_error(schedule_id)
+            raise create_schedule_precondition_failed_error(
+                schedule_id, expected_version, current_version
+            )
+
+        giver_days = [_giver_day(schedule)]
+        if original_giver_day is not None:
+            giver_days.append(tuple(original_giver_day))
+        self._commit(
+            db,
+            giver_days=giver_days,
+            summary=bool(DAILY_SUMMARY_FIELDS & kwargs.keys()),
+        )
+
+        return schedule
+
+    def _soft_delete_values(
+        self,
+        deleted_by: int | None,
+        deleted_by_role: UserRoleEnum | None,
+    ) -> dict[str, Any]:
+        """軟刪除的 UPDATE 欄位值。"""
+        now = get_local_now_naive()
+        return {
+            "updated_at": now,
+            "updated_by": deleted_by,
+            # updated_by_role 不可為 NULL：未指定刪除者角色時視為系統操作
+            "updated_by_role": deleted_by_role or UserRoleEnum.SYSTEM,
+            "deleted_at": now,
+            "deleted_by": deleted_by,
+            "deleted_by_role": deleted_by_role,
+            "status": ScheduleStatusEnum.CANCELLED,
+            "version": Schedule.version + 1,
+        }
+
     def delete_schedule(
         self,
         db: Session,
         schedule_id: int,
         deleted_by: int | None = None,
         deleted_by_role: UserRoleEnum | None = None,
+        expected_version: int | None = None,
     ) -> DeletionResult:
         """軟刪除時段。
 
+        以單一條件式 UPDATE 完成：
+        UPDATE ... WHERE id=? AND deleted_at IS NULL AND status NOT IN ('ACCEPTED','COMPLETED')，
+        影響 1 列即刪除成功；影響 0 列時才查詢原因，對應到其他刪除結果。
+
+        Args:
+            expected_version: If-Match 指定的版本號，None 表示不檢查版本
+
         Returns:
             DeletionResult: 刪除結果
                 - SUCCESS: 刪除成功
                 - ALREADY_DELETED: 已經刪除
                 - NOT_FOUND: 時段不存在
                 - CANNOT_DELETE: 無法刪除（狀態不允許）
+                - VERSION_MISMATCH: 版本不符（If-Match）
         """
-        schedule = self.get_schedule_including_deleted(db, schedule_id)
+        statement = (
+            update(Schedule)
+            .where(
+                Schedule.id == schedule_id,  # type: ignore
+                Schedule.deleted_at.is_(None),  # type: ignore
+                Schedule.status.not_in(UNDELETABLE_STATUSES),  # type: ignore
+            )
+            .values(self._soft_delete_values(deleted_by, deleted_by_role))
+            # evaluate：在 Python 端同步 Session 中已載入的物件，不需額外查詢
+            .execution_options(synchronize_session="evaluate")
+        )
+        if expected_version is not None:
+            statement = statement.where(Schedule.version == expected_version)  # type: ignore
+
+        # 支援 RETURNING 的資料庫直接取回 Giver 日，讓區間索引只失效該日
+        if db.get_bind().dialect.update_returning:
+            giver_day: Row | None = db.execute(
+                statement.returning(Schedule.giver_id, Schedule.date)
+            ).first()
+            deleted = giver_day is not None
+        else:
+            giver_day = None
+            deleted = cast(CursorResult[Any], db.execute(statement)).rowcount > 0
+
+        if deleted:
+            if giver_day is not None:
+                self._commit(db, giver_days=[(giver_day.giver_id, giver_day.date)])
+            else:
+                self._commit(db, schedule_ids=[schedule_id])
+            return DeletionResult.SUCCESS
+
+        # 影響 0 列：只查詢判斷原因需要的欄位
+        current: Row | None = (
+            db.query(Schedule.deleted_at, Schedule.status, Schedule.version)
+            .filter(Schedule.id == schedule_id)  # type: ignore
+            .first()
+        )
+        db.rollback()
 
         # 使用 match-case 語法處理不同的刪除情況
-        match schedule:
+        match current:
             case None:
                 return DeletionResult.NOT_FOUND
-            case _ if schedule.deleted_at is not None:
+            case _ if current.deleted_at is not None:
                 return DeletionResult.ALREADY_DELETED
+            case _ if (
+                expected_version is not None and current.version != expected_version
+            ):
+                return DeletionResult.VERSION_MISMATCH
             # 已接受或已完成的時段無法刪除
-            # ACCEPTED: 雙方已確認面談時間，刪除會影響約定
-            # COMPLETED: 面談已完成，屬於歷史記錄，不應刪除
-            case _ if schedule.status in [
-                ScheduleStatusEnum.ACCEPTED,
-                ScheduleStatusEnum.COMPLETED,
-            ]:
+            case _ if current.status in UNDELETABLE_STATUSES:
                 return DeletionResult.CANNOT_DELETE
             case _:
-                # 執行軟刪除
-                schedule.updated_at = get_local_now_naive()
-                schedule.updated_by = deleted_by
-                schedule.updated_by_role = deleted_by_role
-                schedule.deleted_at = get_local_now_naive()
-                schedule.deleted_by = deleted_by
-                schedule.deleted_by_role = deleted_by_role
-                schedule.status = ScheduleStatusEnum.CANCELLED
+                # UPDATE 與查詢之間被其他請求改成可刪除的狀態：以 UPDATE 當下的狀態為準
+                return DeletionResult.CANNOT_DELETE
 
-                db.commit()
-                return DeletionResult.SUCCESS
+    def _filter_delete_conditions(
+        self,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+    ) -> list[Any]:
+        """依條件批次軟刪除的 WHERE 條件：已接受或已完成的時段一律不刪除。"""
+        conditions = [
+            Schedule.giver_id == giver_id,
+            Schedule.date.in_(dates),  # type: ignore
+            Schedule.deleted_at.is_(None),  # type: ignore
+            Schedule.status.not_in(UNDELETABLE_STATUSES),  # type: ignore
+        ]
+        if status_filter is not None:
+            conditions.append(Schedule.status == status_filter)
+        return conditions
+
+    def list_deletable_schedules(
+        self,
+        db: Session,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+    ) -> list[Row]:
+        """查詢依條件批次軟刪除會刪除的時段 id、taker_id。"""
+        statement: Select = select(Schedule.id, Schedule.taker_id).where(
+            *self._filter_delete_conditions(giver_id, dates, status_filter)
+        )
+        return list(db.execute(statement).all())
+
+    def delete_schedules_by_filter(
+        self,
+        db: Session,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> int:
+        """依條件批次軟刪除時段，以單一 UPDATE 陳述式完成。
+
+        已接受或已完成的時段一律不刪除，與單筆刪除規則相同。
+
+        Args:
+            giver_id: Giver ID
+            dates: 要刪除的日期
+            status_filter: 只刪除指定狀態的時段，None 表示所有可刪除的狀態
+
+        Returns:
+            int: 刪除的時段數量
+        """
+        statement = (
+            update(Schedule)
+            .where(*self._filter_delete_conditions(giver_id, dates, status_filter))
+            .values(self._soft_delete_values(deleted_by, deleted_by_role))
+            # evaluate：在 Python 端同步 Session 中已載入的物件，不需額外查詢
+            .execution_options(synchronize_session="evaluate")
+        )
+
+        deleted_count = cast(CursorResult[Any], db.execute(statement)).rowcount
+        self._commit(db, giver_days=[(giver_id, d) for d in dates])
+
+        return deleted_count
+
+
+class AsyncScheduleCRUD:
+    """時段 CRUD 操作類別（非同步版本）。
+
+    透過 AsyncSession.run_sync 執行 ScheduleCRUD 的查詢邏輯：
+    SQL 組裝與 ORM 映射只維護一份，實際的資料庫 I/O 由非同步驅動完成，等待期間會讓出事件迴圈。
+    """
+
+    def __init__(self) -> None:
+        """初始化 CRUD 實例。"""
+        self.schedule_crud = ScheduleCRUD()
+
+    async def create_schedules(
+        self,
+        db: AsyncSession,
+        schedules: list[Schedule],
+    ) -> list[Schedule]:
+        """建立多個時段。"""
+        return await db.run_sync(self.schedule_crud.create_schedules, schedules)
+
+    async def list_schedules(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fieldset: ScheduleFieldset | None = None,
+    ) -> list[Schedule]:
+        """查詢時段列表，排除已軟刪除的記錄。"""
+        return await db.run_sync(
+            self.schedule_crud.list_schedules,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit,
+            after,
+            fieldset,
+        )
+
+    async def list_schedule_rows(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Row]:
+        """以 Core select() 查詢時段列表的資料列。"""
+        return await db.run_sync(
+            self.schedule_crud.list_schedule_rows,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit,
+            after,
+            fields,
+        )
+
+    async def get_list_validator(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+    ) -> Row:
+        """以聚合查詢取得時段列表的驗證器。"""
+        return await db.run_sync(
+            self.schedule_crud.get_list_validator, giver_id, taker_id, status_filter
+        )
+
+    async def get_schedule_version(
+        self, db: AsyncSession, schedule_id: int
+    ) -> int | None:
+        """只查詢時段的版本號。"""
+        return await db.run_sync(self.schedule_crud.get_schedule_version, schedule_id)
+
+    async def stream_schedule_rows(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """以伺服器端游標串流查詢時段資料列，每次產生一批。
+
+        查詢以 stream_results 執行，驅動程式不會一次把結果全部載入記憶體，
+        每批以 yield_per 讀取 batch_size 筆，記憶體用量只與批次大小有關。
+        串流期間持有資料庫連線，呼叫端需讓會話存活到串流結束。
+        """
+        statement = self.schedule_crud.schedule_rows_statement(
+            giver_id,
+            taker_id,
+            status_filter,
+            fields=fields,
+            date_from=date_from,
+            date_to=date_to,
+        ).execution_options(yield_per=batch_size)
+
+        result = await db.stream(statement)
+        try:
+            async for rows in result.partitions():
+                yield rows
+        finally:
+            await result.close()
+
+    async def get_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        fieldset: ScheduleFieldset | None = None,
+    ) -> Schedule:
+        """根據 ID 查詢單一時段，排除已軟刪除的記錄。"""
+        return await db.run_sync(self.schedule_crud.get_schedule, schedule_id, fieldset)
+
+    async def get_schedule_including_deleted(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+    ) -> Schedule | None:
+        """根據 ID 查詢單一時段，包含已軟刪除的記錄。"""
+        return await db.run_sync(
+            self.schedule_crud.get_schedule_including_deleted, schedule_id
+        )
+
+    async def get_schedule_for_update(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        expected_version: int | None = None,
+    ) -> Schedule:
+        """根據 ID 查詢單一時段供更新使用，排除已軟刪除的記錄。"""
+        return await db.run_sync(
+            self.schedule_crud.get_schedule_for_update, schedule_id, expected_version
+        )
+
+    async def update_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        updated_by: int,
+        updated_by_role: UserRoleEnum,
+        **kwargs: Any,
+    ) -> Schedule:
+        """更新時段。"""
+        return await db.run_sync(
+            self.schedule_crud.update_schedule,
+            schedule_id,
+            updated_by,
+            updated_by_role,
+            **kwargs,
+        )
+
+    async def update_schedule_if_version(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        expected_version: int,
+        updated_by: int,
+        updated_by_role: UserRoleEnum,
+        **kwargs: Any,
+    ) -> Schedule:
+        """以單一條件式 UPDATE 更新時段。"""
+        return await db.run_sync(
+            self.schedule_crud.update_schedule_if_version,
+            schedule_id,
+            expected_version,
+            updated_by,
+            updated_by_role,
+            **kwargs,
+        )
+
+    async def delete_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+        expected_version: int | None = None,
+    ) -> DeletionResult:
+        """軟刪除時段。"""
+        return await db.run_sync(
+            self.schedule_crud.delete_schedule,
+            schedule_id,
+            deleted_by,
+            deleted_by_role,
+            expected_version,
+        )
+
+    async def delete_schedules_by_filter(
+        self,
+        db: AsyncSession,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> int:
+        """依條件批次軟刪除時段。"""
+        return await db.run_sync(
+            self.schedule_crud.delete_schedules_by_filter,
+            giver_id,
+            dates,
+            status_filter,
+            deleted_by,
+            deleted_by_role,
+        )
 
 
 schedule_crud = ScheduleCRUD()
+async_schedule_crud = AsyncScheduleCRUD()
@@ -6,23 +6,53 @@
 # ===== 本地模組 =====
 from .base import Base
 from .connection import (
+    async_engine,
+    AsyncSessionLocal,
     check_db_connection,
+    check_replica_connections,
+    create_async_database_engine,
     create_database_engine,
+    create_replica_pool,
     engine,
+    get_async_db,
+    get_async_read_db,
+    get_async_read_session_factory,
+    get_async_session_factory,
     get_db,
     initialize_database,
     SessionLocal,
 )
+from .instrumentation import (
+    get_query_stats,
+    QueryStats,
+    start_query_stats,
+    stop_query_stats,
+)
 
 __all__ = [
     # 基礎類別
     "Base",
     # 資料庫連線管理
     "create_database_engine",
+    "create_async_database_engine",
     "initialize_database",
     "get_db",
+    "get_async_db",
+    "get_async_session_factory",
     "check_db_connection",
+    # 唯讀副本
+    "create_replica_pool",
+    "get_async_read_db",
+    "get_async_read_session_factory",
+    "check_replica_connections",
+    # 查詢統計
+    "QueryStats",
+    "start_query_stats",
+    "stop_query_stats",
+    "get_query_stats",
     # 全域變數
     "engine",
     "SessionLocal",
+    "async_engine",
+    "AsyncSessionLocal",
 ]
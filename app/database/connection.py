@@ -4,25 +4,52 @@
 """
 
 # ===== 標準函式庫 =====
+from functools import partial
 import logging
-from typing import Generator
+from typing import AsyncGenerator, Generator
 
 # ===== 第三方套件 =====
-from fastapi import HTTPException
-from sqlalchemy import create_engine, text
+from fastapi import HTTPException, Request
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import (
+    async_sessionmaker,
+    AsyncEngine,
+    AsyncSession,
+    create_async_engine,
+)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import NullPool, Pool, QueuePool
 
 # ===== 本地模組 =====
 from app.core import settings
 from app.database.base import Base
+from app.database.instrumentation import TimedAsyncQueuePool, TimedQueuePool
+from app.database.replicas import (
+    is_sticky_to_primary,
+    mask_url,
+    READ_FROM_REPLICA_KEY,
+    READ_PRIMARY_COOKIE,
+    READ_YOUR_WRITES_KEY,
+    Replica,
+    ReplicaPool,
+    to_async_url,
+)
 from app.decorators import handle_generic_errors_sync
 from app.errors import create_database_error, create_service_unavailable_error
 from app.errors.exceptions import APIError
+from app.metrics import Gauge, registry
 
 # 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
 logger = logging.getLogger(__name__)
 
+# MySQL 連線層級設定：時區為台灣時間、sql_mode 為嚴格模式
+# 以驅動的 init_command 在建立實體連線時執行一次，之後每次借出連線都不必再送出
+MYSQL_SESSION_INIT_COMMAND = (
+    "SET time_zone = '+08:00', "
+    "SESSION sql_mode = 'STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO'"
+)
+
 
 def create_database_engine() -> tuple[Engine, sessionmaker]:
     """建立資料庫引擎和會話工廠。"""
@@ -49,13 +76,17 @@ def create_database_engine() -> tuple[Engine, sessionmaker]:
             engine = create_engine(
                 DATABASE_URL,  # MySQL 連接字串
                 echo=False,  # 關閉 SQL 查詢日誌，避免測試輸出過於冗長
-                pool_pre_ping=True,  # 啟用連線檢查，確保連線有效性
-                pool_size=10,  # 連線池大小
-                max_overflow=10,  # 最大溢出連線數（通常是 pool_size 的 1-2 倍）
+                # 連線檢查：關閉時不在每次借出連線時 ping，斷線錯誤會讓連線池失效並重新連線
+                pool_pre_ping=settings.database_pool_pre_ping,
+                poolclass=TimedQueuePool,  # 記錄借出連線的等待時間
+                pool_logging_name="primary",  # 指標中的連線池名稱
+                pool_size=settings.database_pool_size,  # 連線池大小
+                max_overflow=settings.database_max_overflow,  # 最大溢出連線數（通常是 pool_size 的 1-2 倍）
                 pool_timeout=30,  # 連線超時時間（30秒）
                 pool_recycle=3600,  # 連線池回收時間（1小時）
                 connect_args={  # pymysql 特定參數
                     "charset": "utf8mb4",  # 使用 utf8mb4 字符集
+                    "init_command": MYSQL_SESSION_INIT_COMMAND,  # 建立連線時設定時區與 sql_mode
                 },
             )
 
@@ -79,17 +110,143 @@ def create_database_engine() -> tuple[Engine, sessionmaker]:
         raise create_service_unavailable_error(f"資料庫引擎建立失敗：{str(e)}")
 
 
+def create_async_database_engine() -> tuple[AsyncEngine, async_sessionmaker]:
+    """建立非同步資料庫引擎和 AsyncSession 工廠。
+
+    與 create_database_engine 使用相同的連線池參數，但改用非同步驅動
+    （MySQL：aiomysql，SQLite：aiosqlite），讓路由等待資料庫 I/O 時不會阻塞事件迴圈。
+    """
+    try:
+        if settings.testing or settings.app_env == "testing":
+            # SQLite 配置：aiosqlite 在背景執行緒執行查詢，不需要 check_same_thread
+            async_engine = create_async_engine(
+                settings.sqlite_async_connection_string,
+                echo=False,
+                pool_pre_ping=False,
+            )
+        else:
+            # MySQL 配置：與同步引擎相同的連線池大小，避免兩條路徑的容量不一致
+            async_engine = create_async_engine(
+                settings.mysql_async_connection_string,
+                echo=False,
+                pool_pre_ping=settings.database_pool_pre_ping,
+                poolclass=TimedAsyncQueuePool,
+                pool_logging_name="primary_async",
+                pool_size=settings.database_pool_size,
+                max_overflow=settings.database_max_overflow,
+                pool_timeout=30,
+                pool_recycle=3600,
+                connect_args={"init_command": MYSQL_SESSION_INIT_COMMAND},
+            )
+
+        # 建立 AsyncSession 工廠
+        # expire_on_commit=False：commit 後仍可讀取物件屬性，避免在事件迴圈中觸發隱性的延遲載入
+        AsyncSessionLocal = async_sessionmaker(
+            bind=async_engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+        logger.info("成功建立非同步資料庫引擎和會話工廠")
+
+        return async_engine, AsyncSessionLocal
+
+    except Exception as e:
+        raise create_service_unavailable_error(f"非同步資料庫引擎建立失敗：{str(e)}")
+
+
+def create_replica_pool(urls: list[str] | None = None) -> ReplicaPool | None:
+    """建立唯讀副本池。
+
+    每個副本各自建立同步引擎（健康檢查）與非同步引擎（讀取），連線池參數與主資料庫相同；
+    副本在此不測試連線，無法連線的副本在第一次讀取或健康檢查時進入冷卻，不影響應用程式啟動。
+
+    Args:
+        urls: 副本的同步連線字串，None 表示使用設定的 DATABASE_REPLICA_URLS
+
+    Returns:
+        ReplicaPool | None: 副本池，沒有設定副本時為 None
+    """
+    urls = settings.database_replica_url_list if urls is None else urls
+    if not urls:
+        return None
+
+    replicas = []
+    for index, url in enumerate(urls):
+        if url.startswith("sqlite"):
+            # SQLite 配置（本機測試以另一個資料庫檔案模擬副本）
+            # NullPool：每次讀取都建立新連線，避免連線綁定到不同的事件迴圈
+            replica_engine = create_engine(
+                url, connect_args={"check_same_thread": False}
+            )
+            replica_async_engine = create_async_engine(
+                to_async_url(url), poolclass=NullPool
+            )
+        else:
+            # MySQL 配置：與主資料庫相同的連線池大小與連線層級設定
+            pool_options = {
+                "pool_pre_ping": settings.database_pool_pre_ping,
+                "pool_size": settings.database_pool_size,
+                "max_overflow": settings.database_max_overflow,
+                "pool_timeout": 30,
+                "pool_recycle": 3600,
+            }
+            replica_engine = create_engine(
+                url,
+                connect_args={
+                    "charset": "utf8mb4",
+                    "init_command": MYSQL_SESSION_INIT_COMMAND,
+                },
+                poolclass=TimedQueuePool,
+                pool_logging_name=f"replica_{index}",
+                **pool_options,
+            )
+            replica_async_engine = create_async_engine(
+                to_async_url(url),
+                connect_args={"init_command": MYSQL_SESSION_INIT_COMMAND},
+                poolclass=TimedAsyncQueuePool,
+                pool_logging_name=f"replica_{index}_async",
+                **pool_options,
+            )
+        replicas.append(
+            Replica(
+                name=mask_url(url),
+                engine=replica_engine,
+                async_engine=replica_async_engine,
+                session_factory=async_sessionmaker(
+                    bind=replica_async_engine,
+                    autoflush=False,
+                    expire_on_commit=False,
+                ),
+            )
+        )
+
+    pool = ReplicaPool(replicas, settings.database_replica_failure_cooldown_seconds)
+    for replica in replicas:
+        # 查詢途中斷線時讓副本進入冷卻，之後的讀取改用其他副本
+        for bind in (replica.engine, replica.async_engine.sync_engine):
+            event.listen(bind, "handle_error", partial(pool.on_engine_error, replica))
+
+    logger.info(f"成功建立唯讀副本池: {[replica.name for replica in replicas]}")
+    return pool
+
+
 # 全域變數，用於儲存引擎和會話工廠
 engine: Engine | None = None
 SessionLocal: sessionmaker | None = None
+async_engine: AsyncEngine | None = None
+AsyncSessionLocal: async_sessionmaker | None = None
+replica_pool: ReplicaPool | None = None
 
 
 def initialize_database() -> None:
-    """初始化資料庫引擎和會話工廠。"""
-    global engine, SessionLocal
+    """初始化資料庫引擎和會話工廠（同步與非同步），以及設定的唯讀副本。"""
+    global engine, SessionLocal, async_engine, AsyncSessionLocal, replica_pool
 
     try:
         engine, SessionLocal = create_database_engine()
+        async_engine, AsyncSessionLocal = create_async_database_engine()
+        replica_pool = create_replica_pool()
 
         # 在測試環境中創建資料庫表
         if settings.testing or settings.app_env == "testing":
@@ -118,28 +275,8 @@ def get_db() -> Generator[Session, None, None]:
     # db 是實際的 Session 實例，用來進行 add()、query()、commit()、close() 等操作
     db = SessionLocal()
     try:
-        # 根據資料庫類型設定不同的參數
-        is_sqlite = engine.url.drivername == "sqlite"
-
-        if is_sqlite:
-            # SQLite 不需要設定時區和 sql_mode
-            # 驗證連線是否有效（輕量級檢查）
-            db.execute(text("SELECT 1"))
-        else:
-            # MySQL 特定設定
-            # 設定時區為台灣時間
-            db.execute(text("SET time_zone = '+08:00'"))
-
-            # 設定 sql_mode 為嚴格模式（每個連線都會設定）
-            db.execute(
-                text(
-                    "SET SESSION sql_mode = 'STRICT_TRANS_TABLES,NO_ZERO_DATE,NO_ZERO_IN_DATE,ERROR_FOR_DIVISION_BY_ZERO'"
-                )
-            )
-
-            # 驗證連線是否有效（輕量級檢查）
-            db.execute(text("SELECT 1"))
-
+        # 時區與 sql_mode 已在建立實體連線時設定，連線有效性由連線池負責，
+        # 這裡不再送出任何 SQL，讓請求只為實際需要的查詢付出往返成本
         logger.info("get_db() yield: 傳遞資料庫連線給處理函式")
         yield db
     except APIError as e:
@@ -162,6 +299,147 @@ def get_db() -> Generator[Session, None, None]:
         db.close()
 
 
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """非同步資料庫會話依賴注入函式。
+
+    與 get_db 相同的生命週期與錯誤處理，但提供 AsyncSession，
+    讓 async def 路由以 await 等待資料庫 I/O，而不是在事件迴圈上同步阻塞。
+
+    Yields:
+        AsyncSession: SQLAlchemy 非同步資料庫會話實例
+    """
+    if AsyncSessionLocal is None or async_engine is None:
+        raise create_database_error("資料庫尚未初始化")
+
+    logger.info("get_async_db() called: 建立非同步資料庫連線")
+    db = AsyncSessionLocal()
+    try:
+        # 與 get_db 相同：連線層級設定已移到建立連線時，這裡不再送出任何 SQL
+        logger.info("get_async_db() yield: 傳遞非同步資料庫連線給處理函式")
+        yield db
+    except APIError as e:
+        # APIError 類型直接向上傳遞，不要包裝
+        logger.error(f"get_async_db() error: API 錯誤 - {str(e)}")
+        await db.rollback()
+        raise
+    except HTTPException as e:
+        # HTTPException 類型直接向上傳遞，不要包裝
+        logger.error(f"get_async_db() error: HTTP 錯誤 - {str(e)}")
+        await db.rollback()
+        raise
+    except Exception as e:
+        # 其他異常包裝成 DatabaseError
+        logger.error(f"get_async_db() error: 資料庫操作錯誤 - {str(e)}")
+        await db.rollback()
+        raise create_database_error(f"資料庫會話建立失敗：{str(e)}")
+    finally:
+        logger.info("get_async_db() cleanup: 關閉非同步資料庫連線")
+        await db.close()
+
+
+def get_async_session_factory() -> async_sessionmaker:
+    """非同步會話工廠依賴注入函式。
+
+    串流回應在路由函式回傳後才產生內容，但 get_async_db 的會話在回應送出前就已關閉，
+    因此串流路由以此工廠在產生內容時自行建立會話，讓會話存活到串流結束。
+
+    Returns:
+        async_sessionmaker: 非同步會話工廠
+    """
+    if AsyncSessionLocal is None or async_engine is None:
+        raise create_database_error("資料庫尚未初始化")
+    return AsyncSessionLocal
+
+
+def _is_sticky_to_primary(request: Request) -> bool:
+    """設定副本時，客戶端是否剛寫入（read-your-writes cookie 未過期）。"""
+    return replica_pool is not None and is_sticky_to_primary(
+        request.cookies.get(READ_PRIMARY_COOKIE)
+    )
+
+
+def _reads_primary(request: Request) -> bool:
+    """讀取是否使用主資料庫：沒有副本，或客戶端剛寫入（read-your-writes）。"""
+    return replica_pool is None or _is_sticky_to_primary(request)
+
+
+async def _open_read_session() -> AsyncSession:
+    """依輪流順序開啟第一個可連線副本的會話，都無法連線時使用主資料庫。
+
+    先借出連線確認副本可用（連線池中的連線直接借出，不送出任何 SQL），
+    無法連線的副本進入冷卻，改用下一個，讓這次讀取不因副本故障而失敗。
+    """
+    assert replica_pool is not None and AsyncSessionLocal is not None
+    for replica in replica_pool.candidates():
+        db = replica.session_factory()
+        try:
+            await db.connection()
+        except Exception as e:
+            await db.close()
+            replica_pool.mark_failed(replica, e)
+            continue
+        db.info[READ_FROM_REPLICA_KEY] = True
+        return db
+
+    logger.warning("沒有可用的唯讀副本，讀取改用主資料庫")
+    return AsyncSessionLocal()
+
+
+async def get_async_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """唯讀非同步資料庫會話依賴注入函式。
+
+    與 get_async_db 相同的生命週期與錯誤處理，但設定唯讀副本時，
+    會話輪流連到健康的副本；客戶端剛寫入時（read-your-writes cookie 未過期）使用主資料庫。
+    讀取來源記錄在 Session.info（READ_FROM_REPLICA_KEY、READ_YOUR_WRITES_KEY），
+    讀取快取不寫回副本查詢的內容，也不回應剛寫入的客戶端。只用於不寫入的 GET 路由。
+
+    Yields:
+        AsyncSession: 副本或主資料庫的非同步資料庫會話實例
+    """
+    if AsyncSessionLocal is None or async_engine is None:
+        raise create_database_error("資料庫尚未初始化")
+
+    if _reads_primary(request):
+        db = AsyncSessionLocal()
+        if _is_sticky_to_primary(request):
+            db.info[READ_YOUR_WRITES_KEY] = True
+    else:
+        db = await _open_read_session()
+    try:
+        yield db
+    except (APIError, HTTPException):
+        # APIError、HTTPException 類型直接向上傳遞，不要包裝
+        await db.rollback()
+        raise
+    except Exception as e:
+        # 其他異常包裝成 DatabaseError
+        logger.error(f"get_async_read_db() error: 資料庫操作錯誤 - {str(e)}")
+        await db.rollback()
+        raise create_database_error(f"資料庫會話建立失敗：{str(e)}")
+    finally:
+        await db.close()
+
+
+def get_async_read_session_factory(request: Request) -> async_sessionmaker:
+    """唯讀非同步會話工廠依賴注入函式。
+
+    供串流匯出使用；選擇規則與 get_async_read_db 相同，
+    但不預先借出連線：副本在讀取途中斷線時由引擎的錯誤事件進入冷卻。
+
+    Returns:
+        async_sessionmaker: 副本或主資料庫的非同步會話工廠
+    """
+    if AsyncSessionLocal is None or async_engine is None:
+        raise create_database_error("資料庫尚未初始化")
+
+    if not _reads_primary(request):
+        assert replica_pool is not None
+        candidates = replica_pool.candidates()
+        if candidates:
+            return candidates[0].session_factory
+    return AsyncSessionLocal
+
+
 @handle_generic_errors_sync("檢查資料庫連線")
 def check_db_connection() -> None:
     """檢查資料庫連線狀態。"""
@@ -170,3 +448,49 @@ def check_db_connection() -> None:
 
     with engine.connect() as conn:
         conn.execute(text("SELECT 1"))  # 執行簡單的查詢來測試連線
+
+
+def check_replica_connections() -> dict[str, bool]:
+    """檢查唯讀副本連線並更新健康狀態，讓冷卻中但已恢復的副本提前恢復使用。
+
+    Returns:
+        dict[str, bool]: 各副本是否可連線，沒有設定副本時為空字典
+    """
+    if replica_pool is None:
+        return {}
+    return replica_pool.check()
+
+
+def iter_pools() -> list[tuple[str, Pool]]:
+    """目前使用中的連線池（主資料庫同步、非同步與唯讀副本）與其名稱。"""
+    engines = []
+    if engine is not None:
+        engines.append(("primary", engine))
+    if async_engine is not None:
+        engines.append(("primary_async", async_engine.sync_engine))
+    if replica_pool is not None:
+        for index, replica in enumerate(replica_pool.replicas):
+            engines.append((f"replica_{index}", replica.engine))
+            engines.append((f"replica_{index}_async", replica.async_engine.sync_engine))
+    return [(name, bound.pool) for name, bound in engines]
+
+
+def _collect_pool_metrics() -> list[Gauge]:
+    """連線池狀態收集器：在輸出指標時才讀取，借出與歸還連線時沒有額外成本。
+
+    只有 QueuePool（MySQL）有容量與溢出的概念，SQLite 的連線池略過。
+    """
+    size = Gauge("db_pool_size", "連線池常駐連線數上限", ("pool",))
+    checked_out = Gauge("db_pool_checked_out", "目前借出的連線數", ("pool",))
+    overflow = Gauge("db_pool_overflow", "目前超出常駐連線數的溢出連線數", ("pool",))
+    for name, pool in iter_pools():
+        if not isinstance(pool, QueuePool):
+            continue
+        size.set(pool.size(), pool=name)
+        checked_out.set(pool.checkedout(), pool=name)
+        # QueuePool 的溢出計數從 -pool_size 開始，常駐連線建滿之前為負數
+        overflow.set(max(pool.overflow(), 0), pool=name)
+    return [size, checked_out, overflow]
+
+
+registry.register_collector(_collect_pool_metrics)
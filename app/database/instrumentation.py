@@ -0,0 +1,127 @@
+"""資料庫查詢統計模組。
+
+以 contextvars 記錄每個請求實際送到資料庫的往返次數與執行時間，
+用來量測連線設定、查詢合併等最佳化的效果；
+並提供記錄借出連線等待時間的連線池類別。
+"""
+
+# ===== 標準函式庫 =====
+from contextvars import ContextVar, Token
+from dataclasses import dataclass
+import logging
+import time
+from typing import Any
+
+# ===== 第三方套件 =====
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+# ===== 本地模組 =====
+from app.metrics import add_db_time, DB_POOL_CHECKOUT_WAIT
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class QueryStats:
+    """單一請求的資料庫查詢統計。"""
+
+    round_trips: int = 0  # 送出的 SQL 陳述式數量（每次 cursor.execute 算一次往返）
+    query_seconds: float = 0.0  # 執行 SQL 陳述式的總時間（秒）
+
+
+# 目前請求的統計物件：存放可變物件而非計數值，
+# 讓複製出去的 context（執行緒池、run_sync 的 greenlet）累加到同一份統計
+_current_query_stats: ContextVar[QueryStats | None] = ContextVar(
+    "current_query_stats", default=None
+)
+
+
+def start_query_stats() -> tuple[QueryStats, Token]:
+    """開始記錄目前 context 的查詢統計。
+
+    Returns:
+        tuple[QueryStats, Token]: 統計物件，以及結束時用來還原 context 的 token
+    """
+    stats = QueryStats()
+    token = _current_query_stats.set(stats)
+    return stats, token
+
+
+def stop_query_stats(token: Token) -> None:
+    """結束記錄，還原成開始記錄前的狀態。"""
+    _current_query_stats.reset(token)
+
+
+def get_query_stats() -> QueryStats | None:
+    """取得目前 context 的查詢統計，未開始記錄時回傳 None。"""
+    return _current_query_stats.get()
+
+
+@event.listens_for(Engine, "before_cursor_execute")
+def _count_round_trip(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """每次送出 SQL 前累加往返次數（掛在 Engine 類別上，同步與非同步引擎皆適用）。"""
+    stats = _current_query_stats.get()
+    if stats is not None:
+        stats.round_trips += 1
+        # 開始時間記在這次執行的 context 上，失敗的陳述式不會留下殘留的狀態
+        if context is not None:
+            context._query_stats_started = time.perf_counter()
+
+
+@event.listens_for(Engine, "after_cursor_execute")
+def _accumulate_query_time(
+    conn: Any,
+    cursor: Any,
+    statement: str,
+    parameters: Any,
+    context: Any,
+    executemany: bool,
+) -> None:
+    """SQL 執行完成後累加執行時間，只在記錄統計時計時。
+
+    服務層呼叫中的執行時間同時累加到請求時間分解，從服務層時間中扣除。
+    """
+    started = getattr(context, "_query_stats_started", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+    stats = _current_query_stats.get()
+    if stats is not None:
+        stats.query_seconds += elapsed
+    add_db_time(elapsed)
+
+
+class _TimedCheckoutMixin:
+    """借出連線時記錄等待時間，以連線池的 logging_name（pool_logging_name）分組。
+
+    _do_get 是 QueuePool 借出連線的實作：連線池已滿時在此排隊，沒有閒置連線時在此建立新連線。
+    """
+
+    logging_name: str | None
+
+    def _do_get(self) -> Any:
+        started = time.perf_counter()
+        try:
+            return super()._do_get()  # type: ignore[misc]
+        finally:
+            DB_POOL_CHECKOUT_WAIT.observe(
+                time.perf_counter() - started, pool=self.logging_name or "default"
+            )
+
+
+class TimedQueuePool(_TimedCheckoutMixin, QueuePool):
+    """記錄借出連線等待時間的 QueuePool（同步引擎）。"""
+
+
+class TimedAsyncQueuePool(_TimedCheckoutMixin, AsyncAdaptedQueuePool):
+    """記錄借出連線等待時間的 AsyncAdaptedQueuePool（非同步引擎）。"""
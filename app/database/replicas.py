@@ -0,0 +1,167 @@
+"""唯讀副本路由模組。
+
+GET 時段與健康檢查的讀取改送到唯讀副本，分散主資料庫的讀取負載：
+- 輪流（round-robin）選擇副本，讀取量平均分散
+- 副本連線失敗或斷線時暫停使用一段冷卻時間，讀取改由其他副本或主資料庫回應；
+  冷卻結束或健康檢查成功後恢復
+- 客戶端寫入成功後，以 cookie 記錄一小段時間改讀主資料庫（read-your-writes），
+  避免在副本複寫延遲期間讀到自己寫入前的資料；cookie 由客戶端帶回，多個 worker 之間不必共享狀態
+"""
+
+# ===== 標準函式庫 =====
+from dataclasses import dataclass
+import logging
+import math
+import threading
+import time
+from typing import Any, Callable
+
+# ===== 第三方套件 =====
+from sqlalchemy import make_url, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncEngine
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+# 寫入後改讀主資料庫的 cookie：值為到期時間（Unix 秒）
+READ_PRIMARY_COOKIE = "read_primary_until"
+
+# Session.info 中標記讀取來源的鍵，讀取快取依此決定是否使用、寫回快取
+READ_FROM_REPLICA_KEY = "read_from_replica"  # 會話連到副本，內容可能落後主資料庫
+READ_YOUR_WRITES_KEY = "read_your_writes"  # 客戶端剛寫入，會話改用主資料庫
+
+# 同步驅動對應的非同步驅動
+_ASYNC_DRIVERS = {
+    "mysql+pymysql": "mysql+aiomysql",
+    "sqlite": "sqlite+aiosqlite",
+}
+
+
+def to_async_url(url: str) -> str:
+    """將同步連線字串轉換成對應非同步驅動的連線字串。"""
+    parsed = make_url(url)
+    driver = _ASYNC_DRIVERS.get(parsed.drivername, parsed.drivername)
+    return parsed.set(drivername=driver).render_as_string(hide_password=False)
+
+
+def mask_url(url: str) -> str:
+    """隱藏密碼的連線字串，用於日誌。"""
+    return make_url(url).render_as_string(hide_password=True)
+
+
+@dataclass(eq=False)
+class Replica:
+    """單一唯讀副本：同步引擎用於健康檢查，非同步會話工廠用於讀取。"""
+
+    name: str  # 隱藏密碼的連線字串
+    engine: Engine
+    async_engine: AsyncEngine
+    session_factory: async_sessionmaker
+    failed_until: float = 0.0  # 冷卻結束時間（clock 的時間），0 表示健康
+
+
+class ReplicaPool:
+    """唯讀副本池：輪流選擇健康的副本，失敗的副本在冷卻期間內略過。"""
+
+    def __init__(
+        self,
+        replicas: list[Replica],
+        failure_cooldown_seconds: float,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """初始化副本池。
+
+        Args:
+            replicas: 唯讀副本
+            failure_cooldown_seconds: 副本失敗後暫停使用的秒數
+            clock: 時間來源，測試時可替換
+        """
+        self.replicas = replicas
+        self.failure_cooldown_seconds = failure_cooldown_seconds
+        self._clock = clock
+        self._cursor = 0
+        # 健康檢查在執行緒池中執行，與事件迴圈上的請求共用游標與狀態
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.replicas)
+
+    def candidates(self) -> list[Replica]:
+        """依輪流順序排列目前可用的副本，冷卻中的副本排除。
+
+        每次呼叫起點往後移一個，連續的讀取平均分散到各副本；
+        第一個副本無法連線時，呼叫端依序改用下一個。
+        """
+        now = self._clock()
+        with self._lock:
+            start = self._cursor
+            self._cursor = (self._cursor + 1) % len(self.replicas)
+        ordered = self.replicas[start:] + self.replicas[:start]
+        return [replica for replica in ordered if replica.failed_until <= now]
+
+    def mark_failed(self, replica: Replica, reason: Any = None) -> None:
+        """將副本標記為失敗，冷卻期間內不再選擇。"""
+        with self._lock:
+            replica.failed_until = self._clock() + self.failure_cooldown_seconds
+        logger.warning(
+            f"唯讀副本暫停使用 {self.failure_cooldown_seconds} 秒: "
+            f"{replica.name}, 原因={reason}"
+        )
+
+    def mark_healthy(self, replica: Replica) -> None:
+        """將副本恢復為健康。"""
+        with self._lock:
+            recovered = replica.failed_until > 0
+            replica.failed_until = 0.0
+        if recovered:
+            logger.info(f"唯讀副本恢復使用: {replica.name}")
+
+    def on_engine_error(self, replica: Replica, context: Any) -> None:
+        """引擎 handle_error 事件：斷線錯誤時將副本標記為失敗，之後的讀取改用其他副本。"""
+        if context.is_disconnect:
+            self.mark_failed(replica, context.original_exception)
+
+    def check(self) -> dict[str, bool]:
+        """逐一檢查副本連線並更新健康狀態（包含冷卻中的副本）。
+
+        Returns:
+            dict[str, bool]: 各副本（隱藏密碼的連線字串）是否可連線
+        """
+        statuses = {}
+        for replica in self.replicas:
+            try:
+                with replica.engine.connect() as conn:
+                    conn.execute(text("SELECT 1"))
+            except Exception as e:
+                self.mark_failed(replica, e)
+                statuses[replica.name] = False
+            else:
+                self.mark_healthy(replica)
+                statuses[replica.name] = True
+        return statuses
+
+
+def read_primary_cookie(sticky_seconds: float, now: float | None = None) -> str:
+    """寫入後改讀主資料庫的 Set-Cookie 標頭值。"""
+    now = time.time() if now is None else now
+    max_age = math.ceil(sticky_seconds)
+    return (
+        f"{READ_PRIMARY_COOKIE}={math.ceil(now + sticky_seconds)}; "
+        f"Max-Age={max_age}; Path=/; HttpOnly; SameSite=Lax"
+    )
+
+
+def is_sticky_to_primary(cookie: str | None, now: float | None = None) -> bool:
+    """客戶端是否在寫入後的期間內，需改讀主資料庫。
+
+    除了依賴 Max-Age 讓客戶端丟棄 cookie，也比對 cookie 中的到期時間，
+    不處理 Max-Age 的客戶端不會一直被導向主資料庫。
+    """
+    if not cookie:
+        return False
+    try:
+        until = float(cookie)
+    except ValueError:
+        return False
+    return until > (time.time() if now is None else now)
@@ -1,6 +1,6 @@
 """裝飾器模組。
 
-提供各種裝飾器功能，包括錯誤處理、日誌記錄等。
+提供各種裝飾器功能，包括錯誤處理、日誌記錄、阻塞呼叫卸載等。
 """
 
 # ===== 本地模組 =====
@@ -10,6 +10,10 @@ from .error_handlers import (
     handle_generic_errors_sync,
     handle_service_errors_sync,
 )
+from .executor import (
+    blocking_executor,
+    BlockingCallExecutor,
+)
 from .logging import (
     log_operation,
 )
@@ -22,4 +26,7 @@ __all__ = [
     "handle_service_errors_sync",
     # 日誌記錄裝飾器
     "log_operation",
+    # 阻塞呼叫卸載
+    "BlockingCallExecutor",
+    "blocking_executor",
 ]
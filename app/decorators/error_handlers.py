@@ -13,6 +13,7 @@ from fastapi import HTTPException
 
 # ===== 本地模組 =====
 from app.errors.exceptions import APIError, DatabaseError
+from app.metrics import mark_handler_finished
 
 # 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
 logger = logging.getLogger(__name__)
@@ -33,6 +34,9 @@ def handle_api_errors_async() -> Callable:
             except Exception as e:
                 logger.error(f"API 端點發生未預期錯誤: {str(e)}", exc_info=True)
                 raise HTTPException(status_code=500, detail="內部伺服器錯誤")
+            finally:
+                # 之後到回應送出前的時間為序列化（Server-Timing）
+                mark_handler_finished()
 
         return wrapper
 
@@ -0,0 +1,193 @@
+"""阻塞呼叫執行緒池模組。
+
+提供有界的執行緒池，讓 async def 路由把同步的資料庫、服務層呼叫移出事件迴圈執行。
+"""
+
+# ===== 標準函式庫 =====
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+from functools import partial
+import logging
+import threading
+import time
+from typing import Any, Callable
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.errors.handlers import create_service_unavailable_error
+from app.metrics import BLOCKING_CALL_WAIT, Counter, Gauge, Metric, registry
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+class BlockingCallExecutor:
+    """有界的阻塞呼叫執行緒池。
+
+    - 執行緒數與資料庫連線池容量一致：多出來的執行緒只會卡在等連線，沒有幫助
+    - 等待佇列有上限：佇列已滿時立即拋出 503，讓流量突增變成有秩序的排隊與快速失敗，
+      而不是讓事件迴圈停頓或請求無限堆積
+    - 記錄佇列深度、等待時間等統計，供監控使用
+    """
+
+    def __init__(
+        self,
+        max_workers: int,
+        max_queue: int,
+        thread_name_prefix: str = "blocking-call",
+    ) -> None:
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.thread_name_prefix = thread_name_prefix
+        self._executor: ThreadPoolExecutor | None = None
+        self._lock = threading.Lock()
+
+        # 統計資料：由事件迴圈與工作執行緒共同更新，一律在 _lock 內讀寫
+        self._pending = 0  # 已提交、尚未完成（含執行中）的呼叫數
+        self._running = 0  # 執行中的呼叫數
+        self._submitted_total = 0
+        self._completed_total = 0
+        self._rejected_total = 0
+        self._wait_seconds_total = 0.0
+        self._wait_seconds_max = 0.0
+
+    @property
+    def capacity(self) -> int:
+        """同時可接受的呼叫數上限（執行中 + 排隊中）。"""
+        return self.max_workers + self.max_queue
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """延遲建立執行緒池，避免匯入模組時就啟動執行緒。"""
+        if self._executor is None:
+            with self._lock:
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=self.max_workers,
+                        thread_name_prefix=self.thread_name_prefix,
+                    )
+        return self._executor
+
+    def _acquire_slot(self) -> None:
+        """佔用一個名額，已滿時立即拋出服務不可用錯誤。"""
+        with self._lock:
+            if self._pending >= self.capacity:
+                self._rejected_total += 1
+                logger.warning(
+                    f"阻塞呼叫佇列已滿: pending={self._pending}, capacity={self.capacity}"
+                )
+                raise create_service_unavailable_error("系統忙碌中，請稍後再試")
+            self._pending += 1
+            self._submitted_total += 1
+
+    def _release_slot(self, future: Future) -> None:
+        """呼叫完成或被取消時釋放名額。"""
+        with self._lock:
+            self._pending -= 1
+            if not future.cancelled():
+                self._completed_total += 1
+
+    def _call(
+        self,
+        submitted_at: float,
+        context: contextvars.Context,
+        func: Callable[..., Any],
+    ) -> Any:
+        """在工作執行緒中執行呼叫，並記錄排隊等待時間。"""
+        wait_seconds = time.perf_counter() - submitted_at
+        with self._lock:
+            self._running += 1
+            self._wait_seconds_total += wait_seconds
+            self._wait_seconds_max = max(self._wait_seconds_max, wait_seconds)
+        BLOCKING_CALL_WAIT.observe(wait_seconds, executor=self.thread_name_prefix)
+
+        try:
+            # 在呼叫端的 contextvars 中執行，保留請求層級的上下文
+            return context.run(func)
+        finally:
+            with self._lock:
+                self._running -= 1
+
+    async def run(self, func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """在執行緒池中執行同步函式，並等待結果。
+
+        Raises:
+            ServiceUnavailableError: 執行中與排隊中的呼叫已達上限
+        """
+        self._acquire_slot()
+
+        try:
+            future = self._get_executor().submit(
+                self._call,
+                time.perf_counter(),
+                contextvars.copy_context(),
+                partial(func, *args, **kwargs),
+            )
+        except Exception:
+            with self._lock:
+                self._pending -= 1
+            raise
+
+        future.add_done_callback(self._release_slot)
+        return await asyncio.wrap_future(future)
+
+    def get_stats(self) -> dict[str, Any]:
+        """取得執行緒池統計資料。"""
+        with self._lock:
+            started = self._completed_total + self._running
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "running": self._running,
+                "queue_depth": self._pending - self._running,
+                "submitted_total": self._submitted_total,
+                "completed_total": self._completed_total,
+                "rejected_total": self._rejected_total,
+                "wait_seconds_avg": (
+                    self._wait_seconds_total / started if started else 0.0
+                ),
+                "wait_seconds_max": self._wait_seconds_max,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """關閉執行緒池。"""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+
+# 全域阻塞呼叫執行緒池：大小與資料庫連線池容量一致
+blocking_executor = BlockingCallExecutor(
+    max_workers=settings.blocking_executor_workers,
+    max_queue=settings.blocking_executor_max_queue,
+)
+
+
+def _collect_executor_metrics() -> list[Metric]:
+    """執行緒池狀態收集器：在輸出指標時才讀取統計資料，提交與完成呼叫時沒有額外成本。"""
+    stats = blocking_executor.get_stats()
+    labels = {"executor": blocking_executor.thread_name_prefix}
+
+    capacity = Gauge(
+        "blocking_executor_capacity",
+        "執行緒池同時可接受的呼叫數上限（執行中 + 排隊中）",
+        ("executor",),
+    )
+    running = Gauge("blocking_executor_running", "執行中的阻塞呼叫數", ("executor",))
+    queue_depth = Gauge(
+        "blocking_executor_queue_depth", "排隊等待執行緒的阻塞呼叫數", ("executor",)
+    )
+    rejected = Counter(
+        "blocking_executor_rejected_total",
+        "佇列已滿而拒絕（503）的呼叫數",
+        ("executor",),
+    )
+    capacity.set(blocking_executor.capacity, **labels)
+    running.set(stats["running"], **labels)
+    queue_depth.set(stats["queue_depth"], **labels)
+    rejected.inc(stats["rejected_total"], **labels)
+    return [capacity, running, queue_depth, rejected]
+
+
+registry.register_collector(_collect_executor_metrics)
@@ -8,6 +8,9 @@ from functools import wraps
 import logging
 from typing import Any, Callable
 
+# ===== 本地模組 =====
+from app.metrics import time_service
+
 # 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
 logger = logging.getLogger(__name__)
 
@@ -15,7 +18,7 @@ logger = logging.getLogger(__name__)
 def log_operation(operation_name: str) -> Callable:
     """操作日誌裝飾器。
 
-    記錄操作的開始、成功和失敗狀態。
+    記錄操作的開始、成功和失敗狀態，並將執行時間計入請求的服務層時間（Server-Timing）。
     """
 
     def decorator(func: Callable) -> Callable:
@@ -24,7 +27,8 @@ def log_operation(operation_name: str) -> Callable:
             logger.info(f"開始{operation_name}")
 
             try:
-                result = func(*args, **kwargs)
+                with time_service():
+                    result = func(*args, **kwargs)
                 logger.info(f"{operation_name}成功")
                 return result
             except Exception as e:
@@ -6,13 +6,14 @@
 """
 
 # ===== 本地模組 =====
-from .models import ScheduleStatusEnum, UserRoleEnum
+from .models import RecurrenceFrequencyEnum, ScheduleStatusEnum, UserRoleEnum
 from .operations import OperationContext
 
 __all__ = [
     # 模型相關
     "UserRoleEnum",
     "ScheduleStatusEnum",
+    "RecurrenceFrequencyEnum",
     # 操作相關
     "OperationContext",
 ]
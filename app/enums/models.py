@@ -25,3 +25,10 @@ class ScheduleStatusEnum(str, Enum):
     REJECTED = "REJECTED"
     CANCELLED = "CANCELLED"
     COMPLETED = "COMPLETED"
+
+
+class RecurrenceFrequencyEnum(str, Enum):
+    """週期規則頻率 ENUM"""
+
+    DAILY = "DAILY"
+    WEEKLY = "WEEKLY"
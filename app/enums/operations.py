@@ -24,3 +24,4 @@ class DeletionResult(str, Enum):
     ALREADY_DELETED = "已經刪除"
     NOT_FOUND = "時段不存在"
     CANNOT_DELETE = "無法刪除"
+    VERSION_MISMATCH = "版本不符"
@@ -17,9 +17,12 @@ from .exceptions import (
     BusinessLogicError,
     ConflictError,
     DatabaseError,
+    NotAcceptableError,
+    RecurrenceRuleNotFoundError,
     ScheduleCannotBeDeletedError,
     ScheduleNotFoundError,
     ScheduleOverlapError,
+    SchedulePreconditionFailedError,
     ServiceUnavailableError,
     UserNotFoundError,
     ValidationError,
@@ -32,9 +35,12 @@ from .handlers import (
     create_business_logic_error,
     create_conflict_error,
     create_database_error,
+    create_not_acceptable_error,
+    create_recurrence_rule_not_found_error,
     create_schedule_cannot_be_deleted_error,
     create_schedule_not_found_error,
     create_schedule_overlap_error,
+    create_schedule_precondition_failed_error,
     create_service_unavailable_error,
     create_user_not_found_error,
     create_validation_error,
@@ -57,6 +63,7 @@ __all__ = [
     "BadRequestError",
     "AuthenticationError",
     "AuthorizationError",
+    "NotAcceptableError",
     "ValidationError",
     # Service 層級
     "BusinessLogicError",
@@ -65,6 +72,8 @@ __all__ = [
     "ConflictError",
     "ScheduleCannotBeDeletedError",
     "ScheduleOverlapError",
+    "SchedulePreconditionFailedError",
+    "RecurrenceRuleNotFoundError",
     # System 層級
     "ServiceUnavailableError",
     # ===== 錯誤格式化 =====
@@ -76,6 +85,7 @@ __all__ = [
     "create_bad_request_error",
     "create_authentication_error",
     "create_authorization_error",
+    "create_not_acceptable_error",
     "create_validation_error",
     # Service 層級
     "create_business_logic_error",
@@ -85,6 +95,8 @@ __all__ = [
     "get_deletion_explanation",  # 解釋刪除時段的原因
     "create_schedule_cannot_be_deleted_error",
     "create_schedule_overlap_error",
+    "create_schedule_precondition_failed_error",
+    "create_recurrence_rule_not_found_error",
     # System 層級
     "create_service_unavailable_error",
 ]
@@ -22,5 +22,8 @@ class RouterErrorCode:
     ENDPOINT_NOT_FOUND = "ROUTER_ENDPOINT_NOT_FOUND"  # 404 - API 端點不存在
     SCHEDULE_NOT_FOUND = "ROUTER_SCHEDULE_NOT_FOUND"  # 404 - 時段不存在
 
+    # 406 Not Acceptable - 路由層內容協商錯誤
+    NOT_ACCEPTABLE = "ROUTER_NOT_ACCEPTABLE"  # 406 - 不支援 Accept 要求的回應格式
+
     # 422 Unprocessable Entity - 路由層驗證錯誤
     VALIDATION_ERROR = "ROUTER_VALIDATION_ERROR"  # 422 - 路由層資料驗證失敗
@@ -15,9 +15,17 @@ class ServiceErrorCode:
     # 404 Not Found - 服務層資源錯誤
     USER_NOT_FOUND = "SERVICE_USER_NOT_FOUND"  # 404 - 使用者不存在
     SCHEDULE_NOT_FOUND = "SERVICE_SCHEDULE_NOT_FOUND"  # 404 - 時段不存在
+    RECURRENCE_RULE_NOT_FOUND = (
+        "SERVICE_RECURRENCE_RULE_NOT_FOUND"  # 404 - 週期規則不存在
+    )
 
     # 409 Conflict - 服務層衝突錯誤
     CONFLICT = "SERVICE_CONFLICT"  # 409 - 業務邏輯衝突（如重複 email）
     SCHEDULE_CANNOT_BE_DELETED = (
         "SERVICE_SCHEDULE_CANNOT_BE_DELETED"  # 409 - 時段無法刪除
     )
+
+    # 412 Precondition Failed - 服務層前置條件錯誤
+    SCHEDULE_VERSION_MISMATCH = (
+        "SERVICE_SCHEDULE_VERSION_MISMATCH"  # 412 - 時段版本不符（If-Match）
+    )
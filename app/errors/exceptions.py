@@ -99,6 +99,22 @@ class AuthorizationError(APIError):
         )
 
 
+class NotAcceptableError(APIError):
+    """內容協商錯誤：無法提供 Accept 標頭接受的回應格式。"""
+
+    def __init__(
+        self,
+        message: str,
+        details: dict[str, Any] | None = None,
+    ):
+        super().__init__(
+            message=message,
+            error_code=RouterErrorCode.NOT_ACCEPTABLE,
+            status_code=status.HTTP_406_NOT_ACCEPTABLE,
+            details=details,
+        )
+
+
 class ValidationError(APIError):
     """資料驗證錯誤。"""
 
@@ -149,6 +165,23 @@ class ScheduleNotFoundError(APIError):
         )
 
 
+class RecurrenceRuleNotFoundError(APIError):
+    """週期規則不存在錯誤。"""
+
+    def __init__(
+        self,
+        rule_id: int | str,
+        details: dict[str, Any] | None = None,
+    ):
+        message = f"週期規則不存在: ID={rule_id}"
+        super().__init__(
+            message=message,
+            error_code=ServiceErrorCode.RECURRENCE_RULE_NOT_FOUND,
+            status_code=status.HTTP_404_NOT_FOUND,
+            details=details,
+        )
+
+
 class UserNotFoundError(APIError):
     """使用者不存在錯誤。"""
 
@@ -215,6 +248,23 @@ class ScheduleOverlapError(APIError):
         )
 
 
+class SchedulePreconditionFailedError(APIError):
+    """時段版本不符錯誤：If-Match 的版本與目前版本不同。"""
+
+    def __init__(
+        self,
+        schedule_id: int | str,
+        details: dict[str, Any] | None = None,
+    ):
+        message = f"時段已被其他請求修改: ID={schedule_id}"
+        super().__init__(
+            message=message,
+            error_code=ServiceErrorCode.SCHEDULE_VERSION_MISMATCH,
+            status_code=status.HTTP_412_PRECONDITION_FAILED,
+            details=details,
+        )
+
+
 # ===== System 層級 =====
 class ServiceUnavailableError(APIError):
     """服務不可用錯誤。"""
@@ -11,9 +11,12 @@ from app.errors.exceptions import (  # CRUD 層級; Router 層級; Service 層
     BusinessLogicError,
     ConflictError,
     DatabaseError,
+    NotAcceptableError,
+    RecurrenceRuleNotFoundError,
     ScheduleCannotBeDeletedError,
     ScheduleNotFoundError,
     ScheduleOverlapError,
+    SchedulePreconditionFailedError,
     ServiceUnavailableError,
     UserNotFoundError,
     ValidationError,
@@ -42,6 +45,14 @@ def create_authorization_error(message: str) -> AuthorizationError:
     return AuthorizationError(message)
 
 
+def create_not_acceptable_error(
+    message: str, available: list[str] | None = None
+) -> NotAcceptableError:
+    """建立內容協商錯誤，details 列出可提供的媒體類型。"""
+    details = {"available": available} if available else None
+    return NotAcceptableError(message, details=details)
+
+
 def create_validation_error(message: str) -> ValidationError:
     """建立資料驗證錯誤。"""
     return ValidationError(message)
@@ -58,6 +69,13 @@ def create_schedule_not_found_error(schedule_id: int | str) -> ScheduleNotFoundE
     return ScheduleNotFoundError(schedule_id)
 
 
+def create_recurrence_rule_not_found_error(
+    rule_id: int | str,
+) -> RecurrenceRuleNotFoundError:
+    """建立週期規則不存在錯誤。"""
+    return RecurrenceRuleNotFoundError(rule_id)
+
+
 def create_user_not_found_error(user_id: int | str) -> UserNotFoundError:
     """建立使用者不存在錯誤。"""
     return UserNotFoundError(user_id)
@@ -113,6 +131,20 @@ def create_schedule_overlap_error(
     return ScheduleOverlapError(message, details=details)
 
 
+def create_schedule_precondition_failed_error(
+    schedule_id: int | str,
+    expected_version: int | None = None,
+    current_version: int | None = None,
+) -> SchedulePreconditionFailedError:
+    """建立時段版本不符錯誤。"""
+    details = {}
+    if expected_version is not None:
+        details["expected_version"] = expected_version
+    if current_version is not None:
+        details["current_version"] = current_version
+    return SchedulePreconditionFailedError(schedule_id, details=details)
+
+
 # ===== System 層級錯誤 =====
 def create_service_unavailable_error(message: str) -> ServiceUnavailableError:
     """建立服務不可用錯誤。"""
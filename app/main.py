@@ -8,6 +8,10 @@ from app.core import settings
 from app.factory import create_app, create_static_files, create_templates
 from app.middleware.cors import log_app_startup, setup_cors_middleware
 from app.middleware.error_handler import setup_error_handlers
+from app.middleware.metrics import setup_metrics_middleware
+from app.middleware.query_stats import setup_query_stats_middleware
+from app.middleware.read_your_writes import setup_read_your_writes_middleware
+from app.middleware.server_timing import setup_server_timing_middleware
 from app.routers import health_router, main_router  # api_router
 
 # ===== 應用程式初始化 =====
@@ -23,6 +27,18 @@ setup_cors_middleware(app)
 # 錯誤處理器設定
 setup_error_handlers(app)
 
+# Server-Timing 中間件設定（啟用時；在查詢統計內層，才能讀取資料庫時間）
+setup_server_timing_middleware(app)
+
+# 資料庫查詢統計中間件設定
+setup_query_stats_middleware(app)
+
+# 寫入後讀取主資料庫中間件設定（設定唯讀副本時）
+setup_read_your_writes_middleware(app)
+
+# HTTP 請求指標中間件設定（最外層，處理時間包含其他中間件）
+setup_metrics_middleware(app)
+
 # ===== 應用程式狀態設定 =====
 # 建立模板引擎實例
 templates = create_templates(settings)
@@ -0,0 +1,67 @@
+"""指標模組。
+
+提供 Prometheus 文字格式的指標：
+- Counter、Gauge、Histogram 與登錄表
+- 應用程式的請求、資料庫與業務指標定義
+- 單一請求的時間分解（Server-Timing）
+"""
+
+# ===== 本地模組 =====
+from .definitions import (
+    BLOCKING_CALL_WAIT,
+    DB_POOL_CHECKOUT_WAIT,
+    DB_QUERIES_PER_REQUEST,
+    DB_QUERY_DURATION_PER_REQUEST,
+    HTTP_REQUEST_DURATION,
+    HTTP_REQUESTS_IN_PROGRESS,
+    SCHEDULE_OVERLAP_REJECTIONS,
+)
+from .registry import (
+    CONTENT_TYPE,
+    Counter,
+    Gauge,
+    Histogram,
+    Metric,
+    MetricsRegistry,
+    registry,
+)
+from .request_timing import (
+    add_db_time,
+    format_server_timing,
+    get_request_timing,
+    mark_handler_finished,
+    RequestTiming,
+    start_request_timing,
+    stop_request_timing,
+    time_service,
+    timing_breakdown,
+)
+
+__all__ = [
+    # 指標與登錄表
+    "CONTENT_TYPE",
+    "Metric",
+    "Counter",
+    "Gauge",
+    "Histogram",
+    "MetricsRegistry",
+    "registry",
+    # 指標定義
+    "HTTP_REQUEST_DURATION",
+    "HTTP_REQUESTS_IN_PROGRESS",
+    "DB_QUERIES_PER_REQUEST",
+    "DB_QUERY_DURATION_PER_REQUEST",
+    "DB_POOL_CHECKOUT_WAIT",
+    "BLOCKING_CALL_WAIT",
+    "SCHEDULE_OVERLAP_REJECTIONS",
+    # 請求時間分解
+    "RequestTiming",
+    "start_request_timing",
+    "stop_request_timing",
+    "get_request_timing",
+    "time_service",
+    "add_db_time",
+    "mark_handler_finished",
+    "timing_breakdown",
+    "format_server_timing",
+]
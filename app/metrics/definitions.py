@@ -0,0 +1,55 @@
+"""應用程式的指標定義。
+
+請求、資料庫與業務指標集中定義於此，由中間件、連線池與服務層記錄，/metrics 端點輸出。
+連線池目前的狀態（借出、溢出）由 app.database.connection 的收集器在輸出時計算，
+阻塞呼叫執行緒池的佇列深度由 app.decorators.executor 的收集器在輸出時計算。
+"""
+
+# ===== 本地模組 =====
+from .registry import registry
+
+# ===== HTTP 請求 =====
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP 請求處理時間（秒），依路由樣板與狀態碼分組",
+    ("method", "route", "status"),
+)
+HTTP_REQUESTS_IN_PROGRESS = registry.gauge(
+    "http_requests_in_progress",
+    "處理中的 HTTP 請求數",
+    ("method",),
+)
+
+# ===== 資料庫 =====
+DB_QUERIES_PER_REQUEST = registry.histogram(
+    "db_queries_per_request",
+    "每個請求送到資料庫的 SQL 陳述式數量",
+    ("route",),
+    buckets=(0, 1, 2, 3, 5, 8, 13, 21, 34, 55, 89),
+)
+DB_QUERY_DURATION_PER_REQUEST = registry.histogram(
+    "db_query_duration_seconds_per_request",
+    "每個請求執行 SQL 陳述式的總時間（秒）",
+    ("route",),
+)
+DB_POOL_CHECKOUT_WAIT = registry.histogram(
+    "db_pool_checkout_wait_seconds",
+    "從連線池借出連線的等待時間（秒），包含連線池已滿時的排隊與建立新連線",
+    ("pool",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+# ===== 阻塞呼叫執行緒池 =====
+BLOCKING_CALL_WAIT = registry.histogram(
+    "blocking_executor_wait_seconds",
+    "阻塞呼叫在執行緒池佇列中等待的時間（秒），依執行緒池分組",
+    ("executor",),
+    buckets=(0.0005, 0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+# ===== 業務 =====
+SCHEDULE_OVERLAP_REJECTIONS = registry.counter(
+    "schedule_overlap_rejections_total",
+    "因時段重疊而拒絕的寫入次數，依操作分組",
+    ("operation",),
+)
@@ -0,0 +1,234 @@
+"""Prometheus 文字格式的指標模組。
+
+只需要 Counter、Gauge、Histogram 三種指標與文字格式輸出，不另外依賴 prometheus_client：
+- 熱路徑上每次記錄只做一次字典查詢與加法，以鎖保護，執行緒池中的同步呼叫也能安全累加
+- Histogram 只累加落入的單一桶，輸出時才轉成 Prometheus 的累積桶
+- 收集器（collector）在每次輸出時才計算，例如連線池狀態，平時沒有任何成本
+"""
+
+# ===== 標準函式庫 =====
+from bisect import bisect_left
+import math
+import threading
+from typing import Callable, Iterable, Sequence
+
+# Prometheus 文字格式的 Content-Type
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# 預設的延遲分桶（秒）
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = tuple[str, ...]
+
+
+def _format_value(value: float) -> str:
+    """格式化數值：整數不帶小數點，無限大為 +Inf。"""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: str) -> str:
+    """跳脫標籤值中的反斜線、雙引號與換行。"""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str]) -> str:
+    """格式化標籤，例如 {method="GET",status="200"}；沒有標籤時為空字串。"""
+    if not names:
+        return ""
+    pairs = ",".join(f'{n}="{_escape(v)}"' for n, v in zip(names, values))
+    return "{" + pairs + "}"
+
+
+class Metric:
+    """指標基底類別：名稱、說明、標籤名稱，以及保護數值的鎖。"""
+
+    type_name = "untyped"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: dict[str, object]) -> LabelValues:
+        """依標籤名稱順序取出標籤值；缺少或多出標籤時拋出 ValueError。"""
+        if labels.keys() != set(self.labelnames):
+            raise ValueError(
+                f"指標 {self.name} 的標籤必須是 {self.labelnames}，收到 {tuple(labels)}"
+            )
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        """(名稱後綴, 格式化後的標籤, 數值)。"""
+        raise NotImplementedError
+
+    def render(self) -> list[str]:
+        """輸出 Prometheus 文字格式的行。"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.type_name}",
+        ]
+        lines.extend(
+            f"{self.name}{suffix}{labels} {_format_value(value)}"
+            for suffix, labels, value in self.samples()
+        )
+        return lines
+
+
+class Counter(Metric):
+    """只增不減的計數器。"""
+
+    type_name = "counter"
+
+    def __init__(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: object) -> None:
+        """增加計數。"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, **labels: object) -> float:
+        """目前的計數（測試與除錯用）。"""
+        return self._values.get(self._key(labels), 0.0)
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            yield "", _format_labels(self.labelnames, key), value
+
+
+class Gauge(Counter):
+    """可增可減、也可直接設定的量測值。"""
+
+    type_name = "gauge"
+
+    def dec(self, amount: float = 1.0, **labels: object) -> None:
+        """減少數值。"""
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: object) -> None:
+        """設定數值。"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+
+class Histogram(Metric):
+    """分桶統計：各桶的次數、總和與次數。"""
+
+    type_name = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> None:
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 每組標籤：[各桶次數（最後一個為 +Inf）, 總和]
+        self._values: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: object) -> None:
+        """記錄一次觀測值，只累加落入的那一個桶。"""
+        key = self._key(labels)
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def count(self, **labels: object) -> int:
+        """觀測次數（測試與除錯用）。"""
+        entry = self._values.get(self._key(labels))
+        return sum(entry[0]) if entry else 0
+
+    def samples(self) -> Iterable[tuple[str, str, float]]:
+        with self._lock:
+            items = sorted(
+                (key, list(counts), total[0])
+                for key, (counts, total) in self._values.items()
+            )
+        bounds = [*self.buckets, math.inf]
+        names = (*self.labelnames, "le")
+        for key, counts, total in items:
+            cumulative = 0
+            for bound, count in zip(bounds, counts):
+                cumulative += count
+                labels = _format_labels(names, (*key, _format_value(bound)))
+                yield "_bucket", labels, cumulative
+            labels = _format_labels(self.labelnames, key)
+            yield "_sum", labels, total
+            yield "_count", labels, cumulative
+
+
+class MetricsRegistry:
+    """指標登錄表：輸出所有指標，以及收集器在輸出時才計算的指標。"""
+
+    def __init__(self) -> None:
+        self._metrics: list[Metric] = []
+        self._collectors: list[Callable[[], Iterable[Metric]]] = []
+
+    def register(self, metric: Metric) -> Metric:
+        """登錄指標。"""
+        self._metrics.append(metric)
+        return metric
+
+    def counter(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Counter:
+        """建立並登錄計數器。"""
+        metric = Counter(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def gauge(
+        self, name: str, documentation: str, labelnames: Sequence[str] = ()
+    ) -> Gauge:
+        """建立並登錄量測值。"""
+        metric = Gauge(name, documentation, labelnames)
+        self.register(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ) -> Histogram:
+        """建立並登錄分桶統計。"""
+        metric = Histogram(name, documentation, labelnames, buckets)
+        self.register(metric)
+        return metric
+
+    def register_collector(self, collector: Callable[[], Iterable[Metric]]) -> None:
+        """登錄收集器：每次輸出時呼叫，回傳當下計算的指標。"""
+        self._collectors.append(collector)
+
+    def render(self) -> str:
+        """輸出 Prometheus 文字格式。"""
+        metrics = list(self._metrics)
+        for collector in self._collectors:
+            metrics.extend(collector())
+        lines = [line for metric in metrics for line in metric.render()]
+        return "\n".join(lines) + "\n"
+
+
+# 全域指標登錄表
+registry = MetricsRegistry()
@@ -0,0 +1,124 @@
+"""請求時間分解模組。
+
+以 contextvars 記錄單一請求在各層花費的時間，輸出成 Server-Timing 標頭與日誌：
+- db：送出 SQL 陳述式的時間，由 app.database.instrumentation 的 cursor 事件累加
+- service：log_operation 裝飾的最外層服務呼叫時間，扣除其中的資料庫時間
+- serialization：handle_api_errors_async 裝飾的路由函式結束，到回應開始送出之間，
+  即回應模型驗證與 JSON 編碼
+- app：總時間扣除以上各項，包含中間件、依賴注入與路由函式本身
+"""
+
+# ===== 標準函式庫 =====
+from contextlib import contextmanager
+from contextvars import ContextVar, Token
+from dataclasses import dataclass, field
+import time
+from typing import Iterator
+
+
+@dataclass
+class RequestTiming:
+    """單一請求的時間分解。"""
+
+    started: float = field(default_factory=time.perf_counter)
+    service_seconds: float = 0.0  # 服務層呼叫的總時間（含其中的資料庫時間）
+    service_db_seconds: float = 0.0  # 服務層呼叫中的資料庫時間
+    handler_finished: float | None = None  # 路由函式結束的時間（perf_counter）
+
+
+# 目前請求的時間分解：與查詢統計相同，存放可變物件，
+# 讓複製出去的 context（執行緒池、run_sync 的 greenlet）累加到同一份物件
+_current_request_timing: ContextVar[RequestTiming | None] = ContextVar(
+    "current_request_timing", default=None
+)
+
+# 目前是否在服務層呼叫中：每個 context 各自一份，巢狀或並行的服務呼叫不會互相干擾
+_in_service: ContextVar[bool] = ContextVar("in_service", default=False)
+
+
+def start_request_timing() -> tuple[RequestTiming, Token]:
+    """開始記錄目前 context 的時間分解。
+
+    Returns:
+        tuple[RequestTiming, Token]: 時間分解物件，以及結束時用來還原 context 的 token
+    """
+    timing = RequestTiming()
+    token = _current_request_timing.set(timing)
+    return timing, token
+
+
+def stop_request_timing(token: Token) -> None:
+    """結束記錄，還原成開始記錄前的狀態。"""
+    _current_request_timing.reset(token)
+
+
+def get_request_timing() -> RequestTiming | None:
+    """取得目前 context 的時間分解，未開始記錄時回傳 None。"""
+    return _current_request_timing.get()
+
+
+@contextmanager
+def time_service() -> Iterator[None]:
+    """計時服務層呼叫，巢狀的服務呼叫只計算最外層。"""
+    timing = _current_request_timing.get()
+    if timing is None or _in_service.get():
+        yield
+        return
+
+    token = _in_service.set(True)
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        timing.service_seconds += time.perf_counter() - started
+        _in_service.reset(token)
+
+
+def add_db_time(seconds: float) -> None:
+    """累加服務層呼叫中的資料庫時間，供計算服務層本身的時間。"""
+    if not _in_service.get():
+        return
+    timing = _current_request_timing.get()
+    if timing is not None:
+        timing.service_db_seconds += seconds
+
+
+def mark_handler_finished() -> None:
+    """記錄路由函式結束的時間，之後到回應送出前的時間計為序列化。"""
+    timing = _current_request_timing.get()
+    if timing is not None:
+        timing.handler_finished = time.perf_counter()
+
+
+def timing_breakdown(
+    timing: RequestTiming, db_seconds: float, now: float | None = None
+) -> dict[str, float]:
+    """各層花費的時間（秒），依 Server-Timing 的輸出順序排列。
+
+    Args:
+        timing: 請求的時間分解
+        db_seconds: 請求送出 SQL 陳述式的總時間
+        now: 回應開始送出的時間（perf_counter），預設為現在
+
+    Returns:
+        dict[str, float]: db、service、serialization（路由函式未記錄結束時間時省略）、
+        app 與 total
+    """
+    now = time.perf_counter() if now is None else now
+    total = now - timing.started
+    breakdown = {
+        "db": db_seconds,
+        "service": max(timing.service_seconds - timing.service_db_seconds, 0.0),
+    }
+    if timing.handler_finished is not None:
+        breakdown["serialization"] = max(now - timing.handler_finished, 0.0)
+    breakdown["app"] = max(total - sum(breakdown.values()), 0.0)
+    breakdown["total"] = total
+    return breakdown
+
+
+def format_server_timing(breakdown: dict[str, float]) -> str:
+    """Server-Timing 標頭值，例如 db;dur=12.3, service;dur=4.5（毫秒）。"""
+    return ", ".join(
+        f"{name};dur={seconds * 1000:.1f}" for name, seconds in breakdown.items()
+    )
@@ -6,10 +6,29 @@
 # ===== 本地模組 =====
 from .cors import setup_cors_middleware
 from .error_handler import setup_error_handlers
+from .metrics import MetricsMiddleware, setup_metrics_middleware
+from .query_stats import QueryStatsMiddleware, setup_query_stats_middleware
+from .read_your_writes import (
+    ReadYourWritesMiddleware,
+    setup_read_your_writes_middleware,
+)
+from .server_timing import ServerTimingMiddleware, setup_server_timing_middleware
 
 __all__ = [
     # CORS 中間件
     "setup_cors_middleware",
     # 錯誤處理中間件
     "setup_error_handlers",
+    # HTTP 請求指標中間件
+    "MetricsMiddleware",
+    "setup_metrics_middleware",
+    # 資料庫查詢統計中間件
+    "QueryStatsMiddleware",
+    "setup_query_stats_middleware",
+    # 寫入後讀取主資料庫中間件
+    "ReadYourWritesMiddleware",
+    "setup_read_your_writes_middleware",
+    # Server-Timing 中間件
+    "ServerTimingMiddleware",
+    "setup_server_timing_middleware",
 ]
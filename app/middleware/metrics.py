@@ -0,0 +1,76 @@
+"""HTTP 請求指標中間件。
+
+記錄每個請求的處理時間（依路由樣板與狀態碼分組）與處理中的請求數。
+"""
+
+# ===== 標準函式庫 =====
+import logging
+import time
+
+# ===== 第三方套件 =====
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ===== 本地模組 =====
+from app.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+# 沒有對應 API 路由的請求（404、靜態檔案）的路由標籤
+UNMATCHED_ROUTE = "unmatched"
+
+
+def route_label(scope: Scope) -> str:
+    """請求對應的路由樣板，例如 /api/v1/schedules/{schedule_id}。
+
+    路由比對後 scope 才有 route，需在請求處理完成後呼叫；
+    使用樣板而非實際路徑，指標的標籤數量不會隨 ID 增加。
+    """
+    route = scope.get("route")
+    return getattr(route, "path", None) or UNMATCHED_ROUTE
+
+
+class MetricsMiddleware:
+    """記錄 HTTP 請求處理時間與處理中請求數的 ASGI 中間件。
+
+    使用純 ASGI 介面而非 BaseHTTPMiddleware，不緩衝回應內容；
+    每個請求只做兩次時間讀取與三次指標更新。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        # 回應開始前發生未處理的例外時，由伺服器回應 500
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_REQUESTS_IN_PROGRESS.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            HTTP_REQUESTS_IN_PROGRESS.dec(method=method)
+            HTTP_REQUEST_DURATION.observe(
+                time.perf_counter() - started,
+                method=method,
+                route=route_label(scope),
+                status=status_code,
+            )
+
+
+def setup_metrics_middleware(app: FastAPI) -> None:
+    """設定 HTTP 請求指標中間件。"""
+    app.add_middleware(MetricsMiddleware)
+    logger.info("HTTP 請求指標中間件設定完成")
@@ -0,0 +1,55 @@
+"""資料庫查詢統計中間件。
+
+為每個 HTTP 請求開始一份查詢統計，請求結束時記錄資料庫往返次數與執行時間，
+並依路由樣板累加到指標。
+"""
+
+# ===== 標準函式庫 =====
+import logging
+
+# ===== 第三方套件 =====
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Receive, Scope, Send
+
+# ===== 本地模組 =====
+from app.database.instrumentation import start_query_stats, stop_query_stats
+from app.metrics import DB_QUERIES_PER_REQUEST, DB_QUERY_DURATION_PER_REQUEST
+from app.middleware.metrics import route_label
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """記錄每個請求資料庫往返次數的 ASGI 中間件。
+
+    使用純 ASGI 介面而非 BaseHTTPMiddleware，
+    確保路由與依賴注入在同一個 context 中執行，統計才能累加到同一份物件。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats, token = start_query_stats()
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            stop_query_stats(token)
+            route = route_label(scope)
+            DB_QUERIES_PER_REQUEST.observe(stats.round_trips, route=route)
+            DB_QUERY_DURATION_PER_REQUEST.observe(stats.query_seconds, route=route)
+            logger.info(
+                f"{scope['method']} {scope['path']} 資料庫往返次數: {stats.round_trips}, "
+                f"執行時間: {stats.query_seconds * 1000:.1f} ms"
+            )
+
+
+def setup_query_stats_middleware(app: FastAPI) -> None:
+    """設定資料庫查詢統計中間件。"""
+    app.add_middleware(QueryStatsMiddleware)
+    logger.info("資料庫查詢統計中間件設定完成")
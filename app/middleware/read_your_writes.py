@@ -0,0 +1,66 @@
+"""寫入後讀取主資料庫（read-your-writes）中間件。
+
+設定唯讀副本時，在寫入成功的回應加上短期 cookie，
+客戶端在這段期間內的 GET 讀取改用主資料庫，不會因副本複寫延遲讀到寫入前的資料。
+"""
+
+# ===== 標準函式庫 =====
+import logging
+
+# ===== 第三方套件 =====
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.database.replicas import read_primary_cookie
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+# 不會寫入資料的 HTTP 方法
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+class ReadYourWritesMiddleware:
+    """在寫入成功的回應加上改讀主資料庫 cookie 的 ASGI 中間件。
+
+    使用純 ASGI 介面而非 BaseHTTPMiddleware，只改寫回應標頭，不緩衝回應內容。
+    """
+
+    def __init__(self, app: ASGIApp, sticky_seconds: float | None = None) -> None:
+        self.app = app
+        self.sticky_seconds = (
+            settings.database_replica_sticky_seconds
+            if sticky_seconds is None
+            else sticky_seconds
+        )
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] in SAFE_METHODS
+            or self.sticky_seconds <= 0
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_cookie(message: Message) -> None:
+            # 失敗的寫入沒有改變資料，不需要改讀主資料庫
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                cookie = read_primary_cookie(self.sticky_seconds)
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode("latin-1")),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_cookie)
+
+
+def setup_read_your_writes_middleware(app: FastAPI) -> None:
+    """設定寫入後讀取主資料庫中間件，沒有設定唯讀副本時不需要。"""
+    if not settings.database_replica_url_list:
+        return
+    app.add_middleware(ReadYourWritesMiddleware)
+    logger.info("寫入後讀取主資料庫中間件設定完成")
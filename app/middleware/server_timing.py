@@ -0,0 +1,85 @@
+"""Server-Timing 中間件。
+
+在回應加上 Server-Timing 標頭，並記錄一行 JSON 日誌，
+列出請求在資料庫、服務層、序列化與其他部分各花費的時間，用來找出慢請求的瓶頸。
+"""
+
+# ===== 標準函式庫 =====
+import json
+import logging
+
+# ===== 第三方套件 =====
+from fastapi import FastAPI
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.database.instrumentation import get_query_stats
+from app.metrics.request_timing import (
+    format_server_timing,
+    start_request_timing,
+    stop_request_timing,
+    timing_breakdown,
+)
+from app.middleware.metrics import route_label
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+class ServerTimingMiddleware:
+    """在回應標頭加上 Server-Timing 的 ASGI 中間件。
+
+    使用純 ASGI 介面而非 BaseHTTPMiddleware，只改寫回應標頭，不緩衝回應內容；
+    時間計算到回應開始送出為止，串流回應的內容產生時間不包含在內。
+    資料庫時間來自查詢統計，需安裝在 QueryStatsMiddleware 內層。
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timing, token = start_request_timing()
+
+        async def send_with_timing(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                stats = get_query_stats()
+                breakdown = timing_breakdown(
+                    timing, stats.query_seconds if stats is not None else 0.0
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"server-timing", format_server_timing(breakdown).encode()),
+                ]
+                record = {
+                    "method": scope["method"],
+                    "route": route_label(scope),
+                    "status": message["status"],
+                    **{
+                        f"{name}_ms": round(seconds * 1000, 1)
+                        for name, seconds in breakdown.items()
+                    },
+                }
+                logger.info(f"請求時間分解: {json.dumps(record, ensure_ascii=False)}")
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            stop_request_timing(token)
+
+
+def setup_server_timing_middleware(app: FastAPI) -> None:
+    """設定 Server-Timing 中間件，未啟用時不需要。
+
+    需在 setup_query_stats_middleware 之前呼叫：後加入的中間件在外層，
+    查詢統計才會包住本中間件，回應送出時可讀取到資料庫時間。
+    """
+    if not settings.server_timing_enabled:
+        return
+    app.add_middleware(ServerTimingMiddleware)
+    logger.info("Server-Timing 中間件設定完成")
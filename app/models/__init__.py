@@ -9,6 +9,8 @@ from app.database import Base
 from app.enums.models import UserRoleEnum
 
 # 相對路徑導入（同模組）
+from .giver_daily_summary import GiverDailySummary, STATUS_COUNT_COLUMNS
+from .recurrence_rule import RecurrenceRule
 from .schedule import Schedule
 from .user import User
 
@@ -18,6 +20,10 @@ __all__ = [
     # 模型類別
     "Schedule",
     "User",
+    "GiverDailySummary",
+    "RecurrenceRule",
+    # 每日狀態統計欄位
+    "STATUS_COUNT_COLUMNS",
     # 相關 ENUM
     "UserRoleEnum",
 ]
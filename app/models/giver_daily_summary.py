@@ -0,0 +1,67 @@
+"""Giver 每日時段狀態統計模型。
+
+定義 Giver 每日各狀態時段數量的彙總資料表，供月曆檢視使用，
+不必讀取每一筆時段；由時段寫入在同一個交易中維護。
+"""
+
+# ===== 第三方套件 =====
+from sqlalchemy import Column, Date, ForeignKey
+from sqlalchemy.dialects.mysql import INTEGER
+
+# ===== 本地模組 =====
+from app.database import Base
+from app.enums.models import ScheduleStatusEnum
+
+# 各時段狀態對應的數量欄位
+STATUS_COUNT_COLUMNS = {
+    status: f"{status.value.lower()}_count" for status in ScheduleStatusEnum
+}
+
+
+def _count_column(status: ScheduleStatusEnum) -> Column:
+    """建立狀態數量欄位。"""
+    return Column(
+        INTEGER(unsigned=True),
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment=f"{status.value} 時段數量",
+    )
+
+
+class GiverDailySummary(Base):  # type: ignore[misc,valid-type]
+    """Giver 每日時段狀態統計模型。
+
+    只統計未刪除的時段；當天沒有任何時段時不保留資料列。
+    """
+
+    __tablename__ = "giver_daily_summary"
+
+    # ===== 主鍵 =====
+    giver_id = Column(
+        INTEGER(unsigned=True),
+        ForeignKey(
+            "users.id",
+            ondelete="CASCADE",
+        ),  # 彙總資料隨 Giver 一併刪除
+        primary_key=True,
+        comment="Giver ID",
+    )
+    date = Column(
+        Date,
+        primary_key=True,
+        comment="日期",
+    )
+
+    # ===== 各狀態的時段數量 =====
+    draft_count = _count_column(ScheduleStatusEnum.DRAFT)
+    available_count = _count_column(ScheduleStatusEnum.AVAILABLE)
+    pending_count = _count_column(ScheduleStatusEnum.PENDING)
+    accepted_count = _count_column(ScheduleStatusEnum.ACCEPTED)
+    rejected_count = _count_column(ScheduleStatusEnum.REJECTED)
+    cancelled_count = _count_column(ScheduleStatusEnum.CANCELLED)
+    completed_count = _count_column(ScheduleStatusEnum.COMPLETED)
+
+    def __repr__(self) -> str:
+        """字串表示。"""
+        return f"<GiverDailySummary(giver_id={self.giver_id}, date={self.date})>"
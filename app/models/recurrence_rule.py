@@ -0,0 +1,197 @@
+"""週期規則資料模型。
+
+定義 Giver 週期性可預約時段（每天或每週固定時間）的資料表，
+一條規則取代整段期間逐一建立的時段，只有滾動期間內的發生日期會展開成時段。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date
+from typing import cast
+
+# ===== 第三方套件 =====
+from sqlalchemy import (
+    Column,
+    Date,
+    DateTime,
+    Enum,
+    ForeignKey,
+    Index,
+    JSON,
+    SmallInteger,
+    String,
+    Time,
+)
+from sqlalchemy.dialects.mysql import INTEGER
+
+# ===== 本地模組 =====
+from app.database import Base
+from app.enums.models import RecurrenceFrequencyEnum, UserRoleEnum
+from app.utils.timezone import get_local_now_naive
+
+
+class RecurrenceRule(Base):  # type: ignore[misc,valid-type]
+    """週期規則資料模型。
+
+    發生日期：
+    - DAILY：從 starts_on 起每 interval 天一次
+    - WEEKLY：weekdays 中的星期，從 starts_on 所在的週起每 interval 週一次
+    - 介於 starts_on 與 ends_on（含）之間，且不在 exceptions 中
+
+    materialized_until 之前（含）的發生日期已展開成時段，由時段本身參與重疊檢查；
+    之後的發生日期只存在於規則中，重疊檢查以規則計算，不展開。
+    """
+
+    __tablename__ = "schedule_recurrence_rules"
+
+    # ===== 基本欄位 =====
+    id = Column(
+        INTEGER(unsigned=True),
+        primary_key=True,
+        autoincrement=True,
+        comment="週期規則 ID",
+    )
+    giver_id = Column(
+        INTEGER(unsigned=True),
+        ForeignKey(
+            "users.id",
+            ondelete="CASCADE",
+        ),  # 規則隨 Giver 一併刪除，已展開的時段由 schedules 的外鍵保護
+        nullable=False,
+        comment="Giver ID",
+    )
+    frequency: "Column[RecurrenceFrequencyEnum]" = Column(
+        Enum(RecurrenceFrequencyEnum),
+        nullable=False,
+        comment="頻率：DAILY 每天、WEEKLY 每週",
+    )
+    interval = Column(
+        SmallInteger,
+        nullable=False,
+        default=1,
+        server_default="1",
+        comment="間隔：每幾天（DAILY）或每幾週（WEEKLY）一次",
+    )
+    weekdays = Column(
+        SmallInteger,
+        nullable=False,
+        default=0,
+        server_default="0",
+        comment="星期位元遮罩（WEEKLY 使用）：bit 0 為星期一，bit 6 為星期日",
+    )
+    start_time = Column(
+        Time,
+        nullable=False,
+        comment="每次的開始時間",
+    )
+    end_time = Column(
+        Time,
+        nullable=False,
+        comment="每次的結束時間",
+    )
+    starts_on = Column(
+        Date,
+        nullable=False,
+        comment="規則開始日期（含）",
+    )
+    ends_on = Column(
+        Date,
+        nullable=True,
+        comment="規則結束日期（含），可為 NULL（表示不結束）",
+    )
+    exceptions = Column(
+        JSON,
+        nullable=False,
+        default=list,
+        comment="例外日期（ISO 格式日期字串陣列），這些日期不發生",
+    )
+    note = Column(
+        String(255),
+        nullable=True,
+        comment="備註，展開的時段沿用此備註",
+    )
+
+    # ===== 系統欄位 =====
+    materialized_until = Column(
+        Date,
+        nullable=True,
+        comment="已展開成時段的最後日期（含），可為 NULL（表示尚未展開）",
+    )
+
+    # ===== 審計欄位 =====
+    created_at = Column(
+        DateTime,
+        default=get_local_now_naive,
+        nullable=False,
+        comment="建立時間（本地時間）",
+    )
+    created_by = Column(
+        INTEGER(unsigned=True),
+        ForeignKey(
+            "users.id",
+            ondelete="SET NULL",
+        ),  # 指向 users 表
+        nullable=True,
+        comment="建立者的 ID，可為 NULL（表示系統自動建立）",
+    )
+    created_by_role: "Column[UserRoleEnum]" = Column(
+        Enum(UserRoleEnum),
+        nullable=False,
+        default=UserRoleEnum.SYSTEM,
+        comment="建立者角色，展開的時段沿用此角色",
+    )
+    updated_at = Column(
+        DateTime,
+        default=get_local_now_naive,
+        onupdate=get_local_now_naive,
+        nullable=False,
+        comment="更新時間（本地時間）",
+    )
+    deleted_at = Column(
+        DateTime,
+        nullable=True,
+        comment="軟刪除標記（本地時間）",
+    )
+    deleted_by = Column(
+        INTEGER(unsigned=True),
+        ForeignKey(
+            "users.id",
+            ondelete="SET NULL",
+        ),  # 指向 users 表
+        nullable=True,
+        comment="刪除者的 ID，可為 NULL（表示系統自動刪除）",
+    )
+    deleted_by_role: "Column[UserRoleEnum]" = Column(
+        Enum(UserRoleEnum),
+        nullable=True,
+        comment="刪除者角色，可為 NULL（未刪除時）",
+    )
+
+    __table_args__ = (
+        # 重疊檢查：依 Giver 載入未刪除的規則
+        Index("idx_recurrence_rule_giver", "giver_id", "deleted_at"),
+        # 定期展開：找出展開進度落後的規則
+        Index("idx_recurrence_rule_materialized", "deleted_at", "materialized_until"),
+    )
+
+    @property
+    def is_active(self) -> bool:
+        """檢查規則是否有效（未刪除）。"""
+        return self.deleted_at is None
+
+    @property
+    def weekday_list(self) -> list[int]:
+        """星期列表（0 為星期一），由位元遮罩轉換。"""
+        return [weekday for weekday in range(7) if (self.weekdays or 0) >> weekday & 1]
+
+    @property
+    def exception_dates(self) -> list[date]:
+        """例外日期，依日期排序。"""
+        exceptions = cast(list[str] | None, self.exceptions)
+        return sorted(date.fromisoformat(value) for value in exceptions or ())
+
+    def __repr__(self) -> str:
+        """字串表示。"""
+        return (
+            f"<RecurrenceRule(id={self.id}, giver_id={self.giver_id}, "
+            f"frequency={self.frequency}, starts_on={self.starts_on})>"
+        )
@@ -131,6 +131,13 @@ class Schedule(Base):  # type: ignore[misc,valid-type]
     )
 
     # ===== 系統欄位 =====
+    version = Column(
+        INTEGER(unsigned=True),
+        nullable=False,
+        default=1,
+        server_default="1",
+        comment="版本號（樂觀鎖），每次更新遞增",
+    )
     deleted_at = Column(
         DateTime,
         nullable=True,
@@ -190,8 +197,28 @@ class Schedule(Base):  # type: ignore[misc,valid-type]
         Index("idx_schedule_taker_date", "taker_id", "date", "start_time"),
         Index("idx_schedule_status", "status"),
         Index("idx_schedule_giver_time", "giver_id", "start_time", "end_time"),
+        # 涵蓋時段列表驗證器（條件式 GET）的聚合查詢，只掃描索引
+        Index(
+            "idx_schedule_giver_changes",
+            "giver_id",
+            "deleted_at",
+            "status",
+            "updated_at",
+            "version",
+        ),
+        Index(
+            "idx_schedule_taker_changes",
+            "taker_id",
+            "deleted_at",
+            "status",
+            "updated_at",
+            "version",
+        ),
     )
 
+    # 樂觀鎖：ORM 更新時自動帶上 WHERE version=? 並遞增版本號，版本不符時拋出 StaleDataError
+    __mapper_args__ = {"version_id_col": version}
+
     @property
     def is_active(self) -> bool:
         """檢查記錄是否有效（未刪除）。"""
@@ -239,6 +266,7 @@ class Schedule(Base):  # type: ignore[misc,valid-type]
                 "updated_by": getattr(self, 'updated_by', None),
                 "updated_by_role": getattr(self, 'updated_by_role', None),
                 # 系統欄位
+                "version": getattr(self, 'version', None),
                 "deleted_at": format_datetime(getattr(self, 'deleted_at', None)),
                 "deleted_by": getattr(self, 'deleted_by', None),
                 "deleted_by_role": getattr(self, 'deleted_by_role', None),
@@ -4,16 +4,31 @@
 
 包含：
 - 時段管理 API（schedule_router）
+- 行事曆訂閱 API（calendar_router）
+- Giver 每日時段統計 API（summary_router）
+- Giver 空檔搜尋 API（slot_search_router）
+- 共同可面談時間比對 API（matching_router）
+- 週期規則 API（recurrence_rule_router）
 """
 
 # ===== 第三方套件 =====
 from fastapi import APIRouter
 
 # ===== 本地模組 =====
+from .calendar import router as calendar_router
+from .matching import router as matching_router
+from .recurrence_rule import router as recurrence_rule_router
 from .schedule import router as schedule_router
+from .slot_search import router as slot_search_router
+from .summary import router as summary_router
 
 # 建立 API 路由器
 api_router = APIRouter()
 
 # 註冊所有 API 路由
 api_router.include_router(schedule_router)
+api_router.include_router(calendar_router)
+api_router.include_router(summary_router)
+api_router.include_router(slot_search_router)
+api_router.include_router(matching_router)
+api_router.include_router(recurrence_rule_router)
@@ -0,0 +1,146 @@
+"""行事曆訂閱 API 路由模組。
+
+提供 Giver、Taker 訂閱已接受時段的 iCalendar（.ics）端點。
+"""
+
+# ===== 標準函式庫 =====
+from email.utils import format_datetime
+from typing import Any
+
+# ===== 第三方套件 =====
+from fastapi import APIRouter, Depends, Header, Path, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ===== 本地模組 =====
+from app.database import get_async_db
+from app.decorators import handle_api_errors_async
+from app.enums.models import UserRoleEnum
+from app.services import async_schedule_service
+from app.services.calendar import CALENDAR_MEDIA_TYPE
+from app.utils.etag import if_none_match_matches, not_modified_since
+
+router = APIRouter(prefix="/api/v1", tags=["Calendars"])
+
+CALENDAR_DESCRIPTION = """
+## 功能簡介
+- 以 iCalendar（RFC 5545）格式訂閱{role}已接受（ACCEPTED）的面談時段
+
+### 使用場景
+- 在 Google 日曆、Apple 行事曆、Outlook 中以網址訂閱，面談時段自動同步
+
+### 快取與條件式請求
+- 訂閱內容依使用者快取，時段寫入後失效，行事曆用戶端輪詢時不必每次查詢資料庫
+- 回應標頭 `ETag` 為內容雜湊、`Last-Modified` 為內容產生時間
+- **If-None-Match** / **If-Modified-Since**（選填）：內容未變更時回傳 304，不含內容；
+  兩者都提供時只比對 If-None-Match
+
+### 回應狀態
+- **200 OK**: 成功取得行事曆訂閱
+- **304 Not Modified**: 內容未變更
+- **422 Unprocessable Entity**: 參數驗證錯誤
+"""
+
+CALENDAR_RESPONSES: dict[int | str, dict[str, Any]] = {
+    200: {
+        "description": "成功取得行事曆訂閱",
+        "content": {
+            "text/calendar": {
+                "example": "BEGIN:VCALENDAR\r\nVERSION:2.0\r\n...\r\nEND:VCALENDAR\r\n"
+            }
+        },
+    },
+    304: {"description": "內容未變更"},
+}
+
+
+async def _calendar_response(
+    db: AsyncSession,
+    role: UserRoleEnum,
+    user_id: int,
+    if_none_match: str | None,
+    if_modified_since: str | None,
+) -> Response:
+    """取得行事曆訂閱，依條件式請求標頭回傳 200 或 304。"""
+    feed = await async_schedule_service.get_calendar_feed(db, role, user_id)
+    headers = {
+        "ETag": feed.etag,
+        "Last-Modified": format_datetime(feed.last_modified, usegmt=True),
+        # 允許快取，但每次使用前需向伺服器驗證
+        "Cache-Control": "no-cache",
+    }
+
+    # 依 RFC 9110，提供 If-None-Match 時忽略 If-Modified-Since
+    if if_none_match is not None:
+        not_modified = if_none_match_matches(if_none_match, feed.etag)
+    else:
+        not_modified = not_modified_since(if_modified_since, feed.last_modified)
+
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=feed.body, media_type=CALENDAR_MEDIA_TYPE, headers=headers)
+
+
+@router.get(
+    "/givers/{giver_id}/calendar.ics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="訂閱 Giver 的行事曆",
+    description=CALENDAR_DESCRIPTION.format(role="Giver"),
+    responses=CALENDAR_RESPONSES,
+)
+@handle_api_errors_async()
+async def get_giver_calendar(
+    giver_id: int = Path(..., gt=0, description="Giver ID，必填，必須大於 0"),
+    if_none_match: str | None = Header(None, description="先前回應的 ETag"),
+    if_modified_since: str | None = Header(
+        None, description="先前回應的 Last-Modified"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """訂閱 Giver 的行事曆：Giver 已接受的面談時段。
+
+    Args:
+        giver_id (int): Giver ID，必填，必須大於 0。
+        if_none_match (str | None): 先前回應的 ETag，相符時回傳 304。
+        if_modified_since (str | None): 先前回應的 Last-Modified，未修改時回傳 304。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        Response: iCalendar 內容，或 304 Not Modified。
+    """
+    return await _calendar_response(
+        db, UserRoleEnum.GIVER, giver_id, if_none_match, if_modified_since
+    )
+
+
+@router.get(
+    "/takers/{taker_id}/calendar.ics",
+    response_class=Response,
+    status_code=status.HTTP_200_OK,
+    summary="訂閱 Taker 的行事曆",
+    description=CALENDAR_DESCRIPTION.format(role="Taker"),
+    responses=CALENDAR_RESPONSES,
+)
+@handle_api_errors_async()
+async def get_taker_calendar(
+    taker_id: int = Path(..., gt=0, description="Taker ID，必填，必須大於 0"),
+    if_none_match: str | None = Header(None, description="先前回應的 ETag"),
+    if_modified_since: str | None = Header(
+        None, description="先前回應的 Last-Modified"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> Response:
+    """訂閱 Taker 的行事曆：Taker 已接受的面談時段。
+
+    Args:
+        taker_id (int): Taker ID，必填，必須大於 0。
+        if_none_match (str | None): 先前回應的 ETag，相符時回傳 304。
+        if_modified_since (str | None): 先前回應的 Last-Modified，未修改時回傳 304。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        Response: iCalendar 內容，或 304 Not Modified。
+    """
+    return await _calendar_response(
+        db, UserRoleEnum.TAKER, taker_id, if_none_match, if_modified_since
+    )
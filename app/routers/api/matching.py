@@ -0,0 +1,116 @@
+"""共同可面談時間比對 API 路由模組。
+
+提供 Taker 提出的時段與 Giver 可預約時段的交集比對端點。
+"""
+
+# ===== 第三方套件 =====
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ===== 本地模組 =====
+from app.database import get_async_db
+from app.decorators import handle_api_errors_async
+from app.schemas import MatchWindowResponse, TakerMatchesResponse
+from app.services import async_schedule_service
+
+router = APIRouter(prefix="/api/v1", tags=["Matching"])
+
+MATCHING_NOTES = """
+### 比對規則
+- Taker 提出的時段：Taker 向所有 Giver 提出、尚未回覆（PENDING）的時段，代表 Taker 有空的時間
+  （同一個 Giver 的時段依重疊檢查不會彼此重疊，因此提案包含向其他 Giver 提出的時段）
+- Giver 開放的時段：Giver 可預約（AVAILABLE）的時段
+- 兩者的交集即為候選視窗，長度不足 min_minutes 的交集不回報；相鄰的時段不算交集
+- 排名：越早越前面，同一個開始時間時較長的視窗在前
+"""
+
+
+@router.get(
+    "/givers/{giver_id}/matches",
+    response_model=list[MatchWindowResponse],
+    status_code=status.HTTP_200_OK,
+    summary="比對 Taker 與 Giver 的共同可面談時間",
+    description=f"""
+## 功能簡介
+- 比對 Taker 提出的時段與 Giver 的可預約時段，回傳排名後的候選面談視窗
+
+### 使用場景
+- 聊天介面中 Taker 提出時間、Giver 已開放時段時，不必由雙方人工比對兩份清單
+{MATCHING_NOTES}
+### 回應狀態
+- **200 OK**: 成功取得候選視窗（沒有交集時為空陣列）
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def get_matches(
+    giver_id: int = Path(..., gt=0, description="Giver ID，必填，必須大於 0"),
+    taker_id: int = Query(..., gt=0, description="Taker ID，必填，必須大於 0"),
+    min_minutes: int = Query(1, ge=1, le=24 * 60, description="視窗最短長度（分鐘）"),
+    limit: int = Query(50, ge=1, le=500, description="最多回傳的候選視窗數量"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[MatchWindowResponse]:
+    """比對 Taker 與 Giver 的共同可面談時間。
+
+    Args:
+        giver_id (int): Giver ID，必填，必須大於 0。
+        taker_id (int): Taker ID，必填，必須大於 0。
+        min_minutes (int): 視窗最短長度（分鐘）。
+        limit (int): 最多回傳的候選視窗數量。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[MatchWindowResponse]: 排名後的候選視窗。
+    """
+    windows = await async_schedule_service.match_availability(
+        db, giver_id, taker_id, min_minutes=min_minutes, limit=limit
+    )
+    return [MatchWindowResponse.model_validate(w) for w in windows]
+
+
+@router.get(
+    "/givers/{giver_id}/inbox/matches",
+    response_model=list[TakerMatchesResponse],
+    status_code=status.HTTP_200_OK,
+    summary="比對 Giver 收件匣中所有 Taker 的共同可面談時間",
+    description=f"""
+## 功能簡介
+- 對 Giver 收件匣中每個 Taker（向 Giver 提出 PENDING 時段的 Taker），
+  比對其提出的時段與 Giver 的可預約時段
+
+### 使用場景
+- Giver 一次檢視所有待回覆的 Taker 中，哪些人的時間可以直接安排
+{MATCHING_NOTES}
+### 說明
+- Giver 的可預約時段與所有 Taker 的提案各以一次查詢載入
+- 只回傳有候選視窗的 Taker，依 taker_id 排序；limit 為每個 Taker 的候選視窗數量上限
+
+### 回應狀態
+- **200 OK**: 成功取得候選視窗
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def get_inbox_matches(
+    giver_id: int = Path(..., gt=0, description="Giver ID，必填，必須大於 0"),
+    min_minutes: int = Query(1, ge=1, le=24 * 60, description="視窗最短長度（分鐘）"),
+    limit: int = Query(
+        10, ge=1, le=100, description="每個 Taker 最多回傳的候選視窗數量"
+    ),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[TakerMatchesResponse]:
+    """比對 Giver 收件匣中所有 Taker 的共同可面談時間。
+
+    Args:
+        giver_id (int): Giver ID，必填，必須大於 0。
+        min_minutes (int): 視窗最短長度（分鐘）。
+        limit (int): 每個 Taker 最多回傳的候選視窗數量。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[TakerMatchesResponse]: 每個 Taker 排名後的候選視窗。
+    """
+    results = await async_schedule_service.match_giver_inbox(
+        db, giver_id, min_minutes=min_minutes, limit=limit
+    )
+    return [TakerMatchesResponse.model_validate(r) for r in results]
@@ -0,0 +1,209 @@
+"""週期規則 API 路由模組。
+
+提供 Giver 週期性可預約時段規則的建立、查詢、發生日期與刪除端點。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date
+
+# ===== 第三方套件 =====
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ===== 本地模組 =====
+from app.database import get_async_db
+from app.decorators import handle_api_errors_async
+from app.enums.models import RecurrenceFrequencyEnum
+from app.errors import create_bad_request_error
+from app.schemas import (
+    RecurrenceRuleBase,
+    RecurrenceRuleCreateRequest,
+    RecurrenceRuleResponse,
+    ScheduleDeleteRequest,
+)
+from app.services import async_recurrence_rule_service
+
+router = APIRouter(prefix="/api/v1", tags=["Recurrence Rules"])
+
+RECURRENCE_NOTES = """
+### 發生日期
+- **DAILY**: 從 starts_on 起每 interval 天一次
+- **WEEKLY**: weekdays 中的星期（0 為星期一，6 為星期日），從 starts_on 所在的週起每 interval 週一次
+- 介於 starts_on 與 ends_on（含）之間，且不在 exceptions 中
+"""
+
+
+def _validate_rule(rule: RecurrenceRuleBase) -> None:
+    """驗證週期規則的時間與星期邏輯。"""
+    if rule.start_time >= rule.end_time:
+        raise create_bad_request_error("開始時間必須早於結束時間")
+    if rule.ends_on is not None and rule.ends_on < rule.starts_on:
+        raise create_bad_request_error("結束日期不可早於開始日期")
+    if rule.frequency == RecurrenceFrequencyEnum.WEEKLY:
+        if not rule.weekdays:
+            raise create_bad_request_error("每週規則必須指定星期")
+        if any(weekday < 0 or weekday > 6 for weekday in rule.weekdays):
+            raise create_bad_request_error("星期必須介於 0（星期一）到 6（星期日）")
+
+
+@router.post(
+    "/recurrence-rules",
+    response_model=RecurrenceRuleResponse,
+    status_code=status.HTTP_201_CREATED,
+    summary="建立週期規則",
+    description=f"""
+## 功能簡介
+- 建立 Giver 的週期性可預約時段規則，例如「每週二 19:00–21:00，連續三個月」
+- 不必逐一建立每個時段：只有未來滾動期間內的發生日期會建立成可預約（AVAILABLE）時段，
+  之後由定期排程（scripts/materialize_recurrence_rules.py）延伸
+{RECURRENCE_NOTES}
+### 重疊檢查
+- 規則的所有發生日期不可與 Giver 的現有時段或其他規則重疊，以算術判斷，不展開規則
+- 規則建立後，新建立或更新的時段也不可與規則中尚未展開的發生日期重疊
+
+### 回應狀態
+- **201 Created**: 建立成功，materialized_until 為已展開成時段的最後日期
+- **400 Bad Request**: 時間、日期或星期不正確
+- **409 Conflict**: 與現有時段或其他規則重疊
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def create_recurrence_rule(
+    request: RecurrenceRuleCreateRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> RecurrenceRuleResponse:
+    """建立週期規則。
+
+    Args:
+        request (RecurrenceRuleCreateRequest): 週期規則與建立者資訊。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        RecurrenceRuleResponse: 建立的週期規則。
+    """
+    _validate_rule(request.rule)
+
+    rule = await async_recurrence_rule_service.create_rule(
+        db, request.rule, request.created_by, request.created_by_role
+    )
+    return RecurrenceRuleResponse.model_validate(rule)
+
+
+@router.get(
+    "/givers/{giver_id}/recurrence-rules",
+    response_model=list[RecurrenceRuleResponse],
+    status_code=status.HTTP_200_OK,
+    summary="查詢 Giver 的週期規則",
+    description="""
+## 功能簡介
+- 查詢 Giver 未刪除的週期規則，依開始日期與時間排序
+
+### 回應狀態
+- **200 OK**: 成功取得週期規則（沒有規則時為空陣列）
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def list_recurrence_rules(
+    giver_id: int = Path(..., gt=0, description="Giver ID，必填，必須大於 0"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[RecurrenceRuleResponse]:
+    """查詢 Giver 的週期規則。
+
+    Args:
+        giver_id (int): Giver ID，必填，必須大於 0。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[RecurrenceRuleResponse]: 週期規則列表。
+    """
+    rules = await async_recurrence_rule_service.list_giver_rules(db, giver_id)
+    return [RecurrenceRuleResponse.model_validate(rule) for rule in rules]
+
+
+@router.get(
+    "/recurrence-rules/{rule_id}/occurrences",
+    response_model=list[date],
+    status_code=status.HTTP_200_OK,
+    summary="列出週期規則的發生日期",
+    description=f"""
+## 功能簡介
+- 依規則計算日期範圍內的發生日期，不建立時段，也不限於已展開的滾動期間
+{RECURRENCE_NOTES}
+### 回應狀態
+- **200 OK**: 成功取得發生日期，依日期排序
+- **400 Bad Request**: 日期範圍不正確
+- **404 Not Found**: 週期規則不存在
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def list_recurrence_occurrences(
+    rule_id: int = Path(..., gt=0, description="週期規則 ID，必填，必須大於 0"),
+    date_from: date | None = Query(
+        None, description="開始日期（含），預設為規則開始日期"
+    ),
+    date_to: date | None = Query(
+        None, description="結束日期（含），預設為規則結束日期"
+    ),
+    limit: int = Query(100, ge=1, le=1000, description="最多回傳的發生日期數量"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[date]:
+    """列出週期規則的發生日期。
+
+    Args:
+        rule_id (int): 週期規則 ID，必填，必須大於 0。
+        date_from (date | None): 開始日期（含）。
+        date_to (date | None): 結束日期（含）。
+        limit (int): 最多回傳的發生日期數量。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[date]: 發生日期。
+    """
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise create_bad_request_error("開始日期不可晚於結束日期")
+
+    return await async_recurrence_rule_service.list_occurrences(
+        db, rule_id, date_from, date_to, limit
+    )
+
+
+@router.delete(
+    "/recurrence-rules/{rule_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="刪除週期規則",
+    description="""
+## 功能簡介
+- 軟刪除週期規則，之後不再展開新的發生日期，也不再參與重疊檢查
+- 已展開的時段保留為一般時段，可使用刪除時段 API 個別刪除
+
+### 回應狀態
+- **204 No Content**: 刪除成功
+- **404 Not Found**: 週期規則不存在或已刪除
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def delete_recurrence_rule(
+    request: ScheduleDeleteRequest,
+    rule_id: int = Path(..., gt=0, description="週期規則 ID，必填，必須大於 0"),
+    db: AsyncSession = Depends(get_async_db),
+) -> None:
+    """刪除週期規則。
+
+    Args:
+        request (ScheduleDeleteRequest): 刪除者資訊。
+        rule_id (int): 週期規則 ID，必填，必須大於 0。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        None: 刪除成功無回傳內容。
+    """
+    await async_recurrence_rule_service.delete_rule(
+        db,
+        rule_id,
+        deleted_by=request.deleted_by,
+        deleted_by_role=request.deleted_by_role,
+    )
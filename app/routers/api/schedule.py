@@ -3,22 +3,62 @@
 提供時段相關的 API 端點，包括建立、查詢、更新和刪除時段。
 """
 
+# ===== 標準函式庫 =====
+from datetime import date
+from typing import Any, AsyncIterator
+
 # ===== 第三方套件 =====
-from fastapi import APIRouter, Depends, Path, Query, status
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, Header, Path, Query, Response, status
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 
 # ===== 本地模組 =====
-from app.database import get_db
+from app.core import settings
+from app.database import (
+    get_async_db,
+    get_async_read_db,
+    get_async_read_session_factory,
+    get_async_session_factory,
+)
 from app.decorators import handle_api_errors_async
 from app.enums.models import ScheduleStatusEnum
-from app.errors import create_bad_request_error
+from app.errors import create_bad_request_error, create_not_acceptable_error
 from app.schemas import (
+    ScheduleBatchDeleteOperation,
+    ScheduleBatchOperationResult,
+    ScheduleBatchRequest,
+    ScheduleBatchResponse,
+    ScheduleBulkDeleteRequest,
+    ScheduleBulkDeleteResponse,
     ScheduleCreateRequest,
     ScheduleDeleteRequest,
     SchedulePartialUpdateRequest,
     ScheduleResponse,
 )
-from app.services import schedule_service
+from app.services import async_schedule_service
+from app.utils.etag import (
+    format_list_etag,
+    format_schedule_etag,
+    if_none_match_matches,
+    parse_if_match,
+)
+from app.utils.fieldsets import (
+    parse_schedule_fieldset,
+    schedule_columns,
+    schedule_rows_to_dicts,
+    ScheduleFieldset,
+)
+from app.utils.negotiation import (
+    COLUMNAR_MEDIA_TYPE,
+    encode_ndjson,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    negotiate_media_type,
+    render_response,
+    to_columnar,
+)
+from app.utils.pagination import decode_schedule_cursor
 
 router = APIRouter(prefix="/api/v1", tags=["Schedules"])
 
@@ -65,6 +105,7 @@ router = APIRouter(prefix="/api/v1", tags=["Schedules"])
                             "updated_at": "2024-01-01T00:00:00Z",
                             "updated_by": 1,
                             "updated_by_role": "TAKER",
+                            "version": 1,
                             "deleted_at": "null",
                             "deleted_by": "null",
                             "deleted_by_role": "null",
@@ -139,13 +180,13 @@ router = APIRouter(prefix="/api/v1", tags=["Schedules"])
 @handle_api_errors_async()
 async def create_schedules(
     request: ScheduleCreateRequest,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> list[ScheduleResponse]:
     """建立多個時段：批量建立時段記錄，用於 Giver、Taker 建立方便面談的時段。
 
     Args:
         request (ScheduleCreateRequest): 建立時段請求資料。
-        db (Session): 資料庫會話。
+        db (AsyncSession): 非同步資料庫會話。
 
     Returns:
         list[ScheduleResponse]: 建立的時段列表。
@@ -155,7 +196,7 @@ async def create_schedules(
         if schedule.start_time >= schedule.end_time:
             raise create_bad_request_error("開始時間必須早於結束時間")
 
-    schedules = schedule_service.create_schedules(
+    schedules = await async_schedule_service.create_schedules(
         db,
         request.schedules,
         created_by=request.created_by,
@@ -166,6 +207,67 @@ async def create_schedules(
     return [ScheduleResponse.model_validate(schedule) for schedule in schedules]
 
 
+# fields、include 查詢參數的說明，列表與單一時段 API 共用
+FIELDS_DESCRIPTION = "只回傳指定的欄位，以逗號分隔，例如 id,date,start_time,end_time"
+INCLUDE_DESCRIPTION = (
+    "附加關聯使用者，以逗號分隔："
+    "giver、taker、created_by_user、updated_by_user、deleted_by_user"
+)
+
+
+def _fieldset(fields: str | None, include: str | None) -> ScheduleFieldset | None:
+    """解析 fields、include 查詢參數，格式無效時拋出 400 錯誤。"""
+    try:
+        return parse_schedule_fieldset(fields, include)
+    except ValueError as e:
+        raise create_bad_request_error(str(e))
+
+
+# 查詢時段 API 可提供的回應格式，第一個為預設格式；欄式 JSON 只用於列表
+LIST_MEDIA_TYPES = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE)
+ITEM_MEDIA_TYPES = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE)
+ACCEPT_DESCRIPTION = (
+    "回應格式：application/json（預設）、application/msgpack、"
+    "application/vnd.schedule.columnar+json（僅列表）"
+)
+
+
+def _media_type(accept: str | None, available: tuple[str, ...]) -> str:
+    """依 Accept 標頭選擇回應格式，沒有可接受的格式時拋出 406 錯誤。"""
+    media_type = negotiate_media_type(accept, available)
+    if media_type is None:
+        raise create_not_acceptable_error(
+            f"不支援的回應格式：{accept}", list(available)
+        )
+    return media_type
+
+
+def _negotiated_response(
+    data: Any,
+    media_type: str,
+    fieldset: ScheduleFieldset | None,
+    response: Response,
+) -> Response:
+    """以協商出的格式編碼已序列化的時段。
+
+    直接回傳的 Response 不會合併注入的 response 標頭，因此一併複製自訂標頭。
+    """
+    if media_type == COLUMNAR_MEDIA_TYPE:
+        data = to_columnar(data, schedule_columns(fieldset))
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    return render_response(data, media_type, headers)
+
+
+IF_NONE_MATCH_DESCRIPTION = "先前回應的 ETag，內容未變更時回傳 304"
+
+
+def _not_modified(response: Response) -> Response:
+    """回傳不含內容的 304 Not Modified，保留 ETag 等標頭與 Vary: Accept。"""
+    headers = {k: v for k, v in response.headers.items() if k != "content-length"}
+    headers["Vary"] = "Accept"
+    return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+
 @router.get(
     "/schedules",
     response_model=list[ScheduleResponse],
@@ -186,9 +288,46 @@ async def create_schedules(
 - **giver_id**: 篩選特定 Giver 的時段（必須大於 0）
 - **taker_id**: 篩選特定 Taker 的時段（必須大於 0）
 - **status_filter**: 篩選特定狀態的時段（DRAFT、AVAILABLE、PENDING、ACCEPTED、REJECTED、CANCELLED、COMPLETED）
+- **limit**: 每頁最多筆數（1-500），不提供則回傳所有符合條件的時段
+- **cursor**: 分頁游標，取自上一頁回應的 `X-Next-Cursor` 標頭
+
+### 分頁
+- 結果依日期、開始時間、ID 排序
+- 使用鍵集（keyset）分頁：從游標之後繼續查詢，深頁與第一頁的成本相同
+- 還有下一頁時，回應標頭 `X-Next-Cursor` 提供下一頁的游標；沒有此標頭表示已是最後一頁
+
+### 稀疏欄位
+- **fields**: 只回傳指定的欄位（以逗號分隔），例如 `fields=id,date,start_time,end_time`
+- **include**: 附加關聯使用者的 `id`、`name`（以逗號分隔）：`giver`、`taker`、`created_by_user`、`updated_by_user`、`deleted_by_user`
+- 未指定 include 時不 JOIN 使用者資料表，只查詢 schedules 資料表
+- 未指定 include 時以 SQL 直接查詢需要的欄位並輸出，不建立 ORM 物件，也不逐筆經過回應模型驗證
+
+### 條件式請求
+- 未指定 include 時，回應標頭 `ETag` 由符合條件的時段筆數、最後更新時間與版本號總和產生（弱 ETag）
+- **If-None-Match**（選填）：內容未變更時回傳 304，只執行一次涵蓋索引的聚合查詢，不讀取與序列化時段
+- 指定 include 時不提供 ETag：關聯使用者的資料變更不會反映在驗證器中
+
+### 讀取快取
+- 啟用讀取快取（`SCHEDULE_READ_CACHE_BACKEND=memory` 或 `redis`）時，序列化後的列表依查詢參數快取
+- 時段寫入後，相關 Giver、Taker 的列表與不篩選的列表立即失效
+- 可設定在新鮮時間過後先回傳舊內容並於背景重新查詢，或在資料庫查詢失敗時回傳舊內容
+- 設定唯讀副本時，快取的內容一律從主資料庫查詢；`read_primary_until` cookie 未過期時不使用快取
+
+### 唯讀副本
+- 設定唯讀副本（`DATABASE_REPLICA_URLS`）時，輪流從健康的副本讀取，副本無法連線時改用其他副本或主資料庫
+- 客戶端寫入成功後的一小段時間內（`read_primary_until` cookie），改從主資料庫讀取，讀得到自己剛寫入的資料
+
+### 回應格式
+依 `Accept` 標頭選擇回應格式，回應帶有 `Vary: Accept`：
+- `application/json`（預設）：時段物件陣列
+- `application/msgpack`：與 JSON 相同結構的 MessagePack 二進位格式
+- `application/vnd.schedule.columnar+json`：欄式 JSON `{"columns": [...], "rows": [[...]]}`，欄位名稱只出現一次
 
 ### 回應狀態
 - **200 OK**: 成功取得時段列表
+- **304 Not Modified**: 內容未變更
+- **400 Bad Request**: 分頁游標、欄位或關聯名稱無效
+- **406 Not Acceptable**: 不支援 Accept 要求的回應格式
 - **422 Unprocessable Entity**: 參數驗證錯誤
     """,
     responses={
@@ -212,12 +351,23 @@ async def create_schedules(
                             "updated_at": "2024-01-01T00:00:00Z",
                             "updated_by": 1,
                             "updated_by_role": "TAKER",
+                            "version": 1,
                             "deleted_at": "null",
                             "deleted_by": "null",
                             "deleted_by_role": "null",
                         }
                     ]
-                }
+                },
+                "application/msgpack": {},
+                "application/vnd.schedule.columnar+json": {
+                    "example": {
+                        "columns": ["id", "date", "start_time", "end_time"],
+                        "rows": [
+                            [1, "2024-01-01", "09:00:00", "10:00:00"],
+                            [2, "2024-01-01", "10:00:00", "11:00:00"],
+                        ],
+                    }
+                },
             },
         },
         422: {
@@ -242,30 +392,164 @@ async def create_schedules(
 )
 @handle_api_errors_async()
 async def list_schedules(
+    response: Response,
     giver_id: int | None = Query(None, gt=0, description="Giver ID，必須大於 0"),
     taker_id: int | None = Query(None, gt=0, description="Taker ID，必須大於 0"),
     status_filter: ScheduleStatusEnum | None = None,
-    db: Session = Depends(get_db),
-) -> list[ScheduleResponse]:
-    """取得時段列表：查詢時段列表，支援多種篩選條件。
+    limit: int | None = Query(None, ge=1, le=500, description="每頁最多筆數"),
+    cursor: str | None = Query(None, description="分頁游標"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    accept: str | None = Header(None, description=ACCEPT_DESCRIPTION),
+    if_none_match: str | None = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+) -> Response:
+    """取得時段列表：查詢時段列表，支援多種篩選條件、鍵集分頁、稀疏欄位與多種回應格式。
 
     Args:
+        response (Response): 回應物件，用於設定 ETag 與下一頁游標標頭。
         giver_id (int | None): Giver ID 篩選條件，必須大於 0。
         taker_id (int | None): Taker ID 篩選條件，必須大於 0。
         status_filter (ScheduleStatusEnum | None): 狀態篩選條件。
-        db (Session): 資料庫會話。
+        limit (int | None): 每頁最多筆數。
+        cursor (str | None): 上一頁回應提供的分頁游標。
+        fields (str | None): 只回傳指定的欄位。
+        include (str | None): 附加的關聯使用者。
+        accept (str | None): Accept 標頭，決定回應格式。
+        if_none_match (str | None): 先前回應的 ETag，內容未變更時回傳 304。
+        db (AsyncSession): 非同步資料庫會話。
+        session_factory (async_sessionmaker): 讀取快取未命中與背景重新查詢使用的主資料庫會話工廠。
 
     Returns:
-        list[ScheduleResponse]: 時段列表。
+        Response: 時段列表，指定 fields 或 include 時只含指定的欄位；內容未變更時為 304。
     """
-    schedules = schedule_service.list_schedules(
+    fieldset = _fieldset(fields, include)
+    media_type = _media_type(accept, LIST_MEDIA_TYPES)
+
+    after = None
+    if cursor is not None:
+        try:
+            after = decode_schedule_cursor(cursor)
+        except ValueError:
+            raise create_bad_request_error("無效的分頁游標")
+
+    # 未附加關聯時先以聚合查詢取得驗證器，內容未變更時不查詢、不序列化時段
+    # 驗證器在時段之前讀取：期間若有寫入，ETag 只會比內容舊，下次請求重新取得完整內容
+    if fieldset is None or not fieldset.include:
+        validator = await async_schedule_service.get_list_validator(
+            db, giver_id, taker_id, status_filter
+        )
+        etag = format_list_etag(validator, media_type, fieldset, limit, cursor)
+        response.headers["ETag"] = etag
+        if if_none_match_matches(if_none_match, etag):
+            return _not_modified(response)
+
+    page = await async_schedule_service.read_schedule_page(
         db,
         giver_id,
         taker_id,
         status_filter,
+        limit=limit,
+        after=after,
+        fieldset=fieldset,
+        session_factory=session_factory,
     )
+    if page.next_cursor is not None:
+        response.headers["X-Next-Cursor"] = page.next_cursor
 
-    return [ScheduleResponse.model_validate(schedule) for schedule in schedules]
+    return _negotiated_response(page.items, media_type, fieldset, response)
+
+
+@router.get(
+    "/schedules:export",
+    response_class=StreamingResponse,
+    status_code=status.HTTP_200_OK,
+    summary="串流匯出時段",
+    description="""
+## 功能簡介
+- 以 NDJSON（每行一筆 JSON）串流匯出符合條件的所有時段，不分頁
+- 以伺服器端游標分批讀取並逐批輸出，匯出筆數再多，伺服器的記憶體用量也維持固定
+
+### 使用場景
+- 匯出 Giver 的所有歷史時段
+- 匯出日期範圍內所有 Giver 的時段，供報表或資料分析使用
+
+### 查詢參數
+- **giver_id**、**taker_id**、**status_filter**: 與取得時段列表相同的篩選條件
+- **date_from**、**date_to**: 日期範圍（包含兩端），格式為 YYYY-MM-DD
+- **fields**: 只匯出指定的欄位（以逗號分隔）
+
+### 回應格式
+- `application/x-ndjson`：每行一筆時段，欄位與取得時段列表相同，依日期、開始時間、ID 排序
+
+### 唯讀副本
+- 設定唯讀副本（`DATABASE_REPLICA_URLS`）時，輪流從健康的副本讀取，副本無法連線時改用其他副本或主資料庫
+- 客戶端寫入成功後的一小段時間內（`read_primary_until` cookie），改從主資料庫讀取，讀得到自己剛寫入的資料
+
+### 回應狀態
+- **200 OK**: 開始串流匯出；串流途中發生錯誤時連線會中斷，匯出內容不完整
+- **400 Bad Request**: 日期範圍或欄位名稱無效
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+    responses={
+        200: {
+            "description": "NDJSON 串流",
+            "content": {
+                NDJSON_MEDIA_TYPE: {
+                    "example": (
+                        '{"id":1,"date":"2024-01-01","start_time":"09:00:00"}\n'
+                        '{"id":2,"date":"2024-01-01","start_time":"10:00:00"}\n'
+                    )
+                }
+            },
+        },
+    },
+)
+@handle_api_errors_async()
+async def export_schedules(
+    giver_id: int | None = Query(None, gt=0, description="Giver ID，必須大於 0"),
+    taker_id: int | None = Query(None, gt=0, description="Taker ID，必須大於 0"),
+    status_filter: ScheduleStatusEnum | None = None,
+    date_from: date | None = Query(None, description="日期範圍起日（包含）"),
+    date_to: date | None = Query(None, description="日期範圍迄日（包含）"),
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    session_factory: async_sessionmaker = Depends(get_async_read_session_factory),
+) -> StreamingResponse:
+    """串流匯出時段：以 NDJSON 逐批輸出符合條件的所有時段。
+
+    Args:
+        giver_id (int | None): Giver ID 篩選條件，必須大於 0。
+        taker_id (int | None): Taker ID 篩選條件，必須大於 0。
+        status_filter (ScheduleStatusEnum | None): 狀態篩選條件。
+        date_from (date | None): 日期範圍起日（包含）。
+        date_to (date | None): 日期範圍迄日（包含）。
+        fields (str | None): 只匯出指定的欄位。
+        session_factory (async_sessionmaker): 非同步會話工廠，會話存活到串流結束。
+
+    Returns:
+        StreamingResponse: NDJSON 串流回應。
+    """
+    if date_from is not None and date_to is not None and date_from > date_to:
+        raise create_bad_request_error("日期範圍起日不可晚於迄日")
+    fieldset = _fieldset(fields, None)
+    selected_fields = fieldset.fields if fieldset is not None else None
+
+    async def content() -> AsyncIterator[bytes]:
+        async with session_factory() as db:
+            async for rows in async_schedule_service.export_schedule_rows(
+                db,
+                giver_id,
+                taker_id,
+                status_filter,
+                fields=selected_fields,
+                date_from=date_from,
+                date_to=date_to,
+                batch_size=settings.schedule_export_batch_size,
+            ):
+                yield encode_ndjson(schedule_rows_to_dicts(rows, selected_fields))
+
+    return StreamingResponse(content(), media_type=NDJSON_MEDIA_TYPE)
 
 
 @router.get(
@@ -284,9 +568,33 @@ async def list_schedules(
 ### 路徑參數
 - **schedule_id**: 時段 ID（必填，必須大於 0）
 
+### 版本控制
+- 回應標頭 `ETag` 為時段的版本號，更新或刪除時可放在 `If-Match` 標頭避免覆蓋他人的修改
+- **If-None-Match**（選填）：版本未變更時回傳 304，只查詢版本號，不讀取與序列化時段；
+  指定 include 時一律回傳完整內容
+
+### 讀取快取
+- 啟用讀取快取時，序列化後的時段依 ID 與欄位快取，時段寫入後立即失效
+- 設定唯讀副本時，快取的內容一律從主資料庫查詢；`read_primary_until` cookie 未過期時不使用快取
+
+### 唯讀副本
+- 設定唯讀副本（`DATABASE_REPLICA_URLS`）時，輪流從健康的副本讀取，副本無法連線時改用其他副本或主資料庫
+- 客戶端寫入成功後的一小段時間內（`read_primary_until` cookie），改從主資料庫讀取，讀得到自己剛寫入的資料
+
+### 稀疏欄位
+- **fields**: 只回傳指定的欄位（以逗號分隔），例如 `fields=id,date,start_time,end_time`
+- **include**: 附加關聯使用者的 `id`、`name`（以逗號分隔）：`giver`、`taker`、`created_by_user`、`updated_by_user`、`deleted_by_user`
+- 未指定 include 時不 JOIN 使用者資料表，只查詢 schedules 資料表
+
+### 回應格式
+依 `Accept` 標頭選擇 `application/json`（預設）或 `application/msgpack`，回應帶有 `Vary: Accept`
+
 ### 回應狀態
 - **200 OK**: 成功取得時段資訊
+- **304 Not Modified**: 版本未變更
+- **400 Bad Request**: 欄位或關聯名稱無效
 - **404 Not Found**: 時段不存在錯誤
+- **406 Not Acceptable**: 不支援 Accept 要求的回應格式
 - **422 Unprocessable Entity**: 參數驗證錯誤
     """,
     responses={
@@ -309,6 +617,7 @@ async def list_schedules(
                         "updated_at": "2024-01-01T00:00:00Z",
                         "updated_by": 1,
                         "updated_by_role": "TAKER",
+                        "version": 1,
                         "deleted_at": "null",
                         "deleted_by": "null",
                         "deleted_by_role": "null",
@@ -354,20 +663,56 @@ async def list_schedules(
 )
 @handle_api_errors_async()
 async def get_schedule(
+    response: Response,
     schedule_id: int = Path(..., gt=0, description="時段 ID，必填，必須大於 0"),
-    db: Session = Depends(get_db),
-) -> ScheduleResponse:
+    fields: str | None = Query(None, description=FIELDS_DESCRIPTION),
+    include: str | None = Query(None, description=INCLUDE_DESCRIPTION),
+    accept: str | None = Header(None, description=ACCEPT_DESCRIPTION),
+    if_none_match: str | None = Header(None, description=IF_NONE_MATCH_DESCRIPTION),
+    db: AsyncSession = Depends(get_async_read_db),
+    session_factory: async_sessionmaker = Depends(get_async_session_factory),
+) -> Response:
     """取得單一時段：根據時段 ID 取得單一時段的詳細資訊。
 
     Args:
+        response (Response): 回應物件，用於設定 ETag 標頭。
         schedule_id (int): 時段 ID，必填，必須大於 0。
-        db (Session): 資料庫會話。
+        fields (str | None): 只回傳指定的欄位。
+        include (str | None): 附加的關聯使用者。
+        accept (str | None): Accept 標頭，決定回應格式。
+        if_none_match (str | None): 先前回應的 ETag，版本未變更時回傳 304。
+        db (AsyncSession): 非同步資料庫會話。
+        session_factory (async_sessionmaker): 讀取快取未命中與背景重新查詢使用的主資料庫會話工廠。
 
     Returns:
-        ScheduleResponse: 時段詳細資訊。
+        Response: 時段詳細資訊，指定 fields 或 include 時只含指定的欄位；版本未變更時為 304。
     """
-    schedule = schedule_service.get_schedule(db, schedule_id)
-    return ScheduleResponse.model_validate(schedule)
+    fieldset = _fieldset(fields, include)
+    media_type = _media_type(accept, ITEM_MEDIA_TYPES)
+
+    # 只查詢版本號比對 ETag；時段不存在時改走完整查詢，回傳 404
+    if if_none_match is not None and (fieldset is None or not fieldset.include):
+        version = await async_schedule_service.get_schedule_version(db, schedule_id)
+        if version is not None:
+            etag = format_schedule_etag(version)
+            if if_none_match_matches(if_none_match, etag):
+                response.headers["ETag"] = etag
+                return _not_modified(response)
+
+    schedule = await async_schedule_service.read_schedule(
+        db, schedule_id, fieldset, session_factory
+    )
+    response.headers["ETag"] = format_schedule_etag(schedule.version)
+
+    return _negotiated_response(schedule.data, media_type, fieldset, response)
+
+
+def _expected_version(if_match: str | None) -> int | None:
+    """解析 If-Match 標頭，格式無效時拋出 400 錯誤。"""
+    try:
+        return parse_if_match(if_match)
+    except ValueError:
+        raise create_bad_request_error("無效的 If-Match 標頭")
 
 
 @router.patch(
@@ -387,11 +732,17 @@ async def get_schedule(
 ### 路徑參數
 - **schedule_id**: 時段 ID（必填，必須大於 0）
 
+### 版本控制
+- **If-Match**（選填）：取自查詢時段回應的 `ETag`，版本不符表示時段已被他人修改，回傳 412
+- 提供 `If-Match` 時不鎖定資料列，以 `UPDATE ... WHERE id=? AND version=?` 寫入，並行請求互不等待
+- 回應標頭 `ETag` 為更新後的版本號
+
 ### 回應狀態
 - **200 OK**: 成功更新時段
-- **400 Bad Request**: 更新資料無效
+- **400 Bad Request**: 更新資料無效、If-Match 標頭格式無效
 - **404 Not Found**: 時段不存在錯誤
 - **409 Conflict**: 時段衝突錯誤
+- **412 Precondition Failed**: 版本不符
 - **422 Unprocessable Entity**: 參數驗證錯誤
     """,
     responses={
@@ -414,6 +765,7 @@ async def get_schedule(
                         "updated_at": "2024-01-01T09:00:00Z",
                         "updated_by": 1,
                         "updated_by_role": "TAKER",
+                        "version": 1,
                         "deleted_at": "null",
                         "deleted_by": "null",
                         "deleted_by_role": "null",
@@ -480,6 +832,22 @@ async def get_schedule(
                 }
             },
         },
+        412: {
+            "description": "版本不符錯誤（Service 拋出錯誤，由 Route 捕捉）",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "message": "時段已被其他請求修改: ID=schedule_id",
+                            "status_code": 412,
+                            "code": "SERVICE_SCHEDULE_VERSION_MISMATCH",
+                            "timestamp": "2024-01-01T00:00:00Z",
+                            "details": {"expected_version": 1, "current_version": 2},
+                        }
+                    }
+                }
+            },
+        },
         422: {
             "description": "參數驗證錯誤",
             "content": {
@@ -503,15 +871,19 @@ async def get_schedule(
 @handle_api_errors_async()
 async def update_schedule(
     request: SchedulePartialUpdateRequest,
+    response: Response,
     schedule_id: int = Path(..., gt=0, description="時段 ID，必填，必須大於 0"),
-    db: Session = Depends(get_db),
+    if_match: str | None = Header(None, description="預期的時段版本（ETag）"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ScheduleResponse:
     """部分更新時段：只更新提供的欄位。
 
     Args:
         request (SchedulePartialUpdateRequest): 更新請求資料。
+        response (Response): 回應物件，用於設定 ETag 標頭。
         schedule_id (int): 時段 ID，必填，必須大於 0。
-        db (Session): 資料庫會話。
+        if_match (str | None): 預期的時段版本，版本不符時回傳 412。
+        db (AsyncSession): 非同步資料庫會話。
 
     Returns:
         ScheduleResponse: 更新後的時段資訊。
@@ -523,14 +895,17 @@ async def update_schedule(
     if "date" in update_data:
         update_data["schedule_date"] = update_data.pop("date")
 
-    schedule = schedule_service.update_schedule(
+    schedule = await async_schedule_service.update_schedule(
         db,
         schedule_id,
         updated_by=request.updated_by,
         updated_by_role=request.updated_by_role,
+        expected_version=_expected_version(if_match),
         **update_data,  # 字典解包：傳遞更新資料
     )
-    return ScheduleResponse.model_validate(schedule)
+    result = ScheduleResponse.model_validate(schedule)
+    response.headers["ETag"] = format_schedule_etag(result.version)
+    return result
 
 
 @router.delete(
@@ -550,10 +925,15 @@ async def update_schedule(
 ### 路徑參數
 - **schedule_id**: 時段 ID（必填，必須大於 0）
 
+### 版本控制
+- **If-Match**（選填）：取自查詢時段回應的 `ETag`，版本不符表示時段已被他人修改，回傳 412
+
 ### 回應狀態
 - **204 No Content**: 成功刪除時段
+- **400 Bad Request**: If-Match 標頭格式無效
 - **404 Not Found**: 時段不存在錯誤
 - **409 Conflict**: 時段無法刪除錯誤
+- **412 Precondition Failed**: 版本不符
 - **422 Unprocessable Entity**: 參數驗證錯誤
     """,
     responses={
@@ -596,6 +976,22 @@ async def update_schedule(
                 }
             },
         },
+        412: {
+            "description": "版本不符錯誤（Service 拋出錯誤，由 Route 捕捉）",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "message": "時段已被其他請求修改: ID=schedule_id",
+                            "status_code": 412,
+                            "code": "SERVICE_SCHEDULE_VERSION_MISMATCH",
+                            "timestamp": "2024-01-01T00:00:00Z",
+                            "details": {"expected_version": 1, "current_version": 2},
+                        }
+                    }
+                }
+            },
+        },
         422: {
             "description": "參數驗證錯誤",
             "content": {
@@ -620,21 +1016,277 @@ async def update_schedule(
 async def delete_schedule(
     request: ScheduleDeleteRequest,
     schedule_id: int = Path(..., gt=0, description="時段 ID，必填，必須大於 0"),
-    db: Session = Depends(get_db),
+    if_match: str | None = Header(None, description="預期的時段版本（ETag）"),
+    db: AsyncSession = Depends(get_async_db),
 ) -> None:
     """刪除時段：刪除指定的時段記錄。
 
     Args:
         request (ScheduleDeleteRequest): 刪除請求資料。
         schedule_id (int): 時段 ID，必填，必須大於 0。
-        db (Session): 資料庫會話。
+        if_match (str | None): 預期的時段版本，版本不符時回傳 412。
+        db (AsyncSession): 非同步資料庫會話。
 
     Returns:
         None: 刪除成功無回傳內容。
     """
-    schedule_service.delete_schedule(
+    await async_schedule_service.delete_schedule(
         db,
         schedule_id,
         deleted_by=request.deleted_by,
         deleted_by_role=request.deleted_by_role,
+        expected_version=_expected_version(if_match),
+    )
+
+
+@router.delete(
+    "/schedules",
+    response_model=ScheduleBulkDeleteResponse,
+    status_code=status.HTTP_200_OK,
+    summary="依條件批次刪除時段",
+    description="""
+## 功能簡介
+- 依 Giver 與日期批次軟刪除時段，以單一 UPDATE 陳述式完成
+
+### 使用場景
+- Giver 清除某幾天所有尚未被預約的時段（例如 `status=AVAILABLE`）
+- 取代逐筆呼叫刪除時段 API
+
+### 請求內容
+- **giver_id**: Giver ID（必填）
+- **dates**: 要刪除的日期（必填，1-366 個）
+- **status**: 只刪除指定狀態的時段（選填）
+- **deleted_by**、**deleted_by_role**: 刪除者資訊（必填）
+
+### 刪除規則
+- 已接受（ACCEPTED）或已完成（COMPLETED）的時段一律不刪除
+- 已刪除的時段不重複刪除
+
+### 回應狀態
+- **200 OK**: 批次刪除完成，回傳刪除數量（沒有符合條件的時段時為 0）
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+    responses={
+        200: {
+            "description": "批次刪除完成",
+            "content": {"application/json": {"example": {"deleted_count": 5}}},
+        },
+        422: {
+            "description": "參數驗證錯誤",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [
+                            {
+                                "type": "validation_error_type",
+                                "loc": ["path", "to", "field"],
+                                "msg": "具體錯誤訊息",
+                                "input": "無效的輸入值",
+                                "ctx": {"error": "錯誤上下文"},
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+    },
+)
+@handle_api_errors_async()
+async def delete_schedules_by_filter(
+    request: ScheduleBulkDeleteRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> ScheduleBulkDeleteResponse:
+    """依條件批次刪除時段。
+
+    Args:
+        request (ScheduleBulkDeleteRequest): 批次刪除條件與刪除者資訊。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        ScheduleBulkDeleteResponse: 刪除的時段數量。
+    """
+    deleted_count = await async_schedule_service.delete_schedules_by_filter(
+        db,
+        request.giver_id,
+        request.dates,
+        status_filter=request.status,
+        deleted_by=request.deleted_by,
+        deleted_by_role=request.deleted_by_role,
     )
+    return ScheduleBulkDeleteResponse(deleted_count=deleted_count)
+
+
+@router.post(
+    "/schedules:batch",
+    response_model=ScheduleBatchResponse,
+    status_code=status.HTTP_200_OK,
+    summary="批次操作時段",
+    description="""
+## 功能簡介
+- 在單一交易中依序執行多個建立、更新、刪除操作，最後只 commit 一次
+
+### 使用場景
+- Giver 一次編輯整週的可預約時段：新增、調整、移除時段只需要一次請求
+- 取代逐筆呼叫建立、更新、刪除時段 API
+
+### 請求內容
+- **operations**: 依序執行的操作（必填，1-500 個），以 `op` 區分類型
+  - `create`：`schedule` 為要建立的時段資料
+  - `update`：`schedule_id`、`schedule` 為要更新的欄位，`version` 為預期版本（選填）
+  - `delete`：`schedule_id`，`version` 為預期版本（選填）
+- **operated_by**、**operated_by_role**: 操作者資訊（必填）
+
+### 交易規則
+- 每個操作沿用單筆 API 的業務規則，後面的操作可看到前面操作的結果
+- 任一操作失敗時整批回滾，錯誤詳情的 `operation_indexes` 指出失敗的操作
+
+### 回應狀態
+- **200 OK**: 全部操作成功，依請求順序回傳每個操作的結果
+- **400 Bad Request**: 時段邏輯錯誤
+- **404 Not Found**: 時段不存在錯誤
+- **409 Conflict**: 時段衝突或無法刪除錯誤
+- **412 Precondition Failed**: 版本不符
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+    responses={
+        200: {
+            "description": "全部操作成功",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "results": [
+                            {
+                                "index": 0,
+                                "op": "create",
+                                "schedule_id": 1,
+                                "schedule": {
+                                    "id": 1,
+                                    "giver_id": 1,
+                                    "taker_id": None,
+                                    "status": "AVAILABLE",
+                                    "date": "2024-01-01",
+                                    "start_time": "09:00:00",
+                                    "end_time": "10:00:00",
+                                    "note": None,
+                                    "created_at": "2024-01-01T00:00:00Z",
+                                    "created_by": 1,
+                                    "created_by_role": "GIVER",
+                                    "updated_at": "2024-01-01T00:00:00Z",
+                                    "updated_by": 1,
+                                    "updated_by_role": "GIVER",
+                                    "version": 1,
+                                    "deleted_at": None,
+                                    "deleted_by": None,
+                                    "deleted_by_role": None,
+                                },
+                            },
+                            {
+                                "index": 1,
+                                "op": "delete",
+                                "schedule_id": 3,
+                                "schedule": None,
+                            },
+                        ]
+                    }
+                }
+            },
+        },
+        409: {
+            "description": "時段衝突錯誤（Service 拋出錯誤，由 Route 捕捉）",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "error": {
+                            "message": "檢測到 1 個重疊時段，請調整時段之時間",
+                            "status_code": 409,
+                            "code": "SERVICE_SCHEDULE_OVERLAP",
+                            "timestamp": "2024-01-01T00:00:00Z",
+                            "details": {
+                                "overlapping_schedules": [
+                                    {
+                                        "id": 123,
+                                        "giver_id": 1,
+                                        "date": "2024-01-01",
+                                        "start_time": "08:00:00",
+                                        "end_time": "12:00:00",
+                                        "status": "AVAILABLE",
+                                    }
+                                ],
+                                "operation_indexes": [0],
+                            },
+                        }
+                    }
+                }
+            },
+        },
+        422: {
+            "description": "參數驗證錯誤",
+            "content": {
+                "application/json": {
+                    "example": {
+                        "detail": [
+                            {
+                                "type": "validation_error_type",
+                                "loc": ["path", "to", "field"],
+                                "msg": "具體錯誤訊息",
+                                "input": "無效的輸入值",
+                                "ctx": {"error": "錯誤上下文"},
+                            }
+                        ]
+                    }
+                }
+            },
+        },
+    },
+)
+@handle_api_errors_async()
+async def execute_schedule_batch(
+    request: ScheduleBatchRequest,
+    db: AsyncSession = Depends(get_async_db),
+) -> ScheduleBatchResponse:
+    """批次操作時段：在單一交易中依序執行建立、更新、刪除操作。
+
+    Args:
+        request (ScheduleBatchRequest): 批次操作與操作者資訊。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        ScheduleBatchResponse: 依請求順序排列的操作結果。
+    """
+    # 驗證建立操作的時間邏輯，與建立時段 API 相同
+    for operation in request.operations:
+        if (
+            operation.op == "create"
+            and operation.schedule.start_time >= operation.schedule.end_time
+        ):
+            raise create_bad_request_error("開始時間必須早於結束時間")
+
+    schedules = await async_schedule_service.execute_batch(
+        db,
+        request.operations,
+        operated_by=request.operated_by,
+        operated_by_role=request.operated_by_role,
+    )
+
+    results = []
+    for index, (operation, schedule) in enumerate(zip(request.operations, schedules)):
+        # 刪除操作沒有時段物件，只回傳時段 ID
+        if isinstance(operation, ScheduleBatchDeleteOperation):
+            results.append(
+                ScheduleBatchOperationResult(
+                    index=index,
+                    op=operation.op,
+                    schedule_id=operation.schedule_id,
+                    schedule=None,
+                )
+            )
+            continue
+
+        data = ScheduleResponse.model_validate(schedule)
+        results.append(
+            ScheduleBatchOperationResult(
+                index=index, op=operation.op, schedule_id=data.id, schedule=data
+            )
+        )
+
+    return ScheduleBatchResponse(results=results)
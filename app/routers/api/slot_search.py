@@ -0,0 +1,115 @@
+"""Giver 空檔搜尋 API 路由模組。
+
+提供跨 Giver 搜尋連續空檔視窗的端點。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ===== 本地模組 =====
+from app.database import get_async_db
+from app.decorators import handle_api_errors_async
+from app.errors import create_bad_request_error
+from app.schemas import FreeSlotGiverResponse
+from app.services import async_schedule_service
+from app.services.slot_search import SLOT_MINUTES, SlotSearchMode
+
+router = APIRouter(prefix="/api/v1", tags=["Slot Search"])
+
+# 單次搜尋的日期範圍上限（天），涵蓋一季
+MAX_SEARCH_DAYS = 92
+
+# 單次搜尋可指定的 Giver 數量上限
+MAX_SEARCH_GIVER_IDS = 1000
+
+
+@router.get(
+    "/slots/search",
+    response_model=list[FreeSlotGiverResponse],
+    status_code=status.HTTP_200_OK,
+    summary="搜尋有空檔的 Giver",
+    description=f"""
+## 功能簡介
+- 搜尋在日期範圍內、每日時間範圍內，有連續指定分鐘數空檔的 Giver
+
+### 使用場景
+- Taker 尋找「下週平日 19:00–22:00 有 60 分鐘可預約」的 Giver
+- 媒合時找出在指定時間完全沒有安排、可請其開放時段的 Giver
+
+### 查詢參數
+- **from** / **to**: 日期範圍起訖日（包含），必填，相差不超過 {MAX_SEARCH_DAYS} 天
+- **start_time** / **end_time**: 每日時間範圍，預設為整天
+- **duration**: 視窗長度（分鐘），必填
+- **mode**: `available`（預設）視窗完全落在可預約（AVAILABLE）時段內；
+  `free` 視窗內沒有任何未刪除的時段
+- **giver_ids**: 只搜尋這些 Giver（可重複，最多 {MAX_SEARCH_GIVER_IDS} 個）；
+  未提供時搜尋日期範圍內有時段的 Giver（available 模式只搜尋有可預約時段的 Giver）
+- **limit**: 最多回傳的 Giver 數量
+
+### 說明
+- 以 {SLOT_MINUTES} 分鐘為時格建立每個 Giver 每天的點陣圖，以向量運算一次搜尋所有 Giver
+- 不在時格邊界的時間採保守取整：每日時間範圍與可預約時段向內取整，
+  其他時段向外取整，視窗長度向上取整；回報的視窗一定可以預約
+- 每個 Giver 每天只回報最早的一個視窗，結果依 giver_id 排序
+
+### 回應狀態
+- **200 OK**: 成功搜尋
+- **400 Bad Request**: 日期範圍或時間範圍無效
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def search_free_slots(
+    date_from: date = Query(..., alias="from", description="日期範圍起日（包含）"),
+    date_to: date = Query(..., alias="to", description="日期範圍迄日（包含）"),
+    start_time: time = Query(time.min, description="每日時間範圍的開始時間"),
+    end_time: time = Query(time.max, description="每日時間範圍的結束時間"),
+    duration: int = Query(
+        ..., gt=0, le=24 * 60, description="視窗長度（分鐘），必填，必須大於 0"
+    ),
+    mode: SlotSearchMode = Query("available", description="搜尋模式"),
+    giver_ids: list[int] | None = Query(None, description="只搜尋這些 Giver"),
+    limit: int = Query(100, ge=1, le=1000, description="最多回傳的 Giver 數量"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[FreeSlotGiverResponse]:
+    """搜尋有空檔的 Giver：日期範圍 × 每日時間範圍內有連續 duration 分鐘的視窗。
+
+    Args:
+        date_from (date): 日期範圍起日（包含）。
+        date_to (date): 日期範圍迄日（包含）。
+        start_time (time): 每日時間範圍的開始時間。
+        end_time (time): 每日時間範圍的結束時間。
+        duration (int): 視窗長度（分鐘）。
+        mode (SlotSearchMode): available 或 free。
+        giver_ids (list[int] | None): 只搜尋這些 Giver。
+        limit (int): 最多回傳的 Giver 數量。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[FreeSlotGiverResponse]: 符合條件的 Giver 與每天最早的視窗。
+    """
+    if date_from > date_to:
+        raise create_bad_request_error("日期範圍起日不可晚於迄日")
+    if (date_to - date_from).days >= MAX_SEARCH_DAYS:
+        raise create_bad_request_error(f"日期範圍不可超過 {MAX_SEARCH_DAYS} 天")
+    if start_time >= end_time:
+        raise create_bad_request_error("每日時間範圍的開始時間必須早於結束時間")
+    if giver_ids is not None and len(giver_ids) > MAX_SEARCH_GIVER_IDS:
+        raise create_bad_request_error(f"giver_ids 不可超過 {MAX_SEARCH_GIVER_IDS} 個")
+
+    results = await async_schedule_service.search_free_slots(
+        db,
+        date_from,
+        date_to,
+        start_time,
+        end_time,
+        duration,
+        mode=mode,
+        giver_ids=giver_ids,
+        limit=limit,
+    )
+    return [FreeSlotGiverResponse.model_validate(r) for r in results]
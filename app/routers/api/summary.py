@@ -0,0 +1,79 @@
+"""Giver 每日時段統計 API 路由模組。
+
+提供月曆檢視使用的 Giver 每日各狀態時段數量。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date
+
+# ===== 第三方套件 =====
+from fastapi import APIRouter, Depends, Path, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# ===== 本地模組 =====
+from app.database import get_async_db
+from app.decorators import handle_api_errors_async
+from app.errors import create_bad_request_error
+from app.schemas import GiverDailySummaryResponse
+from app.services import async_schedule_service
+
+router = APIRouter(prefix="/api/v1", tags=["Summaries"])
+
+# 單次查詢的日期範圍上限（天），涵蓋一年的月曆
+MAX_SUMMARY_DAYS = 366
+
+
+@router.get(
+    "/givers/{giver_id}/summary",
+    response_model=list[GiverDailySummaryResponse],
+    status_code=status.HTTP_200_OK,
+    summary="取得 Giver 每日時段統計",
+    description=f"""
+## 功能簡介
+- 查詢 Giver 在日期範圍內，每天各狀態（DRAFT、AVAILABLE、PENDING、ACCEPTED、REJECTED、CANCELLED、COMPLETED）的時段數量
+
+### 使用場景
+- 月曆檢視：顯示每天可預約、待回覆、已接受的時段數量，不必取得每一筆時段
+
+### 查詢參數
+- **from**: 日期範圍起日（包含），必填
+- **to**: 日期範圍迄日（包含），必填，與起日相差不超過 {MAX_SUMMARY_DAYS} 天
+
+### 說明
+- 統計由時段寫入在同一個交易中維護，查詢只讀取彙總表，不讀取時段
+- 不包含已刪除的時段；沒有任何時段的日期不回傳，視為各狀態皆為 0
+- 結果依日期排序
+
+### 回應狀態
+- **200 OK**: 成功取得每日時段統計
+- **400 Bad Request**: 日期範圍無效
+- **422 Unprocessable Entity**: 參數驗證錯誤
+    """,
+)
+@handle_api_errors_async()
+async def get_giver_summary(
+    giver_id: int = Path(..., gt=0, description="Giver ID，必填，必須大於 0"),
+    date_from: date = Query(..., alias="from", description="日期範圍起日（包含）"),
+    date_to: date = Query(..., alias="to", description="日期範圍迄日（包含）"),
+    db: AsyncSession = Depends(get_async_db),
+) -> list[GiverDailySummaryResponse]:
+    """取得 Giver 每日時段統計：日期範圍內每天各狀態的時段數量。
+
+    Args:
+        giver_id (int): Giver ID，必填，必須大於 0。
+        date_from (date): 日期範圍起日（包含）。
+        date_to (date): 日期範圍迄日（包含）。
+        db (AsyncSession): 非同步資料庫會話。
+
+    Returns:
+        list[GiverDailySummaryResponse]: 有時段的日期與各狀態的時段數量。
+    """
+    if date_from > date_to:
+        raise create_bad_request_error("日期範圍起日不可晚於迄日")
+    if (date_to - date_from).days >= MAX_SUMMARY_DAYS:
+        raise create_bad_request_error(f"日期範圍不可超過 {MAX_SUMMARY_DAYS} 天")
+
+    summaries = await async_schedule_service.get_giver_daily_summary(
+        db, giver_id, date_from, date_to
+    )
+    return [GiverDailySummaryResponse.model_validate(s) for s in summaries]
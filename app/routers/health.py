@@ -1,13 +1,15 @@
 """健康檢查路由模組。
 
-包含存活探測和就緒探測等端點。
+包含存活探測、就緒探測和監控指標等端點。
 """
 
 # ===== 第三方套件 =====
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, HTTPException, Response, status
 
 # ===== 本地模組 =====
-from app.database import check_db_connection
+from app.database import check_db_connection, check_replica_connections
+from app.decorators import blocking_executor
+from app.metrics import CONTENT_TYPE, registry
 
 router = APIRouter(tags=["Health Check"])
 
@@ -72,6 +74,7 @@ async def liveness_probe() -> dict[str, str]:
 ### 檢查項目
 - **應用程式**: 檢查應用程式進程狀態
 - **資料庫**: 檢查資料庫連線和基本查詢
+- **唯讀副本**: 檢查副本連線並更新健康狀態；副本故障時讀取改用其他副本或主資料庫，不影響就緒狀態
 - **快取** (未來): 檢查 Redis 連線狀態
 - **外部 API** (未來): 檢查關鍵外部服務連線
 
@@ -97,10 +100,59 @@ async def readiness_probe() -> dict[str, str]:
         dict[str, str]:只包含基本狀態資訊，避免暴露敏感資訊。
     """
     # 檢查真實資料庫連線（如果連線失敗會拋出異常）
+    # 同步的資料庫檢查在有界執行緒池中執行，連線逾時不會卡住事件迴圈
     try:
-        check_db_connection()
+        await blocking_executor.run(check_db_connection)
     except Exception:
         # 不暴露具體錯誤資訊，避免資訊洩露
         raise HTTPException(status_code=503, detail="Service Unavailable")
 
+    # 檢查唯讀副本：無法連線的副本進入冷卻，已恢復的副本提前恢復使用
+    try:
+        await blocking_executor.run(check_replica_connections)
+    except Exception:
+        # 副本只分擔讀取，檢查失敗（例如執行緒池已滿）不影響就緒狀態
+        pass
+
     return {"status": "healthy"}
+
+
+@router.get(
+    "/metrics",
+    status_code=status.HTTP_200_OK,
+    summary="監控指標",
+    response_class=Response,
+    description="""
+## 功能簡介
+- 以 Prometheus 文字格式輸出應用程式的監控指標，供 Prometheus 定期抓取
+- 不查詢資料庫，連線池狀態在抓取時才從記憶體中的連線池計算
+
+### 指標項目
+- **http_request_duration_seconds**: 請求處理時間，依方法、路由樣板、狀態碼分組
+- **http_requests_in_progress**: 處理中的請求數
+- **db_queries_per_request**: 每個請求的資料庫往返次數，依路由樣板分組
+- **db_query_duration_seconds_per_request**: 每個請求的資料庫執行時間，依路由樣板分組
+- **db_pool_size / db_pool_checked_out / db_pool_overflow**: 連線池容量、使用中連線數與溢出連線數
+- **db_pool_checkout_wait_seconds**: 從連線池取得連線的等待時間
+- **blocking_executor_capacity / blocking_executor_running / blocking_executor_queue_depth**: 阻塞呼叫執行緒池的容量、執行中與排隊中的呼叫數
+- **blocking_executor_wait_seconds**: 阻塞呼叫在佇列中等待執行緒的時間
+- **blocking_executor_rejected_total**: 佇列已滿而回應 503 的呼叫數
+- **schedule_overlap_rejections_total**: 因時段重疊而拒絕的建立、更新次數
+
+### 回應狀態
+- **200 OK**: 成功取得監控指標
+    """,
+    responses={
+        200: {
+            "description": "Prometheus 文字格式的監控指標",
+            "content": {"text/plain": {}},
+        },
+    },
+)
+async def metrics() -> Response:
+    """監控指標：以 Prometheus 文字格式輸出所有指標。
+
+    Returns:
+        Response: Prometheus 文字格式的監控指標
+    """
+    return Response(registry.render(), media_type=CONTENT_TYPE)
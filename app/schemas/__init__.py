@@ -7,16 +7,37 @@
 
 包含：
 - 時段相關模式（ScheduleBase, ScheduleResponse 等）
+- 週期規則相關模式（RecurrenceRuleBase, RecurrenceRuleResponse 等）
 """
 
 # ===== 本地模組 =====
+from .recurrence_rule import (
+    RecurrenceRuleBase,
+    RecurrenceRuleCreateRequest,
+    RecurrenceRuleResponse,
+)
 from .schedule import (
+    FreeSlotGiverResponse,
+    FreeSlotWindowResponse,
+    GiverDailySummaryResponse,
+    MatchWindowResponse,
     ScheduleBase,
+    ScheduleBatchCreateOperation,
+    ScheduleBatchDeleteOperation,
+    ScheduleBatchOperation,
+    ScheduleBatchOperationResult,
+    ScheduleBatchRequest,
+    ScheduleBatchResponse,
+    ScheduleBatchUpdateOperation,
+    ScheduleBulkDeleteRequest,
+    ScheduleBulkDeleteResponse,
     ScheduleCreateRequest,
     ScheduleDeleteRequest,
     SchedulePartialUpdateRequest,
     ScheduleResponse,
     ScheduleUpdateBase,
+    ScheduleUserResponse,
+    TakerMatchesResponse,
 )
 
 __all__ = [
@@ -26,5 +47,27 @@ __all__ = [
     "ScheduleUpdateBase",
     "SchedulePartialUpdateRequest",
     "ScheduleDeleteRequest",
+    "ScheduleBulkDeleteRequest",
+    "ScheduleBatchCreateOperation",
+    "ScheduleBatchUpdateOperation",
+    "ScheduleBatchDeleteOperation",
+    "ScheduleBatchOperation",
+    "ScheduleBatchRequest",
     "ScheduleResponse",
+    "ScheduleUserResponse",
+    "ScheduleBulkDeleteResponse",
+    "ScheduleBatchOperationResult",
+    "ScheduleBatchResponse",
+    # Giver 每日時段統計
+    "GiverDailySummaryResponse",
+    # Giver 空檔搜尋
+    "FreeSlotGiverResponse",
+    "FreeSlotWindowResponse",
+    # 共同可面談時間比對
+    "MatchWindowResponse",
+    "TakerMatchesResponse",
+    # 週期規則相關模式
+    "RecurrenceRuleBase",
+    "RecurrenceRuleCreateRequest",
+    "RecurrenceRuleResponse",
 ]
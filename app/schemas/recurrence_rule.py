@@ -0,0 +1,113 @@
+"""週期規則相關的資料驗證模式。
+
+定義 Giver 週期性可預約時段規則的請求與回應模型。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, datetime, time
+
+# ===== 第三方套件 =====
+from pydantic import BaseModel, ConfigDict, Field
+
+# ===== 本地模組 =====
+from app.enums.models import RecurrenceFrequencyEnum, UserRoleEnum
+
+
+class RecurrenceRuleBase(BaseModel):
+    """週期規則資料模型。"""
+
+    giver_id: int = Field(
+        ..., description="Giver ID", gt=0, json_schema_extra={"example": 1}
+    )
+    frequency: RecurrenceFrequencyEnum = Field(
+        ...,
+        description="頻率：DAILY 每天、WEEKLY 每週",
+        json_schema_extra={"example": RecurrenceFrequencyEnum.WEEKLY},
+    )
+    interval: int = Field(
+        1,
+        description="間隔：每幾天（DAILY）或每幾週（WEEKLY）一次",
+        ge=1,
+        le=30,
+        json_schema_extra={"example": 1},
+    )
+    weekdays: list[int] = Field(
+        default_factory=list,
+        description="星期（0 為星期一，6 為星期日），WEEKLY 必填，DAILY 忽略",
+        max_length=7,
+        json_schema_extra={"example": [1]},
+    )
+    start_time: time = Field(
+        ...,
+        description="每次的開始時間（格式：HH:MM:SS）",
+        json_schema_extra={"example": "19:00:00"},
+    )
+    end_time: time = Field(
+        ...,
+        description="每次的結束時間（格式：HH:MM:SS）",
+        json_schema_extra={"example": "21:00:00"},
+    )
+    starts_on: date = Field(
+        ...,
+        description="規則開始日期（含）",
+        json_schema_extra={"example": "2024-01-02"},
+    )
+    ends_on: date | None = Field(
+        None,
+        description="規則結束日期（含），不提供表示不結束",
+        json_schema_extra={"example": "2024-03-26"},
+    )
+    exceptions: list[date] = Field(
+        default_factory=list,
+        description="例外日期，這些日期不發生",
+        max_length=366,
+        json_schema_extra={"example": ["2024-02-13"]},
+    )
+    note: str | None = Field(
+        None,
+        description="備註，展開的時段沿用此備註",
+        max_length=255,
+        json_schema_extra={"example": "每週二晚上履歷健診"},
+    )
+
+
+# ===== 請求模型 =====
+class RecurrenceRuleCreateRequest(BaseModel):
+    """建立週期規則的 API 請求模型。"""
+
+    rule: RecurrenceRuleBase = Field(..., description="要建立的週期規則")
+    created_by: int = Field(
+        ..., description="建立者的 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    created_by_role: UserRoleEnum = Field(
+        ..., description="建立者角色", json_schema_extra={"example": UserRoleEnum.GIVER}
+    )
+
+
+# ===== 回應模型 =====
+class RecurrenceRuleResponse(BaseModel):
+    """週期規則的回應模型。"""
+
+    id: int = Field(..., description="週期規則 ID", gt=0)
+    giver_id: int = Field(..., description="Giver ID", gt=0)
+    frequency: RecurrenceFrequencyEnum = Field(..., description="頻率")
+    interval: int = Field(..., description="間隔", ge=1)
+    weekdays: list[int] = Field(
+        ..., description="星期（0 為星期一）", validation_alias="weekday_list"
+    )
+    start_time: time = Field(..., description="每次的開始時間")
+    end_time: time = Field(..., description="每次的結束時間")
+    starts_on: date = Field(..., description="規則開始日期（含）")
+    ends_on: date | None = Field(None, description="規則結束日期（含）")
+    exceptions: list[date] = Field(
+        ..., description="例外日期", validation_alias="exception_dates"
+    )
+    note: str | None = Field(None, description="備註")
+    materialized_until: date | None = Field(
+        None, description="已展開成時段的最後日期（含），之後的發生日期只存在於規則中"
+    )
+    created_at: datetime = Field(..., description="建立時間（本地時間）")
+    created_by: int | None = Field(None, description="建立者的 ID")
+    created_by_role: UserRoleEnum = Field(..., description="建立者角色")
+
+    model_config = ConfigDict(from_attributes=True)
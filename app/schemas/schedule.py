@@ -5,6 +5,7 @@
 
 # ===== 標準函式庫 =====
 from datetime import date, datetime, time
+from typing import Annotated, Literal
 
 # ===== 第三方套件 =====
 from pydantic import BaseModel, ConfigDict, Field
@@ -176,7 +177,132 @@ class ScheduleDeleteRequest(BaseModel):
     )
 
 
+class ScheduleBulkDeleteRequest(ScheduleDeleteRequest):
+    """依條件批次刪除時段的 API 請求模型。"""
+
+    giver_id: int = Field(
+        ..., description="Giver ID", gt=0, json_schema_extra={"example": 1}
+    )
+    dates: list[date] = Field(
+        ...,
+        description="要刪除的時段日期",
+        min_length=1,
+        max_length=366,
+        json_schema_extra={"example": ["2024-01-01", "2024-01-02"]},
+    )
+    status: ScheduleStatusEnum | None = Field(
+        None,
+        description="只刪除指定狀態的時段，不提供則刪除所有可刪除的狀態",
+        json_schema_extra={"example": ScheduleStatusEnum.AVAILABLE},
+    )
+
+
+class ScheduleBatchCreateOperation(BaseModel):
+    """批次操作：建立時段。"""
+
+    op: Literal["create"] = Field(..., description="操作類型")
+    schedule: ScheduleBase = Field(..., description="要建立的時段資料")
+
+
+class ScheduleBatchUpdateOperation(BaseModel):
+    """批次操作：部分更新時段。"""
+
+    op: Literal["update"] = Field(..., description="操作類型")
+    schedule_id: int = Field(
+        ..., description="時段 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    schedule: ScheduleUpdateBase = Field(..., description="要更新的時段資料")
+    version: int | None = Field(
+        None,
+        description="預期的時段版本（與 If-Match 相同），版本不符時整批回滾",
+        ge=1,
+        json_schema_extra={"example": 1},
+    )
+
+
+class ScheduleBatchDeleteOperation(BaseModel):
+    """批次操作：刪除時段。"""
+
+    op: Literal["delete"] = Field(..., description="操作類型")
+    schedule_id: int = Field(
+        ..., description="時段 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    version: int | None = Field(
+        None,
+        description="預期的時段版本（與 If-Match 相同），版本不符時整批回滾",
+        ge=1,
+        json_schema_extra={"example": 1},
+    )
+
+
+# 依 op 欄位區分的批次操作
+ScheduleBatchOperation = Annotated[
+    ScheduleBatchCreateOperation
+    | ScheduleBatchUpdateOperation
+    | ScheduleBatchDeleteOperation,
+    Field(discriminator="op"),
+]
+
+
+class ScheduleBatchRequest(BaseModel):
+    """批次操作時段的 API 請求模型。"""
+
+    operations: list[ScheduleBatchOperation] = Field(
+        ...,
+        description="依序執行的建立、更新、刪除操作",
+        min_length=1,
+        max_length=500,
+        json_schema_extra={
+            "example": [
+                {
+                    "op": "create",
+                    "schedule": {
+                        "giver_id": 1,
+                        "date": "2024-01-01",
+                        "start_time": "09:00:00",
+                        "end_time": "10:00:00",
+                    },
+                },
+                {
+                    "op": "update",
+                    "schedule_id": 2,
+                    "schedule": {"start_time": "14:00:00", "end_time": "15:00:00"},
+                    "version": 1,
+                },
+                {"op": "delete", "schedule_id": 3},
+            ]
+        },
+    )
+    operated_by: int = Field(
+        ..., description="操作者的 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    operated_by_role: UserRoleEnum = Field(
+        ..., description="操作者角色", json_schema_extra={"example": UserRoleEnum.GIVER}
+    )
+
+
 # ===== 回應模型 =====
+class ScheduleBulkDeleteResponse(BaseModel):
+    """批次刪除時段的回應模型。"""
+
+    deleted_count: int = Field(
+        ..., description="刪除的時段數量", ge=0, json_schema_extra={"example": 5}
+    )
+
+
+class ScheduleUserResponse(BaseModel):
+    """時段關聯使用者的回應模型，以 include 查詢參數附加到時段回應。"""
+
+    id: int = Field(
+        ..., description="使用者 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    name: str = Field(
+        ..., description="使用者名稱", json_schema_extra={"example": "王零一"}
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class ScheduleResponse(BaseModel):
     """時段回應模型。"""
 
@@ -249,6 +375,12 @@ class ScheduleResponse(BaseModel):
         description="最後更新者角色",
         json_schema_extra={"example": UserRoleEnum.GIVER},
     )
+    version: int = Field(
+        ...,
+        description="版本號（樂觀鎖），每次更新遞增，與 ETag 標頭相同",
+        ge=1,
+        json_schema_extra={"example": 1},
+    )
     deleted_at: datetime | None = Field(
         None, description="軟刪除標記（本地時間）", json_schema_extra={"example": None}
     )
@@ -263,3 +395,111 @@ class ScheduleResponse(BaseModel):
     )
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class GiverDailySummaryResponse(BaseModel):
+    """Giver 每日時段狀態統計的回應模型。"""
+
+    summary_date: date = Field(
+        ...,
+        description="日期",
+        alias="date",
+        json_schema_extra={"example": "2024-01-01"},
+    )
+    draft_count: int = Field(..., description="草稿時段數量", ge=0)
+    available_count: int = Field(..., description="可預約時段數量", ge=0)
+    pending_count: int = Field(..., description="等待 Giver 回覆的時段數量", ge=0)
+    accepted_count: int = Field(..., description="已接受的時段數量", ge=0)
+    rejected_count: int = Field(..., description="已拒絕的時段數量", ge=0)
+    cancelled_count: int = Field(..., description="已取消的時段數量", ge=0)
+    completed_count: int = Field(..., description="已完成的時段數量", ge=0)
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class FreeSlotWindowResponse(BaseModel):
+    """某一天最早符合條件的空檔視窗。"""
+
+    window_date: date = Field(
+        ...,
+        description="日期",
+        alias="date",
+        json_schema_extra={"example": "2024-01-01"},
+    )
+    start_time: time = Field(
+        ..., description="視窗開始時間", json_schema_extra={"example": "09:00:00"}
+    )
+    end_time: time = Field(
+        ..., description="視窗結束時間", json_schema_extra={"example": "10:00:00"}
+    )
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class FreeSlotGiverResponse(BaseModel):
+    """空檔搜尋中符合條件的 Giver。"""
+
+    giver_id: int = Field(
+        ..., description="Giver ID", gt=0, json_schema_extra={"example": 1}
+    )
+    windows: list[FreeSlotWindowResponse] = Field(
+        ..., description="每天最早符合條件的視窗，依日期排序"
+    )
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class MatchWindowResponse(BaseModel):
+    """Taker 提案與 Giver 開放時段交集的候選視窗。"""
+
+    window_date: date = Field(
+        ...,
+        description="日期",
+        alias="date",
+        json_schema_extra={"example": "2024-01-01"},
+    )
+    start_time: time = Field(
+        ..., description="視窗開始時間", json_schema_extra={"example": "09:00:00"}
+    )
+    end_time: time = Field(
+        ..., description="視窗結束時間", json_schema_extra={"example": "10:00:00"}
+    )
+    minutes: int = Field(..., description="視窗長度（分鐘）", gt=0)
+    proposal_id: int = Field(..., description="Taker 提出的時段 ID", gt=0)
+    opening_id: int = Field(..., description="Giver 可預約的時段 ID", gt=0)
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class TakerMatchesResponse(BaseModel):
+    """Giver 收件匣中一個 Taker 的候選視窗。"""
+
+    taker_id: int = Field(
+        ..., description="Taker ID", gt=0, json_schema_extra={"example": 2}
+    )
+    windows: list[MatchWindowResponse] = Field(..., description="依排名排序的候選視窗")
+
+    model_config = ConfigDict(from_attributes=True)
+
+
+class ScheduleBatchOperationResult(BaseModel):
+    """批次操作中單一操作的結果。"""
+
+    index: int = Field(
+        ..., description="操作在請求中的索引", ge=0, json_schema_extra={"example": 0}
+    )
+    op: Literal["create", "update", "delete"] = Field(..., description="操作類型")
+    schedule_id: int = Field(
+        ..., description="時段 ID", gt=0, json_schema_extra={"example": 1}
+    )
+    schedule: ScheduleResponse | None = Field(
+        None, description="建立或更新後的時段，刪除操作為 null"
+    )
+
+
+class ScheduleBatchResponse(BaseModel):
+    """批次操作時段的回應模型。"""
+
+    results: list[ScheduleBatchOperationResult] = Field(
+        ..., description="依請求順序排列的操作結果"
+    )
@@ -1,13 +1,31 @@
 """服務層模組。
 
-提供業務邏輯處理服務，包括時段管理等。
+提供業務邏輯處理服務，包括時段管理、週期規則等。
 """
 
 # ===== 本地模組 =====
-from .schedule import schedule_service, ScheduleService
+from .recurrence_rule import (
+    async_recurrence_rule_service,
+    AsyncRecurrenceRuleService,
+    recurrence_rule_service,
+    RecurrenceRuleService,
+)
+from .schedule import (
+    async_schedule_service,
+    AsyncScheduleService,
+    schedule_service,
+    ScheduleService,
+)
 
 __all__ = [
     # 時段管理服務
     "ScheduleService",
     "schedule_service",
+    "AsyncScheduleService",
+    "async_schedule_service",
+    # 週期規則服務
+    "RecurrenceRuleService",
+    "recurrence_rule_service",
+    "AsyncRecurrenceRuleService",
+    "async_recurrence_rule_service",
 ]
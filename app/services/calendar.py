@@ -0,0 +1,228 @@
+"""行事曆訂閱（iCalendar）模組。
+
+將使用者已接受（ACCEPTED）的時段產生成 iCalendar（RFC 5545）訂閱內容，
+並在行程內依使用者快取，讓行事曆用戶端頻繁輪詢時不必每次查詢資料庫：
+
+- 快取鍵：(角色, 使用者 ID)，Giver 與 Taker 各有一份訂閱
+- 寫入失效：ScheduleService 的寫入 commit 後，使相關使用者的訂閱失效
+- 存活時間：多個 worker 行程各自持有快取，以 TTL 限制其他行程寫入造成的過期時間
+- 驗證器：ETag 為內容雜湊，Last-Modified 為訂閱內容產生的時間
+"""
+
+# ===== 標準函式庫 =====
+from collections import OrderedDict
+from datetime import date, datetime, time, timezone
+import hashlib
+import threading
+import time as time_module
+from typing import Any, Iterable, NamedTuple
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.enums.models import UserRoleEnum
+from app.utils.timezone import TAIWAN_TIMEZONE
+
+# 產生訂閱內容需要的時段欄位
+CALENDAR_FIELDS = ("date", "start_time", "end_time", "note", "updated_at", "version")
+
+CALENDAR_MEDIA_TYPE = "text/calendar; charset=utf-8"
+
+_PRODID = "-//104 Resume Clinic//Scheduler//ZH-TW"
+_UID_DOMAIN = "104-resume-clinic-scheduler"  # 事件 UID 的網域部分，需全域唯一且固定
+_CALENDAR_NAMES = {
+    UserRoleEnum.GIVER: "104 履歷診療室（Giver）",
+    UserRoleEnum.TAKER: "104 履歷診療室（Taker）",
+}
+
+CalendarKey = tuple[UserRoleEnum, int]
+
+
+class CalendarFeed(NamedTuple):
+    """已產生的行事曆訂閱內容與 HTTP 驗證器。"""
+
+    body: bytes
+    etag: str
+    last_modified: datetime  # UTC，已捨去微秒，與 HTTP 日期的精度相同
+
+
+def _escape_text(value: str) -> str:
+    """依 RFC 5545 跳脫 TEXT 值中的反斜線、分號、逗號與換行。"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+    )
+
+
+def _fold_line(line: str) -> str:
+    """依 RFC 5545 將超過 75 位元組的內容行折行，不切斷 UTF-8 字元。"""
+    encoded = line.encode()
+    if len(encoded) <= 75:
+        return line
+
+    parts: list[str] = []
+    current = ""
+    limit = 75
+    for char in line:
+        if len((current + char).encode()) > limit:
+            parts.append(current)
+            current = ""
+            limit = 74  # 續行開頭的空白佔一個位元組
+        current += char
+    parts.append(current)
+    return "\r\n ".join(parts)
+
+
+def _utc_stamp(value: datetime) -> str:
+    """將本地（台灣時間）的 naive datetime 格式化為 UTC 的 iCalendar 時間。"""
+    utc = value.replace(tzinfo=TAIWAN_TIMEZONE).astimezone(timezone.utc)
+    return utc.strftime("%Y%m%dT%H%M%SZ")
+
+
+def _local_datetime(schedule_date: date, schedule_time: time) -> datetime:
+    """合併時段的日期與時間。"""
+    return datetime.combine(schedule_date, schedule_time)
+
+
+def render_schedule_calendar(rows: Iterable[Any], role: UserRoleEnum) -> bytes:
+    """將時段資料列產生成 iCalendar 內容。
+
+    內容只由時段資料決定（DTSTAMP 使用時段的更新時間），
+    相同的時段產生相同的位元組，因此內容雜湊可作為跨 worker 一致的 ETag。
+
+    Args:
+        rows: 具有 id 與 CALENDAR_FIELDS 屬性的時段資料列
+        role: 訂閱者角色
+
+    Returns:
+        bytes: 以 CRLF 換行的 UTF-8 iCalendar 內容
+    """
+    lines = [
+        "BEGIN:VCALENDAR",
+        "VERSION:2.0",
+        f"PRODID:{_PRODID}",
+        "CALSCALE:GREGORIAN",
+        "METHOD:PUBLISH",
+        f"X-WR-CALNAME:{_escape_text(_CALENDAR_NAMES[role])}",
+    ]
+    for row in rows:
+        start = _local_datetime(row.date, row.start_time)
+        end = _local_datetime(row.date, row.end_time)
+        modified = _utc_stamp(row.updated_at or start)
+        lines += [
+            "BEGIN:VEVENT",
+            f"UID:schedule-{row.id}@{_UID_DOMAIN}",
+            f"DTSTAMP:{modified}",
+            f"LAST-MODIFIED:{modified}",
+            f"SEQUENCE:{max(row.version - 1, 0)}",
+            f"DTSTART:{_utc_stamp(start)}",
+            f"DTEND:{_utc_stamp(end)}",
+            f"SUMMARY:{_escape_text('履歷諮詢面談')}",
+        ]
+        if row.note:
+            lines.append(f"DESCRIPTION:{_escape_text(row.note)}")
+        lines.append("END:VEVENT")
+    lines.append("END:VCALENDAR")
+
+    return ("\r\n".join(_fold_line(line) for line in lines) + "\r\n").encode()
+
+
+def build_calendar_feed(body: bytes) -> CalendarFeed:
+    """為訂閱內容建立 ETag（內容雜湊）與 Last-Modified（產生時間）。
+
+    Last-Modified 使用產生時間而不是時段的最後更新時間：
+    時段不再是 ACCEPTED 時會從訂閱中移除，最後更新時間可能倒退，
+    產生時間則在每次失效重建後只會往後，If-Modified-Since 不會誤判為未修改。
+    """
+    digest = hashlib.blake2b(body, digest_size=16).hexdigest()
+    last_modified = datetime.now(timezone.utc).replace(microsecond=0)
+    return CalendarFeed(body, f'"{digest}"', last_modified)
+
+
+class ScheduleCalendarCache:
+    """行程內的行事曆訂閱快取（LRU + TTL）。"""
+
+    def __init__(
+        self, ttl_seconds: float | None = None, max_entries: int = 10000
+    ) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._feeds: OrderedDict[CalendarKey, tuple[CalendarFeed, float]] = (
+            OrderedDict()
+        )
+        # 路由在事件迴圈上讀取、同步服務在執行緒中寫入，字典的讀寫一律在 _lock 內進行
+        self._lock = threading.Lock()
+        # 每次失效遞增：產生期間若有寫入失效，產生的結果只回傳、不寫回快取，避免快取舊資料
+        self._generation = 0
+
+        # 統計資料
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def generation(self) -> int:
+        """目前的失效世代，產生訂閱前取得，寫回快取時比對。"""
+        with self._lock:
+            return self._generation
+
+    def get(self, role: UserRoleEnum, user_id: int) -> CalendarFeed | None:
+        """取得快取的訂閱，不存在或已過期時回傳 None。"""
+        key = (role, user_id)
+        now = time_module.monotonic()
+        with self._lock:
+            entry = self._feeds.get(key)
+            if entry is not None and (
+                self.ttl_seconds is None or now - entry[1] < self.ttl_seconds
+            ):
+                self._feeds.move_to_end(key)
+                self._hits += 1
+                return entry[0]
+            self._misses += 1
+            return None
+
+    def put(
+        self, role: UserRoleEnum, user_id: int, feed: CalendarFeed, generation: int
+    ) -> None:
+        """寫回產生的訂閱；產生期間已有失效時不寫回。"""
+        with self._lock:
+            if generation != self._generation:
+                return
+            self._feeds[(role, user_id)] = (feed, time_module.monotonic())
+            self._feeds.move_to_end((role, user_id))
+            while len(self._feeds) > self.max_entries:
+                self._feeds.popitem(last=False)
+
+    def invalidate(
+        self, giver_ids: Iterable[int] = (), taker_ids: Iterable[int] = ()
+    ) -> None:
+        """使指定 Giver、Taker 的訂閱失效，下次輪詢時重新產生。"""
+        with self._lock:
+            self._generation += 1
+            for giver_id in giver_ids:
+                self._feeds.pop((UserRoleEnum.GIVER, giver_id), None)
+            for taker_id in taker_ids:
+                self._feeds.pop((UserRoleEnum.TAKER, taker_id), None)
+
+    def clear(self) -> None:
+        """清空快取，用於無法得知受影響使用者的寫入。"""
+        with self._lock:
+            self._generation += 1
+            self._feeds.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        """取得快取統計資料。"""
+        with self._lock:
+            return {
+                "feeds": len(self._feeds),
+                "hits": self._hits,
+                "misses": self._misses,
+            }
+
+
+# 全域行事曆訂閱快取
+schedule_calendar_cache = ScheduleCalendarCache(
+    ttl_seconds=settings.schedule_calendar_cache_ttl_seconds,
+    max_entries=settings.schedule_calendar_cache_max_entries,
+)
@@ -0,0 +1,135 @@
+"""Taker 提案與 Giver 開放時段的共同時間比對演算法模組。
+
+Taker 提出的時段（PENDING）代表 Taker 有空的時間，Giver 的可預約時段（AVAILABLE）
+代表 Giver 開放的時間，兩者的交集即為雙方都可以面談的候選視窗。
+
+兩個區間列表依 (日期, 開始時間) 排序後線性合併掃描，掃描時只保留尚未結束的區間，
+每組成本為 O(n + m + 交集數)；輸入已排序時排序本身也是線性的（Timsort 合併已排序的區段），
+因此可以對 Giver 的整個收件匣（每個 Taker 各一次）重複使用同一份開放時段。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+from typing import Iterable, Mapping, NamedTuple, Sequence
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+
+
+class MatchWindow(NamedTuple):
+    """雙方都有空的候選視窗，以及交集來源的提案與開放時段。"""
+
+    date: date
+    start_time: time
+    end_time: time
+    minutes: int
+    proposal_id: int | None
+    opening_id: int | None
+
+
+class TakerMatches(NamedTuple):
+    """收件匣中一個 Taker 的候選視窗，依排名排序。"""
+
+    taker_id: int
+    windows: list[MatchWindow]
+
+
+def _minutes(value: time) -> int:
+    """將時間轉換成當天的分鐘數。"""
+    return value.hour * 60 + value.minute
+
+
+def _sort_key(interval: ScheduleInterval) -> tuple[date, time, time]:
+    """區間的排序鍵：日期、開始時間、結束時間。"""
+    return interval.date, interval.start_time, interval.end_time
+
+
+def intersect_intervals(
+    proposals: Iterable[ScheduleInterval],
+    openings: Iterable[ScheduleInterval],
+    min_minutes: int = 1,
+) -> list[MatchWindow]:
+    """找出提案與開放時段的所有交集，依日期與開始時間排序。
+
+    同一側的區間可以彼此重疊（例如 Taker 向多個 Giver 提出相同的時間），
+    每一組重疊的 (提案, 開放時段) 各產生一個視窗；相鄰的區間不算交集。
+
+    Args:
+        proposals: Taker 提出的時段
+        openings: Giver 的可預約時段
+        min_minutes: 視窗的最短長度（分鐘），較短的交集不回報
+
+    Returns:
+        list[MatchWindow]: 交集視窗
+    """
+    # 兩側各自排序後合併；第三個元素區分提案（0）與開放時段（1）
+    merged = sorted(
+        [(_sort_key(p), 0, i, p) for i, p in enumerate(proposals)]
+        + [(_sort_key(o), 1, i, o) for i, o in enumerate(openings)],
+        key=lambda item: item[:3],
+    )
+
+    windows: list[MatchWindow] = []
+    active: tuple[list[ScheduleInterval], list[ScheduleInterval]] = ([], [])
+    current_date: date | None = None
+    for (day, start, end), side, _, interval in merged:
+        if day != current_date:
+            active[0].clear()
+            active[1].clear()
+            current_date = day
+
+        # 移除另一側已結束的區間：結束時間等於開始時間視為相鄰，不算交集
+        other = active[1 - side]
+        other[:] = [item for item in other if item.end_time > start]
+        for item in other:
+            window_end = min(end, item.end_time)
+            minutes = _minutes(window_end) - _minutes(start)
+            if minutes >= min_minutes:
+                proposal, opening = (interval, item) if side == 0 else (item, interval)
+                windows.append(
+                    MatchWindow(
+                        date=day,
+                        start_time=start,
+                        end_time=window_end,
+                        minutes=minutes,
+                        proposal_id=proposal.id,
+                        opening_id=opening.id,
+                    )
+                )
+        active[side].append(interval)
+
+    return windows
+
+
+def rank_windows(
+    windows: Sequence[MatchWindow], limit: int | None = None
+) -> list[MatchWindow]:
+    """候選視窗排名：越早越前面，同一個開始時間時較長的視窗在前。"""
+    ranked = sorted(
+        windows, key=lambda w: (w.date, w.start_time, -w.minutes, w.end_time)
+    )
+    return ranked[:limit] if limit is not None else ranked
+
+
+def match_inbox(
+    proposals_by_taker: Mapping[int, Sequence[ScheduleInterval]],
+    openings: Sequence[ScheduleInterval],
+    min_minutes: int = 1,
+    limit: int | None = None,
+) -> list[TakerMatches]:
+    """比對 Giver 收件匣中每個 Taker 的提案與同一份開放時段。
+
+    開放時段只排序一次，每個 Taker 各做一次線性合併。
+
+    Returns:
+        list[TakerMatches]: 依 taker_id 排序，只包含有候選視窗的 Taker
+    """
+    openings = sorted(openings, key=_sort_key)
+    results = []
+    for taker_id in sorted(proposals_by_taker):
+        windows = intersect_intervals(
+            proposals_by_taker[taker_id], openings, min_minutes
+        )
+        if windows:
+            results.append(TakerMatches(taker_id, rank_windows(windows, limit)))
+    return results
@@ -0,0 +1,68 @@
+"""時段重疊檢查演算法模組。
+
+以排序掃描（sort-and-sweep）一次找出同一 Giver 同一天內所有重疊的時段區間，
+同時涵蓋「新時段 vs 資料庫現有時段」與「同一批新時段彼此之間」的衝突。
+"""
+
+# ===== 標準函式庫 =====
+from collections import defaultdict
+from datetime import date, time
+from typing import Iterable, Sequence
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+
+
+def find_overlaps(
+    existing: Iterable[ScheduleInterval],
+    incoming: Sequence[ScheduleInterval],
+) -> list[ScheduleInterval]:
+    """找出與新時段重疊的所有區間。
+
+    依 (giver_id, date) 分組後，每組依開始時間排序掃描一次，
+    掃描時只保留尚未結束的區間，因此每組成本為 O(n log n + 衝突數)。
+
+    回報規則：
+    - 新時段與現有時段重疊：回報現有時段（每組衝突各回報一次）
+    - 新時段彼此重疊：回報開始時間較晚的新時段
+    - 現有時段彼此重疊：不屬於本次請求的衝突，不回報
+
+    Args:
+        existing: 資料庫中可能重疊的現有時段
+        incoming: 本次要寫入的新時段
+
+    Returns:
+        list[ScheduleInterval]: 衝突的區間，依 (giver_id, date, start_time) 排序
+    """
+    # 分組：(giver_id, date) -> [(開始時間, 結束時間, 是否為新時段, 區間)]
+    groups: dict[tuple[int, date], list[tuple[time, time, bool, ScheduleInterval]]]
+    groups = defaultdict(list)
+    for interval in incoming:
+        groups[(interval.giver_id, interval.date)].append(
+            (interval.start_time, interval.end_time, True, interval)
+        )
+    for interval in existing:
+        key = (interval.giver_id, interval.date)
+        # 只檢查有新時段的分組，避免呼叫端多查的資料造成多餘計算
+        if key in groups:
+            groups[key].append(
+                (interval.start_time, interval.end_time, False, interval)
+            )
+
+    conflicts: list[ScheduleInterval] = []
+    for key in sorted(groups):
+        active: list[tuple[time, bool, ScheduleInterval]] = []
+        # 依開始時間排序；開始時間相同時現有時段在前，新時段維持輸入順序（穩定排序）
+        for start, end, is_incoming, interval in sorted(
+            groups[key], key=lambda item: (item[0], item[2])
+        ):
+            # 移除已結束的區間：結束時間等於開始時間視為相鄰，不算重疊
+            active = [item for item in active if item[0] > start]
+            for _, active_is_incoming, active_interval in active:
+                if is_incoming and not active_is_incoming:
+                    conflicts.append(active_interval)  # 新時段與現有時段重疊
+                elif is_incoming or active_is_incoming:
+                    conflicts.append(interval)  # 回報開始時間較晚的一方
+            active.append((end, is_incoming, interval))
+
+    return conflicts
@@ -0,0 +1,283 @@
+"""時段讀取快取模組。
+
+以可替換的快取後端（行程內 LRU + TTL 或 Redis）快取時段列表與單一時段的回應內容：
+
+- 範圍世代：快取項目記錄讀取當下相關範圍（Giver、Taker、時段、全部）的世代計數器，
+  世代不同即視為失效；寫入 commit 後遞增受影響範圍的世代，不需要逐一刪除快取鍵
+- 延後失效：同步服務在 commit 後把受影響的範圍記錄在 Session.info，
+  由非同步服務在 run_sync 返回後遞增世代，Redis 的網路 I/O 不會阻塞在同步程式碼中
+- stale-while-revalidate：超過新鮮時間但仍在允許範圍內時，先回傳舊內容，同時在背景重新查詢
+- stale-if-error：資料庫查詢失敗時，在允許範圍內回傳最後一次的內容（即使已失效）
+- 唯讀副本：副本可能尚未複寫到遞增世代的寫入，未命中時改由主資料庫查詢後才寫回；
+  客戶端剛寫入（read-your-writes）時不使用快取，直接讀主資料庫
+- 快取後端失敗時記錄警告並直接查詢資料庫，快取只影響效能，不影響可用性
+"""
+
+# ===== 標準函式庫 =====
+import asyncio
+import hashlib
+import logging
+import time as time_module
+from typing import Any, Awaitable, Callable, Iterable, Sequence
+
+# ===== 第三方套件 =====
+import orjson
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.cache import CacheBackend, create_cache_backend
+from app.core import settings
+from app.database.replicas import READ_FROM_REPLICA_KEY, READ_YOUR_WRITES_KEY
+from app.errors.exceptions import DatabaseError
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+# Session.info 中待遞增世代的範圍：同步服務在 commit 後加入，非同步服務取出後遞增
+PENDING_SCOPES_KEY = "schedule_read_cache_pending"
+
+# 不依 Giver、Taker 篩選的列表使用的範圍，任何寫入都會遞增
+ALL_SCOPE = "all"
+
+_KEY_PREFIX = "schedule-read:"
+
+Loader = Callable[[AsyncSession], Awaitable[Any]]
+
+
+def list_scopes(giver_id: int | None, taker_id: int | None) -> list[str]:
+    """時段列表依賴的範圍：依 Giver、Taker 篩選時為該使用者，否則為全部。"""
+    scopes = []
+    if giver_id is not None:
+        scopes.append(f"giver:{giver_id}")
+    if taker_id is not None:
+        scopes.append(f"taker:{taker_id}")
+    return scopes or [ALL_SCOPE]
+
+
+def schedule_scopes(schedule_id: int) -> list[str]:
+    """單一時段依賴的範圍。"""
+    return [f"schedule:{schedule_id}"]
+
+
+def write_scopes(
+    giver_ids: Iterable[int | None] = (),
+    taker_ids: Iterable[int | None] = (),
+    schedule_ids: Iterable[int | None] = (),
+) -> set[str]:
+    """寫入影響的範圍：相關的 Giver、Taker、時段，以及不篩選的列表。"""
+    scopes = {ALL_SCOPE}
+    scopes.update(f"giver:{i}" for i in giver_ids if i is not None)
+    scopes.update(f"taker:{i}" for i in taker_ids if i is not None)
+    scopes.update(f"schedule:{i}" for i in schedule_ids if i is not None)
+    return scopes
+
+
+def cache_key(*parts: Any) -> str:
+    """以查詢參數建立快取鍵。"""
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f"{parts[0]}:{digest}"
+
+
+class ScheduleReadCache:
+    """時段讀取快取。"""
+
+    def __init__(
+        self,
+        backend: CacheBackend | None,
+        ttl_seconds: float = 30.0,
+        stale_while_revalidate_seconds: float = 0.0,
+        stale_if_error_seconds: float = 0.0,
+    ) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.stale_while_revalidate_seconds = stale_while_revalidate_seconds
+        self.stale_if_error_seconds = stale_if_error_seconds
+
+        # 背景重新查詢中的快取鍵，同一個鍵同時只重新查詢一次
+        self._refreshing: set[str] = set()
+        self._tasks: set[asyncio.Task] = set()
+
+    @property
+    def enabled(self) -> bool:
+        """是否啟用讀取快取。"""
+        return self.backend is not None
+
+    @property
+    def _entry_ttl_seconds(self) -> float:
+        """快取項目在後端的存活時間：新鮮時間加上可回傳舊內容的時間。"""
+        return self.ttl_seconds + max(
+            self.stale_while_revalidate_seconds, self.stale_if_error_seconds
+        )
+
+    def mark_stale(self, db: Session, scopes: Iterable[str]) -> None:
+        """記錄寫入影響的範圍，由 flush 遞增世代；作為 commit 後回呼使用。"""
+        if self.enabled:
+            db.info.setdefault(PENDING_SCOPES_KEY, set()).update(scopes)
+
+    async def flush(self, db: AsyncSession) -> None:
+        """遞增 Session 中記錄的範圍世代，使相關的快取內容失效。"""
+        scopes = db.sync_session.info.pop(PENDING_SCOPES_KEY, None)
+        if not scopes or self.backend is None:
+            return
+        try:
+            await self.backend.bump(f"{_KEY_PREFIX}gen:{s}" for s in sorted(scopes))
+        except Exception as e:
+            # 無法失效時，舊內容最多在新鮮時間內仍被回傳
+            logger.error(f"讀取快取失效失敗: scopes={sorted(scopes)}, 錯誤: {str(e)}")
+
+    async def get_or_load(
+        self,
+        db: AsyncSession,
+        key: str,
+        scopes: Sequence[str],
+        load: Loader,
+        session_factory: async_sessionmaker | None = None,
+    ) -> Any:
+        """取得快取內容，未命中時以 load 查詢資料庫並寫回快取。
+
+        寫回的內容一律來自主資料庫：db 連到副本時，未命中改以 session_factory 開啟的會話查詢；
+        沒有 session_factory 時以副本查詢但不寫回。客戶端剛寫入時 db 為主資料庫，直接查詢不使用快取。
+
+        Args:
+            db: 請求的非同步資料庫會話，未命中時傳給 load
+            key: 快取鍵（cache_key 的結果）
+            scopes: 內容依賴的範圍（list_scopes、schedule_scopes 的結果）
+            load: 查詢資料庫並回傳可序列化成 JSON 的內容
+            session_factory: 主資料庫的會話工廠，用於副本未命中與背景重新查詢；
+                None 表示不在背景重新查詢
+
+        Returns:
+            Any: 快取或查詢得到的內容
+        """
+        info = db.sync_session.info
+        if self.backend is None or info.get(READ_YOUR_WRITES_KEY):
+            return await load(db)
+
+        gen_keys = [f"{_KEY_PREFIX}gen:{scope}" for scope in scopes]
+        entry_key = f"{_KEY_PREFIX}entry:{key}"
+        try:
+            *generations, raw = await self.backend.get_many(gen_keys + [entry_key])
+            if any(generation is None for generation in generations):
+                # 世代尚未建立或已被淘汰：先建立，之後寫回的內容才有可比對的世代
+                await self.backend.bump(
+                    k for k, g in zip(gen_keys, generations) if g is None
+                )
+                generations = await self.backend.get_many(gen_keys)
+        except Exception as e:
+            logger.warning(f"讀取快取失敗，直接查詢資料庫: key={key}, 錯誤: {str(e)}")
+            return await load(db)
+
+        current = [
+            int(generation) for generation in generations if generation is not None
+        ]
+        if len(current) != len(gen_keys):
+            # 世代建立後隨即被淘汰：無法判斷快取是否為最新，直接查詢資料庫
+            logger.warning(f"讀取快取世代失敗，直接查詢資料庫: key={key}")
+            return await load(db)
+
+        entry: dict[str, Any] | None = None
+        age = 0.0
+        if raw is not None:
+            entry = orjson.loads(raw)
+            age = time_module.time() - entry["t"]
+
+        if entry is not None and entry["g"] == current:
+            if age < self.ttl_seconds:
+                return entry["d"]
+            if age < self.ttl_seconds + self.stale_while_revalidate_seconds:
+                if session_factory is not None:
+                    self._refresh_later(
+                        key, entry_key, gen_keys, current, load, session_factory
+                    )
+                return entry["d"]
+
+        from_replica = info.get(READ_FROM_REPLICA_KEY, False)
+        try:
+            if from_replica and session_factory is not None:
+                # 副本可能落後於這次讀取的世代，寫回的內容改由主資料庫查詢
+                async with session_factory() as primary:
+                    data = await load(primary)
+            else:
+                data = await load(db)
+        except (DatabaseError, SQLAlchemyError):
+            if (
+                entry is not None
+                and age < self.ttl_seconds + self.stale_if_error_seconds
+            ):
+                logger.warning(f"資料庫查詢失敗，回傳快取的舊內容: key={key}")
+                return entry["d"]
+            raise
+
+        if not from_replica or session_factory is not None:
+            await self._store(entry_key, gen_keys, current, data)
+        return data
+
+    async def _store(
+        self,
+        entry_key: str,
+        gen_keys: list[str],
+        generations: list[int],
+        data: Any,
+    ) -> None:
+        """寫回查詢結果，記錄查詢前讀取的世代。
+
+        寫回前再次讀取世代，與查詢前不同（查詢期間有寫入）時不寫回，不以可能過時的內容取代快取；
+        比對與寫回之間的寫入仍會使項目記錄的世代過時，下次讀取即視為失效。
+        """
+        if self.backend is None:
+            return
+        entry = orjson.dumps({"g": generations, "t": time_module.time(), "d": data})
+        try:
+            current = await self.backend.get_many(gen_keys)
+            if [int(g) for g in current if g is not None] != generations:
+                logger.info(f"查詢期間世代已變更，不寫回讀取快取: key={entry_key}")
+                return
+            await self.backend.set(entry_key, entry, self._entry_ttl_seconds)
+        except Exception as e:
+            logger.warning(f"寫入讀取快取失敗: key={entry_key}, 錯誤: {str(e)}")
+
+    def _refresh_later(
+        self,
+        key: str,
+        entry_key: str,
+        gen_keys: list[str],
+        generations: list[int],
+        load: Loader,
+        session_factory: async_sessionmaker,
+    ) -> None:
+        """在背景重新查詢並寫回快取，請求的會話結束後仍可執行，因此使用新的會話。"""
+        if key in self._refreshing:
+            return
+        self._refreshing.add(key)
+
+        async def refresh() -> None:
+            try:
+                async with session_factory() as db:
+                    data = await load(db)
+                await self._store(entry_key, gen_keys, generations, data)
+            except Exception as e:
+                logger.warning(f"背景重新查詢讀取快取失敗: key={key}, 錯誤: {str(e)}")
+            finally:
+                self._refreshing.discard(key)
+
+        task = asyncio.get_running_loop().create_task(refresh())
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def wait_for_refreshes(self) -> None:
+        """等待背景重新查詢完成，用於測試與關閉前。"""
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
+# 全域時段讀取快取
+schedule_read_cache = ScheduleReadCache(
+    create_cache_backend(settings),
+    ttl_seconds=settings.schedule_read_cache_ttl_seconds,
+    stale_while_revalidate_seconds=(
+        settings.schedule_read_cache_stale_while_revalidate_seconds
+    ),
+    stale_if_error_seconds=settings.schedule_read_cache_stale_if_error_seconds,
+)
@@ -0,0 +1,192 @@
+"""週期規則的發生日期計算模組。
+
+週期規則以 (頻率, 間隔, 星期遮罩, 起訖日期, 例外日期) 表示，不儲存每一個發生日期：
+- occurs_on：以算術判斷某天是否發生，O(1)，重疊檢查不必展開規則
+- iter_occurrences：惰性產生發生日期，只在展開滾動期間或列出發生日期時使用
+- find_rule_conflicts：新時段與規則中尚未展開的發生日期的重疊
+- first_common_date：兩條規則第一個同時發生的日期，只在一個週期內搜尋
+"""
+
+# ===== 標準函式庫 =====
+from collections import defaultdict
+from datetime import date, timedelta
+from math import lcm
+from typing import Iterable, Iterator, Sequence
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+from app.crud.recurrence_rule import RecurrencePattern
+from app.enums.models import RecurrenceFrequencyEnum, ScheduleStatusEnum
+
+# 星期位元遮罩：bit 0 為星期一（date.weekday() == 0），bit 6 為星期日
+ALL_WEEKDAYS = 0b1111111
+
+
+def weekday_mask(weekdays: Iterable[int]) -> int:
+    """將星期列表（0 為星期一）轉換成位元遮罩。"""
+    mask = 0
+    for weekday in weekdays:
+        mask |= 1 << weekday
+    return mask
+
+
+def mask_weekdays(mask: int) -> list[int]:
+    """將位元遮罩轉換成星期列表（0 為星期一）。"""
+    return [weekday for weekday in range(7) if mask >> weekday & 1]
+
+
+def period_days(pattern: RecurrencePattern) -> int:
+    """規則重複的週期天數：每 interval 天，或每 interval 週。"""
+    if pattern.frequency == RecurrenceFrequencyEnum.DAILY:
+        return pattern.interval
+    return 7 * pattern.interval
+
+
+def _week_start(day: date) -> date:
+    """日期所在週的星期一。"""
+    return day - timedelta(days=day.weekday())
+
+
+def occurs_on(pattern: RecurrencePattern, day: date) -> bool:
+    """檢查規則在指定日期是否發生（不考慮是否已展開）。"""
+    if day < pattern.starts_on or (
+        pattern.ends_on is not None and day > pattern.ends_on
+    ):
+        return False
+    if day in pattern.exceptions:
+        return False
+    if pattern.frequency == RecurrenceFrequencyEnum.DAILY:
+        return (day - pattern.starts_on).days % pattern.interval == 0
+    # WEEKLY：星期在遮罩中，且與開始日期所在週相隔的週數是間隔的倍數
+    weeks = (day - _week_start(pattern.starts_on)).days // 7
+    return bool(pattern.weekdays >> day.weekday() & 1) and weeks % pattern.interval == 0
+
+
+def is_pending(pattern: RecurrencePattern, day: date) -> bool:
+    """檢查規則在指定日期是否發生且尚未展開成時段。"""
+    if pattern.materialized_until is not None and day <= pattern.materialized_until:
+        return False
+    return occurs_on(pattern, day)
+
+
+def iter_occurrences(
+    pattern: RecurrencePattern,
+    date_from: date | None = None,
+    date_to: date | None = None,
+) -> Iterator[date]:
+    """惰性產生 [date_from, date_to] 內的發生日期，依日期遞增。
+
+    date_to 與規則的 ends_on 都是 None 時不會結束，由呼叫端決定取用的數量。
+    """
+    first = max(pattern.starts_on, date_from or pattern.starts_on)
+    last = min(
+        (d for d in (date_to, pattern.ends_on) if d is not None),
+        default=None,
+    )
+
+    if pattern.frequency == RecurrenceFrequencyEnum.DAILY:
+        # 對齊到第一個不早於 first 的發生日期
+        offset = -(first - pattern.starts_on).days % pattern.interval
+        candidates = _step(first + timedelta(days=offset), pattern.interval)
+    else:
+        # 對齊到第一個不早於 first 所在週的發生週，逐週產生遮罩中的星期
+        anchor = _week_start(pattern.starts_on)
+        weeks = (_week_start(first) - anchor).days // 7
+        weeks += -weeks % pattern.interval
+        candidates = _weekly_days(
+            anchor + timedelta(weeks=weeks), pattern.interval, pattern.weekdays
+        )
+
+    for day in candidates:
+        if last is not None and day > last:
+            return
+        if day >= first and day not in pattern.exceptions:
+            yield day
+
+
+def _step(start: date, days: int) -> Iterator[date]:
+    """從 start 起每隔 days 天產生一個日期。"""
+    delta = timedelta(days=days)
+    while True:
+        yield start
+        start += delta
+
+
+def _weekly_days(week: date, interval: int, mask: int) -> Iterator[date]:
+    """從 week（星期一）起，每 interval 週產生遮罩中的星期。"""
+    offsets = [timedelta(days=weekday) for weekday in mask_weekdays(mask)]
+    delta = timedelta(weeks=interval)
+    while offsets:
+        for offset in offsets:
+            yield week + offset
+        week += delta
+
+
+def find_rule_conflicts(
+    patterns: Iterable[RecurrencePattern],
+    incoming: Sequence[ScheduleInterval],
+) -> list[ScheduleInterval]:
+    """找出新時段與規則中尚未展開的發生日期的重疊。
+
+    每個 (新時段, 規則) 只做一次算術判斷，不展開規則；
+    重疊的發生日期以 id 為 None、狀態為 AVAILABLE 的區間回報（尚未寫入資料庫），
+    同一條規則同一天只回報一次。
+    """
+    patterns_by_giver: dict[int, list[RecurrencePattern]] = defaultdict(list)
+    for pattern in patterns:
+        patterns_by_giver[pattern.giver_id].append(pattern)
+
+    conflicts: dict[tuple[int | None, date], ScheduleInterval] = {}
+    for interval in incoming:
+        for pattern in patterns_by_giver.get(interval.giver_id, ()):
+            if (
+                pattern.start_time < interval.end_time
+                and interval.start_time < pattern.end_time
+                and is_pending(pattern, interval.date)
+            ):
+                conflicts.setdefault(
+                    (pattern.id, interval.date),
+                    ScheduleInterval(
+                        id=None,
+                        giver_id=pattern.giver_id,
+                        date=interval.date,
+                        start_time=pattern.start_time,
+                        end_time=pattern.end_time,
+                        status=ScheduleStatusEnum.AVAILABLE,
+                    ),
+                )
+    return sorted(conflicts.values(), key=lambda i: (i.date, i.start_time))
+
+
+def first_common_date(a: RecurrencePattern, b: RecurrencePattern) -> date | None:
+    """找出兩條規則第一個同時發生、且時間重疊、都尚未展開的日期。
+
+    兩條規則合起來以兩者週期的最小公倍數重複：一個週期內沒有共同日期就不會有；
+    例外日期每個最多排除一個共同日期，因此最多搜尋（例外日期數 + 1）個週期。
+    只逐一產生 a 的發生日期，b 以算術判斷。
+    """
+    if a.giver_id != b.giver_id:
+        return None
+    if not (a.start_time < b.end_time and b.start_time < a.end_time):
+        return None
+
+    first = max(_pending_from(a), _pending_from(b))
+    ends = [d for d in (a.ends_on, b.ends_on) if d is not None]
+    exceptions = sum(1 for d in a.exceptions | b.exceptions if d >= first)
+    last = first + timedelta(
+        days=lcm(period_days(a), period_days(b)) * (exceptions + 1) - 1
+    )
+    if ends:
+        last = min(last, *ends)
+
+    for day in iter_occurrences(a, first, last):
+        if occurs_on(b, day):
+            return day
+    return None
+
+
+def _pending_from(pattern: RecurrencePattern) -> date:
+    """規則第一個可能尚未展開的日期。"""
+    if pattern.materialized_until is None:
+        return pattern.starts_on
+    return max(pattern.starts_on, pattern.materialized_until + timedelta(days=1))
@@ -0,0 +1,409 @@
+"""週期規則服務層模組。
+
+提供 Giver 週期性可預約時段規則的業務邏輯：
+- 建立規則：以算術檢查與現有時段、其他規則是否重疊，通過後展開滾動期間內的發生日期
+- 展開規則：由定期排程延伸每條規則的滾動期間，只把期間內的發生日期寫入 schedules
+- 列出發生日期：惰性產生，不寫入資料庫
+"""
+
+# ===== 標準函式庫 =====
+from collections import defaultdict
+from datetime import date, timedelta
+from functools import partial
+from itertools import islice
+import logging
+from typing import cast, Iterable
+
+# ===== 第三方套件 =====
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.crud.interval_index import load_schedule_intervals
+from app.crud.recurrence_rule import (
+    load_recurrence_patterns,
+    recurrence_pattern_cache,
+    RecurrencePattern,
+    RecurrenceRuleCRUD,
+)
+from app.decorators import handle_service_errors_sync, log_operation
+from app.enums.models import (
+    RecurrenceFrequencyEnum,
+    ScheduleStatusEnum,
+    UserRoleEnum,
+)
+from app.errors import create_schedule_overlap_error
+from app.metrics import SCHEDULE_OVERLAP_REJECTIONS
+from app.models.recurrence_rule import RecurrenceRule
+from app.schemas import RecurrenceRuleBase, ScheduleBase
+from app.services.overlap import find_overlaps, ScheduleInterval
+from app.services.read_cache import schedule_read_cache
+from app.services.recurrence import (
+    find_rule_conflicts,
+    first_common_date,
+    iter_occurrences,
+    occurs_on,
+    weekday_mask,
+)
+from app.services.schedule import ScheduleService
+from app.utils.timezone import get_local_now_naive
+
+# 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
+logger = logging.getLogger(__name__)
+
+
+class RecurrenceRuleService:
+    """週期規則服務類別。"""
+
+    def __init__(self) -> None:
+        """初始化服務實例。"""
+        self.rule_crud = RecurrenceRuleCRUD()
+        self.schedule_service = ScheduleService()
+
+    def horizon(self, today: date | None = None) -> date:
+        """滾動期間的最後日期（含）：從今天起算 schedule_recurrence_horizon_days 天。"""
+        today = today or get_local_now_naive().date()
+        return today + timedelta(days=settings.schedule_recurrence_horizon_days - 1)
+
+    def build_rule(
+        self,
+        rule_data: RecurrenceRuleBase,
+        created_by: int,
+        created_by_role: UserRoleEnum,
+    ) -> RecurrenceRule:
+        """建立週期規則 ORM 物件；星期轉換成位元遮罩，例外日期去除重複後排序。"""
+        weekly = rule_data.frequency == RecurrenceFrequencyEnum.WEEKLY
+        return RecurrenceRule(
+            giver_id=rule_data.giver_id,
+            frequency=rule_data.frequency,
+            interval=rule_data.interval,
+            weekdays=weekday_mask(rule_data.weekdays) if weekly else 0,
+            start_time=rule_data.start_time,
+            end_time=rule_data.end_time,
+            starts_on=rule_data.starts_on,
+            ends_on=rule_data.ends_on,
+            exceptions=sorted({day.isoformat() for day in rule_data.exceptions}),
+            note=rule_data.note,
+            created_by=created_by,
+            created_by_role=created_by_role,
+        )
+
+    def check_new_rule_overlap(
+        self, db: Session, pattern: RecurrencePattern
+    ) -> list[ScheduleInterval]:
+        """檢查新規則的所有發生日期是否與現有時段或其他規則重疊，不展開新規則。
+
+        - 現有時段：載入規則期間內、時間重疊的時段，逐一以算術判斷是否為發生日期
+        - 其他規則：只在兩條規則合併後的週期內搜尋第一個共同日期
+
+        Returns:
+            list[ScheduleInterval]: 重疊的現有時段，以及其他規則中重疊的發生日期
+                （id 為 None，每條規則只回報第一個）
+        """
+        rows = self.schedule_service.schedule_crud.list_range_intervals(
+            db,
+            pattern.starts_on,
+            pattern.ends_on or date.max,
+            pattern.start_time,
+            pattern.end_time,
+            [pattern.giver_id],
+        )
+        conflicts = [row for row in rows if occurs_on(pattern, row.date)]
+
+        for other in load_recurrence_patterns(db, [pattern.giver_id]):
+            day = first_common_date(other, pattern)
+            if day is not None:
+                conflicts.append(
+                    ScheduleInterval(
+                        id=None,
+                        giver_id=other.giver_id,
+                        date=day,
+                        start_time=other.start_time,
+                        end_time=other.end_time,
+                        status=ScheduleStatusEnum.AVAILABLE,
+                    )
+                )
+
+        logger.info(
+            f"週期規則重疊檢查完成: giver_id={pattern.giver_id}, "
+            f"候選時段數量={len(rows)}, 重疊數量={len(conflicts)}"
+        )
+        return sorted(conflicts, key=lambda i: (i.date, i.start_time))
+
+    @handle_service_errors_sync("建立週期規則")
+    @log_operation("建立週期規則")
+    def create_rule(
+        self,
+        db: Session,
+        rule_data: RecurrenceRuleBase,
+        created_by: int,
+        created_by_role: UserRoleEnum,
+        today: date | None = None,
+    ) -> RecurrenceRule:
+        """建立週期規則，並在同一個交易中展開滾動期間內的發生日期。"""
+        rule = self.build_rule(rule_data, created_by, created_by_role)
+
+        overlapping = self.check_new_rule_overlap(db, RecurrencePattern.from_rule(rule))
+        if overlapping:
+            logger.warning(
+                f"建立週期規則時檢測到重疊: giver_id={rule.giver_id}, "
+                f"重疊數量={len(overlapping)}"
+            )
+            SCHEDULE_OVERLAP_REJECTIONS.inc(operation="recurrence_rule")
+            raise create_schedule_overlap_error(
+                f"週期規則與 {len(overlapping)} 個時段重疊，請調整時間或加入例外日期",
+                overlapping,
+            )
+
+        with self.schedule_service.schedule_crud.batch_transaction(db):
+            self.rule_crud.create_rule(db, rule)
+            # 規則可能從滾動期間之後才開始，不會展開，仍需讓區間索引重新載入規則
+            self.schedule_service.schedule_crud.on_commit(
+                db,
+                partial(
+                    recurrence_pattern_cache.invalidate_rules, [rule_data.giver_id]
+                ),
+            )
+            created = self._materialize_rule(db, rule, self.horizon(today), today)
+
+        logger.info(
+            f"成功建立週期規則: ID={rule.id}, giver_id={rule.giver_id}, "
+            f"展開時段數量={created}"
+        )
+        return rule
+
+    def _materialize_rule(
+        self,
+        db: Session,
+        rule: RecurrenceRule,
+        until: date,
+        today: date | None = None,
+    ) -> int:
+        """將規則在 (materialized_until, until] 內、今天以後的發生日期建立成可預約時段。
+
+        需在批次交易中呼叫：先 flush 新的 materialized_until，建立時段時的重疊檢查
+        才不會把這些發生日期當成規則中尚未展開的部分；與現有時段或其他規則重疊的
+        發生日期略過不建立（建立規則時已檢查，只有規則建立後直接寫入資料庫的時段會發生）。
+
+        Returns:
+            int: 建立的時段數量
+        """
+        today = today or get_local_now_naive().date()
+        # 以 RecurrencePattern 讀取已載入的欄位值，日期與時間的計算不經過 ORM 屬性
+        pattern = RecurrencePattern.from_rule(rule)
+        last = min(until, pattern.ends_on) if pattern.ends_on is not None else until
+        if last < pattern.starts_on or (
+            pattern.materialized_until is not None
+            and pattern.materialized_until >= last
+        ):
+            return 0
+
+        first = today
+        if pattern.materialized_until is not None:
+            first = max(first, pattern.materialized_until + timedelta(days=1))
+        candidates = [
+            ScheduleInterval(
+                None, pattern.giver_id, day, pattern.start_time, pattern.end_time
+            )
+            for day in iter_occurrences(pattern, first, last)
+        ]
+
+        rule.materialized_until = last  # type: ignore
+        db.flush()
+        self.schedule_service.schedule_crud.on_commit(
+            db, partial(recurrence_pattern_cache.invalidate_rules, [pattern.giver_id])
+        )
+
+        occurrences = self._skip_conflicts(db, pattern, candidates)
+        if occurrences:
+            note = cast(str | None, rule.note)
+            self.schedule_service.create_schedules(
+                db,
+                [
+                    ScheduleBase(
+                        giver_id=pattern.giver_id,
+                        taker_id=None,
+                        status=ScheduleStatusEnum.AVAILABLE,
+                        date=occurrence.date,
+                        start_time=occurrence.start_time,
+                        end_time=occurrence.end_time,
+                        note=note,
+                    )
+                    for occurrence in occurrences
+                ],
+                rule.created_by,
+                rule.created_by_role,
+            )
+
+        logger.info(
+            f"週期規則展開完成: ID={rule.id}, 展開至={last}, "
+            f"建立時段數量={len(occurrences)}, "
+            f"略過重疊數量={len(candidates) - len(occurrences)}"
+        )
+        return len(occurrences)
+
+    def _skip_conflicts(
+        self,
+        db: Session,
+        pattern: RecurrencePattern,
+        candidates: list[ScheduleInterval],
+    ) -> list[ScheduleInterval]:
+        """略過與現有時段或其他規則重疊的發生日期。"""
+        if not candidates:
+            return []
+
+        existing: dict[date, list[ScheduleInterval]] = defaultdict(list)
+        for interval in load_schedule_intervals(
+            db, {(c.giver_id, c.date) for c in candidates}
+        ):
+            existing[interval.date].append(interval)
+        others = [
+            p
+            for p in load_recurrence_patterns(db, [pattern.giver_id])
+            if p.id != pattern.id
+        ]
+
+        return [
+            candidate
+            for candidate in candidates
+            if not find_overlaps(existing[candidate.date], [candidate])
+            and not find_rule_conflicts(others, [candidate])
+        ]
+
+    @handle_service_errors_sync("展開週期規則")
+    @log_operation("展開週期規則")
+    def materialize_rules(
+        self,
+        db: Session,
+        until: date | None = None,
+        rule_ids: Iterable[int] | None = None,
+        today: date | None = None,
+    ) -> int:
+        """延伸週期規則的滾動期間，由定期排程呼叫。
+
+        每條規則各自一個交易：一條規則失敗時不影響已完成的規則。
+
+        Args:
+            until: 展開到這一天（含），None 表示滾動期間的最後日期
+            rule_ids: 只展開這些規則，None 表示所有規則
+
+        Returns:
+            int: 建立的時段數量
+        """
+        until = until or self.horizon(today)
+        rules = self.rule_crud.list_rules_to_materialize(db, until, rule_ids)
+
+        created = 0
+        for rule in rules:
+            with self.schedule_service.schedule_crud.batch_transaction(db):
+                created += self._materialize_rule(db, rule, until, today)
+
+        logger.info(
+            f"週期規則展開完成: 規則數量={len(rules)}, 展開至={until}, "
+            f"建立時段數量={created}"
+        )
+        return created
+
+    @handle_service_errors_sync("查詢週期規則")
+    def get_rule(self, db: Session, rule_id: int) -> RecurrenceRule:
+        """查詢單一週期規則。"""
+        return self.rule_crud.get_rule(db, rule_id)
+
+    @handle_service_errors_sync("查詢週期規則列表")
+    def list_giver_rules(self, db: Session, giver_id: int) -> list[RecurrenceRule]:
+        """查詢 Giver 未刪除的週期規則。"""
+        return self.rule_crud.list_giver_rules(db, giver_id)
+
+    @handle_service_errors_sync("查詢週期規則發生日期")
+    def list_occurrences(
+        self,
+        db: Session,
+        rule_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        limit: int = 100,
+    ) -> list[date]:
+        """惰性產生規則的發生日期，最多取 limit 個，不寫入資料庫。"""
+        pattern = RecurrencePattern.from_rule(self.rule_crud.get_rule(db, rule_id))
+        return list(islice(iter_occurrences(pattern, date_from, date_to), limit))
+
+    @handle_service_errors_sync("刪除週期規則")
+    @log_operation("刪除週期規則")
+    def delete_rule(
+        self,
+        db: Session,
+        rule_id: int,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> None:
+        """軟刪除週期規則，不再展開新的發生日期；已展開的時段保留為一般時段。"""
+        rule = self.rule_crud.get_rule(db, rule_id)
+        self.rule_crud.delete_rule(db, rule, deleted_by, deleted_by_role)
+
+
+class AsyncRecurrenceRuleService:
+    """週期規則服務類別（非同步版本）。
+
+    透過 AsyncSession.run_sync 執行 RecurrenceRuleService，業務邏輯只維護一份。
+    """
+
+    def __init__(self) -> None:
+        """初始化服務實例。"""
+        self.rule_service = RecurrenceRuleService()
+
+    async def create_rule(
+        self,
+        db: AsyncSession,
+        rule_data: RecurrenceRuleBase,
+        created_by: int,
+        created_by_role: UserRoleEnum,
+    ) -> RecurrenceRule:
+        """建立週期規則，並展開滾動期間內的發生日期。"""
+        try:
+            return await db.run_sync(
+                self.rule_service.create_rule, rule_data, created_by, created_by_role
+            )
+        finally:
+            # 展開的時段會改變 Giver 的時段列表
+            await schedule_read_cache.flush(db)
+
+    async def get_rule(self, db: AsyncSession, rule_id: int) -> RecurrenceRule:
+        """查詢單一週期規則。"""
+        return await db.run_sync(self.rule_service.get_rule, rule_id)
+
+    async def list_giver_rules(
+        self, db: AsyncSession, giver_id: int
+    ) -> list[RecurrenceRule]:
+        """查詢 Giver 未刪除的週期規則。"""
+        return await db.run_sync(self.rule_service.list_giver_rules, giver_id)
+
+    async def list_occurrences(
+        self,
+        db: AsyncSession,
+        rule_id: int,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        limit: int = 100,
+    ) -> list[date]:
+        """惰性產生規則的發生日期。"""
+        return await db.run_sync(
+            self.rule_service.list_occurrences, rule_id, date_from, date_to, limit
+        )
+
+    async def delete_rule(
+        self,
+        db: AsyncSession,
+        rule_id: int,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> None:
+        """軟刪除週期規則。"""
+        await db.run_sync(
+            self.rule_service.delete_rule, rule_id, deleted_by, deleted_by_role
+        )
+
+
+# 建立服務實例，供其他模組使用
+recurrence_rule_service = RecurrenceRuleService()
+async_recurrence_rule_service = AsyncRecurrenceRuleService()
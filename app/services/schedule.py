@@ -5,15 +5,24 @@
 
 # ===== 標準函式庫 =====
 from datetime import date, time
+from functools import partial
 import logging
-from typing import Any
+from typing import Any, AsyncIterator, Iterable, NamedTuple, Sequence
 
 # ===== 第三方套件 =====
-from sqlalchemy import and_
+from sqlalchemy import and_, Row
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
 from sqlalchemy.orm import Session
 
 # ===== 本地模組 =====
-from app.crud.schedule import ScheduleCRUD
+from app.crud.daily_summary import giver_daily_summary_crud
+from app.crud.interval_index import load_schedule_intervals, schedule_interval_index
+from app.crud.recurrence_rule import (
+    load_recurrence_patterns,
+    recurrence_pattern_cache,
+    RecurrencePattern,
+)
+from app.crud.schedule import AsyncScheduleCRUD, ScheduleCRUD
 from app.decorators import (
     handle_service_errors_sync,
     log_operation,
@@ -25,15 +34,73 @@ from app.errors import (
     create_schedule_cannot_be_deleted_error,
     create_schedule_not_found_error,
     create_schedule_overlap_error,
+    create_schedule_precondition_failed_error,
 )
-from app.errors.exceptions import ScheduleNotFoundError
+from app.errors.exceptions import APIError, ScheduleNotFoundError
+from app.metrics import SCHEDULE_OVERLAP_REJECTIONS
+from app.models.giver_daily_summary import GiverDailySummary
 from app.models.schedule import Schedule
-from app.schemas import ScheduleBase
+from app.schemas import (
+    ScheduleBase,
+    ScheduleBatchCreateOperation,
+    ScheduleBatchDeleteOperation,
+    ScheduleBatchOperation,
+    ScheduleBatchUpdateOperation,
+)
+from app.services.calendar import (
+    build_calendar_feed,
+    CALENDAR_FIELDS,
+    CalendarFeed,
+    render_schedule_calendar,
+    schedule_calendar_cache,
+)
+from app.services.matching import (
+    intersect_intervals,
+    match_inbox,
+    MatchWindow,
+    rank_windows,
+    TakerMatches,
+)
+from app.services.overlap import find_overlaps, ScheduleInterval
+from app.services.read_cache import (
+    cache_key,
+    list_scopes,
+    schedule_read_cache,
+    schedule_scopes,
+    write_scopes,
+)
+from app.services.recurrence import find_rule_conflicts
+from app.services.slot_search import (
+    GiverFreeWindows,
+    search_free_windows,
+    SlotSearchMode,
+)
+from app.utils.fieldsets import (
+    dump_schedules,
+    schedule_rows_to_dicts,
+    ScheduleFieldset,
+)
+from app.utils.pagination import encode_schedule_cursor, ScheduleCursor
 
 # 建立日誌記錄器：可在日誌中看到訊息從哪個模組來，利於除錯與維運
 logger = logging.getLogger(__name__)
 
 
+class SchedulePage(NamedTuple):
+    """已序列化的一頁時段列表。"""
+
+    items: list[dict[str, Any]]
+    # 下一頁的游標，None 表示已是最後一頁
+    next_cursor: str | None
+
+
+class ScheduleItem(NamedTuple):
+    """已序列化的單一時段與其版本號。"""
+
+    data: dict[str, Any]
+    version: int
+
+
 class ScheduleService:
     """時段服務類別。"""
 
@@ -41,6 +108,74 @@ class ScheduleService:
         """初始化服務實例。"""
         self.schedule_crud = ScheduleCRUD()
 
+    def _use_interval_index(self, db: Session) -> bool:
+        """檢查重疊時是否使用時段區間索引。
+
+        批次交易中已 flush 但尚未 commit 的寫入不在索引中，改為直接查詢資料庫。
+        """
+        return schedule_interval_index.enabled and not self.schedule_crud.in_batch(db)
+
+    def _schedule_users(
+        self, schedules: Iterable[Any], accepted_only: bool = False
+    ) -> tuple[set[int], set[int]]:
+        """取得時段的 Giver、Taker；accepted_only 時只取已接受（出現在行事曆訂閱中）的時段。"""
+        if accepted_only:
+            schedules = [
+                s for s in schedules if s.status == ScheduleStatusEnum.ACCEPTED
+            ]
+        else:
+            schedules = list(schedules)
+        return (
+            {s.giver_id for s in schedules if s.giver_id is not None},
+            {s.taker_id for s in schedules if s.taker_id is not None},
+        )
+
+    def _invalidate_calendars(
+        self, db: Session, giver_ids: set[int], taker_ids: set[int]
+    ) -> None:
+        """寫入 commit 後使相關使用者的行事曆訂閱失效。
+
+        刪除不需要失效：已接受的時段無法刪除，不會從訂閱中移除。
+        """
+        if giver_ids or taker_ids:
+            self.schedule_crud.on_commit(
+                db, partial(schedule_calendar_cache.invalidate, giver_ids, taker_ids)
+            )
+
+    def _invalidate_reads(
+        self,
+        db: Session,
+        giver_ids: Iterable[int],
+        taker_ids: Iterable[int],
+        schedule_ids: Iterable[int] = (),
+    ) -> None:
+        """寫入 commit 後使讀取快取中相關的時段列表與單一時段失效。"""
+        scopes = write_scopes(giver_ids, taker_ids, schedule_ids)
+        self.schedule_crud.on_commit(
+            db, partial(schedule_read_cache.mark_stale, db, scopes)
+        )
+
+    def _load_rule_patterns(
+        self, db: Session, giver_ids: Iterable[int]
+    ) -> list[RecurrencePattern]:
+        """載入 Giver 尚有未展開發生日期的週期規則；啟用時段區間索引時由規則快取回答。"""
+        if self._use_interval_index(db):
+            return recurrence_pattern_cache.get_rule_patterns(db, giver_ids)
+        return load_recurrence_patterns(db, giver_ids)
+
+    def check_rule_overlap(
+        self, db: Session, incoming: Sequence[ScheduleInterval]
+    ) -> list[ScheduleInterval]:
+        """檢查新時段與週期規則中尚未展開的發生日期是否重疊。
+
+        已展開的發生日期是一般時段，由時段的重疊檢查涵蓋；
+        尚未展開的部分以算術判斷新時段的日期是否為發生日期，不展開規則。
+        """
+        if not incoming:
+            return []
+        patterns = self._load_rule_patterns(db, {i.giver_id for i in incoming})
+        return find_rule_conflicts(patterns, incoming)
+
     def check_schedule_overlap(
         self,
         db: Session,
@@ -49,8 +184,32 @@ class ScheduleService:
         start_time: time,
         end_time: time,
         exclude_schedule_id: int | None = None,
-    ) -> list[Schedule]:
-        """檢查單一時段重疊。"""
+    ) -> list[ScheduleInterval]:
+        """檢查單一時段重疊，包含週期規則中尚未展開的發生日期。
+
+        啟用時段區間索引時，由記憶體中的排序陣列回答，不查詢資料庫；
+        兩種來源都回傳時段區間，與週期規則的衝突合併在同一個列表。
+        """
+        if self._use_interval_index(db):
+            overlapping_intervals = schedule_interval_index.find_overlapping(
+                db,
+                giver_id,
+                schedule_date,
+                start_time,
+                end_time,
+                exclude_schedule_id=exclude_schedule_id,
+            )
+            overlapping_intervals += self.check_rule_overlap(
+                db,
+                [ScheduleInterval(None, giver_id, schedule_date, start_time, end_time)],
+            )
+            logger.info(
+                f"時段重疊檢查完成（區間索引）: giver_id={giver_id}, "
+                f"date={schedule_date}, time={start_time}-{end_time}, "
+                f"重疊數量={len(overlapping_intervals)}"
+            )
+            return overlapping_intervals
+
         query = (
             db.query(Schedule)  # 查詢 Schedule 資料表
             .options(*self.schedule_crud.get_schedule_query_options())  # 載入所有關聯
@@ -74,40 +233,70 @@ class ScheduleService:
                 > Schedule.start_time,  # 新時段結束時間必須大於現有時段開始時間
             )
         ).all()  # 取出符合條件的所有紀錄，非空代表有重疊
+        overlapping_intervals = [
+            ScheduleInterval._make(
+                (s.id, s.giver_id, s.date, s.start_time, s.end_time, s.status)
+            )
+            for s in overlapping_schedules
+        ]
+
+        # 週期規則中尚未展開的發生日期也不可重疊
+        overlapping_intervals += self.check_rule_overlap(
+            db,
+            [ScheduleInterval(None, giver_id, schedule_date, start_time, end_time)],
+        )
 
         logger.info(
             f"時段重疊檢查完成: giver_id={giver_id}, date={schedule_date}, "
-            f"time={start_time}-{end_time}, 重疊數量={len(overlapping_schedules)}"
+            f"time={start_time}-{end_time}, 重疊數量={len(overlapping_intervals)}"
         )
 
-        return overlapping_schedules
+        return overlapping_intervals
 
     def check_multiple_schedules_overlap(
         self,
         db: Session,
         schedules: list[ScheduleBase],
-    ) -> list[Schedule]:
-        """檢查多個時段重疊。"""
-        # 初始化重疊時段列表，用於收集所有重疊的時段
-        all_overlapping_schedules = []
+    ) -> list[ScheduleInterval]:
+        """檢查多個時段重疊（單一查詢 + 排序掃描）。
 
-        # 逐一檢查每個時段是否與現有資料庫中的時段重疊
-        for schedule_data in schedules:
-            overlapping_schedules = self.check_schedule_overlap(
-                db=db,
+        依 (giver_id, date) 分組，以一次查詢取回所有相關 Giver 當天的現有時段，
+        只載入 id、時間欄位與狀態，不載入任何關聯；
+        再將現有時段與新時段一起排序掃描，同時找出與資料庫及同批次內的所有衝突；
+        最後以算術檢查 Giver 的週期規則中尚未展開的發生日期。
+        """
+        if not schedules:
+            return []
+
+        incoming = [
+            ScheduleInterval(
+                id=None,
                 giver_id=schedule_data.giver_id,
-                schedule_date=schedule_data.schedule_date,
+                date=schedule_data.schedule_date,
                 start_time=schedule_data.start_time,
                 end_time=schedule_data.end_time,
+                status=schedule_data.status,
             )
+            for schedule_data in schedules
+        ]
+        giver_days = {(s.giver_id, s.date) for s in incoming}
 
-            # 如果發現重疊時段，將其加入到總重疊列表中
-            if overlapping_schedules:
-                all_overlapping_schedules.extend(overlapping_schedules)
+        # 啟用時段區間索引時，只有索引中沒有的 Giver 日才查詢資料庫
+        if self._use_interval_index(db):
+            existing = schedule_interval_index.get_intervals(db, giver_days)
+        else:
+            existing = load_schedule_intervals(db, giver_days)
 
-        # 不做錯誤處理，因為 check_schedule_overlap 已經處理錯誤日誌
+        overlapping_schedules = find_overlaps(existing, incoming)
+        overlapping_schedules += self.check_rule_overlap(db, incoming)
 
-        return all_overlapping_schedules
+        logger.info(
+            f"批次時段重疊檢查完成: 新時段數量={len(incoming)}, "
+            f"Giver 日數={len(giver_days)}, 現有時段數量={len(existing)}, "
+            f"重疊數量={len(overlapping_schedules)}"
+        )
+
+        return overlapping_schedules
 
     def determine_schedule_status(
         self,
@@ -215,15 +404,21 @@ class ScheduleService:
             error_msg = (
                 f"檢測到 {len(overlapping_schedules)} 個重疊時段，請調整時段之時間"
             )
+            SCHEDULE_OVERLAP_REJECTIONS.inc(operation="create")
             raise create_schedule_overlap_error(error_msg, overlapping_schedules)
 
         # 將 Pydantic 模型轉換為 ORM 物件
         created_schedules = self.create_schedule_orm_objects(
             schedules, created_by, created_by_role
         )
+        # commit 前取得：同步 Session 在 commit 後會使物件屬性過期
+        users = self._schedule_users(created_schedules)
+        calendar_users = self._schedule_users(created_schedules, accepted_only=True)
 
         # 呼叫 CRUD 層，將 ORM 物件儲存到資料庫
         created_schedules = self.schedule_crud.create_schedules(db, created_schedules)
+        self._invalidate_calendars(db, *calendar_users)
+        self._invalidate_reads(db, *users)
 
         logger.info(
             f"成功建立 {len(created_schedules)} 個時段，"
@@ -240,11 +435,20 @@ class ScheduleService:
         giver_id: int | None = None,
         taker_id: int | None = None,
         status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fieldset: ScheduleFieldset | None = None,
     ) -> list[Schedule]:
         """查詢時段列表。"""
-        # 呼叫 CRUD 層進行資料庫查詢，支援多種篩選條件
+        # 呼叫 CRUD 層進行資料庫查詢，支援多種篩選條件、鍵集分頁與稀疏欄位
         schedules = self.schedule_crud.list_schedules(
-            db, giver_id, taker_id, status_filter
+            db,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit=limit,
+            after=after,
+            fieldset=fieldset,
         )
 
         logger.info(
@@ -254,16 +458,65 @@ class ScheduleService:
 
         return schedules
 
+    @handle_service_errors_sync("查詢時段列表")
+    @log_operation("查詢時段列表")
+    def list_schedule_rows(
+        self,
+        db: Session,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Row]:
+        """查詢時段列表的資料列（Core 讀取路徑，不建立 ORM 物件）。"""
+        rows = self.schedule_crud.list_schedule_rows(
+            db,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit=limit,
+            after=after,
+            fields=fields,
+        )
+
+        logger.info(
+            f"查詢時段列表完成: giver_id={giver_id}, taker_id={taker_id}, "
+            f"status_filter={status_filter}, 找到 {len(rows)} 個時段"
+        )
+
+        return rows
+
+    @handle_service_errors_sync("查詢時段列表驗證器")
+    def get_list_validator(
+        self,
+        db: Session,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+    ) -> Row:
+        """取得時段列表的驗證器（聚合查詢，不讀取時段資料列）。"""
+        return self.schedule_crud.get_list_validator(
+            db, giver_id, taker_id, status_filter
+        )
+
+    @handle_service_errors_sync("查詢時段版本")
+    def get_schedule_version(self, db: Session, schedule_id: int) -> int | None:
+        """取得時段的版本號，時段不存在時回傳 None。"""
+        return self.schedule_crud.get_schedule_version(db, schedule_id)
+
     @handle_service_errors_sync("查詢單一時段")
     @log_operation("查詢單一時段")
     def get_schedule(
         self,
         db: Session,
         schedule_id: int,
+        fieldset: ScheduleFieldset | None = None,
     ) -> Schedule:
         """根據 ID 查詢單一時段。"""
         # 呼叫 CRUD 層查詢指定 ID 的時段
-        schedule = self.schedule_crud.get_schedule(db, schedule_id)
+        schedule = self.schedule_crud.get_schedule(db, schedule_id, fieldset)
 
         # 檢查時段是否存在
         if schedule is None:
@@ -277,16 +530,152 @@ class ScheduleService:
 
         return schedule
 
-    def new_updated_time_values(
+    @handle_service_errors_sync("產生行事曆訂閱")
+    @log_operation("產生行事曆訂閱")
+    def get_calendar_feed(
         self,
         db: Session,
-        schedule_id: int,
+        role: UserRoleEnum,
+        user_id: int,
+    ) -> CalendarFeed:
+        """取得使用者的行事曆訂閱，快取未命中時以已接受的時段產生並寫回快取。"""
+        feed = schedule_calendar_cache.get(role, user_id)
+        if feed is not None:
+            return feed
+
+        generation = schedule_calendar_cache.generation
+        if role == UserRoleEnum.GIVER:
+            giver_id, taker_id = user_id, None
+        else:
+            giver_id, taker_id = None, user_id
+        rows = self.schedule_crud.list_schedule_rows(
+            db,
+            giver_id=giver_id,
+            taker_id=taker_id,
+            status_filter=ScheduleStatusEnum.ACCEPTED.value,
+            fields=CALENDAR_FIELDS,
+        )
+        feed = build_calendar_feed(render_schedule_calendar(rows, role))
+        schedule_calendar_cache.put(role, user_id, feed, generation)
+
+        logger.info(
+            f"產生行事曆訂閱完成: role={role.value}, user_id={user_id}, "
+            f"時段數量={len(rows)}"
+        )
+
+        return feed
+
+    @handle_service_errors_sync("查詢 Giver 每日時段統計")
+    def get_giver_daily_summary(
+        self,
+        db: Session,
+        giver_id: int,
+        date_from: date,
+        date_to: date,
+    ) -> list[GiverDailySummary]:
+        """查詢 Giver 在日期範圍內每日各狀態的時段數量，沒有時段的日期不回傳。"""
+        return giver_daily_summary_crud.list_summaries(db, giver_id, date_from, date_to)
+
+    @handle_service_errors_sync("搜尋 Giver 空檔")
+    def search_free_slots(
+        self,
+        db: Session,
+        date_from: date,
+        date_to: date,
+        start_time: time,
+        end_time: time,
+        duration_minutes: int,
+        mode: SlotSearchMode = "available",
+        giver_ids: list[int] | None = None,
+        limit: int | None = None,
+    ) -> list[GiverFreeWindows]:
+        """搜尋在日期範圍 × 每日時間範圍內，有連續 duration_minutes 分鐘視窗的 Giver。
+
+        以單一查詢載入範圍內的時段區間，再以點陣圖向量運算一次搜尋所有 Giver。
+        """
+        intervals = self.schedule_crud.list_range_intervals(
+            db, date_from, date_to, start_time, end_time, giver_ids
+        )
+        results = search_free_windows(
+            intervals,
+            date_from,
+            date_to,
+            start_time,
+            end_time,
+            duration_minutes,
+            mode=mode,
+            giver_ids=giver_ids,
+            limit=limit,
+        )
+
+        logger.info(
+            f"搜尋 Giver 空檔完成: mode={mode}, 區間數量={len(intervals)}, "
+            f"符合的 Giver 數量={len(results)}"
+        )
+
+        return results
+
+    @handle_service_errors_sync("比對共同可面談時間")
+    def match_availability(
+        self,
+        db: Session,
+        giver_id: int,
+        taker_id: int,
+        min_minutes: int = 1,
+        limit: int | None = None,
+    ) -> list[MatchWindow]:
+        """比對 Taker 提出的時段與 Giver 的可預約時段，回傳排名後的候選視窗。"""
+        openings = self.schedule_crud.list_giver_openings(db, giver_id)
+        proposals = self.schedule_crud.list_taker_proposals(db, [taker_id])[taker_id]
+        windows = rank_windows(
+            intersect_intervals(proposals, openings, min_minutes), limit
+        )
+
+        logger.info(
+            f"比對共同可面談時間完成: giver_id={giver_id}, taker_id={taker_id}, "
+            f"提案數量={len(proposals)}, 開放時段數量={len(openings)}, "
+            f"候選視窗數量={len(windows)}"
+        )
+
+        return windows
+
+    @handle_service_errors_sync("比對收件匣共同可面談時間")
+    def match_giver_inbox(
+        self,
+        db: Session,
+        giver_id: int,
+        min_minutes: int = 1,
+        limit: int | None = None,
+    ) -> list[TakerMatches]:
+        """比對 Giver 收件匣中每個 Taker 的提案與 Giver 的可預約時段。
+
+        開放時段與所有 Taker 的提案各以一次查詢載入。
+        """
+        taker_ids = self.schedule_crud.list_inbox_taker_ids(db, giver_id)
+        if not taker_ids:
+            return []
+
+        openings = self.schedule_crud.list_giver_openings(db, giver_id)
+        results = match_inbox(
+            self.schedule_crud.list_taker_proposals(db, taker_ids),
+            openings,
+            min_minutes,
+            limit,
+        )
+
+        logger.info(
+            f"比對收件匣共同可面談時間完成: giver_id={giver_id}, "
+            f"Taker 數量={len(taker_ids)}, 有候選視窗的 Taker 數量={len(results)}"
+        )
+
+        return results
+
+    def new_updated_time_values(
+        self,
+        schedule: Schedule,
         **kwargs: Any,
     ) -> tuple[date, time, time]:
         """更新後的時間值。"""
-        # 取得現有時段的資訊，用於比較和預設值
-        schedule = self.schedule_crud.get_schedule(db, schedule_id)
-
         # 取得更新後的時間值：如果沒有提供新值，則使用現有值
         new_date = kwargs.get("schedule_date", schedule.date)
         new_start_time = kwargs.get("start_time", schedule.start_time)
@@ -305,18 +694,21 @@ class ScheduleService:
     def check_update_overlap(
         self,
         db: Session,
-        schedule_id: int,
+        schedule: Schedule,
         **kwargs: Any,
-    ) -> list[Schedule]:
-        """檢查更新時段時的重疊情況。"""
+    ) -> list[ScheduleInterval]:
+        """檢查更新時段時的重疊情況。
+
+        Args:
+            schedule: 更新前的時段，由呼叫端載入一次後重複使用
+        """
         # 如果沒有更新時間相關欄位，則不需要檢查重疊
         if not self._needs_overlap_check(**kwargs):
             return []
 
-        # 取得現有時段資訊和更新後的時間值
-        schedule = self.schedule_crud.get_schedule(db, schedule_id)
+        # 取得更新後的時間值
         new_date, new_start_time, new_end_time = self.new_updated_time_values(
-            db, schedule_id, **kwargs
+            schedule, **kwargs
         )
 
         # 更新時段時排除自己，避免查詢結果「和自己重疊」造成誤判
@@ -326,7 +718,7 @@ class ScheduleService:
             schedule_date=new_date,
             start_time=new_start_time,
             end_time=new_end_time,
-            exclude_schedule_id=schedule_id,
+            exclude_schedule_id=int(schedule.id),
         )
 
         return overlapping_schedules
@@ -339,30 +731,101 @@ class ScheduleService:
         schedule_id: int,
         updated_by: int,
         updated_by_role: UserRoleEnum,
+        expected_version: int | None = None,
         **kwargs: Any,
     ) -> Schedule:
-        """更新時段。"""
-        # 檢查更新時是否會造成時段重疊
-        overlapping_schedules = self.check_update_overlap(db, schedule_id, **kwargs)
+        """更新時段。
 
-        # 如果發現重疊，記錄警告並拋出錯誤阻止更新
-        if overlapping_schedules:
-            logger.warning(
-                f"更新時段 {schedule_id} 時檢測到重疊: "
-                f"重疊數量={len(overlapping_schedules)}, "
-                f"更新者={updated_by}, 角色={updated_by_role.value}"
+        - 未指定版本號：以 SELECT ... FOR UPDATE 載入並鎖定時段一次，
+          驗證、重疊檢查與寫入都使用同一個物件，鎖定到 commit 為止
+        - 指定版本號（If-Match）：不鎖定，寫入為 UPDATE ... WHERE id=? AND version=?；
+          不更新時間欄位時不需要重疊檢查，也不先讀取
+
+        Args:
+            expected_version: If-Match 指定的版本號，版本不符時拋出 412 錯誤
+        """
+        if expected_version is not None and not self._needs_overlap_check(**kwargs):
+            changes_users = bool({"giver_id", "taker_id"} & kwargs.keys())
+
+            # 未先讀取時段：改變 Giver、Taker 時，先查詢原本的使用者讓其讀取快取失效
+            owners = []
+            if changes_users and schedule_read_cache.enabled:
+                owners = [self.schedule_crud.get_schedule_owners(db, schedule_id)]
+
+            updated_schedule = self.schedule_crud.update_schedule_if_version(
+                db,
+                schedule_id,
+                expected_version,
+                updated_by,
+                updated_by_role,
+                **kwargs,
             )
-            error_msg = f"更新時段 {schedule_id} 時，檢測到 {len(overlapping_schedules)} 個重疊時段，請調整時段之時間"
-            raise create_schedule_overlap_error(error_msg, overlapping_schedules)
 
-        # 呼叫 CRUD 層進行實際的資料庫更新操作
-        updated_schedule = self.schedule_crud.update_schedule(
-            db=db,
-            schedule_id=schedule_id,
-            updated_by=updated_by,
-            updated_by_role=updated_by_role,
-            **kwargs,
-        )
+            # 未先讀取時段，無法得知更新前的狀態與使用者
+            if changes_users:
+                self.schedule_crud.on_commit(db, schedule_calendar_cache.clear)
+            else:
+                self._invalidate_calendars(
+                    db,
+                    *self._schedule_users(
+                        [updated_schedule], accepted_only="status" not in kwargs
+                    ),
+                )
+            self._invalidate_reads(
+                db,
+                *self._schedule_users([updated_schedule, *filter(None, owners)]),
+                [schedule_id],
+            )
+        else:
+            schedule = self.schedule_crud.get_schedule_for_update(
+                db, schedule_id, expected_version
+            )
+
+            # 檢查更新時是否會造成時段重疊
+            overlapping_schedules = self.check_update_overlap(db, schedule, **kwargs)
+
+            # 如果發現重疊，記錄警告並拋出錯誤阻止更新
+            if overlapping_schedules:
+                logger.warning(
+                    f"更新時段 {schedule_id} 時檢測到重疊: "
+                    f"重疊數量={len(overlapping_schedules)}, "
+                    f"更新者={updated_by}, 角色={updated_by_role.value}"
+                )
+                error_msg = f"更新時段 {schedule_id} 時，檢測到 {len(overlapping_schedules)} 個重疊時段，請調整時段之時間"
+                SCHEDULE_OVERLAP_REJECTIONS.inc(operation="update")
+                raise create_schedule_overlap_error(error_msg, overlapping_schedules)
+
+            # 更新前的使用者：時段可能換到其他使用者，或從已接受變為其他狀態而移出訂閱
+            givers_before, takers_before = self._schedule_users([schedule])
+            accepted_givers, accepted_takers = self._schedule_users(
+                [schedule], accepted_only=True
+            )
+
+            # 呼叫 CRUD 層進行實際的資料庫更新操作，沿用已載入的時段物件
+            updated_schedule = self.schedule_crud.update_schedule(
+                db=db,
+                schedule_id=schedule_id,
+                updated_by=updated_by,
+                updated_by_role=updated_by_role,
+                schedule=schedule,
+                expected_version=expected_version,
+                **kwargs,
+            )
+
+            givers_after, takers_after = self._schedule_users([updated_schedule])
+            self._invalidate_reads(
+                db,
+                givers_before | givers_after,
+                takers_before | takers_after,
+                [schedule_id],
+            )
+
+            givers_after, takers_after = self._schedule_users(
+                [updated_schedule], accepted_only=True
+            )
+            self._invalidate_calendars(
+                db, accepted_givers | givers_after, accepted_takers | takers_after
+            )
 
         logger.info(
             f"時段 {schedule_id} 更新成功，更新者: {updated_by} (角色: {updated_by_role.value})"
@@ -378,16 +841,31 @@ class ScheduleService:
         schedule_id: int,
         deleted_by: int | None = None,
         deleted_by_role: UserRoleEnum | None = None,
+        expected_version: int | None = None,
     ) -> bool:
-        """軟刪除時段。"""
+        """軟刪除時段。
+
+        Args:
+            expected_version: If-Match 指定的版本號，版本不符時拋出 412 錯誤
+        """
+        # 軟刪除以單一 UPDATE 完成、不讀取時段；啟用讀取快取時先查詢使用者，讓相關列表失效
+        owners = []
+        if schedule_read_cache.enabled:
+            owners = [self.schedule_crud.get_schedule_owners(db, schedule_id)]
+
         # 呼叫 CRUD 層進行軟刪除操作，取得刪除結果
         deletion_result = self.schedule_crud.delete_schedule(
-            db, schedule_id, deleted_by, deleted_by_role
+            db, schedule_id, deleted_by, deleted_by_role, expected_version
         )
 
         # 使用 match-case 語法處理不同的刪除結果
         match deletion_result:
             case DeletionResult.SUCCESS:
+                # 已接受的時段無法刪除，行事曆訂閱不需要失效
+                self._invalidate_reads(
+                    db, *self._schedule_users(filter(None, owners)), [schedule_id]
+                )
+
                 # 刪除成功：記錄成功日誌並返回 True
                 logger.info(
                     f"時段 {schedule_id} 軟刪除成功, "
@@ -424,6 +902,14 @@ class ScheduleService:
                 # 已經刪除：記錄警告
                 logger.warning(f"時段 {schedule_id} 已經刪除")
                 raise create_schedule_not_found_error(schedule_id)
+            case DeletionResult.VERSION_MISMATCH:
+                # 版本不符：時段已被其他請求修改
+                logger.warning(
+                    f"時段 {schedule_id} 版本不符，預期版本: {expected_version}"
+                )
+                raise create_schedule_precondition_failed_error(
+                    schedule_id, expected_version
+                )
             case _:  # 防禦性程式設計：處理未預期的刪除結果
                 # 未知錯誤：記錄錯誤並拋出業務邏輯錯誤
                 logger.error(
@@ -431,6 +917,533 @@ class ScheduleService:
                 )
                 raise create_business_logic_error(f"未知的刪除結果: {deletion_result}")
 
+    @handle_service_errors_sync("批次軟刪除時段")
+    @log_operation("批次軟刪除時段")
+    def delete_schedules_by_filter(
+        self,
+        db: Session,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> int:
+        """依條件批次軟刪除時段，已接受或已完成的時段不會被刪除。"""
+        # 啟用讀取快取時先查詢會被刪除的時段，讓相關的 Taker 列表與單一時段失效
+        deletable = []
+        if schedule_read_cache.enabled:
+            deletable = self.schedule_crud.list_deletable_schedules(
+                db, giver_id, dates, status_filter
+            )
+
+        deleted_count = self.schedule_crud.delete_schedules_by_filter(
+            db, giver_id, dates, status_filter, deleted_by, deleted_by_role
+        )
+        self._invalidate_reads(
+            db,
+            [giver_id],
+            [s.taker_id for s in deletable],
+            [s.id for s in deletable],
+        )
+
+        logger.info(
+            f"批次軟刪除時段完成: giver_id={giver_id}, 日期數量={len(dates)}, "
+            f"status={status_filter.value if status_filter else None}, "
+            f"刪除數量={deleted_count}, deleted_by={deleted_by}, role={deleted_by_role}"
+        )
+
+        return deleted_count
+
+    def _batch_steps(self, operations: list[ScheduleBatchOperation]) -> list[list[int]]:
+        """將批次操作分成依序執行的步驟，每個步驟為操作索引列表。
+
+        連續的建立操作合併成同一個步驟：一次重疊檢查、一個多列 INSERT。
+        """
+        steps: list[list[int]] = []
+        for index, operation in enumerate(operations):
+            if (
+                operation.op == "create"
+                and steps
+                and operations[steps[-1][0]].op == "create"
+            ):
+                steps[-1].append(index)
+            else:
+                steps.append([index])
+        return steps
+
+    @handle_service_errors_sync("批次操作時段")
+    @log_operation("批次操作時段")
+    def execute_batch(
+        self,
+        db: Session,
+        operations: list[ScheduleBatchOperation],
+        operated_by: int,
+        operated_by_role: UserRoleEnum,
+    ) -> list[Schedule | None]:
+        """在單一交易中依序執行建立、更新、刪除操作，最後只 commit 一次。
+
+        每個操作沿用單筆 API 的業務規則（重疊檢查、狀態決定、刪除規則、版本檢查），
+        後面的操作可看到前面操作的結果。任一操作失敗時整批回滾，
+        錯誤詳情的 operation_indexes 指出失敗的操作。
+        同一時段有多個操作時，回傳的是同一個物件，反映整批完成後的狀態。
+
+        Returns:
+            list[Schedule | None]: 依操作順序排列的時段，刪除操作為 None
+        """
+        results: list[Schedule | None] = [None] * len(operations)
+
+        with self.schedule_crud.batch_transaction(db):
+            for step in self._batch_steps(operations):
+                first = operations[step[0]]
+                try:
+                    match first:
+                        case ScheduleBatchCreateOperation():
+                            # 同一步驟內皆為建立操作（見 _batch_steps）
+                            create_operations = [
+                                operation
+                                for operation in (operations[i] for i in step)
+                                if isinstance(operation, ScheduleBatchCreateOperation)
+                            ]
+                            created_schedules = self.create_schedules(
+                                db,
+                                [operation.schedule for operation in create_operations],
+                                operated_by,
+                                operated_by_role,
+                            )
+                            for index, schedule in zip(step, created_schedules):
+                                results[index] = schedule
+                        case ScheduleBatchUpdateOperation():
+                            results[step[0]] = self.update_schedule(
+                                db,
+                                first.schedule_id,
+                                operated_by,
+                                operated_by_role,
+                                first.version,
+                                # 欄位名稱即為 schedule_date，不需要處理 date 別名
+                                **first.schedule.model_dump(exclude_none=True),
+                            )
+                        case ScheduleBatchDeleteOperation():
+                            self.delete_schedule(
+                                db,
+                                first.schedule_id,
+                                operated_by,
+                                operated_by_role,
+                                first.version,
+                            )
+                except APIError as e:
+                    e.details["operation_indexes"] = step
+                    raise
+
+        logger.info(
+            f"批次操作時段完成: 操作數量={len(operations)}, "
+            f"操作者={operated_by}, 角色={operated_by_role.value}"
+        )
+
+        return results
+
+
+class AsyncScheduleService:
+    """時段服務類別（非同步版本）。
+
+    透過 AsyncSession.run_sync 在非同步驅動上執行 ScheduleService：
+    重疊檢查、狀態決定、刪除規則等業務邏輯只維護一份，
+    資料庫 I/O 則由事件迴圈等待，慢查詢不會阻塞同一個 worker 上的其他請求。
+    """
+
+    def __init__(self) -> None:
+        """初始化服務實例。"""
+        self.schedule_service = ScheduleService()
+        # 串流查詢需要在事件迴圈上逐批讀取，無法包在 run_sync 中，直接使用非同步 CRUD
+        self.schedule_crud = AsyncScheduleCRUD()
+
+    async def _run_write(
+        self, db: AsyncSession, func: Any, *args: Any, **kwargs: Any
+    ) -> Any:
+        """執行同步寫入，結束後使讀取快取中受影響的範圍失效。
+
+        寫入失敗時也需要失效：批次操作可能在失敗前已 commit 部分寫入。
+        """
+        try:
+            return await db.run_sync(func, *args, **kwargs)
+        finally:
+            await schedule_read_cache.flush(db)
+
+    async def create_schedules(
+        self,
+        db: AsyncSession,
+        schedules: list[ScheduleBase],
+        created_by: int,
+        created_by_role: UserRoleEnum,
+    ) -> list[Schedule]:
+        """建立多個時段。"""
+        return await self._run_write(
+            db,
+            self.schedule_service.create_schedules,
+            schedules,
+            created_by,
+            created_by_role,
+        )
+
+    async def list_schedules(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fieldset: ScheduleFieldset | None = None,
+    ) -> list[Schedule]:
+        """查詢時段列表。"""
+        return await db.run_sync(
+            self.schedule_service.list_schedules,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit,
+            after,
+            fieldset,
+        )
+
+    async def list_schedule_rows(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fields: tuple[str, ...] | None = None,
+    ) -> list[Row]:
+        """查詢時段列表的資料列（Core 讀取路徑）。"""
+        return await db.run_sync(
+            self.schedule_service.list_schedule_rows,
+            giver_id,
+            taker_id,
+            status_filter,
+            limit,
+            after,
+            fields,
+        )
+
+    async def read_schedule_page(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        limit: int | None = None,
+        after: ScheduleCursor | None = None,
+        fieldset: ScheduleFieldset | None = None,
+        session_factory: async_sessionmaker | None = None,
+    ) -> SchedulePage:
+        """查詢一頁時段列表並序列化成回應內容，啟用讀取快取時先查詢快取。
+
+        Args:
+            db: 非同步資料庫會話
+            giver_id, taker_id, status_filter: 篩選條件
+            limit: 每頁最多筆數，None 表示不分頁
+            after: 從此游標之後開始查詢
+            fieldset: 只輸出指定的欄位與關聯
+            session_factory: 讀取快取未命中與背景重新查詢使用的主資料庫會話工廠
+
+        Returns:
+            SchedulePage: 已序列化的時段與下一頁游標
+        """
+
+        async def load(session: AsyncSession) -> dict[str, Any]:
+            # 多查一筆，用來判斷是否還有下一頁，避免最後一頁之後再多一次空查詢
+            fetch_limit = limit + 1 if limit is not None else None
+
+            # 附加關聯時需要 ORM 載入關聯使用者；其餘情況以 Core 查詢資料列，跳過 ORM 與逐筆驗證
+            if fieldset is not None and fieldset.include:
+                results: list[Any] = await self.list_schedules(
+                    session,
+                    giver_id,
+                    taker_id,
+                    status_filter,
+                    limit=fetch_limit,
+                    after=after,
+                    fieldset=fieldset,
+                )
+            else:
+                results = await self.list_schedule_rows(
+                    session,
+                    giver_id,
+                    taker_id,
+                    status_filter,
+                    limit=fetch_limit,
+                    after=after,
+                    fields=fieldset.fields if fieldset is not None else None,
+                )
+
+            next_cursor = None
+            if limit is not None and len(results) > limit:
+                results = results[:limit]
+                next_cursor = encode_schedule_cursor(results[-1])
+
+            if fieldset is not None and fieldset.include:
+                items = dump_schedules(results, fieldset)
+            else:
+                fields = fieldset.fields if fieldset is not None else None
+                items = schedule_rows_to_dicts(results, fields)
+            return {"items": items, "next_cursor": next_cursor}
+
+        key = cache_key(
+            "list", giver_id, taker_id, status_filter, limit, after, fieldset
+        )
+        page = await schedule_read_cache.get_or_load(
+            db, key, list_scopes(giver_id, taker_id), load, session_factory
+        )
+        return SchedulePage(page["items"], page["next_cursor"])
+
+    async def get_list_validator(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+    ) -> Row:
+        """取得時段列表的驗證器。"""
+        return await db.run_sync(
+            self.schedule_service.get_list_validator, giver_id, taker_id, status_filter
+        )
+
+    async def get_schedule_version(
+        self, db: AsyncSession, schedule_id: int
+    ) -> int | None:
+        """取得時段的版本號。"""
+        return await db.run_sync(
+            self.schedule_service.get_schedule_version, schedule_id
+        )
+
+    async def export_schedule_rows(
+        self,
+        db: AsyncSession,
+        giver_id: int | None = None,
+        taker_id: int | None = None,
+        status_filter: str | None = None,
+        fields: tuple[str, ...] | None = None,
+        date_from: date | None = None,
+        date_to: date | None = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Sequence[Row]]:
+        """串流匯出時段資料列，每次產生一批（Core 讀取路徑、伺服器端游標）。"""
+        logger.info(
+            f"開始匯出時段: giver_id={giver_id}, taker_id={taker_id}, "
+            f"status_filter={status_filter}, date_from={date_from}, date_to={date_to}"
+        )
+
+        count = 0
+        try:
+            async for rows in self.schedule_crud.stream_schedule_rows(
+                db,
+                giver_id,
+                taker_id,
+                status_filter,
+                fields=fields,
+                date_from=date_from,
+                date_to=date_to,
+                batch_size=batch_size,
+            ):
+                count += len(rows)
+                yield rows
+        except Exception as e:
+            # 串流已開始，無法再改變回應狀態碼，只能記錄錯誤並中斷連線
+            logger.error(f"匯出時段失敗: 已匯出 {count} 筆, 錯誤: {str(e)}")
+            raise
+
+        logger.info(f"匯出時段完成: 共 {count} 筆")
+
+    async def get_calendar_feed(
+        self,
+        db: AsyncSession,
+        role: UserRoleEnum,
+        user_id: int,
+    ) -> CalendarFeed:
+        """取得使用者的行事曆訂閱；快取命中時直接回傳，不使用資料庫連線。"""
+        feed = schedule_calendar_cache.get(role, user_id)
+        if feed is not None:
+            return feed
+        return await db.run_sync(self.schedule_service.get_calendar_feed, role, user_id)
+
+    async def get_giver_daily_summary(
+        self,
+        db: AsyncSession,
+        giver_id: int,
+        date_from: date,
+        date_to: date,
+    ) -> list[GiverDailySummary]:
+        """查詢 Giver 在日期範圍內的每日時段統計。"""
+        return await db.run_sync(
+            self.schedule_service.get_giver_daily_summary, giver_id, date_from, date_to
+        )
+
+    async def search_free_slots(
+        self,
+        db: AsyncSession,
+        date_from: date,
+        date_to: date,
+        start_time: time,
+        end_time: time,
+        duration_minutes: int,
+        mode: SlotSearchMode = "available",
+        giver_ids: list[int] | None = None,
+        limit: int | None = None,
+    ) -> list[GiverFreeWindows]:
+        """搜尋有連續空檔視窗的 Giver。"""
+        return await db.run_sync(
+            self.schedule_service.search_free_slots,
+            date_from,
+            date_to,
+            start_time,
+            end_time,
+            duration_minutes,
+            mode,
+            giver_ids,
+            limit,
+        )
+
+    async def match_availability(
+        self,
+        db: AsyncSession,
+        giver_id: int,
+        taker_id: int,
+        min_minutes: int = 1,
+        limit: int | None = None,
+    ) -> list[MatchWindow]:
+        """比對 Taker 提案與 Giver 可預約時段的候選視窗。"""
+        return await db.run_sync(
+            self.schedule_service.match_availability,
+            giver_id,
+            taker_id,
+            min_minutes,
+            limit,
+        )
+
+    async def match_giver_inbox(
+        self,
+        db: AsyncSession,
+        giver_id: int,
+        min_minutes: int = 1,
+        limit: int | None = None,
+    ) -> list[TakerMatches]:
+        """比對 Giver 收件匣中每個 Taker 的候選視窗。"""
+        return await db.run_sync(
+            self.schedule_service.match_giver_inbox, giver_id, min_minutes, limit
+        )
+
+    async def get_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        fieldset: ScheduleFieldset | None = None,
+    ) -> Schedule:
+        """根據 ID 查詢單一時段。"""
+        return await db.run_sync(
+            self.schedule_service.get_schedule, schedule_id, fieldset
+        )
+
+    async def read_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        fieldset: ScheduleFieldset | None = None,
+        session_factory: async_sessionmaker | None = None,
+    ) -> ScheduleItem:
+        """查詢單一時段並序列化成回應內容，啟用讀取快取時先查詢快取。"""
+
+        async def load(session: AsyncSession) -> dict[str, Any]:
+            schedule = await self.get_schedule(session, schedule_id, fieldset)
+            return {
+                "data": dump_schedules(schedule, fieldset),
+                "version": schedule.version,
+            }
+
+        item = await schedule_read_cache.get_or_load(
+            db,
+            cache_key("item", schedule_id, fieldset),
+            schedule_scopes(schedule_id),
+            load,
+            session_factory,
+        )
+        return ScheduleItem(item["data"], item["version"])
+
+    async def update_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        updated_by: int,
+        updated_by_role: UserRoleEnum,
+        expected_version: int | None = None,
+        **kwargs: Any,
+    ) -> Schedule:
+        """更新時段。"""
+        return await self._run_write(
+            db,
+            self.schedule_service.update_schedule,
+            schedule_id,
+            updated_by,
+            updated_by_role,
+            expected_version,
+            **kwargs,
+        )
+
+    async def delete_schedule(
+        self,
+        db: AsyncSession,
+        schedule_id: int,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+        expected_version: int | None = None,
+    ) -> bool:
+        """軟刪除時段。"""
+        return await self._run_write(
+            db,
+            self.schedule_service.delete_schedule,
+            schedule_id,
+            deleted_by,
+            deleted_by_role,
+            expected_version,
+        )
+
+    async def delete_schedules_by_filter(
+        self,
+        db: AsyncSession,
+        giver_id: int,
+        dates: list[date],
+        status_filter: ScheduleStatusEnum | None = None,
+        deleted_by: int | None = None,
+        deleted_by_role: UserRoleEnum | None = None,
+    ) -> int:
+        """依條件批次軟刪除時段。"""
+        return await self._run_write(
+            db,
+            self.schedule_service.delete_schedules_by_filter,
+            giver_id,
+            dates,
+            status_filter,
+            deleted_by,
+            deleted_by_role,
+        )
+
+    async def execute_batch(
+        self,
+        db: AsyncSession,
+        operations: list[ScheduleBatchOperation],
+        operated_by: int,
+        operated_by_role: UserRoleEnum,
+    ) -> list[Schedule | None]:
+        """在單一交易中依序執行建立、更新、刪除操作。"""
+        return await self._run_write(
+            db,
+            self.schedule_service.execute_batch,
+            operations,
+            operated_by,
+            operated_by_role,
+        )
+
 
 # 建立服務實例，供其他模組使用
 schedule_service = ScheduleService()
+async_schedule_service = AsyncScheduleService()
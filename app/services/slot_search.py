@@ -0,0 +1,234 @@
+"""跨 Giver 空檔搜尋演算法模組。
+
+回答「哪些 Giver 在日期範圍 × 每日時間範圍內，有連續 N 分鐘的可預約（或完全空白）時段」：
+
+- 點陣圖：以固定粒度（SLOT_MINUTES）把每個 Giver 每天切成時格，
+  形狀為 (Giver, 日期, 時格) 的布林陣列，以差分陣列（bincount + cumsum）一次建立
+- 視窗：沿時格軸取前綴和，連續 k 個時格皆可用即為一個視窗，
+  所有 Giver、所有日期同時以 NumPy 向量運算判斷，不逐一迴圈
+- 記憶體：依 Giver 分塊（CHUNK_GIVERS）處理，尖峰記憶體與 Giver 總數無關
+
+時間不在時格邊界時採保守的取整：可預約時段向內取整（只計入完整涵蓋的時格），
+佔用時段向外取整（部分佔用的時格也視為佔用），回報的視窗一定可以預約。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, datetime, time, timedelta
+from operator import attrgetter
+from typing import Iterable, Literal, NamedTuple, Sequence
+
+# ===== 第三方套件 =====
+import numpy as np
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+from app.enums.models import ScheduleStatusEnum
+
+# 時格粒度（分鐘）
+SLOT_MINUTES = 15
+SLOT_SECONDS = SLOT_MINUTES * 60
+
+# 每次處理的 Giver 數量：256 個 Giver × 92 天 × 96 時格的差分陣列約 18 MB
+CHUNK_GIVERS = 256
+
+# available：視窗完全落在 AVAILABLE 時段內，Taker 可直接預約
+# free：視窗內沒有任何未刪除的時段，Giver 可在此開放新時段（與重疊檢查的規則相同）
+SlotSearchMode = Literal["available", "free"]
+
+
+class FreeWindow(NamedTuple):
+    """某一天最早符合條件的視窗。"""
+
+    date: date
+    start_time: time
+    end_time: time
+
+
+class GiverFreeWindows(NamedTuple):
+    """一個 Giver 在日期範圍內每天最早符合條件的視窗，依日期排序。"""
+
+    giver_id: int
+    windows: list[FreeWindow]
+
+
+def _seconds(value: time) -> int:
+    """將時間轉換成當天的秒數。"""
+    return value.hour * 3600 + value.minute * 60 + value.second
+
+
+def _slot_time(slot: int, extra_seconds: int = 0) -> time:
+    """將時格索引（加上額外秒數）轉換成當天的時間。"""
+    return (
+        datetime.min + timedelta(seconds=slot * SLOT_SECONDS + extra_seconds)
+    ).time()
+
+
+def _coverage(
+    giver: np.ndarray,
+    day: np.ndarray,
+    start: np.ndarray,
+    end: np.ndarray,
+    shape: tuple[int, int, int],
+) -> np.ndarray:
+    """以差分陣列建立 (Giver, 日期, 時格) 的涵蓋點陣圖。
+
+    每個區間在開始時格 +1、結束時格 -1，沿時格軸累加後大於 0 即為涵蓋；
+    bincount 一次處理所有區間，同一 Giver 日的多個區間也能正確累加。
+    """
+    givers, days, width = shape
+    cells = givers * days * (width + 1)
+    base = (giver * days + day) * (width + 1)
+    diff = np.bincount(base + start, minlength=cells) - np.bincount(
+        base + end, minlength=cells
+    )
+    coverage = diff.reshape(givers, days, width + 1).cumsum(axis=-1, dtype=np.int16)
+    return coverage[..., :width] > 0
+
+
+def search_free_windows(
+    intervals: Sequence[ScheduleInterval],
+    date_from: date,
+    date_to: date,
+    start_time: time,
+    end_time: time,
+    duration_minutes: int,
+    mode: SlotSearchMode = "available",
+    giver_ids: Iterable[int] | None = None,
+    limit: int | None = None,
+) -> list[GiverFreeWindows]:
+    """找出在每日時間範圍內有連續 duration_minutes 分鐘視窗的 Giver。
+
+    Args:
+        intervals: 日期範圍內未刪除的時段區間
+        date_from: 日期範圍起日（包含）
+        date_to: 日期範圍迄日（包含）
+        start_time: 每日時間範圍的開始時間，向上取整到時格
+        end_time: 每日時間範圍的結束時間，向下取整到時格
+        duration_minutes: 視窗長度（分鐘），向上取整到時格
+        mode: available 或 free，見 SlotSearchMode
+        giver_ids: 只搜尋這些 Giver；None 表示 intervals 中出現的 Giver
+            （available 模式只有具有可預約時段的 Giver）
+        limit: 最多回傳的 Giver 數量，None 表示不限制
+
+    Returns:
+        list[GiverFreeWindows]: 依 giver_id 排序，只包含至少有一天符合條件的 Giver
+    """
+    days = (date_to - date_from).days + 1
+    first_slot = -(-_seconds(start_time) // SLOT_SECONDS)
+    last_slot = _seconds(end_time) // SLOT_SECONDS
+    width = last_slot - first_slot
+    k = -(-duration_minutes // SLOT_MINUTES)
+    if days <= 0 or k <= 0 or width < k:
+        return []
+
+    # 日期與時間的種類遠少於區間數量，先建立對照表再以 map 轉換，避免逐筆計算
+    count = len(intervals)
+    dates, starts, ends = (
+        list(map(attrgetter(name), intervals))
+        for name in ("date", "start_time", "end_time")
+    )
+    day_index = {d: (d - date_from).days for d in set(dates)}
+    seconds = {t: _seconds(t) for t in set(starts) | set(ends)}
+    giver = np.fromiter(map(attrgetter("giver_id"), intervals), np.int64, count)
+    day = np.fromiter(map(day_index.__getitem__, dates), np.int64, count)
+    start = np.fromiter(map(seconds.__getitem__, starts), np.int64, count)
+    end = np.fromiter(map(seconds.__getitem__, ends), np.int64, count)
+    available = np.fromiter(
+        map(ScheduleStatusEnum.AVAILABLE.__eq__, map(attrgetter("status"), intervals)),
+        np.bool_,
+        count,
+    )
+
+    if giver_ids is not None:
+        candidates = np.unique(np.fromiter(giver_ids, np.int64))
+    elif mode == "available":
+        candidates = np.unique(giver[available])
+    else:
+        candidates = np.unique(giver)
+    if candidates.size == 0:
+        return []
+
+    # 可預約時段向內取整，佔用時段向外取整；free 模式下所有時段都視為佔用
+    usable_source = available if mode == "available" else np.zeros(count, np.bool_)
+    start_slot = np.where(
+        usable_source, -(-start // SLOT_SECONDS), start // SLOT_SECONDS
+    )
+    end_slot = np.where(usable_source, end // SLOT_SECONDS, -(-end // SLOT_SECONDS))
+    start_slot = np.clip(start_slot - first_slot, 0, width)
+    end_slot = np.clip(end_slot - first_slot, 0, width)
+
+    # 只保留候選 Giver、日期範圍內、裁切到時間範圍後仍非空的區間
+    position = np.searchsorted(candidates, giver)
+    keep = (
+        (position < candidates.size)
+        & (candidates[np.minimum(position, candidates.size - 1)] == giver)
+        & (day >= 0)
+        & (day < days)
+        & (start_slot < end_slot)
+    )
+    order = np.argsort(position[keep], kind="stable")
+    position, day, start_slot, end_slot, usable_source = (
+        column[keep][order]
+        for column in (position, day, start_slot, end_slot, usable_source)
+    )
+
+    # 視窗的日期、開始與結束時間只有 days、width 種，先建立對照表
+    window_dates = [date_from + timedelta(days=offset) for offset in range(days)]
+    window_starts = [_slot_time(first_slot + slot) for slot in range(width)]
+    window_ends = [
+        _slot_time(first_slot + slot, duration_minutes * 60) for slot in range(width)
+    ]
+
+    candidate_ids = candidates.tolist()
+    results: list[GiverFreeWindows] = []
+    for chunk_start in range(0, candidates.size, CHUNK_GIVERS):
+        chunk_end = min(chunk_start + CHUNK_GIVERS, candidates.size)
+        lo, hi = np.searchsorted(position, [chunk_start, chunk_end])
+        shape = (chunk_end - chunk_start, days, width)
+        chunk_giver = position[lo:hi] - chunk_start
+        chunk_day = day[lo:hi]
+        chunk_start_slot = start_slot[lo:hi]
+        chunk_end_slot = end_slot[lo:hi]
+        offered = usable_source[lo:hi]
+
+        usable = ~_coverage(
+            chunk_giver[~offered],
+            chunk_day[~offered],
+            chunk_start_slot[~offered],
+            chunk_end_slot[~offered],
+            shape,
+        )
+        if mode == "available":
+            usable &= _coverage(
+                chunk_giver[offered],
+                chunk_day[offered],
+                chunk_start_slot[offered],
+                chunk_end_slot[offered],
+                shape,
+            )
+
+        # 前綴和：prefix[..., j] 為前 j 個時格中可用的數量，連續 k 個皆可用即為視窗
+        prefix = np.zeros((*shape[:2], width + 1), np.int16)
+        np.cumsum(usable, axis=-1, out=prefix[..., 1:])
+        windows = (prefix[..., k:] - prefix[..., :-k]) == k
+        local_givers, day_indexes = np.nonzero(windows.any(axis=-1))
+        earliest = windows[local_givers, day_indexes].argmax(axis=-1)
+
+        # nonzero 依 (Giver, 日期) 排序，同一個 Giver 的視窗連續出現
+        current: GiverFreeWindows | None = None
+        for local, day_offset, slot in zip(
+            local_givers.tolist(), day_indexes.tolist(), earliest.tolist()
+        ):
+            giver_id = candidate_ids[chunk_start + local]
+            if current is None or current.giver_id != giver_id:
+                if limit is not None and len(results) >= limit:
+                    return results
+                current = GiverFreeWindows(giver_id, [])
+                results.append(current)
+            current.windows.append(
+                FreeWindow(
+                    window_dates[day_offset], window_starts[slot], window_ends[slot]
+                )
+            )
+
+    return results
@@ -4,8 +4,44 @@
 - 時區轉換工具
 - 日期時間格式化
 - 模型輔助函數
+- 鍵集分頁游標
+- ETag 與條件式請求標頭（If-Match、If-None-Match、If-Modified-Since）
+- 稀疏欄位（fields、include）
+- 回應格式內容協商（JSON、MessagePack、欄式 JSON）與 NDJSON 編碼
 """
 
+from .etag import (
+    format_list_etag,
+    format_schedule_etag,
+    if_none_match_matches,
+    not_modified_since,
+    parse_if_match,
+)
+from .fieldsets import (
+    dump_schedules,
+    parse_schedule_fieldset,
+    schedule_columns,
+    SCHEDULE_FIELDS,
+    schedule_projection_model,
+    SCHEDULE_RELATIONS,
+    schedule_rows_to_dicts,
+    ScheduleFieldset,
+)
+from .negotiation import (
+    COLUMNAR_MEDIA_TYPE,
+    encode_ndjson,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    NDJSON_MEDIA_TYPE,
+    negotiate_media_type,
+    render_response,
+    to_columnar,
+)
+from .pagination import (
+    decode_schedule_cursor,
+    encode_schedule_cursor,
+    ScheduleCursor,
+)
 from .timezone import (
     get_local_now_naive,
     get_utc_timestamp,
@@ -17,4 +53,32 @@ __all__ = [
     "get_local_now_naive",
     "get_utc_timestamp",
     "TAIWAN_TIMEZONE",
+    # 鍵集分頁游標
+    "ScheduleCursor",
+    "encode_schedule_cursor",
+    "decode_schedule_cursor",
+    # ETag 與條件式請求標頭
+    "format_schedule_etag",
+    "format_list_etag",
+    "parse_if_match",
+    "if_none_match_matches",
+    "not_modified_since",
+    # 稀疏欄位
+    "SCHEDULE_FIELDS",
+    "SCHEDULE_RELATIONS",
+    "ScheduleFieldset",
+    "parse_schedule_fieldset",
+    "schedule_columns",
+    "schedule_projection_model",
+    "schedule_rows_to_dicts",
+    "dump_schedules",
+    # 回應格式內容協商
+    "JSON_MEDIA_TYPE",
+    "MSGPACK_MEDIA_TYPE",
+    "COLUMNAR_MEDIA_TYPE",
+    "NDJSON_MEDIA_TYPE",
+    "negotiate_media_type",
+    "render_response",
+    "to_columnar",
+    "encode_ndjson",
 ]
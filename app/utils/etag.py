@@ -0,0 +1,120 @@
+"""ETag 工具模組。
+
+以時段的版本號作為 ETag，並解析 If-Match 標頭取回用戶端預期的版本號，
+用於樂觀鎖的條件式更新與刪除；
+以及條件式 GET 的 If-None-Match、If-Modified-Since 判斷。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import datetime
+from email.utils import parsedate_to_datetime
+import hashlib
+import re
+from typing import Any, Iterable
+
+# 強 ETag 格式："<版本號>"；If-Match 依 RFC 9110 使用強比較，不接受弱 ETag（W/"..."）
+_ETAG_PATTERN = re.compile(r'^"(\d+)"$')
+
+
+def format_schedule_etag(version: int) -> str:
+    """將時段版本號格式化為 ETag 標頭值。
+
+    Args:
+        version: 時段版本號
+
+    Returns:
+        str: 強 ETag，例如 "3"
+    """
+    return f'"{version}"'
+
+
+def format_list_etag(validator: Iterable[Any], *variant: Any) -> str:
+    """由時段列表的驗證器與回應變體（格式、欄位、分頁）建立弱 ETag。
+
+    驗證器是聚合值而非內容本身，內容相同不保證位元組相同，因此使用弱 ETag。
+
+    Args:
+        validator: 時段列表的驗證器，例如筆數、最後更新時間、版本號總和
+        variant: 影響回應內容的其他參數
+
+    Returns:
+        str: 弱 ETag，例如 W/"3f0c..."
+    """
+    key = repr((tuple(validator), variant)).encode()
+    return f'W/"{hashlib.blake2b(key, digest_size=16).hexdigest()}"'
+
+
+def parse_if_match(if_match: str | None) -> int | None:
+    """解析 If-Match 標頭，取得預期的時段版本號。
+
+    Args:
+        if_match: If-Match 標頭值，None 或 "*" 表示不檢查版本
+
+    Returns:
+        int | None: 預期的版本號，不檢查版本時為 None
+
+    Raises:
+        ValueError: 標頭格式無效（包含弱 ETag 或多個 ETag）
+    """
+    if if_match is None:
+        return None
+
+    value = if_match.strip()
+    if value == "*":
+        return None
+
+    match = _ETAG_PATTERN.match(value)
+    if match is None:
+        raise ValueError(f"無效的 If-Match 標頭：{if_match}")
+    return int(match.group(1))
+
+
+def _opaque_tag(etag: str) -> str:
+    """去除弱 ETag 的 W/ 前綴，取得比較用的值。"""
+    etag = etag.strip()
+    return etag[2:] if etag.startswith("W/") else etag
+
+
+def if_none_match_matches(if_none_match: str | None, etag: str) -> bool:
+    """判斷 If-None-Match 標頭是否與目前的 ETag 相符。
+
+    依 RFC 9110 使用弱比較：忽略 W/ 前綴；標頭可包含多個以逗號分隔的 ETag，或 "*"。
+
+    Args:
+        if_none_match: If-None-Match 標頭值
+        etag: 目前內容的 ETag
+
+    Returns:
+        bool: 相符時為 True，應回傳 304 Not Modified
+    """
+    if if_none_match is None:
+        return False
+
+    value = if_none_match.strip()
+    if value == "*":
+        return True
+
+    current = _opaque_tag(etag)
+    return any(_opaque_tag(tag) == current for tag in value.split(","))
+
+
+def not_modified_since(if_modified_since: str | None, last_modified: datetime) -> bool:
+    """判斷內容自 If-Modified-Since 的時間後是否未修改。
+
+    Args:
+        if_modified_since: If-Modified-Since 標頭值（HTTP 日期），格式無效時忽略
+        last_modified: 內容的最後修改時間（含時區，精度為秒）
+
+    Returns:
+        bool: 未修改時為 True，應回傳 304 Not Modified
+    """
+    if if_modified_since is None:
+        return False
+
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        return False
+    return last_modified <= since
@@ -0,0 +1,157 @@
+"""稀疏欄位（sparse fieldsets）工具模組。
+
+解析查詢時段 API 的 fields、include 查詢參數：
+- fields：只回傳指定的時段欄位，查詢時以 load_only 只讀取需要的欄位
+- include：附加指定的關聯使用者，查詢時才 JOIN 使用者資料表
+
+並依欄位組合建立投影回應模型，只序列化指定的欄位；
+Core 查詢的資料列則直接轉換成回應字典，不經過 Pydantic 驗證。
+序列化結果為可直接編碼成 JSON 的字典，也是讀取快取保存的內容。
+"""
+
+# ===== 標準函式庫 =====
+from copy import copy
+from functools import lru_cache
+from typing import Any, Iterable, NamedTuple, Sequence
+
+# ===== 第三方套件 =====
+from pydantic import BaseModel, create_model
+
+# ===== 本地模組 =====
+from app.schemas import ScheduleResponse, ScheduleUserResponse
+
+# 可指定的時段欄位：回應中的欄位名稱（date 為 schedule_date 的別名，同時也是資料庫欄位名稱）
+SCHEDULE_FIELDS = tuple(
+    field.alias or name for name, field in ScheduleResponse.model_fields.items()
+)
+
+# 日期時間欄位：Core 資料列轉換成回應字典時格式化為 ISO 8601 字串，與 Pydantic 的 JSON 輸出相同
+_TEMPORAL_FIELDS = frozenset(
+    {"date", "start_time", "end_time", "created_at", "updated_at", "deleted_at"}
+)
+
+# 可附加的關聯使用者
+SCHEDULE_RELATIONS = (
+    "giver",
+    "taker",
+    "created_by_user",
+    "updated_by_user",
+    "deleted_by_user",
+)
+
+
+class ScheduleFieldset(NamedTuple):
+    """時段查詢的欄位與關聯選擇。"""
+
+    fields: tuple[str, ...] | None  # None 表示所有欄位
+    include: tuple[str, ...] = ()
+
+
+def _parse_names(value: str, allowed: tuple[str, ...], label: str) -> tuple[str, ...]:
+    """解析逗號分隔的名稱清單，依 allowed 的順序去除重複後回傳。"""
+    names = {name.strip() for name in value.split(",") if name.strip()}
+    invalid = sorted(names - set(allowed))
+    if invalid:
+        raise ValueError(f"無效的{label}：{', '.join(invalid)}")
+    return tuple(name for name in allowed if name in names)
+
+
+def parse_schedule_fieldset(
+    fields: str | None, include: str | None
+) -> ScheduleFieldset | None:
+    """解析 fields、include 查詢參數。
+
+    Args:
+        fields: 逗號分隔的時段欄位，None 表示所有欄位
+        include: 逗號分隔的關聯名稱，None 表示不附加關聯
+
+    Returns:
+        ScheduleFieldset | None: 欄位與關聯選擇，兩個參數都未提供時為 None
+
+    Raises:
+        ValueError: 欄位或關聯名稱無效，或 fields 為空
+    """
+    if fields is None and include is None:
+        return None
+
+    selected_fields = None
+    if fields is not None:
+        selected_fields = _parse_names(fields, SCHEDULE_FIELDS, "欄位")
+        if not selected_fields:
+            raise ValueError("fields 至少需要一個欄位")
+
+    selected_include: tuple[str, ...] = ()
+    if include is not None:
+        selected_include = _parse_names(include, SCHEDULE_RELATIONS, "關聯")
+
+    return ScheduleFieldset(selected_fields, selected_include)
+
+
+def schedule_columns(fieldset: ScheduleFieldset | None) -> tuple[str, ...]:
+    """取得回應包含的欄位名稱，順序與序列化結果的鍵相同。"""
+    if fieldset is None:
+        return SCHEDULE_FIELDS
+    return (fieldset.fields or SCHEDULE_FIELDS) + fieldset.include
+
+
+@lru_cache(maxsize=128)
+def schedule_projection_model(fieldset: ScheduleFieldset) -> type[BaseModel]:
+    """建立只包含指定欄位與關聯的時段回應模型。
+
+    欄位定義沿用 ScheduleResponse；相同的欄位組合重複使用同一個模型。
+    """
+    selected = set(fieldset.fields or SCHEDULE_FIELDS)
+    definitions: dict[str, Any] = {
+        name: (field.annotation, copy(field))
+        for name, field in ScheduleResponse.model_fields.items()
+        if (field.alias or name) in selected
+    }
+    for relation in fieldset.include:
+        definitions[relation] = (ScheduleUserResponse | None, None)
+
+    return create_model(
+        "ScheduleProjectionResponse",
+        __config__=ScheduleResponse.model_config,
+        **definitions,
+    )
+
+
+def dump_schedules(content: Any, fieldset: ScheduleFieldset | None) -> Any:
+    """以回應模型序列化時段（單一或列表），指定 fields、include 時只輸出指定的欄位。"""
+    model = schedule_projection_model(fieldset) if fieldset else ScheduleResponse
+    if isinstance(content, list):
+        return [
+            model.model_validate(s).model_dump(mode="json", by_alias=True)
+            for s in content
+        ]
+    return model.model_validate(content).model_dump(mode="json", by_alias=True)
+
+
+def schedule_rows_to_dicts(
+    rows: Iterable[Any], fields: Sequence[str] | None = None
+) -> list[dict[str, Any]]:
+    """將 Core 查詢的時段資料列轉換成可直接輸出 JSON 的回應字典。
+
+    資料來自資料庫，欄位型別已由資料表定義保證，因此不再逐列以 Pydantic 驗證：
+    日期時間轉換為 ISO 8601 字串，狀態與角色為 str 列舉，JSON 編碼時即為其值。
+
+    Args:
+        rows: 以回應欄位名稱為鍵的資料列（例如 ScheduleCRUD.list_schedule_rows 的結果）
+        fields: 要輸出的欄位，None 表示所有欄位
+
+    Returns:
+        list[dict[str, Any]]: 回應字典列表
+    """
+    keys = tuple(fields or SCHEDULE_FIELDS)
+    temporal = [key for key in keys if key in _TEMPORAL_FIELDS]
+
+    results = []
+    for row in rows:
+        mapping = row._mapping
+        item = {key: mapping[key] for key in keys}
+        for key in temporal:
+            value = item[key]
+            if value is not None:
+                item[key] = value.isoformat()
+        results.append(item)
+    return results
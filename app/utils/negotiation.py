@@ -0,0 +1,126 @@
+"""回應格式內容協商工具模組。
+
+依 Accept 標頭為查詢時段 API 選擇回應格式：
+- application/json：預設格式，以 orjson 編碼
+- application/msgpack：MessagePack 二進位格式（也接受 application/x-msgpack）
+- application/vnd.schedule.columnar+json：欄式 JSON，欄位名稱只出現一次，
+  {"columns": [...], "rows": [[...], ...]}，適合一次取得大量時段的畫面
+
+以及串流匯出使用的 NDJSON（每行一筆 JSON）編碼。
+"""
+
+# ===== 標準函式庫 =====
+from typing import Any, Iterable, Mapping, Sequence
+
+# ===== 第三方套件 =====
+from fastapi import Response
+import msgpack
+import orjson
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPE = "application/msgpack"
+COLUMNAR_MEDIA_TYPE = "application/vnd.schedule.columnar+json"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# 常見的別名，協商時視為同一種格式
+_MEDIA_TYPE_ALIASES = {"application/x-msgpack": MSGPACK_MEDIA_TYPE}
+
+
+def _parse_accept(accept: str) -> list[tuple[str, str, float]]:
+    """解析 Accept 標頭，回傳 (type, subtype, q) 列表，忽略格式無效的項目。"""
+    ranges = []
+    for part in accept.split(","):
+        media_range, *params = (item.strip() for item in part.split(";"))
+        media_range = media_range.lower()
+        media_range = _MEDIA_TYPE_ALIASES.get(media_range, media_range)
+        type_, _, subtype = media_range.partition("/")
+        if not type_ or not subtype:
+            continue
+
+        quality = 1.0
+        for param in params:
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    quality = min(max(float(value), 0.0), 1.0)
+                except ValueError:
+                    quality = 0.0
+        ranges.append((type_, subtype, quality))
+    return ranges
+
+
+def negotiate_media_type(accept: str | None, available: Sequence[str]) -> str | None:
+    """依 Accept 標頭選擇回應的媒體類型。
+
+    每種可提供的格式取最明確的相符範圍（type/subtype > type/* > */*）的 q 值，
+    選出 q 值最高者；q 值相同時依 available 的順序，第一個為預設格式。
+
+    Args:
+        accept: Accept 標頭值，未提供時使用預設格式
+        available: 可提供的媒體類型，依偏好排序
+
+    Returns:
+        str | None: 選出的媒體類型，沒有可接受的格式時為 None
+    """
+    ranges = _parse_accept(accept) if accept else []
+    if not ranges:
+        return available[0]
+
+    def quality(media_type: str) -> float:
+        type_, _, subtype = media_type.partition("/")
+        best: tuple[int, float] | None = None
+        for range_type, range_subtype, q in ranges:
+            if (range_type, range_subtype) == (type_, subtype):
+                specificity = 2
+            elif range_type == type_ and range_subtype == "*":
+                specificity = 1
+            elif (range_type, range_subtype) == ("*", "*"):
+                specificity = 0
+            else:
+                continue
+            if best is None or specificity > best[0]:
+                best = (specificity, q)
+        return best[1] if best else 0.0
+
+    best_quality, media_type = max(
+        ((quality(m), m) for m in available), key=lambda item: item[0]
+    )
+    return media_type if best_quality > 0 else None
+
+
+def to_columnar(
+    items: Sequence[Mapping[str, Any]], columns: Sequence[str]
+) -> dict[str, Any]:
+    """將回應字典列表轉換成欄式格式：欄位名稱只出現一次，每筆資料為一列值。"""
+    return {
+        "columns": list(columns),
+        "rows": [[item[column] for column in columns] for item in items],
+    }
+
+
+def render_response(
+    data: Any, media_type: str, headers: Mapping[str, str] | None = None
+) -> Response:
+    """以選定的格式編碼已序列化的資料（只含 JSON 相容的型別）。
+
+    Args:
+        data: 回應資料，例如 model_dump(mode="json") 或 to_columnar 的結果
+        media_type: negotiate_media_type 選出的媒體類型
+        headers: 額外的回應標頭
+
+    Returns:
+        Response: 已編碼的回應，並加上 Vary: Accept 讓快取依 Accept 區分格式
+    """
+    if media_type == MSGPACK_MEDIA_TYPE:
+        body = msgpack.packb(data)
+    else:
+        body = orjson.dumps(data)
+
+    response = Response(content=body, media_type=media_type, headers=headers)
+    response.headers["Vary"] = "Accept"
+    return response
+
+
+def encode_ndjson(items: Iterable[Any]) -> bytes:
+    """將多筆已序列化的資料編碼成 NDJSON：每筆一行 JSON，以換行結尾。"""
+    return b"".join(orjson.dumps(item) + b"\n" for item in items)
@@ -0,0 +1,62 @@
+"""鍵集（keyset）分頁工具模組。
+
+以 (date, start_time, id) 作為時段列表的排序鍵，
+將上一頁最後一筆的排序鍵編碼成不透明的游標字串，下一頁從該鍵之後繼續查詢。
+"""
+
+# ===== 標準函式庫 =====
+import base64
+import binascii
+from datetime import date, time
+import json
+from typing import Any, NamedTuple
+
+
+class ScheduleCursor(NamedTuple):
+    """時段列表的分頁游標：上一頁最後一筆的排序鍵。"""
+
+    date: date
+    start_time: time
+    id: int
+
+
+def encode_schedule_cursor(schedule: Any) -> str:
+    """將時段的排序鍵編碼成游標字串。
+
+    Args:
+        schedule: 具有 date、start_time、id 屬性的時段物件
+
+    Returns:
+        str: URL 安全的 base64 游標字串
+    """
+    payload = json.dumps(
+        [schedule.date.isoformat(), schedule.start_time.isoformat(), schedule.id],
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_schedule_cursor(cursor: str) -> ScheduleCursor:
+    """將游標字串解碼成排序鍵。
+
+    Args:
+        cursor: encode_schedule_cursor 產生的游標字串
+
+    Returns:
+        ScheduleCursor: 上一頁最後一筆的排序鍵
+
+    Raises:
+        ValueError: 游標格式無效
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        date_str, time_str, schedule_id = json.loads(
+            base64.urlsafe_b64decode(padded.encode())
+        )
+        if not isinstance(schedule_id, int) or isinstance(schedule_id, bool):
+            raise ValueError("游標中的 id 必須為整數")
+        return ScheduleCursor(
+            date.fromisoformat(date_str), time.fromisoformat(time_str), schedule_id
+        )
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError) as e:
+        raise ValueError(f"無效的分頁游標：{cursor}") from e
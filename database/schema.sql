@@ -101,6 +101,8 @@ CREATE TABLE `schedules` (
         COMMENT '最後更新者的 ID，可為 NULL（表示系統自動更新）',
     `updated_by_role` ENUM('GIVER', 'TAKER', 'SYSTEM') NOT NULL DEFAULT 'SYSTEM'
         COMMENT '最後更新者角色',
+    `version` INT UNSIGNED NOT NULL DEFAULT 1
+        COMMENT '版本號（樂觀鎖），每次更新遞增',
     `deleted_at` DATETIME NULL 
         COMMENT '軟刪除標記（本地時間）',
     `deleted_by` INT UNSIGNED NULL
@@ -164,15 +166,146 @@ CREATE INDEX `idx_schedule_status`
 CREATE INDEX `idx_schedule_giver_time` 
     ON `schedules` (`giver_id`, `start_time`, `end_time`);
 
+-- 場景：時段列表的條件式 GET，以筆數、最後更新時間、版本號總和判斷內容是否變更（涵蓋索引）
+CREATE INDEX `idx_schedule_giver_changes` 
+    ON `schedules` (`giver_id`, `deleted_at`, `status`, `updated_at`, `version`);
+
+CREATE INDEX `idx_schedule_taker_changes` 
+    ON `schedules` (`taker_id`, `deleted_at`, `status`, `updated_at`, `version`);
+
+
+-- ===== Giver 每日時段狀態統計資料表 `giver_daily_summary` =====
+-- 場景：月曆檢視每天各狀態的時段數量，不必讀取每一筆時段
+-- 只統計未刪除的時段，由時段寫入在同一個交易中維護；可用 scripts/rebuild_giver_daily_summary.py 重建
+DROP TABLE IF EXISTS `giver_daily_summary`;
+CREATE TABLE `giver_daily_summary` (
+    `giver_id` INT UNSIGNED NOT NULL
+        COMMENT 'Giver ID',
+    `date` DATE NOT NULL
+        COMMENT '日期',
+    `draft_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'DRAFT 時段數量',
+    `available_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'AVAILABLE 時段數量',
+    `pending_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'PENDING 時段數量',
+    `accepted_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'ACCEPTED 時段數量',
+    `rejected_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'REJECTED 時段數量',
+    `cancelled_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'CANCELLED 時段數量',
+    `completed_count` INT UNSIGNED NOT NULL DEFAULT 0
+        COMMENT 'COMPLETED 時段數量',
+
+    PRIMARY KEY (`giver_id`, `date`),
+
+    -- ===== 外鍵約束 =====
+    CONSTRAINT `fk_giver_daily_summary_giver_id`
+        FOREIGN KEY (`giver_id`)
+        REFERENCES `users`(`id`)
+        -- 彙總資料隨 Giver 一併刪除
+        ON DELETE CASCADE
+        ON UPDATE CASCADE
+
+-- 指定儲存引擎、預設字符集、排序規則
+) ENGINE = InnoDB 
+    DEFAULT CHARSET = utf8mb4 
+    COLLATE = utf8mb4_unicode_ci 
+    COMMENT = 'Giver 每日時段狀態統計';
+
+-- ===== Giver 週期規則資料表 `schedule_recurrence_rules` =====
+-- 場景：Giver 設定「每週二 19:00–21:00，連續三個月」，不必逐一建立每個時段
+-- 只有未來滾動期間內的發生日期展開成時段（materialized_until），之後的發生日期以規則參與重疊檢查
+DROP TABLE IF EXISTS `schedule_recurrence_rules`;
+CREATE TABLE `schedule_recurrence_rules` (
+    `id` INT UNSIGNED AUTO_INCREMENT PRIMARY KEY
+        COMMENT '週期規則 ID',
+    `giver_id` INT UNSIGNED NOT NULL
+        COMMENT 'Giver ID',
+    `frequency` ENUM('DAILY', 'WEEKLY') NOT NULL
+        COMMENT '頻率：DAILY 每天、WEEKLY 每週',
+    `interval` SMALLINT NOT NULL DEFAULT 1
+        COMMENT '間隔：每幾天（DAILY）或每幾週（WEEKLY）一次',
+    `weekdays` SMALLINT NOT NULL DEFAULT 0
+        COMMENT '星期位元遮罩（WEEKLY 使用）：bit 0 為星期一，bit 6 為星期日',
+    `start_time` TIME NOT NULL
+        COMMENT '每次的開始時間',
+    `end_time` TIME NOT NULL
+        COMMENT '每次的結束時間',
+    `starts_on` DATE NOT NULL
+        COMMENT '規則開始日期（含）',
+    `ends_on` DATE NULL
+        COMMENT '規則結束日期（含），可為 NULL（表示不結束）',
+    `exceptions` JSON NOT NULL
+        COMMENT '例外日期（ISO 格式日期字串陣列），這些日期不發生',
+    `note` VARCHAR(255) NULL
+        COMMENT '備註，展開的時段沿用此備註',
+    `materialized_until` DATE NULL
+        COMMENT '已展開成時段的最後日期（含），可為 NULL（表示尚未展開）',
+
+    -- ===== 審計欄位 =====
+    `created_at` DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL
+        COMMENT '建立時間（本地時間）',
+    `created_by` INT UNSIGNED NULL
+        COMMENT '建立者的 ID，可為 NULL（表示系統自動建立）',
+    `created_by_role` ENUM('GIVER', 'TAKER', 'SYSTEM') NOT NULL DEFAULT 'SYSTEM'
+        COMMENT '建立者角色，展開的時段沿用此角色',
+    `updated_at` DATETIME DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP NOT NULL
+        COMMENT '更新時間（本地時間）',
+    `deleted_at` DATETIME NULL
+        COMMENT '軟刪除標記（本地時間）',
+    `deleted_by` INT UNSIGNED NULL
+        COMMENT '刪除者的 ID，可為 NULL（表示系統自動刪除）',
+    `deleted_by_role` ENUM('GIVER', 'TAKER', 'SYSTEM') NULL
+        COMMENT '刪除者角色，可為 NULL（未刪除時）',
+
+    -- ===== 外鍵約束 =====
+    CONSTRAINT `fk_recurrence_rules_giver_id`
+        FOREIGN KEY (`giver_id`)
+        REFERENCES `users`(`id`)
+        -- 規則隨 Giver 一併刪除，已展開的時段由 schedules 的外鍵保護
+        ON DELETE CASCADE
+        ON UPDATE CASCADE,
+
+    CONSTRAINT `fk_recurrence_rules_created_by`
+        FOREIGN KEY (`created_by`)
+        REFERENCES `users`(`id`)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE,
+
+    CONSTRAINT `fk_recurrence_rules_deleted_by`
+        FOREIGN KEY (`deleted_by`)
+        REFERENCES `users`(`id`)
+        ON DELETE SET NULL
+        ON UPDATE CASCADE
+
+-- 指定儲存引擎、預設字符集、排序規則
+) ENGINE = InnoDB 
+    DEFAULT CHARSET = utf8mb4 
+    COLLATE = utf8mb4_unicode_ci 
+    COMMENT = 'Giver 週期性可預約時段規則';
+
+-- 重疊檢查：依 Giver 載入未刪除的規則
+CREATE INDEX `idx_recurrence_rule_giver`
+    ON `schedule_recurrence_rules` (`giver_id`, `deleted_at`);
+
+-- 定期展開：找出展開進度落後的規則
+CREATE INDEX `idx_recurrence_rule_materialized`
+    ON `schedule_recurrence_rules` (`deleted_at`, `materialized_until`);
+
 -- ===== 顯示資料表結構 =====
 SHOW TABLES;
 
 DESCRIBE `users`;
 DESCRIBE `schedules`;
+DESCRIBE `giver_daily_summary`;
+DESCRIBE `schedule_recurrence_rules`;
 
 -- ===== 顯示索引資訊 =====
 SHOW INDEX FROM `users`;
 SHOW INDEX FROM `schedules`;
+SHOW INDEX FROM `schedule_recurrence_rules`;
 
 -- ===== 快速查詢資料 =====
 SELECT * FROM scheduler_db.schedules ORDER BY id DESC;  
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""同步 Session 與 AsyncSession 資料路徑的併發吞吐量基準測試。
+
+模擬 async def 路由在同一個事件迴圈上處理併發請求：
+- 同步路徑：在協程中直接呼叫 schedule_service（資料庫 I/O 阻塞事件迴圈）
+- 非同步路徑：透過 AsyncSession 呼叫 async_schedule_service（await 資料庫 I/O）
+
+除了吞吐量，也量測事件迴圈延遲（heartbeat 協程每 1ms 醒來一次的最大延誤），
+用來觀察慢查詢是否會拖住同一個 worker 上的其他請求。
+
+使用方法:
+    python scripts/benchmark_async_session.py [--requests 500] [--concurrency 50]
+        [--rows 2000] [--mysql]
+
+選項:
+    --requests       每條路徑送出的請求數
+    --concurrency    同時進行中的請求數上限
+    --rows           預先寫入的時段筆數
+    --mysql          使用 .env 中的 MySQL 設定，而不是臨時 SQLite 檔案
+"""
+
+# ===== 標準函式庫 =====
+import argparse  # 解析命令行參數
+import asyncio
+from datetime import date, time, timedelta
+import logging
+from pathlib import Path
+import sys
+import tempfile
+import time as time_module
+from typing import Awaitable, Callable
+
+# 讓腳本可直接從專案根目錄執行
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# ===== 第三方套件 =====
+from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.database import Base
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models import Schedule
+from app.services import async_schedule_service, schedule_service
+
+GIVER_COUNT = 20  # 時段平均分配給多少個 Giver
+
+
+def seed_schedules(session_factory: sessionmaker, rows: int) -> None:
+    """預先寫入測試用時段。"""
+    with session_factory() as db:
+        db.add_all(
+            Schedule(
+                giver_id=i % GIVER_COUNT + 1,
+                status=ScheduleStatusEnum.AVAILABLE,
+                date=date(2024, 1, 1) + timedelta(days=i // GIVER_COUNT),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                created_by_role=UserRoleEnum.GIVER,
+                updated_by_role=UserRoleEnum.GIVER,
+            )
+            for i in range(rows)
+        )
+        db.commit()
+
+
+async def measure(
+    handler: Callable[[int], Awaitable[None]], requests: int, concurrency: int
+) -> dict[str, float]:
+    """以指定併發數執行 handler，回傳吞吐量與事件迴圈延遲。"""
+    semaphore = asyncio.Semaphore(concurrency)
+    max_loop_lag = 0.0
+    running = True
+
+    async def heartbeat() -> None:
+        nonlocal max_loop_lag
+        while running:
+            started = time_module.perf_counter()
+            await asyncio.sleep(0.001)
+            max_loop_lag = max(
+                max_loop_lag, time_module.perf_counter() - started - 0.001
+            )
+
+    async def limited(i: int) -> None:
+        async with semaphore:
+            await handler(i)
+
+    monitor = asyncio.create_task(heartbeat())
+    started = time_module.perf_counter()
+    await asyncio.gather(*(limited(i) for i in range(requests)))
+    elapsed = time_module.perf_counter() - started
+    running = False
+    await monitor
+
+    return {
+        "elapsed": elapsed,
+        "throughput": requests / elapsed,
+        "max_loop_lag_ms": max_loop_lag * 1000,
+    }
+
+
+async def run_benchmark(args: argparse.Namespace) -> None:
+    """建立兩條資料路徑並輸出比較結果。"""
+    if args.mysql:
+        sync_url = settings.mysql_connection_string
+        async_url = settings.mysql_async_connection_string
+    else:
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_db.close()
+        sync_url = f"sqlite:///{temp_db.name}"
+        async_url = f"sqlite+aiosqlite:///{temp_db.name}"
+
+    pool_options = {} if sync_url.startswith("sqlite") else {"pool_size": 10}
+    sync_engine = create_engine(sync_url, **pool_options)
+    async_engine = create_async_engine(async_url, **pool_options)
+    SessionLocal = sessionmaker(bind=sync_engine, autoflush=False)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    Base.metadata.create_all(bind=sync_engine)
+    seed_schedules(SessionLocal, args.rows)
+
+    async def sync_handler(i: int) -> None:
+        # 與改版前的路由相同：在 async def 中直接呼叫同步服務
+        with SessionLocal() as db:
+            schedule_service.list_schedules(db, giver_id=i % GIVER_COUNT + 1)
+
+    async def async_handler(i: int) -> None:
+        async with AsyncSessionLocal() as db:
+            await async_schedule_service.list_schedules(
+                db, giver_id=i % GIVER_COUNT + 1
+            )
+
+    print(
+        f"📊 requests={args.requests}, concurrency={args.concurrency}, "
+        f"rows={args.rows}, database={sync_engine.url.get_backend_name()}"
+    )
+    for name, handler in (
+        ("sync Session", sync_handler),
+        ("AsyncSession", async_handler),
+    ):
+        result = await measure(handler, args.requests, args.concurrency)
+        print(
+            f"  {name:<13} {result['throughput']:>9.1f} req/s  "
+            f"elapsed={result['elapsed']:.3f}s  "
+            f"max loop lag={result['max_loop_lag_ms']:.1f}ms"
+        )
+
+    if not args.mysql:
+        Base.metadata.drop_all(bind=sync_engine)
+    sync_engine.dispose()
+    await async_engine.dispose()
+
+
+def main() -> None:
+    """主函式。"""
+    parser = argparse.ArgumentParser(description="比較同步與非同步資料路徑的併發吞吐量")
+    parser.add_argument("--requests", type=int, default=500, help="每條路徑的請求數")
+    parser.add_argument("--concurrency", type=int, default=50, help="併發請求數上限")
+    parser.add_argument("--rows", type=int, default=2000, help="預先寫入的時段筆數")
+    parser.add_argument(
+        "--mysql", action="store_true", help="使用 .env 中的 MySQL 設定"
+    )
+    args = parser.parse_args()
+
+    # 服務層每次呼叫都會記錄 INFO 日誌，基準測試時關閉避免干擾結果
+    logging.disable(logging.INFO)
+
+    asyncio.run(run_benchmark(args))
+
+
+if __name__ == "__main__":
+    main()
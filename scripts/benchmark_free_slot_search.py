@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""跨 Giver 空檔搜尋的基準測試：NumPy 點陣圖 vs 逐 Giver 日的 Python 迴圈。
+
+以合成資料量測 GET /api/v1/slots/search 的搜尋演算法（不含資料庫查詢）：
+- 向量化：app.services.slot_search.search_free_windows
+- 逐一迴圈：逐個 Giver 日建立時格清單並逐時格掃描，與改用點陣圖前的寫法相同
+
+每個 Giver 每天有一段可預約時段，其中隨機穿插 0–2 個已預約的時段。
+逐一迴圈只在前 --baseline-givers 個 Giver 上執行，並依 Giver 數量線性推估全部的時間，
+同時比對兩者在這些 Giver 上的結果是否相同。
+
+使用方法:
+    python scripts/benchmark_free_slot_search.py [--givers 10000] [--days 90]
+        [--duration 60] [--repeat 3] [--baseline-givers 1000]
+
+選項:
+    --givers           Giver 數量
+    --days             日期範圍天數
+    --duration         搜尋的視窗長度（分鐘）
+    --repeat           向量化搜尋重複執行的次數，取延遲中位數
+    --baseline-givers  執行逐一迴圈的 Giver 數量
+"""
+
+# ===== 標準函式庫 =====
+import argparse  # 解析命令行參數
+from collections import defaultdict
+from datetime import date, time, timedelta
+import logging
+from pathlib import Path
+import random
+import statistics
+import sys
+import time as time_module
+
+# 讓腳本可直接從專案根目錄執行
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+from app.enums.models import ScheduleStatusEnum
+from app.services.slot_search import (
+    FreeWindow,
+    GiverFreeWindows,
+    search_free_windows,
+    SLOT_MINUTES,
+)
+
+DATE_FROM = date(2025, 1, 1)
+SEARCH_START = time(9, 0)  # 每日時間範圍
+SEARCH_END = time(22, 0)
+
+# 重複使用時間物件，避免合成資料佔用過多記憶體
+TIMES = [time(minute // 60, minute % 60) for minute in range(0, 24 * 60, 15)]
+
+
+def generate_intervals(
+    givers: int, days: int, seed: int = 104
+) -> list[ScheduleInterval]:
+    """產生合成時段：每個 Giver 每天一段可預約時段，中間穿插 0–2 個已預約時段。"""
+    rng = random.Random(seed)
+    dates = [DATE_FROM + timedelta(days=offset) for offset in range(days)]
+    intervals = []
+    for giver_id in range(1, givers + 1):
+        for day in dates:
+            # 可預約時段：08:00–20:00 之間開始，長 1–6 小時（以 15 分鐘為單位）
+            start = rng.randrange(32, 80)
+            end = min(start + rng.randrange(4, 25), 95)
+            intervals.append(
+                ScheduleInterval(
+                    None,
+                    giver_id,
+                    day,
+                    TIMES[start],
+                    TIMES[end],
+                    ScheduleStatusEnum.AVAILABLE,
+                )
+            )
+            for _ in range(rng.randrange(3)):
+                booked = rng.randrange(start, end)
+                intervals.append(
+                    ScheduleInterval(
+                        None,
+                        giver_id,
+                        day,
+                        TIMES[booked],
+                        TIMES[min(booked + rng.randrange(2, 5), 95)],
+                        ScheduleStatusEnum.ACCEPTED,
+                    )
+                )
+    return intervals
+
+
+def _minutes(value: time) -> int:
+    """將時間轉換成當天的分鐘數。"""
+    return value.hour * 60 + value.minute
+
+
+def loop_search(
+    intervals: list[ScheduleInterval], days: int, duration: int
+) -> list[GiverFreeWindows]:
+    """逐一迴圈：每個 Giver 日建立時格清單後逐時格檢查是否可預約（available 模式）。"""
+    groups: dict[int, dict[date, list[ScheduleInterval]]] = defaultdict(
+        lambda: defaultdict(list)
+    )
+    for interval in intervals:
+        groups[interval.giver_id][interval.date].append(interval)
+
+    first = -(-_minutes(SEARCH_START) // SLOT_MINUTES)
+    last = _minutes(SEARCH_END) // SLOT_MINUTES
+    k = -(-duration // SLOT_MINUTES)
+    results = []
+    for giver_id in sorted(groups):
+        windows = []
+        for day in sorted(groups[giver_id]):
+            usable = [False] * (last - first)
+            for interval in groups[giver_id][day]:
+                if interval.status != ScheduleStatusEnum.AVAILABLE:
+                    continue
+                start = -(-_minutes(interval.start_time) // SLOT_MINUTES)
+                end = _minutes(interval.end_time) // SLOT_MINUTES
+                for slot in range(max(start, first), min(end, last)):
+                    usable[slot - first] = True
+            for interval in groups[giver_id][day]:
+                if interval.status == ScheduleStatusEnum.AVAILABLE:
+                    continue
+                start = _minutes(interval.start_time) // SLOT_MINUTES
+                end = -(-_minutes(interval.end_time) // SLOT_MINUTES)
+                for slot in range(max(start, first), min(end, last)):
+                    usable[slot - first] = False
+
+            run = 0
+            for index, free in enumerate(usable):
+                run = run + 1 if free else 0
+                if run == k:
+                    slot = first + index - k + 1
+                    start_minutes = slot * SLOT_MINUTES
+                    end_minutes = start_minutes + duration
+                    windows.append(
+                        FreeWindow(
+                            day,
+                            time(start_minutes // 60, start_minutes % 60),
+                            time(end_minutes // 60, end_minutes % 60),
+                        )
+                    )
+                    break
+        if windows:
+            results.append(GiverFreeWindows(giver_id, windows))
+    return results
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """產生合成資料，輸出兩種搜尋方式的比較結果。"""
+    started = time_module.perf_counter()
+    intervals = generate_intervals(args.givers, args.days)
+    date_to = DATE_FROM + timedelta(days=args.days - 1)
+    print(
+        f"📊 givers={args.givers}, days={args.days}, intervals={len(intervals)}, "
+        f"duration={args.duration}min, 產生資料 "
+        f"{time_module.perf_counter() - started:.1f}s"
+    )
+
+    def vectorized(rows: list[ScheduleInterval]) -> list[GiverFreeWindows]:
+        return search_free_windows(
+            rows, DATE_FROM, date_to, SEARCH_START, SEARCH_END, args.duration
+        )
+
+    elapsed = []
+    for _ in range(args.repeat):
+        started = time_module.perf_counter()
+        results = vectorized(intervals)
+        elapsed.append(time_module.perf_counter() - started)
+    vectorized_seconds = statistics.median(elapsed)
+    print(
+        f"  向量化   median={vectorized_seconds * 1000:>9.1f}ms  "
+        f"符合的 Giver={len(results)}"
+    )
+
+    baseline_givers = min(args.baseline_givers, args.givers)
+    subset = [i for i in intervals if i.giver_id <= baseline_givers]
+    started = time_module.perf_counter()
+    expected = loop_search(subset, args.days, args.duration)
+    loop_seconds = time_module.perf_counter() - started
+    estimated = loop_seconds * args.givers / baseline_givers
+    print(
+        f"  逐一迴圈 {baseline_givers} 個 Giver {loop_seconds * 1000:.1f}ms，"
+        f"推估 {args.givers} 個 Giver {estimated * 1000:.1f}ms"
+    )
+    print(f"  向量化加速約 {estimated / vectorized_seconds:.1f}x")
+
+    same = vectorized(subset) == expected
+    print(f"  前 {baseline_givers} 個 Giver 的結果{'相同' if same else '不同'}")
+
+
+def main() -> None:
+    """主函式。"""
+    parser = argparse.ArgumentParser(
+        description="比較跨 Giver 空檔搜尋的向量化與逐一迴圈實作"
+    )
+    parser.add_argument("--givers", type=int, default=10000, help="Giver 數量")
+    parser.add_argument("--days", type=int, default=90, help="日期範圍天數")
+    parser.add_argument("--duration", type=int, default=60, help="視窗長度（分鐘）")
+    parser.add_argument("--repeat", type=int, default=3, help="向量化搜尋重複執行次數")
+    parser.add_argument(
+        "--baseline-givers", type=int, default=1000, help="執行逐一迴圈的 Giver 數量"
+    )
+    args = parser.parse_args()
+
+    # 關閉 INFO 訊息，避免干擾結果
+    logging.disable(logging.INFO)
+
+    run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
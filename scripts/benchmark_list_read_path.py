@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""時段列表 ORM 讀取路徑與 Core 讀取路徑的基準測試。
+
+比較 GET /api/v1/schedules 的兩種讀取方式，從查詢到輸出 JSON 字串為止：
+- ORM 路徑：db.query(Schedule) 建立 ORM 物件，逐筆以 ScheduleResponse 驗證後序列化
+- Core 路徑：select() 直接取得資料列，轉換成回應字典後序列化
+
+每種資料量分別量測延遲中位數與 tracemalloc 記錄的尖峰記憶體。
+
+使用方法:
+    python scripts/benchmark_list_read_path.py [--rows 1000,10000,100000]
+        [--repeat 5] [--mysql]
+
+選項:
+    --rows      以逗號分隔的時段筆數，每種筆數各量測一次
+    --repeat    每條路徑重複執行的次數，取延遲中位數
+    --mysql     使用 .env 中的 MySQL 設定，而不是臨時 SQLite 檔案
+"""
+
+# ===== 標準函式庫 =====
+import argparse  # 解析命令行參數
+from datetime import date, time, timedelta
+import json
+import logging
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time as time_module
+import tracemalloc
+from typing import Callable
+
+# 讓腳本可直接從專案根目錄執行
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# ===== 第三方套件 =====
+from sqlalchemy import create_engine, delete, insert
+from sqlalchemy.orm import Session, sessionmaker
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.crud import schedule_crud
+from app.database import Base
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models import Schedule
+from app.schemas import ScheduleResponse
+from app.utils.fieldsets import schedule_rows_to_dicts
+
+GIVER_COUNT = 20  # 時段平均分配給多少個 Giver
+SLOTS_PER_DAY = 8  # 每個 Giver 每天的時段數
+INSERT_CHUNK = 5000  # 每次 INSERT 的筆數
+
+
+def seed_schedules(session_factory: sessionmaker, rows: int) -> None:
+    """清空並以 Core INSERT 預先寫入測試用時段。"""
+    with session_factory() as db:
+        db.execute(delete(Schedule))
+        for offset in range(0, rows, INSERT_CHUNK):
+            db.execute(
+                insert(Schedule),
+                [
+                    {
+                        "giver_id": i % GIVER_COUNT + 1,
+                        "status": ScheduleStatusEnum.AVAILABLE,
+                        "date": date(2024, 1, 1)
+                        + timedelta(days=i // (GIVER_COUNT * SLOTS_PER_DAY)),
+                        "start_time": time(9 + i // GIVER_COUNT % SLOTS_PER_DAY),
+                        "end_time": time(10 + i // GIVER_COUNT % SLOTS_PER_DAY),
+                        "note": "基準測試時段",
+                        "created_by": i % GIVER_COUNT + 1,
+                        "created_by_role": UserRoleEnum.GIVER,
+                        "updated_by": i % GIVER_COUNT + 1,
+                        "updated_by_role": UserRoleEnum.GIVER,
+                    }
+                    for i in range(offset, min(offset + INSERT_CHUNK, rows))
+                ],
+            )
+        db.commit()
+
+
+def orm_read_path(db: Session) -> str:
+    """ORM 讀取路徑：與改版前的列表路由相同。"""
+    schedules = schedule_crud.list_schedules(db)
+    return json.dumps(
+        [
+            ScheduleResponse.model_validate(s).model_dump(mode="json", by_alias=True)
+            for s in schedules
+        ]
+    )
+
+
+def core_read_path(db: Session) -> str:
+    """Core 讀取路徑：select() 資料列直接轉換成回應字典。"""
+    rows = schedule_crud.list_schedule_rows(db)
+    return json.dumps(schedule_rows_to_dicts(rows))
+
+
+def measure(
+    session_factory: sessionmaker, read_path: Callable[[Session], str], repeat: int
+) -> dict[str, float]:
+    """執行讀取路徑，回傳延遲中位數與尖峰記憶體。"""
+    elapsed = []
+    for _ in range(repeat):
+        with session_factory() as db:
+            started = time_module.perf_counter()
+            read_path(db)
+            elapsed.append(time_module.perf_counter() - started)
+
+    # tracemalloc 本身會拖慢執行，另外執行一次量測記憶體
+    with session_factory() as db:
+        tracemalloc.start()
+        read_path(db)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+    return {
+        "median_ms": statistics.median(elapsed) * 1000,
+        "peak_mib": peak / 1024 / 1024,
+    }
+
+
+def run_benchmark(args: argparse.Namespace) -> None:
+    """依序寫入各種資料量，輸出兩條讀取路徑的比較結果。"""
+    if args.mysql:
+        url = settings.mysql_connection_string
+    else:
+        temp_db = tempfile.NamedTemporaryFile(delete=False, suffix=".db")
+        temp_db.close()
+        url = f"sqlite:///{temp_db.name}"
+
+    engine = create_engine(url)
+    SessionLocal = sessionmaker(bind=engine, autoflush=False)
+    Base.metadata.create_all(bind=engine)
+
+    print(f"📊 repeat={args.repeat}, database={engine.url.get_backend_name()}")
+    for rows in args.rows:
+        seed_schedules(SessionLocal, rows)
+        results = {
+            name: measure(SessionLocal, read_path, args.repeat)
+            for name, read_path in (("ORM", orm_read_path), ("Core", core_read_path))
+        }
+        orm, core = results["ORM"], results["Core"]
+        print(f"  rows={rows}")
+        for name, result in results.items():
+            print(
+                f"    {name:<5} median={result['median_ms']:>9.1f}ms  "
+                f"peak={result['peak_mib']:>8.1f}MiB"
+            )
+        print(
+            f"    Core 加速 {orm['median_ms'] / core['median_ms']:.1f}x，"
+            f"尖峰記憶體 {core['peak_mib'] / orm['peak_mib']:.0%}"
+        )
+
+    if args.mysql:
+        seed_schedules(SessionLocal, 0)
+    else:
+        Base.metadata.drop_all(bind=engine)
+    engine.dispose()
+
+
+def main() -> None:
+    """主函式。"""
+    parser = argparse.ArgumentParser(description="比較時段列表的 ORM 與 Core 讀取路徑")
+    parser.add_argument(
+        "--rows",
+        type=lambda value: [int(n) for n in value.split(",")],
+        default=[1000, 10000, 100000],
+        help="以逗號分隔的時段筆數",
+    )
+    parser.add_argument("--repeat", type=int, default=5, help="每條路徑重複執行次數")
+    parser.add_argument(
+        "--mysql", action="store_true", help="使用 .env 中的 MySQL 設定"
+    )
+    args = parser.parse_args()
+
+    # 關閉查詢日誌等 INFO 訊息，避免干擾結果
+    logging.disable(logging.INFO)
+
+    run_benchmark(args)
+
+
+if __name__ == "__main__":
+    main()
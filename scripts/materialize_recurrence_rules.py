@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""展開週期規則的腳本。
+
+週期規則只把滾動期間（SCHEDULE_RECURRENCE_HORIZON_DAYS 天）內的發生日期建立成時段；
+以定期排程（例如每天一次的 cron）執行此腳本，讓每條規則的滾動期間跟著日期往前延伸。
+已展開的日期不會重複建立，與現有時段重疊的發生日期會略過。
+
+使用方法:
+    python scripts/materialize_recurrence_rules.py [--until 2024-03-31] [--rule-ids 1 2]
+
+選項:
+    --until       展開到這一天（含），不指定則為今天起的滾動期間
+    --rule-ids    只展開指定的規則，不指定則展開所有規則
+"""
+
+# ===== 標準函式庫 =====
+import argparse  # 解析命令行參數
+from datetime import date
+from pathlib import Path
+import sys
+import time as time_module
+
+# 讓腳本可直接從專案根目錄執行
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# ===== 本地模組 =====
+from app.database import create_database_engine
+from app.services.recurrence_rule import recurrence_rule_service
+
+
+def main() -> None:
+    """主函式。"""
+    parser = argparse.ArgumentParser(description="將週期規則展開成可預約時段")
+    parser.add_argument(
+        "--until",
+        type=date.fromisoformat,
+        default=None,
+        help="展開到這一天（含），格式 YYYY-MM-DD",
+    )
+    parser.add_argument(
+        "--rule-ids", type=int, nargs="+", default=None, help="只展開指定的規則"
+    )
+    args = parser.parse_args()
+
+    # 依 .env 的環境設定連線（與應用程式相同）
+    engine, session_factory = create_database_engine()
+    started = time_module.perf_counter()
+    try:
+        with session_factory() as db:
+            until = args.until or recurrence_rule_service.horizon()
+            count = recurrence_rule_service.materialize_rules(db, until, args.rule_ids)
+    finally:
+        engine.dispose()
+
+    elapsed = time_module.perf_counter() - started
+    print(f"✅ 已展開週期規則至 {until}：建立 {count} 個時段，耗時 {elapsed:.2f} 秒")
+
+
+if __name__ == "__main__":
+    main()
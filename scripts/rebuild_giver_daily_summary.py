@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""重建 Giver 每日時段狀態統計的腳本。
+
+giver_daily_summary 平時由時段寫入在同一個交易中維護；
+初次部署、直接修改資料庫或懷疑統計不一致時，以此腳本依 schedules 批次重新計算：
+以單一 INSERT ... SELECT ... GROUP BY 完成，不在 Python 端逐筆讀取時段。
+
+使用方法:
+    python scripts/rebuild_giver_daily_summary.py [--giver-id 1]
+
+選項:
+    --giver-id    只重建指定 Giver 的統計，不指定則重建整張表
+"""
+
+# ===== 標準函式庫 =====
+import argparse  # 解析命令行參數
+from pathlib import Path
+import sys
+import time as time_module
+
+# 讓腳本可直接從專案根目錄執行
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+# ===== 本地模組 =====
+from app.crud.daily_summary import giver_daily_summary_crud
+from app.database import create_database_engine
+
+
+def main() -> None:
+    """主函式。"""
+    parser = argparse.ArgumentParser(description="依時段重建 Giver 每日時段狀態統計")
+    parser.add_argument(
+        "--giver-id", type=int, default=None, help="只重建指定 Giver 的統計"
+    )
+    args = parser.parse_args()
+
+    # 依 .env 的環境設定連線（與應用程式相同）
+    engine, session_factory = create_database_engine()
+    started = time_module.perf_counter()
+    try:
+        with session_factory() as db:
+            count = giver_daily_summary_crud.rebuild(db, args.giver_id)
+    finally:
+        engine.dispose()
+
+    elapsed = time_module.perf_counter() - started
+    target = f"Giver {args.giver_id}" if args.giver_id is not None else "所有 Giver"
+    print(f"✅ 已重建{target}的每日時段統計：{count} 筆，耗時 {elapsed:.2f} 秒")
+
+
+if __name__ == "__main__":
+    main()
@@ -1704,15 +1704,24 @@ const ChatStateManager = {
     console.log('ChatStateManager.loadUserSchedulesFromDatabase called', { giverId, userId });
     
     try {
-      // 呼叫 API 獲取使用者提供給該 Giver 的時段
-      const response = await fetch(`/api/v1/schedules?giver_id=${giverId}&taker_id=${userId}`);
-      
-      if (!response.ok) {
-        console.error('ChatStateManager.loadUserSchedulesFromDatabase: API 請求失敗', response.status);
-        return [];
-      }
-      
-      const schedules = await response.json();
+      // 呼叫 API 獲取使用者提供給該 Giver 的時段：依 X-Next-Cursor 標頭逐頁載入
+      const schedules = [];
+      let cursor = null;
+      do {
+        const params = new URLSearchParams({ giver_id: giverId, taker_id: userId, limit: 200 });
+        if (cursor) {
+          params.set('cursor', cursor);
+        }
+        const response = await fetch(`/api/v1/schedules?${params}`);
+        
+        if (!response.ok) {
+          console.error('ChatStateManager.loadUserSchedulesFromDatabase: API 請求失敗', response.status);
+          return [];
+        }
+        
+        schedules.push(...await response.json());
+        cursor = response.headers.get('X-Next-Cursor');
+      } while (cursor);
       console.log('ChatStateManager.loadUserSchedulesFromDatabase: 從資料庫載入的時段', schedules);
       
       // 將資料庫中的時段轉換為前端格式
@@ -10,6 +10,7 @@ import pytest
 # 匯入整合測試的 fixtures
 from tests.fixtures.integration.database import (  # noqa: F401
     integration_db_override,
+    integration_db_path,
     integration_db_session,
     integration_test_client,
 )
@@ -23,6 +24,7 @@ from tests.fixtures.integration.schedule import (  # noqa: F401
 # ===== 本地模組 =====
 # 匯入單元測試的 fixtures
 from tests.fixtures.unit.database import (  # noqa: F401
+    async_db_session,
     db_session,
 )
 from tests.fixtures.unit.schedules import (  # noqa: F401
@@ -12,31 +12,48 @@ from fastapi import FastAPI
 from fastapi.testclient import TestClient
 import pytest
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import NullPool
 
 # ===== 本地模組 =====
 from app.core import settings
-from app.database import Base, get_db
+from app.database import (
+    Base,
+    get_async_db,
+    get_async_read_db,
+    get_async_read_session_factory,
+    get_async_session_factory,
+    get_db,
+)
 from app.factory import create_templates
 from app.middleware.error_handler import setup_error_handlers
 from app.models import (  # 導入所有模型，因為 SQLAlchemy 需要知道所有表結構才能創建表
+    GiverDailySummary,
+    RecurrenceRule,
     Schedule,
     User,
 )
 from app.routers import api_router, health_router, main_router
+from app.services.calendar import schedule_calendar_cache
 
 
 @pytest.fixture(scope="function")
-def integration_db_session():
-    """建立整合測試專用的資料庫會話實例。"""
-    # TODO: 生產環境部署前應切換回 MySQL
-    # database_url = settings.mysql_connection_string  # MySQL 連接字串
-
+def integration_db_path():
+    """建立整合測試專用的 SQLite 臨時檔案路徑，供同步與非同步引擎共用。"""
     # 使用 SQLite 臨時檔案資料庫，所有連線共享同一個檔案，解決會話隔離問題
     # 記憶體資料庫 (sqlite:///:memory:) 每個連線都是新的實例，會導致會話隔離問題
     temp_db = tempfile.NamedTemporaryFile(delete=False, suffix='.db')
     temp_db.close()
-    database_url = f"sqlite:///{temp_db.name}"
+    return temp_db.name
+
+
+@pytest.fixture(scope="function")
+def integration_db_session(integration_db_path):
+    """建立整合測試專用的資料庫會話實例。"""
+    # TODO: 生產環境部署前應切換回 MySQL
+    # database_url = settings.mysql_connection_string  # MySQL 連接字串
+    database_url = f"sqlite:///{integration_db_path}"
 
     # 建立 SQLite 引擎
     engine = create_engine(
@@ -101,7 +118,7 @@ def integration_db_override(integration_db_session):  # 先取得會話實例
 
 
 @pytest.fixture(scope="function")
-def integration_test_client(integration_db_session):
+def integration_test_client(integration_db_session, integration_db_path):
     """建立整合測試專用的 FastAPI 測試客戶端，用於發送 HTTP 請求。"""
     # 創建應用程式實例
     test_app = FastAPI()
@@ -125,8 +142,43 @@ def integration_test_client(integration_db_session):
         """覆蓋 get_db 依賴，使用測試專用的資料庫會話實例。"""
         yield integration_db_session
 
+    # 非同步路由使用同一個臨時檔案資料庫，讓測試可用同步會話準備與驗證資料
+    # NullPool：每次請求都建立新連線，避免連線綁定到不同的事件迴圈
+    async_engine = create_async_engine(
+        f"sqlite+aiosqlite:///{integration_db_path}", poolclass=NullPool
+    )
+    TestingAsyncSessionLocal = async_sessionmaker(
+        bind=async_engine, autoflush=False, expire_on_commit=False
+    )
+
+    async def override_get_async_db():
+        """覆蓋 get_async_db 依賴，使用測試專用的非同步資料庫會話實例。"""
+        # 請求使用獨立的連線讀取，先提交測試在同步會話中準備、尚未提交的資料
+        integration_db_session.commit()
+        async with TestingAsyncSessionLocal() as db:
+            yield db
+        # 請求使用獨立的連線寫入，讓測試的同步會話在下次存取時重新讀取資料庫
+        integration_db_session.expire_all()
+
+    def override_get_async_session_factory():
+        """覆蓋 get_async_session_factory 依賴，串流路由使用測試專用的會話工廠。"""
+        integration_db_session.commit()
+        return TestingAsyncSessionLocal
+
     # 使用 FastAPI 的依賴注入覆蓋機制
     test_app.dependency_overrides[get_db] = override_get_db
+    test_app.dependency_overrides[get_async_db] = override_get_async_db
+    test_app.dependency_overrides[get_async_session_factory] = (
+        override_get_async_session_factory
+    )
+    # 整合測試沒有唯讀副本，讀取路由與寫入路由使用同一個資料庫
+    test_app.dependency_overrides[get_async_read_db] = override_get_async_db
+    test_app.dependency_overrides[get_async_read_session_factory] = (
+        override_get_async_session_factory
+    )
+
+    # 每個測試使用新的資料庫，清空行程內的行事曆訂閱快取
+    schedule_calendar_cache.clear()
 
     # 創建測試客戶端並提供給測試使用
     with TestClient(test_app) as client:
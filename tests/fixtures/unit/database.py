@@ -6,12 +6,20 @@
 
 # ===== 第三方套件 =====
 import pytest
+import pytest_asyncio
 from sqlalchemy import create_engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession, create_async_engine
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
 
 # ===== 本地模組 =====
 from app.database import Base
-from app.models import schedule, user  # noqa: F401
+from app.models import (  # noqa: F401
+    giver_daily_summary,
+    recurrence_rule,
+    schedule,
+    user,
+)
 
 
 @pytest.fixture
@@ -47,3 +55,28 @@ def db_session() -> Session:
     finally:
         # 清理測試資料（記憶體資料庫會自動清理）
         session.close()
+
+
+@pytest_asyncio.fixture
+async def async_db_session() -> AsyncSession:
+    """提供單元測試用的非同步資料庫會話。
+
+    使用 aiosqlite 記憶體資料庫，StaticPool 讓所有連線共用同一個記憶體資料庫。
+
+    Returns:
+        AsyncSession: 測試用的非同步資料庫會話
+    """
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:", poolclass=StaticPool)
+
+    # 建立資料表（每次都是全新的）
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    TestingAsyncSessionLocal = async_sessionmaker(
+        bind=engine, autoflush=False, expire_on_commit=False
+    )
+
+    async with TestingAsyncSessionLocal() as session:
+        yield session
+
+    await engine.dispose()
@@ -0,0 +1,113 @@
+"""行事曆訂閱路由整合測試。
+
+測試 Giver、Taker 的 iCalendar 訂閱端點，包括條件式請求與寫入後失效。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+from fastapi import status
+import pytest
+
+# ===== 本地模組 =====
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models.schedule import Schedule as ScheduleModel
+
+
+class TestCalendarRoutes:
+    """行事曆訂閱路由整合測試類別。"""
+
+    @pytest.fixture
+    def client(self, integration_test_client):
+        """建立測試客戶端。"""
+        return integration_test_client
+
+    @pytest.fixture
+    def accepted_schedule(self, integration_db_session):
+        """Giver 1 與 Taker 2 已接受的時段，以及 Giver 1 尚未被預約的時段。"""
+        schedules = [
+            ScheduleModel(
+                giver_id=1,
+                taker_id=2,
+                status=status_value,
+                date=date(2024, 12, 25),
+                start_time=start_time,
+                end_time=time(start_time.hour + 1),
+                created_by=2,
+                created_by_role=UserRoleEnum.TAKER,
+            )
+            for status_value, start_time in (
+                (ScheduleStatusEnum.ACCEPTED, time(9, 0)),
+                (ScheduleStatusEnum.AVAILABLE, time(14, 0)),
+            )
+        ]
+        integration_db_session.add_all(schedules)
+        integration_db_session.commit()
+        return schedules[0]
+
+    @pytest.mark.parametrize("path", ["givers/1", "takers/2"])
+    def test_calendar_accepted_only(self, client, accepted_schedule, path):
+        """測試訂閱行事曆 - 只包含已接受的時段（200）。"""
+        # WHEN：取得 Giver 或 Taker 的行事曆
+        response = client.get(f"/api/v1/{path}/calendar.ics")
+
+        # THEN：iCalendar 內容只有一個事件，並帶有驗證器
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "text/calendar; charset=utf-8"
+        assert response.headers["ETag"].startswith('"')
+        assert response.headers["Last-Modified"].endswith("GMT")
+        assert response.headers["Cache-Control"] == "no-cache"
+        assert response.text.count("BEGIN:VEVENT") == 1
+        assert f"UID:schedule-{accepted_schedule.id}@" in response.text
+        assert "DTSTART:20241225T010000Z" in response.text
+
+    def test_calendar_not_modified(self, client, accepted_schedule):
+        """測試訂閱行事曆 - If-None-Match 或 If-Modified-Since 相符時回傳 304。"""
+        # GIVEN：第一次取得的驗證器
+        first = client.get("/api/v1/givers/1/calendar.ics")
+        etag, last_modified = first.headers["ETag"], first.headers["Last-Modified"]
+
+        # WHEN：帶驗證器重新取得
+        by_etag = client.get(
+            "/api/v1/givers/1/calendar.ics", headers={"If-None-Match": etag}
+        )
+        by_date = client.get(
+            "/api/v1/givers/1/calendar.ics",
+            headers={"If-Modified-Since": last_modified},
+        )
+        stale = client.get(
+            "/api/v1/givers/1/calendar.ics",
+            headers={"If-None-Match": '"stale"', "If-Modified-Since": last_modified},
+        )
+
+        # THEN：未變更時不含內容；If-None-Match 不符時忽略 If-Modified-Since
+        assert by_etag.status_code == status.HTTP_304_NOT_MODIFIED
+        assert by_etag.content == b""
+        assert by_etag.headers["ETag"] == etag
+        assert by_date.status_code == status.HTTP_304_NOT_MODIFIED
+        assert stale.status_code == status.HTTP_200_OK
+
+    def test_calendar_invalidated_after_update(self, client, accepted_schedule):
+        """測試訂閱行事曆 - 時段更新後重新產生內容。"""
+        # GIVEN：已快取的行事曆
+        etag = client.get("/api/v1/takers/2/calendar.ics").headers["ETag"]
+
+        # WHEN：取消已接受的時段後，帶舊的 ETag 重新取得
+        response = client.patch(
+            f"/api/v1/schedules/{accepted_schedule.id}",
+            json={
+                "schedule": {"status": "CANCELLED"},
+                "updated_by": 2,
+                "updated_by_role": "TAKER",
+            },
+        )
+        assert response.status_code == status.HTTP_200_OK
+        refreshed = client.get(
+            "/api/v1/takers/2/calendar.ics", headers={"If-None-Match": etag}
+        )
+
+        # THEN：內容已變更，時段從行事曆中移除
+        assert refreshed.status_code == status.HTTP_200_OK
+        assert refreshed.headers["ETag"] != etag
+        assert "BEGIN:VEVENT" not in refreshed.text
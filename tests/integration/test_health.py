@@ -1,6 +1,6 @@
 """健康檢查路由整合測試。
 
-測試健康檢查端點的完整流程，包括存活探測和就緒探測。
+測試健康檢查端點的完整流程，包括存活探測、就緒探測和監控指標。
 """
 
 # ===== 標準函式庫 =====
@@ -10,6 +10,9 @@ from unittest.mock import patch
 from fastapi import status
 import pytest
 
+# ===== 本地模組 =====
+from app.metrics import SCHEDULE_OVERLAP_REJECTIONS
+
 
 class TestHealthRoutes:
     """健康檢查路由整合測試類別。"""
@@ -150,3 +153,42 @@ class TestHealthRoutes:
 
         # 確認 mock 被呼叫
         mock_db_check.assert_called_once()
+
+    # ===== 監控指標 =====
+    def test_metrics(self, client):
+        """測試監控指標 - 以 Prometheus 文字格式輸出，包含時段重疊的拒絕次數（200）。"""
+        # GIVEN：建立同一個時段兩次，第二次因重疊被拒絕
+        payload = {
+            "schedules": [
+                {
+                    "giver_id": 1,
+                    "date": "2030-01-15",
+                    "start_time": "09:00:00",
+                    "end_time": "10:00:00",
+                }
+            ],
+            "created_by": 1,
+            "created_by_role": "GIVER",
+        }
+        before = SCHEDULE_OVERLAP_REJECTIONS.value(operation="create")
+        assert client.post("/api/v1/schedules", json=payload).status_code == 201
+        assert client.post("/api/v1/schedules", json=payload).status_code == 409
+
+        # WHEN：呼叫監控指標端點
+        response = client.get("/metrics")
+
+        # THEN：回傳 Prometheus 文字格式，包含請求、資料庫與業務指標
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        body = response.text
+        for name in (
+            "http_request_duration_seconds",
+            "db_queries_per_request",
+            "db_pool_checkout_wait_seconds",
+            "schedule_overlap_rejections_total",
+        ):
+            assert f"# TYPE {name} " in body
+        assert (
+            f'schedule_overlap_rejections_total{{operation="create"}} '
+            f"{int(before) + 1}" in body
+        )
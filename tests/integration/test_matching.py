@@ -0,0 +1,94 @@
+"""共同可面談時間比對路由整合測試。
+
+測試 Taker 提案與 Giver 可預約時段的比對端點，包括單一 Taker 與收件匣批次比對。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+from fastapi import status
+import pytest
+
+# ===== 本地模組 =====
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models.schedule import Schedule as ScheduleModel
+
+
+class TestMatchingRoutes:
+    """共同可面談時間比對路由整合測試類別。"""
+
+    @pytest.fixture
+    def client(self, integration_test_client):
+        """建立測試客戶端。"""
+        return integration_test_client
+
+    @pytest.fixture
+    def schedules(self, integration_db_session):
+        """Giver 1 於 12/25 10:00–12:00、14:00–15:00 可預約；
+        Taker 2 向 Giver 1 提出 12/25 16:00–17:00，向 Giver 5 提出 12/25 10:30–11:30；
+        Taker 3 向 Giver 1 提出 12/26 10:00–11:00。"""
+        day = date(2024, 12, 25)
+        rows = [
+            (1, None, ScheduleStatusEnum.AVAILABLE, day, time(10), time(12)),
+            (1, None, ScheduleStatusEnum.AVAILABLE, day, time(14), time(15)),
+            (1, 2, ScheduleStatusEnum.PENDING, day, time(16), time(17)),
+            (5, 2, ScheduleStatusEnum.PENDING, day, time(10, 30), time(11, 30)),
+            (1, 3, ScheduleStatusEnum.PENDING, date(2024, 12, 26), time(10), time(11)),
+        ]
+        models = [
+            ScheduleModel(
+                giver_id=giver_id,
+                taker_id=taker_id,
+                status=status_value,
+                date=schedule_date,
+                start_time=start,
+                end_time=end,
+                created_by=taker_id or giver_id,
+                created_by_role=UserRoleEnum.TAKER if taker_id else UserRoleEnum.GIVER,
+            )
+            for giver_id, taker_id, status_value, schedule_date, start, end in rows
+        ]
+        integration_db_session.add_all(models)
+        integration_db_session.commit()
+        return models
+
+    def test_get_matches(self, client, schedules):
+        """測試比對 - Taker 向其他 Giver 提出的時段與 Giver 可預約時段的交集（200）。"""
+        # WHEN：比對 Giver 1 與 Taker 2
+        response = client.get("/api/v1/givers/1/matches", params={"taker_id": 2})
+
+        # THEN：Taker 2 的 10:30–11:30 落在 Giver 1 的 10:00–12:00 內
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "date": "2024-12-25",
+                "start_time": "10:30:00",
+                "end_time": "11:30:00",
+                "minutes": 60,
+                "proposal_id": schedules[3].id,
+                "opening_id": schedules[0].id,
+            }
+        ]
+
+    def test_get_matches_min_minutes(self, client, schedules):
+        """測試比對 - 交集短於 min_minutes 時不回報（200）。"""
+        # WHEN：要求至少 90 分鐘
+        response = client.get(
+            "/api/v1/givers/1/matches", params={"taker_id": 2, "min_minutes": 90}
+        )
+
+        # THEN：沒有候選視窗
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == []
+
+    def test_get_inbox_matches(self, client, schedules):
+        """測試收件匣比對 - 只回傳有候選視窗的 Taker（200）。"""
+        # WHEN：比對 Giver 1 的收件匣（Taker 2、3）
+        response = client.get("/api/v1/givers/1/inbox/matches")
+
+        # THEN：只有 Taker 2 有交集
+        assert response.status_code == status.HTTP_200_OK
+        body = response.json()
+        assert [item["taker_id"] for item in body] == [2]
+        assert body[0]["windows"][0]["opening_id"] == schedules[0].id
@@ -0,0 +1,197 @@
+"""週期規則路由整合測試。
+
+測試週期規則的建立、滾動期間展開、與時段的重疊檢查、發生日期與刪除端點。
+規則展開以今天為起點，測試日期皆相對於今天計算。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, timedelta
+
+# ===== 第三方套件 =====
+from fastapi import status
+import pytest
+
+# ===== 本地模組 =====
+from app.models.schedule import Schedule as ScheduleModel
+from app.services.recurrence_rule import recurrence_rule_service
+from app.utils.timezone import get_local_now_naive
+
+
+def tuesdays(first: date, last: date) -> list[str]:
+    """[first, last] 內的星期二（ISO 格式）。"""
+    days = (last - first).days + 1
+    return [
+        (first + timedelta(days=offset)).isoformat()
+        for offset in range(days)
+        if (first + timedelta(days=offset)).weekday() == 1
+    ]
+
+
+class TestRecurrenceRuleRoutes:
+    """週期規則路由整合測試類別。"""
+
+    @pytest.fixture
+    def client(self, integration_test_client):
+        """建立測試客戶端。"""
+        return integration_test_client
+
+    @pytest.fixture
+    def starts_on(self):
+        """下週一：規則從下週起每週二發生。"""
+        today = get_local_now_naive().date()
+        return today + timedelta(days=7 - today.weekday())
+
+    @pytest.fixture
+    def rule_payload(self, starts_on):
+        """每週二 19:00–21:00，連續 12 週的規則建立請求資料。"""
+        return {
+            "rule": {
+                "giver_id": 1,
+                "frequency": "WEEKLY",
+                "weekdays": [1],
+                "start_time": "19:00:00",
+                "end_time": "21:00:00",
+                "starts_on": starts_on.isoformat(),
+                "ends_on": (starts_on + timedelta(weeks=12)).isoformat(),
+                "note": "每週二晚上履歷健診",
+            },
+            "created_by": 1,
+            "created_by_role": "GIVER",
+        }
+
+    @pytest.fixture
+    def rule(self, client, rule_payload):
+        """透過 API 建立的規則。"""
+        response = client.post("/api/v1/recurrence-rules", json=rule_payload)
+        assert response.status_code == status.HTTP_201_CREATED
+        return response.json()
+
+    def schedule_payload(self, day: date) -> dict:
+        """Giver 1 於指定日期 20:00–22:00 的時段建立請求資料。"""
+        return {
+            "schedules": [
+                {
+                    "giver_id": 1,
+                    "date": day.isoformat(),
+                    "start_time": "20:00:00",
+                    "end_time": "22:00:00",
+                }
+            ],
+            "created_by": 1,
+            "created_by_role": "GIVER",
+        }
+
+    def test_create_rule_materializes_horizon(
+        self, client, integration_db_session, rule, starts_on
+    ):
+        """測試建立規則 - 只展開滾動期間內的發生日期（201）。"""
+        # THEN：展開到今天起的滾動期間最後一天
+        horizon = recurrence_rule_service.horizon()
+        assert rule["weekdays"] == [1]
+        assert rule["exceptions"] == []
+        assert rule["materialized_until"] == horizon.isoformat()
+
+        # THEN：滾動期間內的每個星期二各有一個可預約時段，沿用規則的備註
+        schedules = (
+            integration_db_session.query(ScheduleModel)
+            .order_by(ScheduleModel.date)
+            .all()
+        )
+        assert [s.date.isoformat() for s in schedules] == tuesdays(starts_on, horizon)
+        assert {s.note for s in schedules} == {"每週二晚上履歷健診"}
+
+    def test_materialize_rules_extends_horizon(
+        self, integration_db_session, rule, starts_on
+    ):
+        """測試定期展開 - 延伸到結束日期且不重複建立時段。"""
+        # WHEN：展開到規則結束日期之後
+        until = starts_on + timedelta(weeks=20)
+        recurrence_rule_service.materialize_rules(integration_db_session, until)
+        recurrence_rule_service.materialize_rules(integration_db_session, until)
+
+        # THEN：12 週內的 12 個星期二各有一個時段
+        dates = [d for (d,) in integration_db_session.query(ScheduleModel.date).all()]
+        assert sorted(d.isoformat() for d in dates) == tuesdays(
+            starts_on, starts_on + timedelta(weeks=12)
+        )
+
+    def test_schedule_overlaps_pending_occurrence(self, client, rule, starts_on):
+        """測試建立時段 - 與規則中尚未展開的發生日期重疊（409）。"""
+        # WHEN：在滾動期間之後的星期二建立重疊時段
+        day = starts_on + timedelta(weeks=8, days=1)
+        response = client.post("/api/v1/schedules", json=self.schedule_payload(day))
+
+        # THEN：回報規則的發生日期
+        assert response.status_code == status.HTTP_409_CONFLICT
+        error = response.json()["error"]
+        assert error["code"] == "SERVICE_SCHEDULE_OVERLAP"
+        overlapping = error["details"]["overlapping_schedules"]
+        assert [(s["date"], s["start_time"]) for s in overlapping] == [
+            (day.isoformat(), "19:00:00")
+        ]
+
+    def test_create_overlapping_rule(self, client, rule, rule_payload):
+        """測試建立規則 - 與其他規則重疊（409）。"""
+        # WHEN：建立每週二、四 20:00–22:00 的規則
+        rule_payload["rule"].update(
+            weekdays=[1, 3], start_time="20:00:00", end_time="22:00:00", ends_on=None
+        )
+        response = client.post("/api/v1/recurrence-rules", json=rule_payload)
+
+        # THEN：時段衝突
+        assert response.status_code == status.HTTP_409_CONFLICT
+        assert response.json()["error"]["code"] == "SERVICE_SCHEDULE_OVERLAP"
+
+    def test_create_rule_weekly_without_weekdays(self, client, rule_payload):
+        """測試建立規則 - 每週規則未指定星期（400）。"""
+        # WHEN：不指定星期
+        rule_payload["rule"]["weekdays"] = []
+        response = client.post("/api/v1/recurrence-rules", json=rule_payload)
+
+        # THEN：參數錯誤
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_rules_and_occurrences(self, client, rule, starts_on):
+        """測試查詢規則與發生日期 - 惰性產生，不限於滾動期間（200）。"""
+        # WHEN：查詢 Giver 1 的規則
+        response = client.get("/api/v1/givers/1/recurrence-rules")
+
+        # THEN：回傳建立的規則
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["id"] for item in response.json()] == [rule["id"]]
+
+        # WHEN：從第 10 週起取前 5 個發生日期
+        response = client.get(
+            f"/api/v1/recurrence-rules/{rule['id']}/occurrences",
+            params={
+                "date_from": (starts_on + timedelta(weeks=10)).isoformat(),
+                "limit": 5,
+            },
+        )
+
+        # THEN：只剩結束日期前的 2 個星期二
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            (starts_on + timedelta(weeks=10, days=1)).isoformat(),
+            (starts_on + timedelta(weeks=11, days=1)).isoformat(),
+        ]
+
+    def test_delete_rule(self, client, rule, starts_on):
+        """測試刪除規則 - 不再參與重疊檢查（204）。"""
+        # WHEN：刪除規則
+        response = client.request(
+            "DELETE",
+            f"/api/v1/recurrence-rules/{rule['id']}",
+            json={"deleted_by": 1, "deleted_by_role": "GIVER"},
+        )
+
+        # THEN：刪除成功，之後可在原本的發生日期建立時段
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+        day = starts_on + timedelta(weeks=8, days=1)
+        response = client.post("/api/v1/schedules", json=self.schedule_payload(day))
+        assert response.status_code == status.HTTP_201_CREATED
+
+        # THEN：再次查詢或刪除時規則不存在
+        response = client.get(f"/api/v1/recurrence-rules/{rule['id']}/occurrences")
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        assert response.json()["error"]["code"] == "SERVICE_RECURRENCE_RULE_NOT_FOUND"
@@ -4,15 +4,29 @@
 """
 
 # ===== 標準函式庫 =====
-from datetime import date, time
+from datetime import date, datetime, time
+import json
+import shutil
+import sqlite3
+import time as time_module
 
 # ===== 第三方套件 =====
 from fastapi import status
+import msgpack
 import pytest
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.pool import NullPool
 
 # ===== 本地模組 =====
+from app.cache import MemoryCacheBackend
+from app.database import connection, get_async_read_db
+from app.database.replicas import READ_PRIMARY_COOKIE
 from app.enums.models import ScheduleStatusEnum
 from app.models.schedule import Schedule as ScheduleModel
+from app.models.user import User as UserModel
+from app.services.read_cache import schedule_read_cache
 
 
 class TestScheduleRoutes:
@@ -287,6 +301,40 @@ class TestScheduleRoutes:
         assert isinstance(data, list)
         assert len(data) == expected_count
 
+    def test_list_schedules_cursor_pagination(self, client, integration_db_session):
+        """測試查詢時段列表 - 依 X-Next-Cursor 逐頁查詢（200）。"""
+        # GIVEN：資料庫中有 3 個時段，寫入順序與排序順序不同
+        integration_db_session.add_all(
+            ScheduleModel(
+                giver_id=1,
+                date=date(2024, 12, 25),
+                start_time=time(hour, 0),
+                end_time=time(hour + 1, 0),
+            )
+            for hour in (13, 9, 11)
+        )
+        integration_db_session.commit()
+
+        # WHEN：每頁 2 筆，依回應標頭的游標查詢下一頁
+        first = client.get("/api/v1/schedules?limit=2")
+        cursor = first.headers["X-Next-Cursor"]
+        second = client.get(f"/api/v1/schedules?limit=2&cursor={cursor}")
+
+        # THEN：依開始時間排序分成兩頁，最後一頁沒有下一頁游標
+        assert first.status_code == status.HTTP_200_OK
+        assert second.status_code == status.HTTP_200_OK
+        start_times = [s["start_time"] for s in first.json() + second.json()]
+        assert start_times == ["09:00:00", "11:00:00", "13:00:00"]
+        assert "X-Next-Cursor" not in second.headers
+
+    def test_list_schedules_invalid_cursor(self, client):
+        """測試查詢時段列表 - 無效的分頁游標（400）。"""
+        # WHEN：使用無效的游標查詢
+        response = client.get("/api/v1/schedules?cursor=not-a-cursor")
+
+        # THEN：確認返回錯誤請求
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     @pytest.mark.parametrize(
         "invalid_query_params",
         [
@@ -300,6 +348,9 @@ class TestScheduleRoutes:
             "status_filter=NONE_EXIST",  # 不存在的狀態
             "status_filter=INVALID",  # 無效的狀態值
             "status_filter=123",  # 非字串狀態值
+            # 測試無效的分頁參數
+            "limit=0",  # limit 必須大於 0
+            "limit=501",  # limit 不能超過 500
             # 測試無效的組合
             "giver_id=0&status_filter=DRAFT",  # 無效 giver_id + 有效 status
             "giver_id=1&status_filter=INVALID",  # 有效 giver_id + 無效 status
@@ -367,6 +418,334 @@ class TestScheduleRoutes:
         assert "deleted_by" in data
         assert "deleted_by_role" in data
 
+        # 版本號：同時以 ETag 標頭提供
+        assert data["version"] == 1
+        assert response.headers["ETag"] == '"1"'
+
+    def test_list_schedules_sparse_fields(self, client, schedule_in_db):
+        """測試取得時段列表 - 只回傳 fields 指定的欄位（200）。"""
+        # WHEN：只查詢日期與時間
+        response = client.get(
+            "/api/v1/schedules?giver_id=1&fields=date,start_time,end_time"
+        )
+
+        # THEN：每筆時段只包含指定的欄位
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {"date": "2024-12-25", "start_time": "09:00:00", "end_time": "10:00:00"}
+        ]
+
+    def test_get_schedule_with_include(self, client, integration_db_session):
+        """測試取得單一時段 - 附加 include 指定的關聯使用者，保留 ETag（200）。"""
+        # GIVEN：Giver 與其時段
+        giver = UserModel(name="王零一", email="giver@example.com")
+        integration_db_session.add(giver)
+        integration_db_session.commit()
+        schedule = ScheduleModel(
+            giver_id=giver.id,
+            date=date(2024, 12, 25),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        integration_db_session.add(schedule)
+        integration_db_session.commit()
+        schedule_id, giver_id = schedule.id, giver.id
+
+        # WHEN：查詢 id 並附加 Giver、Taker
+        response = client.get(
+            f"/api/v1/schedules/{schedule_id}?fields=id&include=giver,taker"
+        )
+
+        # THEN：回傳指定欄位與關聯使用者，沒有 Taker 時為 null
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "id": schedule_id,
+            "giver": {"id": giver_id, "name": "王零一"},
+            "taker": None,
+        }
+        assert response.headers["ETag"] == '"1"'
+
+    @pytest.mark.parametrize(
+        "query", ["fields=id,password", "fields=", "include=owner"]
+    )
+    def test_list_schedules_invalid_fieldset(self, client, query):
+        """測試取得時段列表 - 欄位或關聯名稱無效（400）。"""
+        # WHEN：傳入無效的 fields 或 include
+        response = client.get(f"/api/v1/schedules?{query}")
+
+        # THEN：確認返回請求錯誤
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_schedules_msgpack(self, client, schedule_in_db):
+        """測試取得時段列表 - Accept 為 MessagePack 時回傳相同內容（200）。"""
+        # GIVEN：JSON 格式的結果
+        expected = client.get("/api/v1/schedules?giver_id=1").json()
+
+        # WHEN：要求 MessagePack 格式
+        response = client.get(
+            "/api/v1/schedules?giver_id=1", headers={"Accept": "application/msgpack"}
+        )
+
+        # THEN：解碼後與 JSON 結果相同
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/msgpack"
+        assert response.headers["vary"] == "Accept"
+        assert msgpack.unpackb(response.content) == expected
+
+    def test_list_schedules_columnar(self, client, integration_db_session):
+        """測試取得時段列表 - 欄式 JSON，保留分頁游標（200）。"""
+        # GIVEN：同一 Giver 的兩個時段
+        integration_db_session.add_all(
+            ScheduleModel(
+                giver_id=1,
+                date=date(2024, 12, 25),
+                start_time=time(hour, 0),
+                end_time=time(hour + 1, 0),
+            )
+            for hour in (9, 10)
+        )
+        integration_db_session.commit()
+
+        # WHEN：以欄式 JSON 查詢第一頁的日期與時間
+        response = client.get(
+            "/api/v1/schedules?giver_id=1&limit=1&fields=date,start_time",
+            headers={"Accept": "application/vnd.schedule.columnar+json"},
+        )
+
+        # THEN：欄位名稱只出現一次，仍提供下一頁游標
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {
+            "columns": ["date", "start_time"],
+            "rows": [["2024-12-25", "09:00:00"]],
+        }
+        assert "X-Next-Cursor" in response.headers
+
+    def test_get_schedule_msgpack(self, client, schedule_in_db):
+        """測試取得單一時段 - MessagePack 格式保留 ETag（200）。"""
+        # GIVEN：時段 ID
+        schedule_id = schedule_in_db.id
+
+        # WHEN：要求 MessagePack 格式
+        response = client.get(
+            f"/api/v1/schedules/{schedule_id}",
+            headers={"Accept": "application/x-msgpack"},
+        )
+
+        # THEN：回傳 MessagePack 編碼的時段與 ETag
+        assert response.status_code == status.HTTP_200_OK
+        assert msgpack.unpackb(response.content)["id"] == schedule_id
+        assert response.headers["ETag"] == '"1"'
+
+    @pytest.mark.parametrize("path", ["/api/v1/schedules", "/api/v1/schedules/1"])
+    def test_schedule_not_acceptable(self, client, path):
+        """測試查詢時段 - 不支援 Accept 要求的回應格式（406）。"""
+        # WHEN：只接受 XML
+        response = client.get(path, headers={"Accept": "application/xml"})
+
+        # THEN：確認返回內容協商錯誤
+        assert response.status_code == status.HTTP_406_NOT_ACCEPTABLE
+        assert response.json()["error"]["code"] == "ROUTER_NOT_ACCEPTABLE"
+
+    def test_export_schedules_ndjson(self, client, integration_db_session):
+        """測試串流匯出時段 - NDJSON 套用篩選條件與日期範圍（200）。"""
+        # GIVEN：兩個 Giver 各 3 天的時段，其中一個已軟刪除
+        integration_db_session.add_all(
+            ScheduleModel(
+                giver_id=giver_id,
+                date=date(2024, 12, day),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                deleted_at=datetime(2024, 12, 1) if day == 26 else None,
+            )
+            for giver_id in (1, 2)
+            for day in (24, 25, 26, 27)
+        )
+        integration_db_session.commit()
+
+        # WHEN：匯出 Giver 1 在 12/25 至 12/27 的日期
+        response = client.get(
+            "/api/v1/schedules:export?giver_id=1"
+            "&date_from=2024-12-25&date_to=2024-12-27&fields=giver_id,date"
+        )
+
+        # THEN：每行一筆時段，排除範圍外與已軟刪除的時段
+        assert response.status_code == status.HTTP_200_OK
+        assert response.headers["content-type"] == "application/x-ndjson"
+        assert [json.loads(line) for line in response.text.splitlines()] == [
+            {"giver_id": 1, "date": "2024-12-25"},
+            {"giver_id": 1, "date": "2024-12-27"},
+        ]
+
+    @pytest.mark.parametrize(
+        "query", ["date_from=2024-12-26&date_to=2024-12-25", "fields=password"]
+    )
+    def test_export_schedules_invalid(self, client, query):
+        """測試串流匯出時段 - 日期範圍或欄位無效（400）。"""
+        # WHEN：傳入無效的查詢參數
+        response = client.get(f"/api/v1/schedules:export?{query}")
+
+        # THEN：在開始串流前返回請求錯誤
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
+    def test_list_schedules_not_modified(
+        self, client, schedule_in_db, schedule_update_payload
+    ):
+        """測試查詢時段列表 - If-None-Match 相符時只執行聚合查詢並回傳 304。"""
+        # GIVEN：第一次查詢取得的 ETag
+        path = "/api/v1/schedules?giver_id=1"
+        etag = client.get(path).headers["ETag"]
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        # WHEN：帶 ETag 重新查詢
+        event.listen(Engine, "before_cursor_execute", record_statement)
+        try:
+            response = client.get(path, headers={"If-None-Match": etag})
+        finally:
+            event.remove(Engine, "before_cursor_execute", record_statement)
+
+        # THEN：不含內容，只執行一次聚合查詢
+        assert response.status_code == status.HTTP_304_NOT_MODIFIED
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+        assert response.headers["Vary"] == "Accept"
+        assert len(statements) == 1 and "count(" in statements[0].lower()
+
+        # WHEN：其他回應格式，以及更新時段後以舊的 ETag 查詢
+        msgpack_response = client.get(
+            path, headers={"If-None-Match": etag, "Accept": "application/msgpack"}
+        )
+        client.patch(
+            f"/api/v1/schedules/{schedule_in_db.id}", json=schedule_update_payload
+        )
+        updated = client.get(path, headers={"If-None-Match": etag})
+
+        # THEN：ETag 依回應格式區分，更新後回傳新的內容與 ETag
+        assert msgpack_response.status_code == status.HTTP_200_OK
+        assert updated.status_code == status.HTTP_200_OK
+        assert updated.json()[0]["note"] == "更新後的時段"
+        assert updated.headers["ETag"] != etag
+
+    def test_get_schedule_not_modified(self, client, schedule_in_db):
+        """測試取得單一時段 - If-None-Match 與版本相符時回傳 304。"""
+        # GIVEN：時段目前的 ETag
+        path = f"/api/v1/schedules/{schedule_in_db.id}"
+        etag = client.get(path).headers["ETag"]
+
+        # WHEN：以相符、過期的 ETag 查詢
+        not_modified = client.get(path, headers={"If-None-Match": etag})
+        stale = client.get(path, headers={"If-None-Match": '"0"'})
+
+        # THEN：相符時不含內容，過期時回傳完整內容
+        assert not_modified.status_code == status.HTTP_304_NOT_MODIFIED
+        assert not_modified.headers["ETag"] == etag
+        assert stale.status_code == status.HTTP_200_OK
+        assert stale.json()["id"] == schedule_in_db.id
+
+    def test_read_cache(
+        self,
+        client,
+        schedule_in_db,
+        schedule_update_payload,
+        schedule_delete_payload,
+        monkeypatch,
+    ):
+        """測試讀取快取 - 重複查詢不讀取時段，更新、刪除後立即失效。"""
+        # GIVEN：啟用行程內讀取快取，查詢一次列表與單一時段
+        monkeypatch.setattr(schedule_read_cache, "backend", MemoryCacheBackend())
+        schedule_id = schedule_in_db.id
+        list_path = "/api/v1/schedules?giver_id=1"
+        item_path = f"/api/v1/schedules/{schedule_id}"
+        client.get(list_path)
+        client.get(item_path)
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        # WHEN：再次查詢
+        event.listen(Engine, "before_cursor_execute", record_statement)
+        try:
+            cached_list = client.get(list_path)
+            cached_item = client.get(item_path)
+        finally:
+            event.remove(Engine, "before_cursor_execute", record_statement)
+
+        # THEN：列表只執行驗證器的聚合查詢，單一時段不查詢資料庫
+        assert cached_list.json()[0]["id"] == schedule_id
+        assert cached_item.json()["note"] == "資料庫中的時段資料"
+        assert cached_item.headers["ETag"] == '"1"'
+        assert len(statements) == 1 and "count(" in statements[0].lower()
+
+        # WHEN & THEN：更新後回傳新的內容
+        client.patch(item_path, json=schedule_update_payload)
+        assert client.get(list_path).json()[0]["note"] == "更新後的時段"
+        assert client.get(item_path).headers["ETag"] == '"2"'
+
+        # WHEN & THEN：刪除後從列表中移除
+        client.request("DELETE", item_path, json=schedule_delete_payload)
+        assert client.get(list_path).json() == []
+        assert client.get(item_path).status_code == status.HTTP_404_NOT_FOUND
+
+    def test_read_cache_with_lagging_replica(
+        self,
+        client,
+        integration_db_session,
+        integration_db_path,
+        schedule_in_db,
+        schedule_update_payload,
+        monkeypatch,
+        tmp_path,
+    ):
+        """測試讀取快取 - 副本落後時，寫入後的讀取不回傳也不快取副本的舊內容。"""
+        # GIVEN：啟用讀取快取，唯一的副本是寫入前的資料庫複本，之後不再複寫
+        monkeypatch.setattr(schedule_read_cache, "backend", MemoryCacheBackend())
+        integration_db_session.commit()
+        replica_path = tmp_path / "replica.db"
+        shutil.copyfile(integration_db_path, replica_path)
+        primary = create_async_engine(
+            f"sqlite+aiosqlite:///{integration_db_path}", poolclass=NullPool
+        )
+        monkeypatch.setattr(connection, "async_engine", primary)
+        monkeypatch.setattr(
+            connection,
+            "AsyncSessionLocal",
+            async_sessionmaker(bind=primary, expire_on_commit=False),
+        )
+        monkeypatch.setattr(
+            connection,
+            "replica_pool",
+            connection.create_replica_pool([f"sqlite:///{replica_path}"]),
+        )
+        # 讀取路由改用實際的副本選擇規則
+        monkeypatch.delitem(client.app.dependency_overrides, get_async_read_db)
+        item_path = f"/api/v1/schedules/{schedule_in_db.id}"
+        list_path = "/api/v1/schedules?giver_id=1"
+
+        # WHEN：更新時段後，沒有 cookie 的客戶端從副本讀取
+        assert client.patch(item_path, json=schedule_update_payload).status_code == 200
+        other_item = client.get(item_path)
+        other_list = client.get(list_path)
+
+        # WHEN：寫入的客戶端帶 read-your-writes cookie 讀取
+        client.cookies.set(READ_PRIMARY_COOKIE, str(int(time_module.time()) + 60))
+        writer_item = client.get(item_path)
+        writer_list = client.get(list_path)
+
+        # THEN：副本仍是舊內容，但快取未命中時改由主資料庫查詢，所有讀取都是新內容
+        with sqlite3.connect(replica_path) as replica:
+            (replica_note,) = replica.execute(
+                "SELECT note FROM schedules WHERE id = ?", (schedule_in_db.id,)
+            ).fetchone()
+        assert replica_note == "資料庫中的時段資料"
+        for item in (other_item, writer_item):
+            assert item.json()["note"] == "更新後的時段"
+            assert item.headers["ETag"] == '"2"'
+        for page in (other_list, writer_list):
+            assert page.json()[0]["note"] == "更新後的時段"
+
     def test_get_schedule_not_found(self, client):
         """測試取得單一時段 - 時段不存在（404）。"""
         # GIVEN：不存在的時段 ID
@@ -512,6 +891,121 @@ class TestScheduleRoutes:
         assert db_schedule.deleted_by is None
         assert db_schedule.deleted_by_role is None
 
+    @pytest.mark.parametrize(
+        "schedule_data, expected_statements",
+        [
+            # 只更新備註：鎖定查詢 + UPDATE
+            ({"note": "更新後的時段"}, ["SELECT", "UPDATE"]),
+            # 更新時間：鎖定查詢 + 重疊檢查 + 週期規則 + UPDATE
+            (
+                {"start_time": "10:00:00", "end_time": "11:00:00"},
+                ["SELECT", "SELECT", "SELECT", "UPDATE"],
+            ),
+        ],
+    )
+    def test_update_schedule_query_count(
+        self,
+        client,
+        schedule_in_db,
+        schedule_update_payload,
+        schedule_data,
+        expected_statements,
+    ):
+        """測試更新時段 - 時段只載入一次，SQL 陳述式數量維持最少（200）。"""
+        # GIVEN：記錄請求期間送出的 SQL 陳述式
+        schedule_id = schedule_in_db.id
+        payload = {**schedule_update_payload, "schedule": schedule_data}
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        # WHEN：呼叫更新時段 API
+        event.listen(Engine, "before_cursor_execute", record_statement)
+        try:
+            response = client.patch(f"/api/v1/schedules/{schedule_id}", json=payload)
+        finally:
+            event.remove(Engine, "before_cursor_execute", record_statement)
+
+        # THEN：更新成功，且沒有重複查詢同一筆時段或在寫入後重新查詢
+        assert response.status_code == status.HTTP_200_OK
+        assert [s.split()[0] for s in statements] == expected_statements, statements
+
+    def test_update_schedule_if_match_success(
+        self, client, schedule_in_db, schedule_update_payload
+    ):
+        """測試更新時段 - If-Match 版本相符，以單一條件式 UPDATE 完成（200）。"""
+        # GIVEN：取得時段目前的 ETag
+        schedule_id = schedule_in_db.id
+        etag = client.get(f"/api/v1/schedules/{schedule_id}").headers["ETag"]
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        # WHEN：帶 If-Match 更新備註
+        event.listen(Engine, "before_cursor_execute", record_statement)
+        try:
+            response = client.patch(
+                f"/api/v1/schedules/{schedule_id}",
+                json=schedule_update_payload,
+                headers={"If-Match": etag},
+            )
+        finally:
+            event.remove(Engine, "before_cursor_execute", record_statement)
+
+        # THEN：更新成功，版本號遞增，且沒有先讀取時段
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json()["note"] == "更新後的時段"
+        assert response.json()["version"] == 2
+        assert response.headers["ETag"] == '"2"'
+        assert [s.split()[0] for s in statements] == ["UPDATE"], statements
+
+    @pytest.mark.parametrize(
+        "schedule_data",
+        [
+            {"note": "更新後的時段"},  # 條件式 UPDATE
+            {"start_time": "10:00:00", "end_time": "11:00:00"},  # 讀取後檢查重疊
+        ],
+    )
+    def test_update_schedule_if_match_mismatch(
+        self, client, schedule_in_db, schedule_update_payload, schedule_data
+    ):
+        """測試更新時段 - If-Match 版本不符（412）。"""
+        # GIVEN：另一個請求已更新時段，手上的 ETag 已過期
+        schedule_id = schedule_in_db.id
+        stale_etag = client.get(f"/api/v1/schedules/{schedule_id}").headers["ETag"]
+        client.patch(f"/api/v1/schedules/{schedule_id}", json=schedule_update_payload)
+        payload = {**schedule_update_payload, "schedule": schedule_data}
+
+        # WHEN：以過期的 ETag 更新
+        response = client.patch(
+            f"/api/v1/schedules/{schedule_id}",
+            json=payload,
+            headers={"If-Match": stale_etag},
+        )
+
+        # THEN：回傳 412，並提供目前的版本
+        assert response.status_code == status.HTTP_412_PRECONDITION_FAILED
+        error = response.json()["error"]
+        assert error["code"] == "SERVICE_SCHEDULE_VERSION_MISMATCH"
+        assert error["details"]["expected_version"] == 1
+        assert error["details"]["current_version"] == 2
+
+    def test_update_schedule_invalid_if_match(
+        self, client, schedule_in_db, schedule_update_payload
+    ):
+        """測試更新時段 - If-Match 標頭格式無效（400）。"""
+        # WHEN：使用弱 ETag 作為 If-Match
+        response = client.patch(
+            f"/api/v1/schedules/{schedule_in_db.id}",
+            json=schedule_update_payload,
+            headers={"If-Match": 'W/"1"'},
+        )
+
+        # THEN：回傳 400
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
+
     def test_update_schedule_end_before_start(
         self, client, schedule_in_db, schedule_update_payload
     ):
@@ -705,6 +1199,206 @@ class TestScheduleRoutes:
         assert db_schedule.is_deleted is True
         assert db_schedule.is_active is False
 
+    def test_delete_schedule_if_match(
+        self, client, schedule_in_db, schedule_delete_payload
+    ):
+        """測試刪除時段 - If-Match 版本不符（412），版本相符則刪除（204）。"""
+        # GIVEN：資料已經在資料庫中（版本 1）
+        schedule_id = schedule_in_db.id
+
+        # WHEN：以錯誤的版本刪除，再以正確的版本刪除
+        mismatch = client.request(
+            "DELETE",
+            f"/api/v1/schedules/{schedule_id}",
+            json=schedule_delete_payload,
+            headers={"If-Match": '"2"'},
+        )
+        match = client.request(
+            "DELETE",
+            f"/api/v1/schedules/{schedule_id}",
+            json=schedule_delete_payload,
+            headers={"If-Match": '"1"'},
+        )
+
+        # THEN：版本不符時不刪除，版本相符時刪除成功
+        assert mismatch.status_code == status.HTTP_412_PRECONDITION_FAILED
+        assert mismatch.json()["error"]["code"] == "SERVICE_SCHEDULE_VERSION_MISMATCH"
+        assert match.status_code == status.HTTP_204_NO_CONTENT
+
+    def test_delete_schedules_by_filter(
+        self, client, integration_db_session, schedule_delete_payload
+    ):
+        """測試依條件批次刪除時段 - 成功（200）。"""
+        # GIVEN：Giver 1 在兩天各有一個 AVAILABLE 時段，以及一個 ACCEPTED 時段
+        integration_db_session.add_all(
+            ScheduleModel(
+                giver_id=1,
+                date=schedule_date,
+                start_time=time(hour, 0),
+                end_time=time(hour + 1, 0),
+                status=schedule_status,
+            )
+            for schedule_date, hour, schedule_status in [
+                (date(2024, 12, 25), 9, ScheduleStatusEnum.AVAILABLE),
+                (date(2024, 12, 26), 9, ScheduleStatusEnum.AVAILABLE),
+                (date(2024, 12, 26), 11, ScheduleStatusEnum.ACCEPTED),
+            ]
+        )
+        integration_db_session.commit()
+
+        # WHEN：批次刪除兩天的時段
+        response = client.request(
+            "DELETE",
+            "/api/v1/schedules",
+            json={
+                **schedule_delete_payload,
+                "giver_id": 1,
+                "dates": ["2024-12-25", "2024-12-26"],
+            },
+        )
+
+        # THEN：刪除兩個 AVAILABLE 時段，ACCEPTED 時段保留
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == {"deleted_count": 2}
+        remaining = client.get("/api/v1/schedules?giver_id=1").json()
+        assert [s["status"] for s in remaining] == ["ACCEPTED"]
+
+    def test_delete_schedules_by_filter_validation_error(
+        self, client, schedule_delete_payload
+    ):
+        """測試依條件批次刪除時段 - 日期清單為空（422）。"""
+        # WHEN：不提供任何日期
+        response = client.request(
+            "DELETE",
+            "/api/v1/schedules",
+            json={**schedule_delete_payload, "giver_id": 1, "dates": []},
+        )
+
+        # THEN：參數驗證錯誤
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
+    def test_execute_schedule_batch_success(
+        self, client, integration_db_session, schedule_in_db
+    ):
+        """測試批次操作時段 - 全部成功，只 commit 一次（200）。"""
+        # GIVEN：將現有時段移到 13:00，在原時間建立兩個新時段，並刪除隔天的時段
+        schedule_id = schedule_in_db.id
+        next_day = ScheduleModel(
+            giver_id=1,
+            date=date(2024, 12, 26),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        integration_db_session.add(next_day)
+        integration_db_session.commit()
+        next_day_id = next_day.id
+        payload = {
+            "operations": [
+                {
+                    "op": "update",
+                    "schedule_id": schedule_id,
+                    "schedule": {"start_time": "13:00:00", "end_time": "14:00:00"},
+                    "version": 1,
+                },
+                *(
+                    {
+                        "op": "create",
+                        "schedule": {
+                            "giver_id": 1,
+                            "date": "2024-12-25",
+                            "start_time": start_time,
+                            "end_time": end_time,
+                        },
+                    }
+                    for start_time, end_time in [
+                        ("09:00:00", "10:00:00"),
+                        ("10:00:00", "11:00:00"),
+                    ]
+                ),
+                {"op": "delete", "schedule_id": next_day_id},
+            ],
+            "operated_by": 1,
+            "operated_by_role": "GIVER",
+        }
+        commits: list[object] = []
+
+        def record_commit(conn):
+            # 只記錄 API 使用的非同步連線，不含測試夾具同步會話的 commit
+            if conn.dialect.is_async:
+                commits.append(conn)
+
+        # WHEN：呼叫批次操作 API
+        event.listen(Engine, "commit", record_commit)
+        try:
+            response = client.post("/api/v1/schedules:batch", json=payload)
+        finally:
+            event.remove(Engine, "commit", record_commit)
+
+        # THEN：依請求順序回傳結果，整批只 commit 一次
+        assert response.status_code == status.HTTP_200_OK
+        results = response.json()["results"]
+        assert [(r["index"], r["op"]) for r in results] == [
+            (0, "update"),
+            (1, "create"),
+            (2, "create"),
+            (3, "delete"),
+        ]
+        assert results[0]["schedule"]["version"] == 2
+        assert results[3] == {
+            "index": 3,
+            "op": "delete",
+            "schedule_id": next_day_id,
+            "schedule": None,
+        }
+        assert len(commits) == 1
+        remaining = client.get("/api/v1/schedules?giver_id=1").json()
+        assert [(s["date"], s["start_time"]) for s in remaining] == [
+            ("2024-12-25", "09:00:00"),
+            ("2024-12-25", "10:00:00"),
+            ("2024-12-25", "13:00:00"),
+        ]
+
+    def test_execute_schedule_batch_rolls_back(self, client, schedule_in_db):
+        """測試批次操作時段 - 任一操作失敗時整批回滾（404）。"""
+        # GIVEN：刪除現有時段後，更新不存在的時段
+        payload = {
+            "operations": [
+                {"op": "delete", "schedule_id": schedule_in_db.id},
+                {
+                    "op": "update",
+                    "schedule_id": 99999,
+                    "schedule": {"note": "不存在的時段"},
+                },
+            ],
+            "operated_by": 1,
+            "operated_by_role": "GIVER",
+        }
+
+        # WHEN：呼叫批次操作 API
+        response = client.post("/api/v1/schedules:batch", json=payload)
+
+        # THEN：回傳失敗操作的錯誤，先前的刪除一起回滾
+        assert response.status_code == status.HTTP_404_NOT_FOUND
+        error = response.json()["error"]
+        assert error["code"] == "SERVICE_SCHEDULE_NOT_FOUND"
+        assert error["details"]["operation_indexes"] == [1]
+        assert len(client.get("/api/v1/schedules?giver_id=1").json()) == 1
+
+    def test_execute_schedule_batch_validation_error(self, client):
+        """測試批次操作時段 - 未知的操作類型（422）。"""
+        # WHEN：傳入不支援的操作類型
+        response = client.post(
+            "/api/v1/schedules:batch",
+            json={
+                "operations": [{"op": "archive", "schedule_id": 1}],
+                "operated_by": 1,
+                "operated_by_role": "GIVER",
+            },
+        )
+
+        # THEN：參數驗證錯誤
+        assert response.status_code == status.HTTP_422_UNPROCESSABLE_ENTITY
+
     def test_delete_schedule_not_found(self, client, schedule_delete_payload):
         """測試刪除時段 - 時段不存在（404）。"""
         # GIVEN：不存在的時段 ID 和有效的刪除資料
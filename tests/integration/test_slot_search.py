@@ -0,0 +1,131 @@
+"""Giver 空檔搜尋路由整合測試。
+
+測試跨 Giver 的空檔搜尋端點，包括兩種搜尋模式與參數驗證。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+from fastapi import status
+import pytest
+
+# ===== 本地模組 =====
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models.schedule import Schedule as ScheduleModel
+
+
+class TestSlotSearchRoutes:
+    """Giver 空檔搜尋路由整合測試類別。"""
+
+    @pytest.fixture
+    def client(self, integration_test_client):
+        """建立測試客戶端。"""
+        return integration_test_client
+
+    @pytest.fixture
+    def schedules(self, integration_db_session):
+        """Giver 1 於 12/25 09:00–12:00 可預約，其中 09:30–10:30 已接受；
+        Giver 2 於 12/25 09:00–10:00 可預約；Giver 3 於 12/25 08:00–20:00 有草稿時段。"""
+        day = date(2024, 12, 25)
+        rows = [
+            (1, ScheduleStatusEnum.AVAILABLE, time(9), time(9, 30)),
+            (1, ScheduleStatusEnum.ACCEPTED, time(9, 30), time(10, 30)),
+            (1, ScheduleStatusEnum.AVAILABLE, time(10, 30), time(12)),
+            (2, ScheduleStatusEnum.AVAILABLE, time(9), time(10)),
+            (3, ScheduleStatusEnum.DRAFT, time(8), time(20)),
+        ]
+        integration_db_session.add_all(
+            ScheduleModel(
+                giver_id=giver_id,
+                status=status_value,
+                date=day,
+                start_time=start_time,
+                end_time=end_time,
+                created_by=giver_id,
+                created_by_role=UserRoleEnum.GIVER,
+            )
+            for giver_id, status_value, start_time, end_time in rows
+        )
+        integration_db_session.commit()
+
+    def test_search_available(self, client, schedules):
+        """測試搜尋空檔 - 只回傳有連續可預約視窗的 Giver（200）。"""
+        # WHEN：搜尋 12/25–12/26 上午有 60 分鐘可預約的 Giver
+        response = client.get(
+            "/api/v1/slots/search",
+            params={
+                "from": "2024-12-25",
+                "to": "2024-12-26",
+                "start_time": "08:00:00",
+                "end_time": "12:00:00",
+                "duration": 60,
+            },
+        )
+
+        # THEN：Giver 1 被預約切開後最早的視窗在 10:30；Giver 3 沒有可預約時段
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "giver_id": 1,
+                "windows": [
+                    {
+                        "date": "2024-12-25",
+                        "start_time": "10:30:00",
+                        "end_time": "11:30:00",
+                    }
+                ],
+            },
+            {
+                "giver_id": 2,
+                "windows": [
+                    {
+                        "date": "2024-12-25",
+                        "start_time": "09:00:00",
+                        "end_time": "10:00:00",
+                    }
+                ],
+            },
+        ]
+
+    def test_search_free_with_giver_ids(self, client, schedules):
+        """測試搜尋空檔 - free 模式下任何時段都視為佔用，指定的 Giver 即使沒有時段也會搜尋。"""
+        # WHEN：搜尋 Giver 1、3、4 於 12/25 09:00–12:00 完全空白的 60 分鐘
+        response = client.get(
+            "/api/v1/slots/search",
+            params={
+                "from": "2024-12-25",
+                "to": "2024-12-25",
+                "start_time": "09:00:00",
+                "end_time": "12:00:00",
+                "duration": 60,
+                "mode": "free",
+                "giver_ids": [1, 3, 4],
+            },
+        )
+
+        # THEN：只有沒有任何時段的 Giver 4
+        assert response.status_code == status.HTTP_200_OK
+        assert [item["giver_id"] for item in response.json()] == [4]
+        assert response.json()[0]["windows"][0]["start_time"] == "09:00:00"
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"from": "2024-12-26", "to": "2024-12-25"},
+            {"from": "2024-01-01", "to": "2024-12-31"},
+            {
+                "from": "2024-12-25",
+                "to": "2024-12-25",
+                "start_time": "12:00:00",
+                "end_time": "09:00:00",
+            },
+        ],
+    )
+    def test_search_invalid_range(self, client, params):
+        """測試搜尋空檔 - 日期或時間範圍無效（400）。"""
+        # WHEN：以無效範圍搜尋
+        response = client.get("/api/v1/slots/search", params={**params, "duration": 60})
+
+        # THEN：回傳 400
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
@@ -0,0 +1,74 @@
+"""Giver 每日時段統計路由整合測試。
+
+測試每日時段統計端點，包括時段寫入後的統計與日期範圍驗證。
+"""
+
+# ===== 第三方套件 =====
+from fastapi import status
+import pytest
+
+
+class TestSummaryRoutes:
+    """Giver 每日時段統計路由整合測試類別。"""
+
+    @pytest.fixture
+    def client(self, integration_test_client):
+        """建立測試客戶端。"""
+        return integration_test_client
+
+    def test_summary_after_writes(self, client, schedule_create_payload):
+        """測試取得每日時段統計 - 反映透過 API 建立與更新的時段（200）。"""
+        # GIVEN：Giver 1 在 12/25 建立兩個時段，其中一個改為已接受
+        payload = schedule_create_payload
+        payload["schedules"].append(
+            {
+                **payload["schedules"][0],
+                "start_time": "11:00:00",
+                "end_time": "12:00:00",
+            }
+        )
+        created = client.post("/api/v1/schedules", json=payload).json()
+        client.patch(
+            f"/api/v1/schedules/{created[1]['id']}",
+            json={
+                "schedule": {"status": "ACCEPTED"},
+                "updated_by": 1,
+                "updated_by_role": "GIVER",
+            },
+        )
+
+        # WHEN：取得 12 月的統計
+        response = client.get(
+            "/api/v1/givers/1/summary",
+            params={"from": "2024-12-01", "to": "2024-12-31"},
+        )
+
+        # THEN：只有有時段的日期
+        assert response.status_code == status.HTTP_200_OK
+        assert response.json() == [
+            {
+                "date": "2024-12-25",
+                "draft_count": 0,
+                "available_count": 1,
+                "pending_count": 0,
+                "accepted_count": 1,
+                "rejected_count": 0,
+                "cancelled_count": 0,
+                "completed_count": 0,
+            }
+        ]
+
+    @pytest.mark.parametrize(
+        "params",
+        [
+            {"from": "2024-12-31", "to": "2024-12-01"},
+            {"from": "2024-01-01", "to": "2025-01-01"},
+        ],
+    )
+    def test_summary_invalid_range(self, client, params):
+        """測試取得每日時段統計 - 起日晚於迄日或範圍過大（400）。"""
+        # WHEN：以無效的日期範圍查詢
+        response = client.get("/api/v1/givers/1/summary", params=params)
+
+        # THEN：回傳請求錯誤
+        assert response.status_code == status.HTTP_400_BAD_REQUEST
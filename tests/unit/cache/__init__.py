@@ -0,0 +1,6 @@
+"""快取後端單元測試。
+
+測試讀取快取使用的行程內與 Redis 後端。
+"""
+
+__all__ = []
@@ -0,0 +1,169 @@
+"""快取後端測試。"""
+
+# ===== 標準函式庫 =====
+from unittest.mock import patch
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.cache import MemoryCacheBackend, RedisCacheBackend
+from app.cache.backends import GENERATION_TTL_SECONDS
+
+
+class FakeRedis:
+    """測試用的 redis.asyncio 用戶端，只實作 RedisCacheBackend 使用的指令。"""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.expires: dict[str, int] = {}
+
+    async def mget(self, keys):
+        return [self.data.get(key) for key in keys]
+
+    async def set(self, key, value, px=None, nx=False):
+        if nx and key in self.data:
+            return None
+        self.data[key] = value if isinstance(value, bytes) else str(value).encode()
+        if px is not None:
+            self.expires[key] = px
+        return True
+
+    async def incr(self, key):
+        value = int(self.data.get(key, b"0")) + 1
+        self.data[key] = str(value).encode()
+        return value
+
+    async def pexpire(self, key, px):
+        self.expires[key] = px
+        return key in self.data
+
+    def pipeline(self, transaction=True):
+        return FakePipeline(self)
+
+
+class FakePipeline:
+    """測試用的 pipeline：暫存指令，execute 時依序執行。"""
+
+    def __init__(self, client: FakeRedis) -> None:
+        self.client = client
+        self.commands: list = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+    def set(self, *args, **kwargs):
+        self.commands.append((self.client.set, args, kwargs))
+
+    def incr(self, *args):
+        self.commands.append((self.client.incr, args, {}))
+
+    def pexpire(self, *args):
+        self.commands.append((self.client.pexpire, args, {}))
+
+    async def execute(self):
+        return [
+            await command(*args, **kwargs) for command, args, kwargs in self.commands
+        ]
+
+
+class TestMemoryCacheBackend:
+    """行程內快取後端測試。"""
+
+    @pytest.mark.asyncio
+    async def test_set_get_and_ttl(self):
+        """測試寫入後可取得，超過存活時間後過期。"""
+        # GIVEN：存活 10 秒的項目
+        backend = MemoryCacheBackend()
+        with patch("app.cache.backends.time_module.monotonic", return_value=100.0):
+            await backend.set("a", b"1", 10)
+            await backend.set("b", b"2", None)
+
+            # THEN：未過期時可取得，不存在的鍵為 None
+            assert await backend.get_many(["a", "b", "c"]) == [b"1", b"2", None]
+
+        # WHEN & THEN：超過存活時間後過期，不過期的項目仍在
+        with patch("app.cache.backends.time_module.monotonic", return_value=110.0):
+            assert await backend.get_many(["a", "b"]) == [None, b"2"]
+
+    @pytest.mark.asyncio
+    async def test_lru_eviction(self):
+        """測試超過上限時淘汰最久未使用的項目。"""
+        # GIVEN：最多 2 筆的快取
+        backend = MemoryCacheBackend(max_entries=2)
+        await backend.set("a", b"1", None)
+        await backend.set("b", b"2", None)
+
+        # WHEN：使用 a 後寫入 c
+        await backend.get_many(["a"])
+        await backend.set("c", b"3", None)
+
+        # THEN：淘汰最久未使用的 b
+        assert await backend.get_many(["a", "b", "c"]) == [b"1", None, b"3"]
+
+    @pytest.mark.asyncio
+    async def test_bump_generation(self):
+        """測試遞增世代：重建的計數器不會回到舊值。"""
+        # GIVEN：建立世代計數器
+        backend = MemoryCacheBackend()
+        await backend.bump(["gen"])
+        (first,) = await backend.get_many(["gen"])
+
+        # WHEN：遞增，以及清空後重建
+        await backend.bump(["gen"])
+        (second,) = await backend.get_many(["gen"])
+        backend.clear()
+        await backend.bump(["gen"])
+        (rebuilt,) = await backend.get_many(["gen"])
+
+        # THEN：每次都不同
+        assert int(second) == int(first) + 1
+        assert rebuilt not in (first, second)
+
+    @pytest.mark.asyncio
+    async def test_generation_expires(self):
+        """測試世代計數器在存活時間內未遞增即過期，遞增時延長存活時間。"""
+        # GIVEN：建立世代計數器
+        backend = MemoryCacheBackend()
+        clock = "app.cache.backends.time_module.monotonic"
+        with patch(clock, return_value=0.0):
+            await backend.bump(["gen"])
+
+        # WHEN & THEN：存活時間內遞增後延長
+        with patch(clock, return_value=GENERATION_TTL_SECONDS - 1):
+            await backend.bump(["gen"])
+        with patch(clock, return_value=GENERATION_TTL_SECONDS + 1):
+            assert (await backend.get_many(["gen"]))[0] is not None
+
+        # WHEN & THEN：超過存活時間未遞增則過期
+        with patch(clock, return_value=2 * GENERATION_TTL_SECONDS):
+            assert await backend.get_many(["gen"]) == [None]
+
+
+class TestRedisCacheBackend:
+    """Redis 快取後端測試。"""
+
+    @pytest.mark.asyncio
+    async def test_get_set_and_bump(self):
+        """測試以 MGET、SET PX 與 SET NX + INCR 實作後端介面。"""
+        # GIVEN：使用測試用 Redis 用戶端的後端
+        client = FakeRedis()
+        backend = RedisCacheBackend(client)
+
+        # WHEN：寫入項目並遞增世代兩次
+        await backend.set("entry", b"data", 1.5)
+        await backend.bump(["gen:a", "gen:b"])
+        first = await backend.get_many(["gen:a", "gen:b"])
+        await backend.bump(["gen:a"])
+        second = await backend.get_many(["entry", "gen:a", "gen:b", "missing"])
+
+        # THEN：存活時間以毫秒設定，已存在的計數器只遞增並延長存活時間
+        assert client.expires["entry"] == 1500
+        assert client.expires["gen:a"] == GENERATION_TTL_SECONDS * 1000
+        assert second[0] == b"data"
+        assert int(second[1]) == int(first[0]) + 1
+        assert second[2] == first[1]
+        assert second[3] is None
@@ -5,20 +5,28 @@
 
 # ===== 標準函式庫 =====
 from datetime import date, time
+from unittest.mock import Mock, patch
 
 # ===== 第三方套件 =====
 import pytest
+from sqlalchemy import event, inspect, update
+from sqlalchemy.engine import Engine
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 # ===== 本地模組 =====
-from app.crud.schedule import ScheduleCRUD
+from app.crud.schedule import AsyncScheduleCRUD, ScheduleCRUD
+from app.database.instrumentation import start_query_stats, stop_query_stats
 from app.enums.models import ScheduleStatusEnum, UserRoleEnum
 from app.enums.operations import DeletionResult
 from app.errors import (
     ScheduleNotFoundError,
+    SchedulePreconditionFailedError,
 )
 from app.models.schedule import Schedule
+from app.models.user import User
+from app.utils.fieldsets import ScheduleFieldset
+from app.utils.pagination import ScheduleCursor
 from app.utils.timezone import get_local_now_naive
 
 
@@ -240,6 +248,68 @@ class TestScheduleCRUD:
         # Then: 驗證業務邏輯
         assert all(s.status == ScheduleStatusEnum.PENDING for s in schedules)
 
+    def test_create_schedules_bulk_insert_single_statement(self, db_session: Session):
+        """測試批次建立一個月的時段，只送出一個 INSERT 且不逐筆重新讀取。"""
+        # Given: 30 天、每天一個新時段
+        schedules_data = [
+            Schedule(
+                giver_id=1,
+                date=date(2024, 1, day),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                created_by=1,
+                created_by_role=UserRoleEnum.GIVER,
+                updated_by=1,
+                updated_by_role=UserRoleEnum.GIVER,
+            )
+            for day in range(1, 31)
+        ]
+        stats, token = start_query_stats()
+
+        # When: 建立多個時段
+        try:
+            schedules = self.crud.create_schedules(db_session, schedules_data)
+        finally:
+            stop_query_stats(token)
+
+        # Then: 一個 INSERT 加上每日統計的重新計算（DELETE + INSERT ... SELECT），
+        # 不逐筆重新讀取；id 依輸入順序遞增，預設值已填入
+        assert stats.round_trips == 3
+        ids = [s.id for s in schedules]
+        assert ids == sorted(ids) and len(set(ids)) == 30
+        assert all(s.status == ScheduleStatusEnum.DRAFT for s in schedules)
+        assert all(s.created_at is not None for s in schedules)
+
+        # Then: 資料庫中的資料與回傳物件一致
+        stored = db_session.get(Schedule, schedules[10].id)
+        assert stored.date == date(2024, 1, 11)
+        assert stored.created_at == schedules[10].created_at
+
+    def test_create_schedules_bulk_insert_without_returning(self):
+        """測試不支援 RETURNING 的資料庫（MySQL）以第一列 id 推算其餘 id。"""
+        # Given: 不支援 RETURNING 的資料庫會話，INSERT 回傳第一列的 id
+        mock_db = Mock(info={})
+        mock_db.get_bind.return_value.dialect.insert_returning = False
+        mock_db.execute.return_value.lastrowid = 41
+        schedules_data = [
+            Schedule(
+                giver_id=1,
+                date=date(2024, 1, day),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+            )
+            for day in range(1, 4)
+        ]
+
+        # When: 建立多個時段
+        schedules = self.crud.create_schedules(mock_db, schedules_data)
+
+        # Then: 時段只有單一 INSERT（其餘為每日統計的重新計算），id 依 auto_increment_increment 連續配置
+        statements = [call.args[0] for call in mock_db.execute.call_args_list]
+        assert [s.table.name for s in statements].count("schedules") == 1
+        mock_db.commit.assert_called_once()
+        assert [s.id for s in schedules] == [41, 42, 43]
+
     # ===== 查詢選項 =====
     def test_get_schedule_query_options_default(self):
         """測試取得時段查詢選項：預設行為。"""
@@ -439,6 +509,190 @@ class TestScheduleCRUD:
         assert len(schedules) == 1
         assert schedules[0].id == test_taker_schedule.id
 
+    def test_list_schedules_keyset_pagination(self, db_session: Session):
+        """測試以鍵集游標逐頁查詢，結果依 (date, start_time, id) 排序且不重複。"""
+        # Given: 同一 Giver 的 5 個時段，刻意打亂寫入順序，並有相同日期與開始時間
+        slots = [
+            (date(2024, 1, 2), time(9, 0)),
+            (date(2024, 1, 1), time(14, 0)),
+            (date(2024, 1, 1), time(9, 0)),
+            (date(2024, 1, 2), time(9, 0)),
+            (date(2024, 1, 1), time(9, 0)),
+        ]
+        db_session.add_all(
+            Schedule(
+                giver_id=1,
+                date=schedule_date,
+                start_time=start_time,
+                end_time=time(start_time.hour + 1, 0),
+                status=ScheduleStatusEnum.AVAILABLE,
+                created_by_role=UserRoleEnum.GIVER,
+                updated_by_role=UserRoleEnum.GIVER,
+            )
+            for schedule_date, start_time in slots
+        )
+        db_session.commit()
+
+        # When: 每頁 2 筆，以上一頁最後一筆作為游標逐頁查詢
+        pages = []
+        after = None
+        while True:
+            page = self.crud.list_schedules(
+                db_session, giver_id=1, limit=2, after=after
+            )
+            if not page:
+                break
+            pages.append(page)
+            last = page[-1]
+            after = ScheduleCursor(last.date, last.start_time, last.id)
+
+        # Then: 共 3 頁，串接後等於完整排序結果
+        assert [len(page) for page in pages] == [2, 2, 1]
+        walked = [schedule for page in pages for schedule in page]
+        expected = sorted(
+            self.crud.list_schedules(db_session, giver_id=1),
+            key=lambda s: (s.date, s.start_time, s.id),
+        )
+        assert [s.id for s in walked] == [s.id for s in expected]
+
+    def list_statements(self, db_session: Session, **kwargs) -> tuple[list, list[str]]:
+        """查詢時段列表，並記錄送出的 SQL 陳述式。"""
+        statements: list[str] = []
+
+        def record_statement(conn, cursor, statement, parameters, context, many):
+            statements.append(statement)
+
+        event.listen(Engine, "before_cursor_execute", record_statement)
+        try:
+            schedules = self.crud.list_schedules(db_session, **kwargs)
+        finally:
+            event.remove(Engine, "before_cursor_execute", record_statement)
+        return schedules, statements
+
+    def test_list_schedules_reads_only_schedules_table(
+        self, db_session: Session, test_giver_schedule: Schedule
+    ):
+        """測試預設的時段列表查詢不 JOIN 使用者資料表。"""
+        # When: 不指定欄位與關聯查詢時段列表
+        schedules, statements = self.list_statements(db_session, giver_id=1)
+
+        # Then: 單一查詢，只讀取 schedules 資料表
+        assert len(schedules) == 1
+        assert len(statements) == 1
+        assert "JOIN" not in statements[0]
+        assert "users" not in statements[0]
+
+    def test_list_schedules_with_fieldset(self, db_session: Session):
+        """測試指定欄位與關聯：只讀取指定的欄位，並 JOIN 指定的關聯。"""
+        # Given: Giver 與其時段
+        giver = User(name="王零一", email="giver@example.com")
+        db_session.add(giver)
+        db_session.commit()
+        giver_id = giver.id
+        db_session.add(
+            Schedule(
+                giver_id=giver_id,
+                date=date(2024, 1, 1),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                note="不需要的備註",
+            )
+        )
+        db_session.commit()
+        db_session.expunge_all()
+
+        # When: 只查詢結束時間並附加 Giver
+        schedules, statements = self.list_statements(
+            db_session,
+            giver_id=giver_id,
+            fieldset=ScheduleFieldset(("end_time",), ("giver",)),
+        )
+
+        # Then: 單一查詢取得 Giver 名稱，未指定的欄位沒有讀取
+        assert len(statements) == 1
+        assert statements[0].count("JOIN") == 1
+        assert "note" not in statements[0]
+        assert schedules[0].giver.name == "王零一"
+        assert schedules[0].end_time == time(10, 0)
+        assert {"note", "created_at"} <= inspect(schedules[0]).unloaded
+
+    def test_list_schedule_rows_matches_orm_path(self, db_session: Session):
+        """測試 Core 讀取路徑的資料列與 ORM 查詢結果相同，且不建立 ORM 物件。"""
+        # Given: 同一 Giver 的多個時段，其中一個已軟刪除
+        db_session.add_all(
+            Schedule(
+                giver_id=1,
+                date=date(2024, 1, day),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+                deleted_at=get_local_now_naive() if day == 3 else None,
+            )
+            for day in (2, 1, 3, 4)
+        )
+        db_session.commit()
+        expected = [
+            (s.id, s.date, s.start_time, s.end_time)
+            for s in self.crud.list_schedules(db_session, giver_id=1, limit=2)
+        ]
+        db_session.expunge_all()
+
+        # When: 以 Core 讀取路徑查詢相同條件的第一頁
+        rows = self.crud.list_schedule_rows(db_session, giver_id=1, limit=2)
+
+        # Then: 順序與欄位值相同，identity map 中沒有任何時段物件
+        assert [(r.id, r.date, r.start_time, r.end_time) for r in rows] == expected
+        assert not any(isinstance(obj, Schedule) for obj in db_session)
+
+        # When: 以最後一筆作為游標，只查詢指定的欄位
+        last = rows[-1]
+        rows = self.crud.list_schedule_rows(
+            db_session,
+            giver_id=1,
+            after=ScheduleCursor(last.date, last.start_time, last.id),
+            fields=("end_time",),
+        )
+
+        # Then: 跳過已軟刪除的時段，資料列只包含排序鍵與指定的欄位
+        assert [r.date for r in rows] == [date(2024, 1, 4)]
+        assert set(rows[0]._mapping) == {"id", "date", "start_time", "end_time"}
+
+    def test_list_validator_changes_on_write(self, db_session: Session):
+        """測試時段列表驗證器：更新與軟刪除都會改變，其他 Giver 的寫入不影響。"""
+        # Given: 兩個 Giver 各一個時段
+        schedules = [
+            Schedule(
+                giver_id=giver_id,
+                date=date(2024, 1, 1),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+            )
+            for giver_id in (1, 2)
+        ]
+        db_session.add_all(schedules)
+        db_session.commit()
+        ids = [s.id for s in schedules]
+        initial = self.crud.get_list_validator(db_session, giver_id=1)
+
+        # When & Then: 其他 Giver 的時段更新不影響驗證器
+        self.crud.update_schedule(
+            db_session, ids[1], 2, UserRoleEnum.GIVER, note="其他 Giver"
+        )
+        assert self.crud.get_list_validator(db_session, giver_id=1) == initial
+
+        # When & Then: 更新時段後版本號總和改變
+        self.crud.update_schedule(
+            db_session, ids[0], 1, UserRoleEnum.GIVER, note="更新"
+        )
+        updated = self.crud.get_list_validator(db_session, giver_id=1)
+        assert updated.version_sum == initial.version_sum + 1
+
+        # When & Then: 軟刪除後筆數減少，版本號查詢視為不存在
+        assert self.crud.get_schedule_version(db_session, ids[0]) == 2
+        self.crud.delete_schedule(db_session, ids[0], 1, UserRoleEnum.GIVER)
+        deleted = self.crud.get_list_validator(db_session, giver_id=1)
+        assert (deleted.count, deleted.max_id) == (0, None)
+        assert self.crud.get_schedule_version(db_session, ids[0]) is None
+
     # ===== 查詢單一時段（排除軟刪除） =====
     def test_get_schedule_success(
         self,
@@ -702,6 +956,121 @@ class TestScheduleCRUD:
                 note="測試時段不存在",
             )
 
+    def test_update_schedule_if_version_success(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試以版本號條件更新時段：單一 UPDATE 陳述式，版本號遞增。"""
+        # Given: 時段目前為版本 1
+        schedule_id = test_giver_schedule.id
+        assert test_giver_schedule.version == 1
+
+        # When: 以版本 1 更新備註
+        stats, token = start_query_stats()
+        try:
+            updated_schedule = self.crud.update_schedule_if_version(
+                db_session,
+                schedule_id,
+                1,
+                updated_by=test_giver_schedule.giver_id,
+                updated_by_role=UserRoleEnum.GIVER,
+                note="條件式更新",
+            )
+        finally:
+            stop_query_stats(token)
+
+        # Then: 不先讀取，以 UPDATE ... RETURNING 完成；版本號遞增
+        assert stats.round_trips == 1
+        assert updated_schedule.id == schedule_id
+        assert updated_schedule.note == "條件式更新"
+        assert updated_schedule.version == 2
+        assert updated_schedule.updated_by_role == UserRoleEnum.GIVER
+
+    def test_update_schedule_if_version_mismatch(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試以版本號條件更新時段：412 版本不符，資料不變。"""
+        # Given: 時段目前為版本 1
+        schedule_id = test_giver_schedule.id
+
+        # When & Then: 以過期的版本更新，拋出 SchedulePreconditionFailedError
+        with pytest.raises(SchedulePreconditionFailedError) as exc_info:
+            self.crud.update_schedule_if_version(
+                db_session,
+                schedule_id,
+                5,
+                updated_by=test_giver_schedule.giver_id,
+                updated_by_role=UserRoleEnum.GIVER,
+                note="不應寫入",
+            )
+
+        # Then: 錯誤包含預期與目前的版本，資料沒有被修改
+        assert exc_info.value.details == {"expected_version": 5, "current_version": 1}
+        db_session.expire_all()
+        schedule = db_session.get(Schedule, schedule_id)
+        assert schedule.note == "Giver 提供的可預約時段"
+        assert schedule.version == 1
+
+    def test_update_schedule_if_version_not_found(self, db_session: Session):
+        """測試以版本號條件更新時段：404 資源不存在錯誤。"""
+        # When & Then: 更新不存在的時段
+        with pytest.raises(ScheduleNotFoundError, match="時段不存在: ID=999"):
+            self.crud.update_schedule_if_version(
+                db_session,
+                999,
+                1,
+                updated_by=1,
+                updated_by_role=UserRoleEnum.SYSTEM,
+                note="測試時段不存在",
+            )
+
+    def test_update_schedule_concurrent_modification(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試讀取後被其他請求修改：寫入時版本條件不成立，拋出 412 錯誤。"""
+        # Given: 以版本 1 讀取時段（不鎖定）
+        schedule_id = test_giver_schedule.id
+        schedule = self.crud.get_schedule_for_update(
+            db_session, schedule_id, expected_version=1
+        )
+
+        # Given: 讀取後，其他請求將版本更新為 2
+        db_session.execute(
+            update(Schedule)
+            .where(Schedule.id == schedule_id)
+            .values(version=2)
+            .execution_options(synchronize_session=False)
+        )
+
+        # When & Then: 沿用讀取時的物件寫入
+        with pytest.raises(SchedulePreconditionFailedError):
+            self.crud.update_schedule(
+                db_session,
+                schedule_id,
+                updated_by=test_giver_schedule.giver_id,
+                updated_by_role=UserRoleEnum.GIVER,
+                schedule=schedule,
+                expected_version=1,
+                note="不應寫入",
+            )
+
+    def test_get_schedule_for_update_version_mismatch(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試以過期的版本讀取時段供更新：立即拋出 412 錯誤。"""
+        # When & Then: 以過期的版本讀取
+        with pytest.raises(SchedulePreconditionFailedError):
+            self.crud.get_schedule_for_update(
+                db_session, test_giver_schedule.id, expected_version=2
+            )
+
     # ===== 軟刪除時段 =====
     def test_delete_schedule_success(
         self,
@@ -868,3 +1237,287 @@ class TestScheduleCRUD:
         db_session.refresh(schedule)
         assert schedule.status == status
         assert schedule.deleted_at is None
+
+    def test_delete_schedule_single_statement(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試軟刪除時段只送出一個條件式 UPDATE，不先讀取時段。"""
+        # Given: 時段 ID
+        schedule_id = test_giver_schedule.id
+
+        # When: 軟刪除時段
+        stats, token = start_query_stats()
+        try:
+            result = self.crud.delete_schedule(
+                db_session,
+                schedule_id,
+                deleted_by=1,
+                deleted_by_role=UserRoleEnum.GIVER,
+            )
+        finally:
+            stop_query_stats(token)
+
+        # Then: 刪除成功，一個 UPDATE 加上每日統計的重新計算（DELETE + INSERT ... SELECT）
+        assert result == DeletionResult.SUCCESS
+        assert stats.round_trips == 3
+
+    def test_delete_schedule_version_mismatch(
+        self,
+        db_session: Session,
+        test_giver_schedule: Schedule,
+    ):
+        """測試以過期的版本軟刪除時段：不刪除並回傳版本不符。"""
+        # When: 以錯誤的版本刪除
+        result = self.crud.delete_schedule(
+            db_session,
+            test_giver_schedule.id,
+            deleted_by=1,
+            deleted_by_role=UserRoleEnum.GIVER,
+            expected_version=2,
+        )
+
+        # Then: 回傳版本不符，時段沒有被刪除
+        assert result == DeletionResult.VERSION_MISMATCH
+        db_session.refresh(test_giver_schedule)
+        assert test_giver_schedule.deleted_at is None
+
+    def test_delete_schedules_by_filter(self, db_session: Session):
+        """測試依條件批次軟刪除時段：只刪除符合條件且狀態允許的時段。"""
+        # Given: Giver 1 在 1/1、1/2、1/3 各有時段，另有 Giver 2 的時段
+        schedules = {
+            "available_day1": (1, date(2024, 1, 1), ScheduleStatusEnum.AVAILABLE),
+            "available_day2": (1, date(2024, 1, 2), ScheduleStatusEnum.AVAILABLE),
+            "pending_day2": (1, date(2024, 1, 2), ScheduleStatusEnum.PENDING),
+            "accepted_day2": (1, date(2024, 1, 2), ScheduleStatusEnum.ACCEPTED),
+            "available_day3": (1, date(2024, 1, 3), ScheduleStatusEnum.AVAILABLE),
+            "other_giver": (2, date(2024, 1, 1), ScheduleStatusEnum.AVAILABLE),
+        }
+        rows = {
+            name: Schedule(
+                giver_id=giver_id,
+                date=schedule_date,
+                start_time=time(9 + i, 0),
+                end_time=time(10 + i, 0),
+                status=schedule_status,
+            )
+            for i, (name, (giver_id, schedule_date, schedule_status)) in enumerate(
+                schedules.items()
+            )
+        }
+        db_session.add_all(rows.values())
+        db_session.commit()
+
+        # When: 刪除 Giver 1 在 1/1、1/2 的 AVAILABLE 時段
+        deleted_count = self.crud.delete_schedules_by_filter(
+            db_session,
+            giver_id=1,
+            dates=[date(2024, 1, 1), date(2024, 1, 2)],
+            status_filter=ScheduleStatusEnum.AVAILABLE,
+            deleted_by=1,
+            deleted_by_role=UserRoleEnum.GIVER,
+        )
+
+        # Then: 只刪除符合條件的兩個時段
+        assert deleted_count == 2
+        deleted = {name for name, row in rows.items() if row.deleted_at is not None}
+        assert deleted == {"available_day1", "available_day2"}
+        assert rows["available_day1"].status == ScheduleStatusEnum.CANCELLED
+        assert rows["available_day1"].version == 2
+
+    def test_delete_schedules_by_filter_keeps_final_states(self, db_session: Session):
+        """測試批次軟刪除時段：未指定狀態時仍不刪除已接受或已完成的時段。"""
+        # Given: 同一天有可刪除與不可刪除的時段
+        rows = [
+            Schedule(
+                giver_id=1,
+                date=date(2024, 1, 1),
+                start_time=time(9 + i, 0),
+                end_time=time(10 + i, 0),
+                status=schedule_status,
+            )
+            for i, schedule_status in enumerate(
+                [
+                    ScheduleStatusEnum.DRAFT,
+                    ScheduleStatusEnum.ACCEPTED,
+                    ScheduleStatusEnum.COMPLETED,
+                ]
+            )
+        ]
+        db_session.add_all(rows)
+        db_session.commit()
+
+        # When: 不指定狀態批次刪除
+        deleted_count = self.crud.delete_schedules_by_filter(
+            db_session, giver_id=1, dates=[date(2024, 1, 1)]
+        )
+
+        # Then: 只刪除草稿時段
+        assert deleted_count == 1
+        assert [row.deleted_at is not None for row in rows] == [True, False, False]
+
+    # ===== 批次交易 =====
+    def test_batch_transaction_commits_once(self, db_session: Session):
+        """測試批次交易：多個寫入只 commit 一次，區間索引在 commit 後才失效。"""
+        # Given: 資料庫中的一個時段，以及模擬的區間索引
+        existing = Schedule(
+            giver_id=1,
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+            status=ScheduleStatusEnum.AVAILABLE,
+        )
+        db_session.add(existing)
+        db_session.commit()
+        existing_id = existing.id
+        new = Schedule(
+            giver_id=1,
+            date=date(2024, 1, 2),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        index = Mock()
+
+        # When: 在批次交易中建立一個時段並刪除另一個時段
+        with (
+            patch("app.crud.schedule.schedule_interval_index", index),
+            patch.object(db_session, "commit", wraps=db_session.commit) as commit,
+        ):
+            with self.crud.batch_transaction(db_session):
+                self.crud.create_schedules(db_session, [new])
+                result = self.crud.delete_schedule(db_session, existing_id, 1)
+                assert self.crud.in_batch(db_session)
+                index.invalidate.assert_not_called()
+
+        # Then: 只 commit 一次，兩個 Giver 日一起失效
+        assert result == DeletionResult.SUCCESS
+        commit.assert_called_once()
+        assert not self.crud.in_batch(db_session)
+        index.invalidate.assert_called_once()
+        assert set(index.invalidate.call_args.args[0]) == {
+            (1, date(2024, 1, 1)),
+            (1, date(2024, 1, 2)),
+        }
+
+    def test_batch_transaction_rolls_back_on_error(self, db_session: Session):
+        """測試批次交易：任一操作失敗時，先前的寫入一起回滾。"""
+        # Given: 要建立的時段
+        new = Schedule(
+            giver_id=1,
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+
+        # When: 建立後的操作拋出錯誤
+        with pytest.raises(ScheduleNotFoundError):
+            with self.crud.batch_transaction(db_session):
+                self.crud.create_schedules(db_session, [new])
+                self.crud.get_schedule_for_update(db_session, 99999)
+
+        # Then: 建立的時段沒有寫入資料庫
+        assert not self.crud.in_batch(db_session)
+        assert db_session.query(Schedule).count() == 0
+
+    def test_on_commit_deferred_in_batch(self, db_session: Session):
+        """測試 commit 後回呼：批次交易中延到 commit 之後執行，回滾時不執行。"""
+        # Given: 模擬的回呼
+        callback = Mock()
+
+        # When & Then: 批次交易外立即執行
+        self.crud.on_commit(db_session, callback)
+        callback.assert_called_once()
+        callback.reset_mock()
+
+        # When & Then: 批次交易中延到整批 commit 之後
+        with self.crud.batch_transaction(db_session):
+            self.crud.on_commit(db_session, callback)
+            callback.assert_not_called()
+        callback.assert_called_once()
+        callback.reset_mock()
+
+        # When & Then: 整批回滾時不執行
+        with pytest.raises(ScheduleNotFoundError):
+            with self.crud.batch_transaction(db_session):
+                self.crud.on_commit(db_session, callback)
+                self.crud.get_schedule_for_update(db_session, 99999)
+        callback.assert_not_called()
+
+
+class TestAsyncScheduleCRUD:
+    """時段 CRUD 操作測試類別（非同步版本）。"""
+
+    @pytest.fixture(autouse=True)
+    def setup_crud(self):
+        """設定非同步 CRUD 實例，每個測試自動使用。"""
+        self.crud = AsyncScheduleCRUD()
+
+    @pytest.mark.asyncio
+    async def test_create_get_and_delete_schedule(self, async_db_session):
+        """測試非同步建立、查詢與軟刪除時段。"""
+        # Given: 建立 Giver 提供的時段
+        schedule = Schedule(
+            giver_id=1,
+            status=ScheduleStatusEnum.AVAILABLE,
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        created = await self.crud.create_schedules(async_db_session, [schedule])
+
+        # When: 查詢剛建立的時段
+        fetched = await self.crud.get_schedule(async_db_session, created[0].id)
+
+        # Then: 資料一致
+        assert fetched.id == created[0].id
+        assert fetched.start_time == time(9, 0)
+
+        # When: 軟刪除時段
+        result = await self.crud.delete_schedule(
+            async_db_session, created[0].id, 1, UserRoleEnum.GIVER
+        )
+
+        # Then: 刪除成功，且一般查詢找不到、包含已刪除的查詢仍找得到
+        assert result == DeletionResult.SUCCESS
+        with pytest.raises(ScheduleNotFoundError):
+            await self.crud.get_schedule(async_db_session, created[0].id)
+        deleted = await self.crud.get_schedule_including_deleted(
+            async_db_session, created[0].id
+        )
+        assert deleted is not None
+        assert deleted.deleted_at is not None
+
+    @pytest.mark.asyncio
+    async def test_stream_schedule_rows_in_batches(self, async_db_session):
+        """測試以伺服器端游標分批串流時段資料列，並套用日期範圍。"""
+        # Given: 同一 Giver 連續 6 天的時段
+        await self.crud.create_schedules(
+            async_db_session,
+            [
+                Schedule(
+                    giver_id=1,
+                    date=date(2024, 1, day),
+                    start_time=time(9, 0),
+                    end_time=time(10, 0),
+                )
+                for day in range(1, 7)
+            ],
+        )
+
+        # When: 每批 2 筆，串流匯出 1/2 至 1/6 的日期與時間
+        batches = [
+            rows
+            async for rows in self.crud.stream_schedule_rows(
+                async_db_session,
+                giver_id=1,
+                fields=("date",),
+                date_from=date(2024, 1, 2),
+                date_to=date(2024, 1, 6),
+                batch_size=2,
+            )
+        ]
+
+        # Then: 依日期排序分成 2、2、1 筆三批
+        assert [len(rows) for rows in batches] == [2, 2, 1]
+        assert [row.date.day for rows in batches for row in rows] == [2, 3, 4, 5, 6]
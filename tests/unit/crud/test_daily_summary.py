@@ -0,0 +1,176 @@
+"""Giver 每日時段狀態統計 CRUD 測試。
+
+測試時段寫入在同一個交易中維護統計，以及依時段批次重建。
+"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+import pytest
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.crud.daily_summary import GiverDailySummaryCRUD
+from app.crud.schedule import ScheduleCRUD
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.enums.operations import DeletionResult
+from app.models.giver_daily_summary import GiverDailySummary
+from app.models.schedule import Schedule
+
+DAY_1 = date(2024, 1, 1)
+DAY_2 = date(2024, 1, 2)
+
+
+def _schedule(
+    giver_id: int = 1,
+    day: date = DAY_1,
+    hour: int = 9,
+    status: ScheduleStatusEnum = ScheduleStatusEnum.AVAILABLE,
+) -> Schedule:
+    """建立尚未寫入的時段。"""
+    return Schedule(
+        giver_id=giver_id,
+        status=status,
+        date=day,
+        start_time=time(hour, 0),
+        end_time=time(hour + 1, 0),
+    )
+
+
+def _summaries(db: Session) -> dict[tuple[int, date], dict[str, int]]:
+    """取得所有統計中不為 0 的狀態數量。"""
+    rows = db.scalars(select(GiverDailySummary)).all()
+    return {
+        (row.giver_id, row.date): {
+            status.value: getattr(row, f"{status.value.lower()}_count")
+            for status in ScheduleStatusEnum
+            if getattr(row, f"{status.value.lower()}_count")
+        }
+        for row in rows
+    }
+
+
+class TestGiverDailySummaryCRUD:
+    """Giver 每日時段狀態統計 CRUD 測試類別。"""
+
+    @pytest.fixture(autouse=True)
+    def setup_crud(self):
+        """設定 CRUD 實例，每個測試自動使用。"""
+        self.crud = GiverDailySummaryCRUD()
+        self.schedule_crud = ScheduleCRUD()
+
+    def test_maintained_by_writes(self, db_session: Session):
+        """測試建立、更新狀態與日期、軟刪除時段時，統計隨之更新。"""
+        # Given: Giver 1 第一天兩個可預約時段、一個待回覆時段
+        schedules = self.schedule_crud.create_schedules(
+            db_session,
+            [
+                _schedule(hour=9),
+                _schedule(hour=11),
+                _schedule(hour=13, status=ScheduleStatusEnum.PENDING),
+            ],
+        )
+        assert _summaries(db_session) == {(1, DAY_1): {"AVAILABLE": 2, "PENDING": 1}}
+
+        # When: 接受待回覆的時段、將一個可預約時段改到第二天、刪除另一個可預約時段
+        self.schedule_crud.update_schedule(
+            db_session,
+            schedules[2].id,
+            updated_by=1,
+            updated_by_role=UserRoleEnum.GIVER,
+            status=ScheduleStatusEnum.ACCEPTED,
+        )
+        self.schedule_crud.update_schedule(
+            db_session,
+            schedules[1].id,
+            updated_by=1,
+            updated_by_role=UserRoleEnum.GIVER,
+            schedule_date=DAY_2,
+        )
+        result = self.schedule_crud.delete_schedule(db_session, schedules[0].id)
+
+        # Then: 已刪除的時段不計入，沒有時段的日期不保留資料列
+        assert result == DeletionResult.SUCCESS
+        assert _summaries(db_session) == {
+            (1, DAY_1): {"ACCEPTED": 1},
+            (1, DAY_2): {"AVAILABLE": 1},
+        }
+
+    def test_conditional_update_moves_giver(self, db_session: Session):
+        """測試條件式更新改變 Giver 時，原 Giver 與新 Giver 的統計都更新。"""
+        # Given: Giver 1 的時段
+        (schedule,) = self.schedule_crud.create_schedules(db_session, [_schedule()])
+
+        # When: 以版本號條件更新為 Giver 2
+        self.schedule_crud.update_schedule_if_version(
+            db_session,
+            schedule.id,
+            1,
+            updated_by=1,
+            updated_by_role=UserRoleEnum.GIVER,
+            giver_id=2,
+        )
+
+        # Then: 統計移到 Giver 2
+        assert _summaries(db_session) == {(2, DAY_1): {"AVAILABLE": 1}}
+
+    def test_batch_and_bulk_delete(self, db_session: Session):
+        """測試批次交易在 commit 前一次更新統計，依條件批次刪除也更新統計。"""
+        # Given: 批次交易中建立兩天的時段
+        with self.schedule_crud.batch_transaction(db_session):
+            self.schedule_crud.create_schedules(db_session, [_schedule(day=DAY_1)])
+            self.schedule_crud.create_schedules(db_session, [_schedule(day=DAY_2)])
+        assert set(_summaries(db_session)) == {(1, DAY_1), (1, DAY_2)}
+
+        # When: 依條件刪除第一天的時段
+        self.schedule_crud.delete_schedules_by_filter(db_session, 1, [DAY_1])
+
+        # Then: 只剩第二天
+        assert _summaries(db_session) == {(1, DAY_2): {"AVAILABLE": 1}}
+
+    def test_note_update_skips_summary(self, db_session: Session):
+        """測試只更新備註時不重新計算統計。"""
+        # Given: 時段，統計已被清空（模擬不一致）
+        (schedule,) = self.schedule_crud.create_schedules(db_session, [_schedule()])
+        db_session.execute(delete(GiverDailySummary))
+        db_session.commit()
+
+        # When: 只更新備註
+        self.schedule_crud.update_schedule(
+            db_session,
+            schedule.id,
+            updated_by=1,
+            updated_by_role=UserRoleEnum.GIVER,
+            note="新的備註",
+        )
+
+        # Then: 統計未重新計算
+        assert _summaries(db_session) == {}
+
+    def test_rebuild_and_list(self, db_session: Session):
+        """測試依時段批次重建統計，並依日期範圍查詢。"""
+        # Given: 不經過 CRUD 直接寫入的時段（統計不存在）
+        db_session.add_all(
+            [
+                _schedule(giver_id=1, day=DAY_1),
+                _schedule(giver_id=1, day=DAY_2, status=ScheduleStatusEnum.PENDING),
+                _schedule(giver_id=2, day=DAY_1),
+            ]
+        )
+        db_session.commit()
+
+        # When: 只重建 Giver 1，再重建整張表
+        giver_count = self.crud.rebuild(db_session, giver_id=1)
+        total_count = self.crud.rebuild(db_session)
+
+        # Then: 統計與時段一致，查詢依日期排序並限制在範圍內
+        assert giver_count == 2
+        assert total_count == 3
+        summaries = self.crud.list_summaries(db_session, 1, DAY_1, DAY_2)
+        assert [(s.date, s.available_count, s.pending_count) for s in summaries] == [
+            (DAY_1, 1, 0),
+            (DAY_2, 0, 1),
+        ]
+        assert len(self.crud.list_summaries(db_session, 1, DAY_2, DAY_2)) == 1
@@ -0,0 +1,154 @@
+"""時段區間索引測試模組。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+from unittest.mock import patch
+
+# ===== 第三方套件 =====
+import pytest
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleIntervalIndex
+from app.crud.schedule import ScheduleCRUD
+from app.database.instrumentation import start_query_stats, stop_query_stats
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.models.schedule import Schedule
+
+SCHEDULE_DATE = date(2024, 1, 1)
+
+
+def new_schedule(start_hour: int, end_hour: int, giver_id: int = 1) -> Schedule:
+    """建立測試用的時段 ORM 物件。"""
+    return Schedule(
+        giver_id=giver_id,
+        status=ScheduleStatusEnum.AVAILABLE,
+        date=SCHEDULE_DATE,
+        start_time=time(start_hour, 0),
+        end_time=time(end_hour, 0),
+        created_by_role=UserRoleEnum.GIVER,
+        updated_by_role=UserRoleEnum.GIVER,
+    )
+
+
+class TestScheduleIntervalIndex:
+    """時段區間索引測試類別。"""
+
+    @pytest.fixture
+    def index(self):
+        """建立啟用中、不過期的索引，並取代 CRUD 使用的全域索引。"""
+        index = ScheduleIntervalIndex(enabled=True)
+        with patch("app.crud.schedule.schedule_interval_index", index):
+            yield index
+
+    def find(self, index, db_session, start_hour, end_hour, exclude_id=None):
+        """查詢重疊時段，回傳 id 列表。"""
+        return [
+            interval.id
+            for interval in index.find_overlapping(
+                db_session,
+                1,
+                SCHEDULE_DATE,
+                time(start_hour, 0),
+                time(end_hour, 0),
+                exclude_schedule_id=exclude_id,
+            )
+        ]
+
+    def test_answers_from_memory_after_first_load(
+        self, index: ScheduleIntervalIndex, db_session: Session
+    ):
+        """測試第一次查詢載入後，後續查詢不再送出 SQL。"""
+        # Given: 資料庫中的三個不重疊時段
+        schedules = [new_schedule(9, 10), new_schedule(11, 12), new_schedule(13, 14)]
+        ScheduleCRUD().create_schedules(db_session, schedules)
+        ids = [s.id for s in schedules]
+
+        # When: 第一次查詢載入索引，之後的查詢記錄往返次數
+        assert self.find(index, db_session, 8, 9) == []
+        stats, token = start_query_stats()
+        try:
+            results = [
+                self.find(index, db_session, 9, 11),  # 與第一個重疊、與第二個相鄰
+                self.find(index, db_session, 9, 14),  # 涵蓋全部
+                self.find(index, db_session, 12, 13),  # 位於間隙
+                self.find(index, db_session, 9, 14, exclude_id=ids[1]),  # 排除自己
+            ]
+        finally:
+            stop_query_stats(token)
+
+        # Then: 結果正確，且沒有任何資料庫往返
+        assert results == [[ids[0]], ids, [], [ids[0], ids[2]]]
+        assert stats.round_trips == 0
+        assert index.get_stats()["hits"] == 4
+
+    def test_crud_writes_invalidate_index(
+        self, index: ScheduleIntervalIndex, db_session: Session
+    ):
+        """測試透過 CRUD 建立、更新、刪除時段後，索引反映最新資料。"""
+        crud = ScheduleCRUD()
+        assert self.find(index, db_session, 9, 10) == []
+
+        # When & Then: 建立時段後可查到
+        schedule = crud.create_schedules(db_session, [new_schedule(9, 10)])[0]
+        assert self.find(index, db_session, 9, 10) == [schedule.id]
+
+        # When & Then: 更新時間後，舊時間不再重疊
+        crud.update_schedule(
+            db_session,
+            schedule.id,
+            updated_by=1,
+            updated_by_role=UserRoleEnum.GIVER,
+            start_time=time(15, 0),
+            end_time=time(16, 0),
+        )
+        assert self.find(index, db_session, 9, 10) == []
+        assert self.find(index, db_session, 15, 16) == [schedule.id]
+
+        # When & Then: 刪除後查不到
+        crud.delete_schedule(db_session, schedule.id, 1, UserRoleEnum.GIVER)
+        assert self.find(index, db_session, 15, 16) == []
+
+    def test_verify_mode_detects_stale_index(self, db_session: Session):
+        """測試一致性檢查模式發現索引過期時，以資料庫結果為準。"""
+        # Given: 已載入的索引，之後有一筆未經 CRUD 的寫入（例如其他 worker）
+        index = ScheduleIntervalIndex(enabled=True, verify=True)
+        assert self.find(index, db_session, 9, 10) == []
+        schedule = new_schedule(9, 10)
+        db_session.add(schedule)
+        db_session.commit()
+
+        # When: 再次查詢
+        result = self.find(index, db_session, 9, 10)
+
+        # Then: 回傳資料庫的答案，並記錄不一致次數
+        assert result == [schedule.id]
+        assert index.get_stats()["mismatches"] == 1
+
+    def test_expired_entries_are_reloaded(self, db_session: Session):
+        """測試超過存活時間的 Giver 日會重新從資料庫載入。"""
+        # Given: 存活時間為 0 的索引，以及一筆未經 CRUD 的寫入
+        index = ScheduleIntervalIndex(enabled=True, ttl_seconds=0)
+        assert self.find(index, db_session, 9, 10) == []
+        schedule = new_schedule(9, 10)
+        db_session.add(schedule)
+        db_session.commit()
+
+        # When & Then: 過期後重新載入，查到新時段
+        assert self.find(index, db_session, 9, 10) == [schedule.id]
+        assert index.get_stats()["misses"] == 2
+
+    def test_invalidate_schedule_drops_containing_day(self, db_session: Session):
+        """測試依時段 id 失效時，只移除包含該時段的 Giver 日。"""
+        # Given: 兩個 Giver 日都已載入索引
+        index = ScheduleIntervalIndex(enabled=True)
+        schedules = [new_schedule(9, 10, giver_id=1), new_schedule(9, 10, giver_id=2)]
+        ScheduleCRUD().create_schedules(db_session, schedules)
+        index.get_intervals(db_session, [(1, SCHEDULE_DATE), (2, SCHEDULE_DATE)])
+        assert index.get_stats()["giver_days"] == 2
+
+        # When: 使第一個時段失效
+        index.invalidate_schedule(schedules[0].id)
+
+        # Then: 只剩另一個 Giver 日
+        assert index.get_stats()["giver_days"] == 1
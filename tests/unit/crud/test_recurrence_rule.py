@@ -0,0 +1,60 @@
+"""週期規則快取測試模組。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+from sqlalchemy.orm import Session
+
+# ===== 本地模組 =====
+from app.crud.recurrence_rule import RecurrencePatternCache
+from app.database.instrumentation import start_query_stats, stop_query_stats
+from app.enums.models import RecurrenceFrequencyEnum, UserRoleEnum
+from app.models.recurrence_rule import RecurrenceRule
+
+
+def add_rule(db_session: Session, giver_id: int = 1) -> RecurrenceRule:
+    """在資料庫中建立每天 9 點到 10 點的週期規則。"""
+    rule = RecurrenceRule(
+        giver_id=giver_id,
+        frequency=RecurrenceFrequencyEnum.DAILY,
+        start_time=time(9, 0),
+        end_time=time(10, 0),
+        starts_on=date(2024, 1, 1),
+        created_by_role=UserRoleEnum.GIVER,
+    )
+    db_session.add(rule)
+    db_session.commit()
+    return rule
+
+
+class TestRecurrencePatternCache:
+    """週期規則快取測試類別。"""
+
+    def test_answers_from_memory_until_invalidated(self, db_session: Session):
+        """測試第一次載入後由記憶體回答，失效後重新載入。"""
+        # GIVEN：Giver 1 有一條週期規則，且已載入快取
+        rule = add_rule(db_session)
+        cache = RecurrencePatternCache()
+        assert [p.id for p in cache.get_rule_patterns(db_session, [1])] == [rule.id]
+
+        # WHEN：再次查詢
+        stats, token = start_query_stats()
+        try:
+            patterns = cache.get_rule_patterns(db_session, [1])
+        finally:
+            stop_query_stats(token)
+
+        # THEN：不查詢資料庫
+        assert [p.id for p in patterns] == [rule.id]
+        assert stats.round_trips == 0
+        assert cache.get_stats()["hits"] == 1
+
+        # WHEN：新增規則並使 Giver 1 失效
+        other = add_rule(db_session)
+        cache.invalidate_rules([1])
+
+        # THEN：重新載入，包含新規則
+        ids = {p.id for p in cache.get_rule_patterns(db_session, [1])}
+        assert ids == {rule.id, other.id}
+        assert cache.get_stats()["misses"] == 2
@@ -0,0 +1 @@
+"""資料庫模組測試。"""
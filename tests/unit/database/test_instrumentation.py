@@ -0,0 +1,183 @@
+"""資料庫查詢統計與連線設定測試。"""
+
+# ===== 標準函式庫 =====
+from unittest.mock import patch
+
+# ===== 第三方套件 =====
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.pool import StaticPool
+
+# ===== 本地模組 =====
+from app.database import connection
+from app.database.instrumentation import (
+    get_query_stats,
+    start_query_stats,
+    stop_query_stats,
+    TimedQueuePool,
+)
+from app.metrics import (
+    DB_POOL_CHECKOUT_WAIT,
+    DB_QUERIES_PER_REQUEST,
+    registry,
+)
+from app.middleware.query_stats import QueryStatsMiddleware
+
+
+class TestQueryStats:
+    """查詢統計測試類別。"""
+
+    def test_counts_round_trips_while_recording(self, db_session: Session):
+        """測試開始記錄後，每次送出 SQL 都會累加往返次數。"""
+        # GIVEN：開始記錄查詢統計
+        stats, token = start_query_stats()
+
+        # WHEN：執行兩次查詢
+        try:
+            db_session.execute(text("SELECT 1"))
+            db_session.execute(text("SELECT 2"))
+        finally:
+            stop_query_stats(token)
+
+        # THEN：記錄到兩次往返與執行時間，且結束後不再記錄
+        assert stats.round_trips == 2
+        assert stats.query_seconds > 0
+        assert get_query_stats() is None
+
+    def test_ignores_queries_outside_recording(self, db_session: Session):
+        """測試未開始記錄時，查詢不會被計入。"""
+        # GIVEN：先執行一次未記錄的查詢
+        db_session.execute(text("SELECT 1"))
+
+        # WHEN：開始記錄，不執行查詢
+        stats, token = start_query_stats()
+        stop_query_stats(token)
+
+        # THEN：沒有任何往返
+        assert stats.round_trips == 0
+
+    @pytest.mark.asyncio
+    async def test_counts_round_trips_from_async_session(
+        self, async_db_session: AsyncSession
+    ):
+        """測試 AsyncSession 的查詢也會計入同一份統計。"""
+        # GIVEN：開始記錄查詢統計
+        stats, token = start_query_stats()
+
+        # WHEN：透過 AsyncSession 執行查詢
+        try:
+            await async_db_session.execute(text("SELECT 1"))
+        finally:
+            stop_query_stats(token)
+
+        # THEN：記錄到一次往返
+        assert stats.round_trips == 1
+
+
+class TestSessionDependencies:
+    """資料庫會話依賴注入測試類別。"""
+
+    def test_get_db_sends_no_setup_queries(self, db_session: Session):
+        """測試 get_db 不再為每個請求送出連線設定或檢查查詢。"""
+        # GIVEN：以測試用資料庫取代全域的引擎與會話工廠
+        bind = db_session.get_bind()
+        with (
+            patch.object(connection, "engine", bind),
+            patch.object(connection, "SessionLocal", sessionmaker(bind=bind)),
+        ):
+            stats, token = start_query_stats()
+
+            # WHEN：取得並關閉資料庫會話
+            try:
+                generator = connection.get_db()
+                next(generator)
+                generator.close()
+            finally:
+                stop_query_stats(token)
+
+        # THEN：沒有任何資料庫往返
+        assert stats.round_trips == 0
+
+    def test_middleware_counts_round_trips_per_request(self):
+        """測試中間件為每個請求各自記錄往返次數。"""
+        # GIVEN：使用查詢統計中間件的應用程式，路由回傳目前的往返次數
+        # 同步路由在執行緒池中執行，使用允許跨執行緒共用的記憶體資料庫
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        app = FastAPI()
+        app.add_middleware(QueryStatsMiddleware)
+
+        def get_test_db():
+            with Session(engine) as db:
+                yield db
+
+        @app.get("/queries")
+        def run_queries(count: int, db: Session = Depends(get_test_db)):
+            for _ in range(count):
+                db.execute(text("SELECT 1"))
+            return {"round_trips": get_query_stats().round_trips}
+
+        client = TestClient(app)
+        before = DB_QUERIES_PER_REQUEST.count(route="/queries")
+
+        # WHEN：連續送出兩個請求
+        first = client.get("/queries", params={"count": 3})
+        second = client.get("/queries", params={"count": 1})
+
+        # THEN：每個請求的統計互不影響，並依路由樣板記錄到指標
+        assert first.json() == {"round_trips": 3}
+        assert second.json() == {"round_trips": 1}
+        assert DB_QUERIES_PER_REQUEST.count(route="/queries") == before + 2
+
+
+class TestPoolMetrics:
+    """連線池指標測試類別。"""
+
+    def test_timed_pool_records_checkout_wait(self, tmp_path):
+        """測試 TimedQueuePool 借出連線時以 pool_logging_name 記錄等待時間。"""
+        # GIVEN：使用 TimedQueuePool 的引擎
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=TimedQueuePool,
+            pool_logging_name="test_pool",
+        )
+        before = DB_POOL_CHECKOUT_WAIT.count(pool="test_pool")
+
+        # WHEN：借出兩次連線
+        for _ in range(2):
+            with engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+        engine.dispose()
+
+        # THEN：記錄兩次等待時間
+        assert DB_POOL_CHECKOUT_WAIT.count(pool="test_pool") == before + 2
+
+    def test_pool_gauges_computed_on_render(self, tmp_path):
+        """測試輸出指標時才讀取連線池的容量與借出連線數。"""
+        # GIVEN：容量 3 的連線池作為主資料庫引擎
+        engine = create_engine(
+            f"sqlite:///{tmp_path / 'pool.db'}",
+            poolclass=TimedQueuePool,
+            pool_size=3,
+        )
+        with (
+            patch.object(connection, "engine", engine),
+            patch.object(connection, "async_engine", None),
+            patch.object(connection, "replica_pool", None),
+        ):
+            # WHEN：借出一個連線時輸出指標
+            with engine.connect():
+                output = registry.render()
+        engine.dispose()
+
+        # THEN：輸出主資料庫連線池的狀態
+        assert 'db_pool_size{pool="primary"} 3' in output
+        assert 'db_pool_checked_out{pool="primary"} 1' in output
+        assert 'db_pool_overflow{pool="primary"} 0' in output
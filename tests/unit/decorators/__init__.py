@@ -0,0 +1 @@
+"""裝飾器模組測試。"""
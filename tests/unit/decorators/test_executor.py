@@ -0,0 +1,108 @@
+"""阻塞呼叫執行緒池測試。"""
+
+# ===== 標準函式庫 =====
+import asyncio
+import threading
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.decorators.executor import (
+    blocking_executor,
+    BlockingCallExecutor,
+)
+from app.errors.exceptions import ServiceUnavailableError
+from app.metrics import BLOCKING_CALL_WAIT, registry
+
+
+class TestBlockingCallExecutor:
+    """阻塞呼叫執行緒池測試類別。"""
+
+    @pytest.fixture
+    def executor(self):
+        """建立小容量的執行緒池：1 個工作執行緒、1 個排隊名額。"""
+        executor = BlockingCallExecutor(max_workers=1, max_queue=1)
+        yield executor
+        executor.shutdown()
+
+    @pytest.mark.asyncio
+    async def test_run_executes_off_event_loop_thread(self, executor):
+        """測試同步函式在工作執行緒執行，而非事件迴圈執行緒。"""
+        # GIVEN：事件迴圈所在的執行緒
+        loop_thread = threading.get_ident()
+
+        # WHEN：透過執行緒池執行同步函式
+        result = await executor.run(lambda x: (x, threading.get_ident()), 42)
+
+        # THEN：取得回傳值，且執行緒不同
+        assert result[0] == 42
+        assert result[1] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_run_rejects_when_queue_is_full(self, executor):
+        """測試執行中與排隊中都已滿時，立即拋出 503。"""
+        # GIVEN：一個執行中、一個排隊中的呼叫佔滿容量
+        release = threading.Event()
+        running = asyncio.ensure_future(executor.run(release.wait))
+        queued = asyncio.ensure_future(executor.run(release.wait))
+        await asyncio.sleep(0.05)
+
+        # WHEN & THEN：第三個呼叫被拒絕
+        with pytest.raises(ServiceUnavailableError):
+            await executor.run(release.wait)
+
+        # THEN：統計資料反映佇列深度與拒絕次數
+        stats = executor.get_stats()
+        assert stats["running"] == 1
+        assert stats["queue_depth"] == 1
+        assert stats["rejected_total"] == 1
+
+        # 釋放阻塞後，所有呼叫完成並釋放名額
+        release.set()
+        await asyncio.gather(running, queued)
+        stats = executor.get_stats()
+        assert stats["queue_depth"] == 0
+        assert stats["completed_total"] == 2
+        assert stats["wait_seconds_max"] > 0
+
+    @pytest.mark.asyncio
+    async def test_run_propagates_exception_and_releases_slot(self, executor):
+        """測試同步函式拋出的錯誤會傳回呼叫端，且釋放名額。"""
+
+        # GIVEN：會拋出錯誤的同步函式
+        def failing() -> None:
+            raise ValueError("boom")
+
+        # WHEN & THEN：錯誤原樣傳回
+        with pytest.raises(ValueError):
+            await executor.run(failing)
+
+        # THEN：名額已釋放
+        assert executor.get_stats()["queue_depth"] == 0
+        assert executor.get_stats()["running"] == 0
+
+
+class TestBlockingCallExecutorMetrics:
+    """阻塞呼叫執行緒池指標測試類別。"""
+
+    @pytest.mark.asyncio
+    async def test_metrics_expose_queue_depth_and_wait_time(self):
+        """測試 /metrics 輸出全域執行緒池的佇列深度與等待時間。"""
+        # GIVEN：透過全域執行緒池執行一次呼叫
+        labels = {"executor": blocking_executor.thread_name_prefix}
+        before = BLOCKING_CALL_WAIT.count(**labels)
+        await blocking_executor.run(lambda: None)
+
+        # WHEN：輸出指標
+        output = registry.render()
+
+        # THEN：等待時間已記錄，佇列狀態在輸出時計算
+        assert BLOCKING_CALL_WAIT.count(**labels) == before + 1
+        assert 'blocking_executor_queue_depth{executor="blocking-call"} 0' in output
+        assert 'blocking_executor_running{executor="blocking-call"} 0' in output
+        assert "blocking_executor_wait_seconds_count" in output
+        assert (
+            f'blocking_executor_capacity{{executor="blocking-call"}} '
+            f"{blocking_executor.capacity}"
+        ) in output
@@ -63,6 +63,7 @@ class TestErrorCodes:
                     "AUTHORIZATION_ERROR": "ROUTER_AUTHORIZATION_ERROR",
                     "ENDPOINT_NOT_FOUND": "ROUTER_ENDPOINT_NOT_FOUND",
                     "SCHEDULE_NOT_FOUND": "ROUTER_SCHEDULE_NOT_FOUND",
+                    "NOT_ACCEPTABLE": "ROUTER_NOT_ACCEPTABLE",
                     "VALIDATION_ERROR": "ROUTER_VALIDATION_ERROR",
                 },
             ),
@@ -76,6 +77,8 @@ class TestErrorCodes:
                     "SCHEDULE_NOT_FOUND": "SERVICE_SCHEDULE_NOT_FOUND",
                     "CONFLICT": "SERVICE_CONFLICT",
                     "SCHEDULE_CANNOT_BE_DELETED": "SERVICE_SCHEDULE_CANNOT_BE_DELETED",
+                    "SCHEDULE_VERSION_MISMATCH": "SERVICE_SCHEDULE_VERSION_MISMATCH",
+                    "RECURRENCE_RULE_NOT_FOUND": "SERVICE_RECURRENCE_RULE_NOT_FOUND",
                 },
             ),
             (
@@ -17,9 +17,11 @@ from app.errors.exceptions import (  # CRUD 層級; Router 層級; Service 層
     BusinessLogicError,
     ConflictError,
     DatabaseError,
+    NotAcceptableError,
     ScheduleCannotBeDeletedError,
     ScheduleNotFoundError,
     ScheduleOverlapError,
+    SchedulePreconditionFailedError,
     ServiceUnavailableError,
     UserNotFoundError,
     ValidationError,
@@ -40,6 +42,7 @@ class TestErrorHierarchy:
             BadRequestError("test"),
             AuthenticationError("test"),
             AuthorizationError("test"),
+            NotAcceptableError("test"),
             ValidationError("test"),
             # Service 層級
             BusinessLogicError("test"),
@@ -48,6 +51,7 @@ class TestErrorHierarchy:
             ConflictError("test"),
             ScheduleCannotBeDeletedError(1),
             ScheduleOverlapError("test"),
+            SchedulePreconditionFailedError(1),
             # System 層級
             ServiceUnavailableError("test"),
         ]
@@ -68,6 +72,7 @@ class TestErrorHierarchy:
             BadRequestError("test"),
             AuthenticationError("test"),
             AuthorizationError("test"),
+            NotAcceptableError("test"),
             ValidationError("test"),
             # Service 層級
             BusinessLogicError("test"),
@@ -76,6 +81,7 @@ class TestErrorHierarchy:
             ConflictError("test"),
             ScheduleCannotBeDeletedError(1),
             ScheduleOverlapError("test"),
+            SchedulePreconditionFailedError(1),
             # System 層級
             ServiceUnavailableError("test"),
         ]
@@ -95,6 +101,7 @@ class TestErrorHierarchy:
             BadRequestError("test"),
             AuthenticationError("test"),
             AuthorizationError("test"),
+            NotAcceptableError("test"),
             ValidationError("test"),
             # Service 層級
             BusinessLogicError("test"),
@@ -103,6 +110,7 @@ class TestErrorHierarchy:
             ConflictError("test"),
             ScheduleCannotBeDeletedError(1),
             ScheduleOverlapError("test"),
+            SchedulePreconditionFailedError(1),
             # System 層級
             ServiceUnavailableError("test"),
         ]
@@ -14,9 +14,12 @@ from app.errors.exceptions import (  # CRUD 層級; Router 層級; Service 層
     BusinessLogicError,
     ConflictError,
     DatabaseError,
+    NotAcceptableError,
+    RecurrenceRuleNotFoundError,
     ScheduleCannotBeDeletedError,
     ScheduleNotFoundError,
     ScheduleOverlapError,
+    SchedulePreconditionFailedError,
     ServiceUnavailableError,
     UserNotFoundError,
     ValidationError,
@@ -28,9 +31,12 @@ from app.errors.handlers import (  # CRUD 層級; Router 層級; Service 層級;
     create_business_logic_error,
     create_conflict_error,
     create_database_error,
+    create_not_acceptable_error,
+    create_recurrence_rule_not_found_error,
     create_schedule_cannot_be_deleted_error,
     create_schedule_not_found_error,
     create_schedule_overlap_error,
+    create_schedule_precondition_failed_error,
     create_service_unavailable_error,
     create_user_not_found_error,
     create_validation_error,
@@ -48,6 +54,7 @@ class TestErrorFactories:
             (create_bad_request_error, BadRequestError),
             (create_authentication_error, AuthenticationError),
             (create_authorization_error, AuthorizationError),
+            (create_not_acceptable_error, NotAcceptableError),
             (create_validation_error, ValidationError),
             (create_business_logic_error, BusinessLogicError),
             (create_conflict_error, ConflictError),
@@ -76,6 +83,7 @@ class TestErrorFactories:
             (create_bad_request_error, BadRequestError),
             (create_authentication_error, AuthenticationError),
             (create_authorization_error, AuthorizationError),
+            (create_not_acceptable_error, NotAcceptableError),
             (create_validation_error, ValidationError),
             (create_business_logic_error, BusinessLogicError),
             (create_conflict_error, ConflictError),
@@ -121,6 +129,18 @@ class TestErrorFactories:
                 "檢測到重疊時段",
                 "檢測到重疊時段",
             ),
+            (
+                create_schedule_precondition_failed_error,
+                SchedulePreconditionFailedError,
+                321,
+                "時段已被其他請求修改: ID=321",
+            ),
+            (
+                create_recurrence_rule_not_found_error,
+                RecurrenceRuleNotFoundError,
+                654,
+                "週期規則不存在: ID=654",
+            ),
         ],
     )
     def test_id_error_factories(self, func, exc_class, param, expected_msg):
@@ -164,6 +184,12 @@ class TestErrorFactories:
                 "檢測到重疊時段",
                 "檢測到重疊時段",
             ),
+            (
+                create_schedule_precondition_failed_error,
+                SchedulePreconditionFailedError,
+                321,
+                "時段已被其他請求修改: ID=321",
+            ),
         ],
     )
     def test_id_error_factories_raise_behavior(
@@ -0,0 +1 @@
+"""指標模組測試。"""
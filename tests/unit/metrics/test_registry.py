@@ -0,0 +1,145 @@
+"""指標模組測試。
+
+測試 Prometheus 文字格式輸出、分桶統計、標籤檢查，以及 HTTP 請求指標中間件。
+"""
+
+# ===== 第三方套件 =====
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+import pytest
+
+# ===== 本地模組 =====
+from app.metrics import HTTP_REQUEST_DURATION, HTTP_REQUESTS_IN_PROGRESS
+from app.metrics.registry import Counter, Gauge, Histogram, MetricsRegistry
+from app.middleware.metrics import MetricsMiddleware
+
+
+class TestMetrics:
+    """指標與文字格式輸出測試類別。"""
+
+    def test_counter_render(self):
+        """測試計數器依標籤累加，輸出 HELP、TYPE 與跳脫後的標籤值。"""
+        # GIVEN：有一個標籤的計數器
+        registry = MetricsRegistry()
+        counter = registry.counter("jobs_total", "工作數", ("kind",))
+
+        # WHEN：兩組標籤各自累加
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind='say "hi"')
+
+        # THEN：依標籤值排序輸出
+        assert registry.render() == (
+            "# HELP jobs_total 工作數\n"
+            "# TYPE jobs_total counter\n"
+            'jobs_total{kind="a"} 3\n'
+            'jobs_total{kind="say \\"hi\\""} 1\n'
+        )
+
+    def test_gauge_inc_dec_set(self):
+        """測試量測值可增可減，也可直接設定。"""
+        gauge = Gauge("in_progress", "處理中", ("method",))
+
+        gauge.inc(method="GET")
+        gauge.inc(method="GET")
+        gauge.dec(method="GET")
+        assert gauge.value(method="GET") == 1
+
+        gauge.set(0.5, method="GET")
+        assert gauge.render()[-1] == 'in_progress{method="GET"} 0.5'
+
+    def test_histogram_cumulative_buckets(self):
+        """測試分桶統計輸出累積桶、總和與次數，邊界值落入該桶。"""
+        # GIVEN：桶邊界 1、5
+        histogram = Histogram("latency", "延遲", buckets=(5, 1))
+
+        # WHEN：記錄 0.5、1、3、10
+        for value in (0.5, 1, 3, 10):
+            histogram.observe(value)
+
+        # THEN：le="1" 包含 0.5 與 1，+Inf 包含全部
+        assert histogram.render()[2:] == [
+            'latency_bucket{le="1"} 2',
+            'latency_bucket{le="5"} 3',
+            'latency_bucket{le="+Inf"} 4',
+            "latency_sum 14.5",
+            "latency_count 4",
+        ]
+        assert histogram.count() == 4
+
+    @pytest.mark.parametrize("labels", [{}, {"route": "/"}, {"method": "GET", "x": 1}])
+    def test_label_mismatch(self, labels):
+        """測試缺少或多出標籤時拋出 ValueError。"""
+        counter = Counter("requests_total", "請求數", ("method",))
+
+        with pytest.raises(ValueError):
+            counter.inc(**labels)
+
+    def test_collector_called_on_render(self):
+        """測試收集器在每次輸出時才計算。"""
+        # GIVEN：回傳呼叫次數的收集器
+        registry = MetricsRegistry()
+        calls = []
+
+        def collect():
+            calls.append(1)
+            gauge = Gauge("renders", "輸出次數")
+            gauge.set(len(calls))
+            return [gauge]
+
+        registry.register_collector(collect)
+
+        # WHEN / THEN：登錄時不呼叫，每次輸出各呼叫一次
+        assert calls == []
+        registry.render()
+        assert registry.render().endswith("renders 2\n")
+
+
+class TestMetricsMiddleware:
+    """HTTP 請求指標中間件測試類別。"""
+
+    @pytest.fixture
+    def client(self):
+        """使用指標中間件的應用程式。"""
+        app = FastAPI()
+        app.add_middleware(MetricsMiddleware)
+
+        @app.get("/metrics-test/items/{item_id}")
+        async def read_item(item_id: int):
+            if item_id == 0:
+                raise RuntimeError("boom")
+            return {"in_progress": HTTP_REQUESTS_IN_PROGRESS.value(method="GET")}
+
+        return TestClient(app, raise_server_exceptions=False)
+
+    def test_records_route_template_and_status(self, client):
+        """測試以路由樣板與狀態碼記錄處理時間，處理中請求數在結束後歸零。"""
+        # GIVEN：目前的記錄次數
+        labels = {"method": "GET", "route": "/metrics-test/items/{item_id}"}
+        before = HTTP_REQUEST_DURATION.count(**labels, status=200)
+
+        # WHEN：請求兩個不同 ID
+        responses = [client.get(f"/metrics-test/items/{i}") for i in (1, 2)]
+
+        # THEN：同一個路由樣板記錄兩次，請求處理中時計入處理中請求數
+        assert HTTP_REQUEST_DURATION.count(**labels, status=200) == before + 2
+        assert all(r.json()["in_progress"] >= 1 for r in responses)
+        assert HTTP_REQUESTS_IN_PROGRESS.value(method="GET") == 0
+
+    def test_records_errors_and_unmatched(self, client):
+        """測試未處理的例外記錄為 500，沒有對應路由的請求記錄為 unmatched。"""
+        # GIVEN：目前的記錄次數
+        error = {"method": "GET", "route": "/metrics-test/items/{item_id}"}
+        unmatched = {"method": "GET", "route": "unmatched"}
+        error_before = HTTP_REQUEST_DURATION.count(**error, status=500)
+        unmatched_before = HTTP_REQUEST_DURATION.count(**unmatched, status=404)
+
+        # WHEN：請求拋出例外的路由與不存在的路徑
+        assert client.get("/metrics-test/items/0").status_code == 500
+        assert client.get("/metrics-test/missing").status_code == 404
+
+        # THEN：各記錄一次
+        assert HTTP_REQUEST_DURATION.count(**error, status=500) == error_before + 1
+        assert (
+            HTTP_REQUEST_DURATION.count(**unmatched, status=404) == unmatched_before + 1
+        )
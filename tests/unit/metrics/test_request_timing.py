@@ -0,0 +1,161 @@
+"""請求時間分解測試。
+
+測試服務層、資料庫與序列化時間的計算，以及 Server-Timing 中間件。
+"""
+
+# ===== 標準函式庫 =====
+import json
+import logging
+import time
+from unittest.mock import patch
+
+# ===== 第三方套件 =====
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import Session
+from sqlalchemy.pool import StaticPool
+
+# ===== 本地模組 =====
+from app.core import settings
+from app.decorators import handle_api_errors_async, log_operation
+from app.metrics.request_timing import (
+    add_db_time,
+    format_server_timing,
+    RequestTiming,
+    start_request_timing,
+    stop_request_timing,
+    time_service,
+    timing_breakdown,
+)
+from app.middleware.query_stats import QueryStatsMiddleware
+from app.middleware.server_timing import (
+    ServerTimingMiddleware,
+    setup_server_timing_middleware,
+)
+
+
+class TestRequestTiming:
+    """時間分解計算測試類別。"""
+
+    def test_breakdown_subtracts_service_db_time(self):
+        """測試服務層時間扣除其中的資料庫時間，其餘時間計為 app。"""
+        # GIVEN：總時間 100 ms，服務層 60 ms（其中資料庫 20 ms），路由函式在 90 ms 結束
+        timing = RequestTiming(
+            started=0.0,
+            service_seconds=0.06,
+            service_db_seconds=0.02,
+            handler_finished=0.09,
+        )
+
+        # WHEN：資料庫總時間 30 ms
+        breakdown = timing_breakdown(timing, db_seconds=0.03, now=0.1)
+
+        # THEN：db 30、service 40、serialization 10、app 20
+        assert breakdown == pytest.approx(
+            {
+                "db": 0.03,
+                "service": 0.04,
+                "serialization": 0.01,
+                "app": 0.02,
+                "total": 0.1,
+            }
+        )
+        assert format_server_timing(breakdown) == (
+            "db;dur=30.0, service;dur=40.0, serialization;dur=10.0, "
+            "app;dur=20.0, total;dur=100.0"
+        )
+
+    def test_breakdown_without_handler(self):
+        """測試路由函式未記錄結束時間時，省略序列化時間。"""
+        breakdown = timing_breakdown(RequestTiming(started=0.0), 0.0, now=0.01)
+
+        assert list(breakdown) == ["db", "service", "app", "total"]
+
+    def test_nested_service_counted_once(self):
+        """測試巢狀的服務呼叫只計算最外層，只有服務層中的資料庫時間會被扣除。"""
+        # GIVEN：開始記錄時間分解
+        timing, token = start_request_timing()
+
+        # WHEN：服務層外與巢狀的服務層中各有資料庫時間
+        try:
+            add_db_time(1.0)
+            with time_service():
+                with time_service():
+                    time.sleep(0.01)
+                    add_db_time(0.005)
+        finally:
+            stop_request_timing(token)
+
+        # THEN：服務層時間只計算一次，只扣除服務層中的資料庫時間
+        assert 0.01 <= timing.service_seconds < 0.02
+        assert timing.service_db_seconds == 0.005
+
+
+class TestServerTimingMiddleware:
+    """Server-Timing 中間件測試類別。"""
+
+    @pytest.fixture
+    def client(self):
+        """路由透過服務層查詢資料庫的應用程式，查詢統計在 Server-Timing 外層。"""
+        engine = create_engine(
+            "sqlite://",
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool,
+        )
+        app = FastAPI()
+        app.add_middleware(ServerTimingMiddleware)
+        app.add_middleware(QueryStatsMiddleware)
+
+        def get_test_db():
+            with Session(engine) as db:
+                yield db
+
+        @log_operation("測試查詢")
+        def run_queries(db: Session) -> int:
+            db.execute(text("SELECT 1"))
+            return 1
+
+        @app.get("/timing/{item_id}")
+        @handle_api_errors_async()
+        async def read_item(item_id: int, db: Session = Depends(get_test_db)):
+            return {"rows": run_queries(db)}
+
+        return TestClient(app)
+
+    def test_header_and_log(self, client, caplog):
+        """測試回應帶有 Server-Timing 標頭，並記錄以路由樣板分組的 JSON 日誌。"""
+        # WHEN：送出請求
+        with caplog.at_level(logging.INFO, logger="app.middleware.server_timing"):
+            response = client.get("/timing/1")
+
+        # THEN：標頭依序列出各層時間
+        assert response.status_code == 200
+        names = [
+            entry.split(";")[0]
+            for entry in response.headers["server-timing"].split(", ")
+        ]
+        assert names == ["db", "service", "serialization", "app", "total"]
+
+        # THEN：日誌記錄路由樣板、狀態碼與各層毫秒數
+        message = next(
+            r.getMessage() for r in caplog.records if "請求時間分解" in r.getMessage()
+        )
+        record = json.loads(message.split(": ", 1)[1])
+        assert record["route"] == "/timing/{item_id}"
+        assert record["status"] == 200
+        assert record["db_ms"] >= 0
+        assert record["total_ms"] >= record["service_ms"]
+
+    @pytest.mark.parametrize("enabled", [True, False])
+    def test_setup_follows_setting(self, enabled):
+        """測試只在啟用設定時安裝中間件。"""
+        app = FastAPI()
+
+        with patch.object(settings, "server_timing_enabled", enabled):
+            setup_server_timing_middleware(app)
+
+        assert (
+            any(m.cls is ServerTimingMiddleware for m in app.user_middleware) is enabled
+        )
@@ -0,0 +1,144 @@
+"""行事曆訂閱模組測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, datetime, time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# ===== 本地模組 =====
+from app.enums.models import UserRoleEnum
+from app.services.calendar import (
+    _fold_line,
+    build_calendar_feed,
+    render_schedule_calendar,
+    ScheduleCalendarCache,
+)
+
+
+def _row(schedule_id: int = 1, note: str | None = None, version: int = 1):
+    """建立具有行事曆欄位的時段資料列。"""
+    return SimpleNamespace(
+        id=schedule_id,
+        date=date(2024, 12, 25),
+        start_time=time(9, 0),
+        end_time=time(10, 30),
+        note=note,
+        updated_at=datetime(2024, 12, 1, 8, 0, 0),
+        version=version,
+    )
+
+
+class TestRenderScheduleCalendar:
+    """iCalendar 內容產生測試。"""
+
+    def test_render_events(self):
+        """測試每個時段產生一個 VEVENT，時間轉換為 UTC，版本號對應 SEQUENCE。"""
+        # WHEN：產生含一個時段的訂閱內容
+        body = render_schedule_calendar(
+            [_row(note="a;b,c\n第二行", version=3)], UserRoleEnum.GIVER
+        )
+
+        # THEN：以 CRLF 換行，台灣時間轉換為 UTC，TEXT 值已跳脫
+        lines = body.decode().split("\r\n")
+        assert lines[0] == "BEGIN:VCALENDAR"
+        assert lines[-2:] == ["END:VCALENDAR", ""]
+        assert "UID:schedule-1@104-resume-clinic-scheduler" in lines
+        assert "DTSTART:20241225T010000Z" in lines
+        assert "DTEND:20241225T023000Z" in lines
+        assert "DTSTAMP:20241201T000000Z" in lines
+        assert "SEQUENCE:2" in lines
+        assert "DESCRIPTION:a\\;b\\,c\\n第二行" in lines
+
+    def test_render_is_deterministic(self):
+        """測試相同的時段產生相同的內容與 ETag，時段變更時 ETag 也變更。"""
+        # WHEN：以相同與不同的時段產生訂閱
+        first = build_calendar_feed(
+            render_schedule_calendar([_row()], UserRoleEnum.TAKER)
+        )
+        second = build_calendar_feed(
+            render_schedule_calendar([_row()], UserRoleEnum.TAKER)
+        )
+        changed = build_calendar_feed(
+            render_schedule_calendar([_row(version=2)], UserRoleEnum.TAKER)
+        )
+
+        # THEN：ETag 為內容雜湊
+        assert first.etag == second.etag
+        assert first.etag != changed.etag
+        assert first.last_modified.microsecond == 0
+
+    def test_fold_long_line(self):
+        """測試超過 75 位元組的內容行折行，且不切斷 UTF-8 字元。"""
+        # GIVEN：超過 75 位元組的中文內容行
+        line = "DESCRIPTION:" + "履歷" * 40
+
+        # WHEN：折行
+        folded = _fold_line(line)
+
+        # THEN：每行不超過 75 位元組，移除折行後與原內容相同
+        parts = folded.split("\r\n")
+        assert len(parts) > 1
+        assert all(len(part.encode()) <= 75 for part in parts)
+        assert folded.replace("\r\n ", "") == line
+
+
+class TestScheduleCalendarCache:
+    """行事曆訂閱快取測試。"""
+
+    def _feed(self):
+        return build_calendar_feed(b"BEGIN:VCALENDAR\r\nEND:VCALENDAR\r\n")
+
+    def test_put_get_and_invalidate(self):
+        """測試快取命中，以及只使指定使用者的訂閱失效。"""
+        # GIVEN：兩個 Giver 與一個 Taker 的訂閱
+        cache = ScheduleCalendarCache()
+        feed = self._feed()
+        for role, user_id in (
+            (UserRoleEnum.GIVER, 1),
+            (UserRoleEnum.GIVER, 2),
+            (UserRoleEnum.TAKER, 1),
+        ):
+            cache.put(role, user_id, feed, cache.generation)
+
+        # WHEN：使 Giver 1 與 Taker 1 失效
+        assert cache.get(UserRoleEnum.GIVER, 1) is feed
+        cache.invalidate(giver_ids=[1], taker_ids=[1])
+
+        # THEN：只有 Giver 2 仍在快取中
+        assert cache.get(UserRoleEnum.GIVER, 1) is None
+        assert cache.get(UserRoleEnum.TAKER, 1) is None
+        assert cache.get(UserRoleEnum.GIVER, 2) is feed
+        assert cache.get_stats() == {"feeds": 1, "hits": 2, "misses": 2}
+
+    def test_put_skipped_after_invalidation(self):
+        """測試產生期間發生失效時，產生的訂閱不寫回快取。"""
+        # GIVEN：產生前取得的世代
+        cache = ScheduleCalendarCache()
+        generation = cache.generation
+
+        # WHEN：產生期間其他請求寫入時段並失效
+        cache.invalidate(giver_ids=[2])
+        cache.put(UserRoleEnum.GIVER, 1, self._feed(), generation)
+
+        # THEN：未寫回快取
+        assert cache.get(UserRoleEnum.GIVER, 1) is None
+
+    def test_ttl_and_lru(self):
+        """測試超過存活時間的訂閱過期，超過上限時淘汰最久未使用的訂閱。"""
+        # GIVEN：存活 10 秒、最多 2 筆的快取
+        cache = ScheduleCalendarCache(ttl_seconds=10, max_entries=2)
+        feed = self._feed()
+
+        with patch("app.services.calendar.time_module.monotonic", return_value=100.0):
+            cache.put(UserRoleEnum.GIVER, 1, feed, cache.generation)
+            cache.put(UserRoleEnum.GIVER, 2, feed, cache.generation)
+            cache.get(UserRoleEnum.GIVER, 1)  # Giver 1 成為最近使用
+            cache.put(UserRoleEnum.GIVER, 3, feed, cache.generation)
+
+            # THEN：淘汰最久未使用的 Giver 2
+            assert cache.get(UserRoleEnum.GIVER, 2) is None
+            assert cache.get(UserRoleEnum.GIVER, 1) is feed
+
+        # WHEN & THEN：超過存活時間後過期
+        with patch("app.services.calendar.time_module.monotonic", return_value=110.0):
+            assert cache.get(UserRoleEnum.GIVER, 1) is None
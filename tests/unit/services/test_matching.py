@@ -0,0 +1,120 @@
+"""共同可面談時間比對演算法測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+from app.services.matching import (
+    intersect_intervals,
+    match_inbox,
+    MatchWindow,
+    rank_windows,
+)
+
+
+def interval(start, end, id, day=15):
+    """建立測試用的時段區間，start、end 為 (時, 分)。"""
+    return ScheduleInterval(
+        id=id,
+        giver_id=1,
+        date=date(2024, 1, day),
+        start_time=time(*start),
+        end_time=time(*end),
+    )
+
+
+class TestIntersectIntervals:
+    """線性合併交集測試類別。"""
+
+    @pytest.mark.parametrize(
+        "proposals,openings,expected",
+        [
+            # 相鄰不算交集，不同日期不算交集
+            ([interval((9, 0), (10, 0), 1)], [interval((10, 0), (11, 0), 2)], []),
+            ([interval((9, 0), (10, 0), 1)], [interval((9, 0), (10, 0), 2, 16)], []),
+            # 部分重疊：交集為較晚的開始到較早的結束
+            (
+                [interval((9, 0), (10, 30), 1)],
+                [interval((10, 0), (12, 0), 2)],
+                [(time(10), time(10, 30), 30, 1, 2)],
+            ),
+            # 一個長提案涵蓋多個開放時段，每個開放時段各一個視窗
+            (
+                [interval((9, 0), (17, 0), 1)],
+                [interval((9, 0), (10, 0), 2), interval((13, 0), (14, 0), 3)],
+                [
+                    (time(9), time(10), 60, 1, 2),
+                    (time(13), time(14), 60, 1, 3),
+                ],
+            ),
+            # 同一側彼此重疊的提案，各自與開放時段產生視窗
+            (
+                [interval((9, 0), (12, 0), 1), interval((10, 0), (11, 0), 4)],
+                [interval((10, 30), (11, 30), 2)],
+                [
+                    (time(10, 30), time(11), 30, 4, 2),
+                    (time(10, 30), time(11, 30), 60, 1, 2),
+                ],
+            ),
+        ],
+    )
+    def test_intersections(self, proposals, openings, expected):
+        """測試交集視窗與來源時段。"""
+        # WHEN：以未排序的輸入比對
+        windows = intersect_intervals(proposals[::-1], openings[::-1])
+
+        # THEN：依日期與開始時間回報所有交集
+        actual = [
+            (w.start_time, w.end_time, w.minutes, w.proposal_id, w.opening_id)
+            for w in windows
+        ]
+        assert sorted(actual) == sorted(expected)
+
+    def test_min_minutes_and_rank(self):
+        """測試過短的交集不回報，排名越早越前、同一個開始時間較長的在前。"""
+        # GIVEN：15 分鐘、60 分鐘、30 分鐘的交集
+        proposals = [
+            interval((9, 0), (9, 15), 1),
+            interval((14, 0), (15, 0), 2),
+            interval((14, 0), (14, 30), 3, day=14),
+        ]
+        openings = [
+            interval((8, 0), (18, 0), 10),
+            interval((8, 0), (18, 0), 11, day=14),
+        ]
+
+        # WHEN：只保留至少 30 分鐘的交集並排名
+        ranked = rank_windows(intersect_intervals(proposals, openings, 30))
+
+        # THEN：較早的日期在前，15 分鐘的交集不回報
+        assert [w.proposal_id for w in ranked] == [3, 2]
+        assert ranked[0] == MatchWindow(
+            date(2024, 1, 14), time(14), time(14, 30), 30, 3, 11
+        )
+        assert rank_windows(ranked, limit=1) == ranked[:1]
+
+
+class TestMatchInbox:
+    """收件匣批次比對測試類別。"""
+
+    def test_match_inbox(self):
+        """測試每個 Taker 各自比對同一份開放時段，只回傳有候選視窗的 Taker。"""
+        # GIVEN：Taker 3 的提案與開放時段重疊，Taker 2 沒有
+        openings = [interval((13, 0), (14, 0), 11), interval((9, 0), (10, 0), 10)]
+        proposals_by_taker = {
+            3: [interval((9, 30), (11, 0), 1), interval((13, 0), (13, 45), 2)],
+            2: [interval((11, 0), (12, 0), 4)],
+        }
+
+        # WHEN：比對收件匣，每個 Taker 最多一個視窗
+        results = match_inbox(proposals_by_taker, openings, limit=1)
+
+        # THEN：只有 Taker 3，且為最早的視窗
+        assert [r.taker_id for r in results] == [3]
+        assert results[0].windows == [
+            MatchWindow(date(2024, 1, 15), time(9, 30), time(10), 30, 1, 10)
+        ]
@@ -0,0 +1,62 @@
+"""時段重疊檢查演算法測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.services.overlap import find_overlaps, ScheduleInterval
+
+
+def interval(start_hour, end_hour, id=None, giver_id=1, day=15):
+    """建立測試用的時段區間。"""
+    return ScheduleInterval(
+        id=id,
+        giver_id=giver_id,
+        date=date(2024, 1, day),
+        start_time=time(start_hour, 0),
+        end_time=time(end_hour, 0),
+    )
+
+
+class TestFindOverlaps:
+    """排序掃描重疊檢查測試類別。"""
+
+    @pytest.mark.parametrize(
+        "existing,incoming,expected_ids",
+        [
+            # 相鄰時段不算重疊
+            ([interval(9, 10, id=1)], [interval(10, 11)], []),
+            # 不同 Giver 或不同日期不算重疊
+            ([interval(9, 10, id=1, giver_id=2)], [interval(9, 10)], []),
+            ([interval(9, 10, id=1, day=16)], [interval(9, 10)], []),
+            # 新時段與多個現有時段重疊，每組衝突各回報一次
+            (
+                [interval(9, 10, id=1), interval(10, 11, id=2)],
+                [interval(9, 11)],
+                [1, 2],
+            ),
+            # 現有時段彼此重疊不屬於本次請求的衝突
+            ([interval(9, 11, id=1), interval(10, 12, id=2)], [interval(13, 14)], []),
+        ],
+    )
+    def test_existing_conflicts(self, existing, incoming, expected_ids):
+        """測試新時段與現有時段的衝突。"""
+        # WHEN：排序掃描
+        conflicts = find_overlaps(existing, incoming)
+
+        # THEN：回報衝突的現有時段
+        assert [c.id for c in conflicts] == expected_ids
+
+    def test_intra_batch_conflicts(self):
+        """測試同一批新時段彼此重疊，回報開始時間較晚的新時段。"""
+        # GIVEN：三個新時段，第三個與前兩個都重疊
+        incoming = [interval(9, 10), interval(12, 13), interval(9, 13)]
+
+        # WHEN：排序掃描
+        conflicts = find_overlaps([], incoming)
+
+        # THEN：第三個時段分別與前兩個衝突（開始時間相同時以輸入順序為準）
+        assert conflicts == [incoming[2], incoming[1]]
@@ -0,0 +1,265 @@
+"""時段讀取快取測試。"""
+
+# ===== 標準函式庫 =====
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.cache import MemoryCacheBackend
+from app.database.replicas import READ_FROM_REPLICA_KEY, READ_YOUR_WRITES_KEY
+from app.errors.exceptions import DatabaseError
+from app.services.read_cache import (
+    ALL_SCOPE,
+    list_scopes,
+    ScheduleReadCache,
+    write_scopes,
+)
+
+CLOCK = "app.services.read_cache.time_module.time"
+
+
+class FailingBackend(MemoryCacheBackend):
+    """讀取一律失敗的後端，模擬 Redis 無法連線。"""
+
+    async def get_many(self, keys):
+        raise ConnectionError("無法連線")
+
+
+class EvictingBackend(MemoryCacheBackend):
+    """世代計數器建立後隨即被淘汰的後端，模擬記憶體不足的 Redis。"""
+
+    async def bump(self, keys):
+        list(keys)
+
+
+class Loader:
+    """記錄呼叫次數的查詢函式，依序回傳指定的內容。"""
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.calls = 0
+
+    async def __call__(self, db):
+        self.calls += 1
+        result = self.results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+
+class AsyncContext:
+    """以 async with 回傳指定物件，模擬 async_sessionmaker 建立的會話。"""
+
+    def __init__(self, value) -> None:
+        self.value = value
+
+    async def __aenter__(self):
+        return self.value
+
+    async def __aexit__(self, *exc_info):
+        return None
+
+
+def _session(**info):
+    """只提供 Session.info 的非同步會話替身。"""
+    return SimpleNamespace(sync_session=SimpleNamespace(info=info))
+
+
+def test_scopes():
+    """測試列表依篩選條件使用範圍，寫入一律影響不篩選的列表。"""
+    assert list_scopes(None, None) == [ALL_SCOPE]
+    assert list_scopes(1, 2) == ["giver:1", "taker:2"]
+    assert write_scopes([1], [None], [3]) == {ALL_SCOPE, "giver:1", "schedule:3"}
+
+
+class TestScheduleReadCache:
+    """時段讀取快取測試。"""
+
+    @pytest.mark.asyncio
+    async def test_disabled_always_loads(self):
+        """測試未設定後端時每次都查詢資料庫。"""
+        # GIVEN：未啟用的快取
+        cache = ScheduleReadCache(None)
+        load = Loader("a", "b")
+
+        # WHEN & THEN：每次都查詢
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "a"
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "b"
+        assert not cache.enabled
+
+    @pytest.mark.asyncio
+    async def test_hit_and_invalidation(self):
+        """測試命中時不查詢，commit 後遞增相關範圍的世代使內容失效。"""
+        # GIVEN：已快取 Giver 1 的列表
+        cache = ScheduleReadCache(MemoryCacheBackend())
+        db = _session()
+        load = Loader({"v": 1}, {"v": 2})
+        await cache.get_or_load(db, "k", ["giver:1"], load)
+
+        # WHEN：再次讀取，以及寫入其他 Giver 的時段
+        hit = await cache.get_or_load(db, "k", ["giver:1"], load)
+        cache.mark_stale(db.sync_session, write_scopes([2]))
+        await cache.flush(db)
+        unrelated = await cache.get_or_load(db, "k", ["giver:1"], load)
+
+        # THEN：都命中快取
+        assert hit == unrelated == {"v": 1}
+        assert load.calls == 1
+
+        # WHEN：寫入 Giver 1 的時段
+        cache.mark_stale(db.sync_session, write_scopes([1]))
+        await cache.flush(db)
+
+        # THEN：重新查詢
+        assert await cache.get_or_load(db, "k", ["giver:1"], load) == {"v": 2}
+        assert load.calls == 2
+        assert db.sync_session.info == {}
+
+    @pytest.mark.asyncio
+    async def test_stale_while_revalidate(self):
+        """測試超過新鮮時間時先回傳舊內容，並在背景重新查詢。"""
+        # GIVEN：新鮮 10 秒、可再回傳舊內容 20 秒的快取
+        cache = ScheduleReadCache(
+            MemoryCacheBackend(), ttl_seconds=10, stale_while_revalidate_seconds=20
+        )
+        load = Loader("old", "new")
+
+        def session_factory():
+            return AsyncContext(_session())
+
+        with patch(CLOCK, return_value=1000.0):
+            await cache.get_or_load(_session(), "k", [ALL_SCOPE], load)
+
+        # WHEN：過了 15 秒後讀取
+        with patch(CLOCK, return_value=1015.0):
+            stale = await cache.get_or_load(
+                _session(), "k", [ALL_SCOPE], load, session_factory
+            )
+            await cache.wait_for_refreshes()
+            refreshed = await cache.get_or_load(_session(), "k", [ALL_SCOPE], load)
+
+        # THEN：先回傳舊內容，背景查詢完成後回傳新內容
+        assert stale == "old"
+        assert refreshed == "new"
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_stale_if_error(self):
+        """測試資料庫查詢失敗時，在允許範圍內回傳已失效的舊內容。"""
+        # GIVEN：已快取的內容，之後寫入使其失效
+        cache = ScheduleReadCache(
+            MemoryCacheBackend(), ttl_seconds=10, stale_if_error_seconds=60
+        )
+        db = _session()
+        error = DatabaseError("資料庫無法連線")
+        load = Loader("old", error, error)
+        with patch(CLOCK, return_value=1000.0):
+            await cache.get_or_load(db, "k", ["giver:1"], load)
+        cache.mark_stale(db.sync_session, write_scopes([1]))
+        await cache.flush(db)
+
+        # WHEN & THEN：允許範圍內回傳舊內容
+        with patch(CLOCK, return_value=1030.0):
+            assert await cache.get_or_load(db, "k", ["giver:1"], load) == "old"
+
+        # WHEN & THEN：超過允許範圍時拋出錯誤
+        with patch(CLOCK, return_value=1100.0):
+            with pytest.raises(DatabaseError):
+                await cache.get_or_load(db, "k", ["giver:1"], load)
+
+    @pytest.mark.asyncio
+    async def test_backend_failure_falls_back_to_database(self):
+        """測試快取後端失敗時直接查詢資料庫。"""
+        # GIVEN：無法讀取的後端
+        cache = ScheduleReadCache(FailingBackend())
+        load = Loader("a")
+
+        # WHEN & THEN：回傳資料庫的內容
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "a"
+
+    @pytest.mark.asyncio
+    async def test_evicted_generation_falls_back_to_database(self):
+        """測試世代計數器無法建立時直接查詢資料庫，不寫回快取。"""
+        # GIVEN：世代計數器一律不存在的後端
+        backend = EvictingBackend()
+        cache = ScheduleReadCache(backend)
+        load = Loader("a", "b")
+
+        # WHEN & THEN：每次都查詢資料庫
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "a"
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "b"
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_write_during_load_is_not_stored(self):
+        """測試查詢期間有寫入時不寫回快取，下次讀取重新查詢。"""
+        # GIVEN：查詢途中有寫入遞增 Giver 1 的世代
+        cache = ScheduleReadCache(MemoryCacheBackend())
+        db = _session()
+        load = Loader("old", "new")
+
+        async def load_during_write(session):
+            cache.mark_stale(db.sync_session, write_scopes([1]))
+            await cache.flush(db)
+            return await load(session)
+
+        # WHEN：查詢後再次讀取
+        first = await cache.get_or_load(db, "k", ["giver:1"], load_during_write)
+        second = await cache.get_or_load(db, "k", ["giver:1"], load)
+
+        # THEN：查詢期間的內容未寫回，再次讀取時重新查詢
+        assert (first, second) == ("old", "new")
+        assert load.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_replica_miss_loads_from_primary(self):
+        """測試副本會話未命中時改由主資料庫查詢後寫回，沒有主資料庫工廠時不寫回。"""
+        # GIVEN：連到副本的會話，以及主資料庫的會話工廠
+        cache = ScheduleReadCache(MemoryCacheBackend())
+        replica = _session(**{READ_FROM_REPLICA_KEY: True})
+        primary = _session()
+        sessions = []
+
+        async def load(session):
+            sessions.append(session)
+            return "primary" if session is primary else "replica"
+
+        # WHEN：沒有主資料庫工廠時讀取兩次
+        without_factory = [
+            await cache.get_or_load(replica, "k", [ALL_SCOPE], load) for _ in range(2)
+        ]
+
+        # THEN：回傳副本的內容，但不寫回
+        assert without_factory == ["replica", "replica"]
+
+        # WHEN：提供主資料庫工廠後讀取兩次
+        def session_factory():
+            return AsyncContext(primary)
+
+        with_factory = [
+            await cache.get_or_load(replica, "k", [ALL_SCOPE], load, session_factory)
+            for _ in range(2)
+        ]
+
+        # THEN：未命中時查詢主資料庫並寫回，再次讀取命中快取
+        assert with_factory == ["primary", "primary"]
+        assert sessions == [replica, replica, primary]
+
+    @pytest.mark.asyncio
+    async def test_read_your_writes_skips_cache(self):
+        """測試客戶端剛寫入時不使用快取，直接查詢主資料庫。"""
+        # GIVEN：已快取的內容
+        cache = ScheduleReadCache(MemoryCacheBackend())
+        load = Loader("cached", "fresh")
+        await cache.get_or_load(_session(), "k", [ALL_SCOPE], load)
+
+        # WHEN：剛寫入的客戶端讀取
+        sticky = _session(**{READ_YOUR_WRITES_KEY: True})
+        result = await cache.get_or_load(sticky, "k", [ALL_SCOPE], load)
+
+        # THEN：查詢資料庫，且不取代快取的內容
+        assert result == "fresh"
+        assert await cache.get_or_load(_session(), "k", [ALL_SCOPE], load) == "cached"
@@ -0,0 +1,182 @@
+"""週期規則發生日期計算測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time, timedelta
+from itertools import islice
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.crud.recurrence_rule import RecurrencePattern
+from app.enums.models import RecurrenceFrequencyEnum
+from app.services.overlap import ScheduleInterval
+from app.services.recurrence import (
+    find_rule_conflicts,
+    first_common_date,
+    iter_occurrences,
+    occurs_on,
+    weekday_mask,
+)
+
+DAILY = RecurrenceFrequencyEnum.DAILY
+WEEKLY = RecurrenceFrequencyEnum.WEEKLY
+
+
+def pattern(
+    frequency=WEEKLY,
+    interval=1,
+    weekdays=(1,),
+    start_hour=19,
+    end_hour=21,
+    starts_on=date(2024, 1, 1),
+    ends_on=None,
+    exceptions=(),
+    materialized_until=None,
+    id=1,
+    giver_id=1,
+):
+    """建立測試用的週期規則；2024/1/1 為星期一，預設每週二 19:00–21:00。"""
+    return RecurrencePattern(
+        id=id,
+        giver_id=giver_id,
+        frequency=frequency,
+        interval=interval,
+        weekdays=weekday_mask(weekdays),
+        start_time=time(start_hour),
+        end_time=time(end_hour),
+        starts_on=starts_on,
+        ends_on=ends_on,
+        exceptions=frozenset(exceptions),
+        materialized_until=materialized_until,
+    )
+
+
+def brute_force(rule, date_from, date_to):
+    """逐日以 occurs_on 判斷的發生日期，作為 iter_occurrences 的參考答案。"""
+    days = (date_to - date_from).days + 1
+    return [
+        date_from + timedelta(days=offset)
+        for offset in range(days)
+        if occurs_on(rule, date_from + timedelta(days=offset))
+    ]
+
+
+class TestOccurrences:
+    """發生日期判斷與產生測試類別。"""
+
+    @pytest.mark.parametrize(
+        "rule,day,expected",
+        [
+            # 每週二：1/2 是星期二，1/3 不是
+            (pattern(), date(2024, 1, 2), True),
+            (pattern(), date(2024, 1, 3), False),
+            # 隔週二：從 starts_on 所在的週起算
+            (pattern(interval=2), date(2024, 1, 9), False),
+            (pattern(interval=2), date(2024, 1, 16), True),
+            # 每三天：從 starts_on 起算
+            (pattern(DAILY, interval=3), date(2024, 1, 4), True),
+            (pattern(DAILY, interval=3), date(2024, 1, 5), False),
+            # 起訖日期之外與例外日期不發生
+            (pattern(starts_on=date(2024, 1, 3)), date(2024, 1, 2), False),
+            (pattern(ends_on=date(2024, 1, 8)), date(2024, 1, 9), False),
+            (pattern(exceptions=[date(2024, 1, 9)]), date(2024, 1, 9), False),
+        ],
+    )
+    def test_occurs_on(self, rule, day, expected):
+        """測試以算術判斷某天是否發生。"""
+        assert occurs_on(rule, day) is expected
+
+    @pytest.mark.parametrize(
+        "rule",
+        [
+            pattern(),
+            pattern(interval=3, weekdays=(0, 4, 6), starts_on=date(2024, 1, 5)),
+            pattern(DAILY, interval=4, starts_on=date(2024, 1, 3)),
+            pattern(
+                weekdays=(1, 3),
+                ends_on=date(2024, 2, 20),
+                exceptions=[date(2024, 1, 4), date(2024, 1, 30)],
+            ),
+        ],
+    )
+    def test_iter_occurrences_matches_occurs_on(self, rule):
+        """測試惰性產生的發生日期與逐日判斷一致，包含從規則中途開始。"""
+        for date_from in (date(2024, 1, 1), date(2024, 1, 17), date(2024, 2, 6)):
+            # WHEN：產生 date_from 起到 3/31 的發生日期
+            days = list(iter_occurrences(rule, date_from, date(2024, 3, 31)))
+
+            # THEN：與逐日判斷的結果相同
+            assert days == brute_force(rule, date_from, date(2024, 3, 31))
+
+    def test_iter_occurrences_is_lazy(self):
+        """測試沒有結束日期的規則可只取前幾個發生日期。"""
+        # WHEN：取不結束的每週二規則前三個發生日期
+        days = list(islice(iter_occurrences(pattern()), 3))
+
+        # THEN：依日期遞增
+        assert days == [date(2024, 1, 2), date(2024, 1, 9), date(2024, 1, 16)]
+
+
+class TestRuleConflicts:
+    """規則重疊檢查測試類別。"""
+
+    def test_find_rule_conflicts_only_pending(self):
+        """測試只有尚未展開、時間重疊的發生日期算衝突。"""
+        # GIVEN：每週二 19:00–21:00，已展開到 1/14
+        rules = [pattern(materialized_until=date(2024, 1, 14))]
+        incoming = [
+            # 已展開：由時段本身檢查
+            ScheduleInterval(None, 1, date(2024, 1, 9), time(20), time(22)),
+            # 尚未展開且重疊
+            ScheduleInterval(None, 1, date(2024, 1, 16), time(20), time(22)),
+            # 時間相鄰、不同 Giver、不是發生日期
+            ScheduleInterval(None, 1, date(2024, 1, 23), time(21), time(22)),
+            ScheduleInterval(None, 2, date(2024, 1, 23), time(20), time(22)),
+            ScheduleInterval(None, 1, date(2024, 1, 24), time(20), time(22)),
+        ]
+
+        # WHEN：檢查衝突
+        conflicts = find_rule_conflicts(rules, incoming)
+
+        # THEN：只回報 1/16 的發生日期
+        assert [(c.id, c.date, c.start_time) for c in conflicts] == [
+            (None, date(2024, 1, 16), time(19))
+        ]
+
+    @pytest.mark.parametrize(
+        "a,b,expected",
+        [
+            # 每週二與每週二、四：第一個星期二
+            (pattern(), pattern(id=2, weekdays=(1, 3)), date(2024, 1, 2)),
+            # 隔週二錯開一週：永遠不同時發生
+            (
+                pattern(interval=2),
+                pattern(id=2, interval=2, starts_on=date(2024, 1, 8)),
+                None,
+            ),
+            # 時間相鄰或不同 Giver：不重疊
+            (pattern(), pattern(id=2, start_hour=21, end_hour=22), None),
+            (pattern(), pattern(id=2, giver_id=2), None),
+            # 例外日期排除前幾個共同日期
+            (
+                pattern(DAILY, interval=2),
+                pattern(
+                    id=2,
+                    weekdays=(2,),
+                    exceptions=[date(2024, 1, 3), date(2024, 1, 17)],
+                ),
+                date(2024, 1, 31),
+            ),
+            # 共同日期已展開或在結束日期之後
+            (
+                pattern(materialized_until=date(2024, 3, 31)),
+                pattern(id=2, ends_on=date(2024, 3, 31)),
+                None,
+            ),
+        ],
+    )
+    def test_first_common_date(self, a, b, expected):
+        """測試兩條規則第一個同時發生的日期。"""
+        assert first_common_date(a, b) == expected
+        assert first_common_date(b, a) == expected
@@ -8,6 +8,7 @@ from unittest.mock import Mock, patch
 import pytest
 
 # ===== 本地模組 =====
+from app.database.instrumentation import start_query_stats, stop_query_stats
 from app.enums.models import ScheduleStatusEnum, UserRoleEnum
 from app.enums.operations import DeletionResult, OperationContext
 from app.errors.exceptions import (
@@ -17,8 +18,16 @@ from app.errors.exceptions import (
     ScheduleNotFoundError,
     ScheduleOverlapError,
 )
-from app.schemas import ScheduleBase
-from app.services.schedule import ScheduleService
+from app.models.schedule import Schedule
+from app.schemas import (
+    ScheduleBase,
+    ScheduleBatchCreateOperation,
+    ScheduleBatchDeleteOperation,
+    ScheduleBatchUpdateOperation,
+    ScheduleUpdateBase,
+)
+from app.services.overlap import ScheduleInterval
+from app.services.schedule import AsyncScheduleService, ScheduleService
 
 
 class TestScheduleService:
@@ -48,7 +57,7 @@ class TestScheduleService:
 
         適合服務層測試，因為不需要真實資料庫操作的測試。
         """
-        return Mock()
+        return Mock(info={})
 
     @pytest.fixture
     def mock_query(self):
@@ -81,6 +90,9 @@ class TestScheduleService:
         # 模擬 query.filter(...).all()，重疊檢查和執行查詢
         mock_query.filter.return_value.all.return_value = result
 
+        # 模擬 db.query(...).filter(...).all()，週期規則查詢：Giver 沒有週期規則
+        mock_db.query.return_value.filter.return_value.all.return_value = []
+
     def create_mock_schedule(self, **kwargs):
         """建立模擬時段物件。"""
         return Mock(**kwargs)
@@ -247,13 +259,66 @@ class TestScheduleService:
         assert result[0].start_time == time(9, 30)
         assert result[0].end_time == time(10, 30)
 
+    def test_check_schedule_overlap_uses_interval_index(self, service, mock_db):
+        """測試啟用時段區間索引時，單一時段重疊檢查由索引回答。"""
+        # GIVEN：啟用中的索引，回傳一個重疊區間
+        overlapping = ScheduleInterval(
+            id=1,
+            giver_id=1,
+            date=date(2024, 1, 15),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        index = Mock(enabled=True)
+        index.find_overlapping.return_value = [overlapping]
+        rule_cache = Mock()
+        rule_cache.get_rule_patterns.return_value = []
+
+        # WHEN：檢查單一時段重疊
+        with (
+            patch("app.services.schedule.schedule_interval_index", index),
+            patch("app.services.schedule.recurrence_pattern_cache", rule_cache),
+        ):
+            result = service.check_schedule_overlap(
+                mock_db, 1, date(2024, 1, 15), time(9, 30), time(10, 30)
+            )
+
+        # THEN：回傳索引的結果，且沒有直接查詢資料庫
+        assert result == [overlapping]
+        index.find_overlapping.assert_called_once_with(
+            mock_db,
+            1,
+            date(2024, 1, 15),
+            time(9, 30),
+            time(10, 30),
+            exclude_schedule_id=None,
+        )
+        mock_db.query.assert_not_called()
+
     # ===== 檢查多個時段重疊 =====
-    def test_check_multiple_schedules_overlap_no_overlap(
-        self, service, mock_db, mock_query
-    ):
+    def add_existing_schedule(self, db_session, **kwargs):
+        """在資料庫中建立現有時段。"""
+        schedule = Schedule(
+            status=ScheduleStatusEnum.AVAILABLE,
+            created_by_role=UserRoleEnum.GIVER,
+            updated_by_role=UserRoleEnum.GIVER,
+            **kwargs,
+        )
+        db_session.add(schedule)
+        db_session.commit()
+        return schedule
+
+    def test_check_multiple_schedules_overlap_no_overlap(self, service, db_session):
         """測試檢查多個時段重疊 - 無重疊。"""
-        # GIVEN：建立多個時段資料
-        mock_existing_schedules = [
+        # GIVEN：資料庫中的現有時段，與相鄰但不重疊的新時段
+        self.add_existing_schedule(
+            db_session,
+            giver_id=1,
+            date=date(2024, 1, 15),
+            start_time=time(10, 0),
+            end_time=time(11, 0),
+        )
+        new_schedules = [
             self.create_mock_schedule_base(
                 giver_id=1,
                 schedule_date=date(2024, 1, 15),
@@ -268,24 +333,26 @@ class TestScheduleService:
             ),
         ]
 
-        # 設定 Mock 查詢鏈，模擬無重疊情況
-        self.setup_mock_query_chain(mock_db, mock_query, result=[])
-
         # WHEN：檢查多個時段重疊
         result = service.check_multiple_schedules_overlap(
-            db=mock_db,
-            schedules=mock_existing_schedules,
+            db=db_session,
+            schedules=new_schedules,
         )
 
         # THEN：確認沒有重疊的時段
         assert result == []
 
-    def test_check_multiple_schedules_overlap_with_overlap(
-        self, service, mock_db, mock_query
-    ):
-        """測試檢查多個時段重疊 - 有重疊。"""
-        # GIVEN：建立多個時段資料
-        mock_existing_schedules = [
+    def test_check_multiple_schedules_overlap_with_overlap(self, service, db_session):
+        """測試檢查多個時段重疊 - 與現有時段重疊。"""
+        # GIVEN：資料庫中的現有時段，涵蓋兩個新時段
+        existing = self.add_existing_schedule(
+            db_session,
+            giver_id=1,
+            date=date(2024, 1, 15),
+            start_time=time(8, 0),
+            end_time=time(12, 0),
+        )
+        new_schedules = [
             self.create_mock_schedule_base(
                 giver_id=1,
                 schedule_date=date(2024, 1, 15),
@@ -300,30 +367,81 @@ class TestScheduleService:
             ),
         ]
 
-        # 建立模擬的重疊時段
-        mock_overlapping_schedule = self.create_mock_schedule(
-            id=1,
-            giver_id=1,
-            date=date(2024, 1, 15),
-            start_time=time(8, 0),
-            end_time=time(12, 0),
+        # WHEN：檢查多個時段重疊
+        result = service.check_multiple_schedules_overlap(
+            db=db_session,
+            schedules=new_schedules,
         )
 
-        # 設定 Mock 查詢鏈，模擬有重疊情況
-        self.setup_mock_query_chain(
-            mock_db, mock_query, result=[mock_overlapping_schedule]
-        )
+        # THEN：確認找到重疊的時段（兩個新時段各與現有時段衝突一次）
+        assert len(result) == 2
+        assert result[0].id == existing.id
+        assert result[1].id == existing.id
+        assert result[0].status == ScheduleStatusEnum.AVAILABLE
+
+    def test_check_multiple_schedules_overlap_within_batch(self, service, db_session):
+        """測試檢查多個時段重疊 - 同一批次內的新時段彼此重疊。"""
+        # GIVEN：資料庫沒有現有時段，同批次兩個新時段重疊，另一個 Giver 的時段不受影響
+        new_schedules = [
+            self.create_mock_schedule_base(
+                giver_id=1,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(9, 0),
+                end_time=time(10, 30),
+            ),
+            self.create_mock_schedule_base(
+                giver_id=1,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(10, 0),
+                end_time=time(11, 0),
+            ),
+            self.create_mock_schedule_base(
+                giver_id=2,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(10, 0),
+                end_time=time(11, 0),
+            ),
+        ]
 
         # WHEN：檢查多個時段重疊
         result = service.check_multiple_schedules_overlap(
-            db=mock_db,
-            schedules=mock_existing_schedules,
+            db=db_session,
+            schedules=new_schedules,
         )
 
-        # THEN：確認找到重疊的時段（每個時段都會檢查，所以會有 2 個重疊）
-        assert len(result) == 2
-        assert result[0].id == 1
-        assert result[1].id == 1
+        # THEN：回報開始時間較晚的新時段（尚未寫入，沒有 id）
+        assert len(result) == 1
+        assert result[0].id is None
+        assert result[0].giver_id == 1
+        assert result[0].start_time == time(10, 0)
+
+    def test_check_multiple_schedules_overlap_uses_single_query(
+        self, service, db_session
+    ):
+        """測試檢查多個時段重疊 - 不論時段數量，時段與週期規則各只送出一次查詢。"""
+        # GIVEN：分屬多個 Giver、多個日期的 20 個新時段
+        new_schedules = [
+            self.create_mock_schedule_base(
+                giver_id=i % 4 + 1,
+                schedule_date=date(2024, 1, 15 + i % 5),
+                start_time=time(8 + i // 5, 0),
+                end_time=time(9 + i // 5, 0),
+            )
+            for i in range(20)
+        ]
+        stats, token = start_query_stats()
+
+        # WHEN：檢查多個時段重疊
+        try:
+            service.check_multiple_schedules_overlap(
+                db=db_session,
+                schedules=new_schedules,
+            )
+        finally:
+            stop_query_stats(token)
+
+        # THEN：時段一次、週期規則一次資料庫往返
+        assert stats.round_trips == 2
 
     # ===== 決定時段狀態 =====
     def test_determine_schedule_status_with_specified_status(self, service):
@@ -743,7 +861,13 @@ class TestScheduleService:
 
             # THEN：驗證 CRUD 層被正確呼叫
             mock_list.assert_called_once_with(
-                mock_db, giver_id, taker_id, status_filter
+                mock_db,
+                giver_id,
+                taker_id,
+                status_filter,
+                limit=None,
+                after=None,
+                fieldset=None,
             )
 
             # 確認查詢成功
@@ -788,7 +912,13 @@ class TestScheduleService:
 
             # THEN：確認 CRUD 層被正確呼叫
             mock_list.assert_called_once_with(
-                mock_db, giver_id, taker_id, status_filter
+                mock_db,
+                giver_id,
+                taker_id,
+                status_filter,
+                limit=None,
+                after=None,
+                fieldset=None,
             )
 
             # 確認查詢成功
@@ -827,7 +957,7 @@ class TestScheduleService:
             result = service.get_schedule(mock_db, schedule_id)
 
             # THEN：驗證 CRUD 層被正確呼叫
-            mock_get.assert_called_once_with(mock_db, schedule_id)
+            mock_get.assert_called_once_with(mock_db, schedule_id, None)
 
             # 驗證查詢成功
             assert result == mock_schedule
@@ -891,8 +1021,27 @@ class TestScheduleService:
             status=ScheduleStatusEnum.AVAILABLE,
         )
 
-        # 模擬重疊檢查：返回空列表表示沒有重疊
-        with patch.object(service, 'check_update_overlap', return_value=[]):
+        # 建立模擬的更新前時段（由 CRUD 層載入並鎖定）
+        mock_original_schedule = self.create_mock_schedule(
+            id=schedule_id,
+            giver_id=1,
+            taker_id=2,
+            date=original_schedule_data["schedule_date"],
+            start_time=original_schedule_data["start_time"],
+            end_time=original_schedule_data["end_time"],
+            note=original_schedule_data["note"],
+            status=ScheduleStatusEnum.AVAILABLE,
+        )
+
+        # 模擬 CRUD 層載入並鎖定時段、重疊檢查（返回空列表表示沒有重疊）
+        with (
+            patch.object(
+                service.schedule_crud,
+                'get_schedule_for_update',
+                return_value=mock_original_schedule,
+            ) as mock_get_for_update,
+            patch.object(service, 'check_update_overlap', return_value=[]),
+        ):
             # 模擬 CRUD 層更新：返回更新後的時段
             with patch.object(service.schedule_crud, 'update_schedule') as mock_update:
                 # 設定模擬返回值
@@ -903,17 +1052,22 @@ class TestScheduleService:
                     mock_db, schedule_id, updated_by, updated_by_role, **update_data
                 )
 
-                # THEN：驗證重疊檢查被正確呼叫
+                # THEN：驗證時段只載入一次
+                mock_get_for_update.assert_called_once_with(mock_db, schedule_id, None)
+
+                # 驗證重疊檢查沿用已載入的時段
                 service.check_update_overlap.assert_called_once_with(
-                    mock_db, schedule_id, **update_data
+                    mock_db, mock_original_schedule, **update_data
                 )
 
-                # 驗證 CRUD 層被正確呼叫
+                # 驗證 CRUD 層被正確呼叫，並沿用已載入的時段
                 mock_update.assert_called_once_with(
                     db=mock_db,
                     schedule_id=schedule_id,
                     updated_by=updated_by,
                     updated_by_role=updated_by_role,
+                    schedule=mock_original_schedule,
+                    expected_version=None,
                     **update_data,
                 )
 
@@ -949,9 +1103,18 @@ class TestScheduleService:
             end_time=time(10, 30),
         )
 
-        # 模擬重疊檢查：返回重疊時段
-        with patch.object(
-            service, 'check_update_overlap', return_value=[mock_overlapping_schedule]
+        # 模擬 CRUD 層載入時段、重疊檢查：返回重疊時段
+        with (
+            patch.object(
+                service.schedule_crud,
+                'get_schedule_for_update',
+                return_value=self.create_mock_schedule(id=schedule_id, giver_id=1),
+            ),
+            patch.object(
+                service,
+                'check_update_overlap',
+                return_value=[mock_overlapping_schedule],
+            ),
         ):
             # WHEN & THEN：當檢測到重疊時段時，拋出錯誤並阻止建立
             with pytest.raises(ScheduleOverlapError):
@@ -987,7 +1150,7 @@ class TestScheduleService:
 
             # THEN：驗證 CRUD 層被正確呼叫
             mock_delete.assert_called_once_with(
-                mock_db, schedule_id, deleted_by, deleted_by_role
+                mock_db, schedule_id, deleted_by, deleted_by_role, None
             )
 
             # 確認刪除成功
@@ -1020,7 +1183,7 @@ class TestScheduleService:
 
             # 驗證 CRUD 層被正確呼叫
             mock_delete.assert_called_once_with(
-                mock_db, schedule_id, deleted_by, deleted_by_role
+                mock_db, schedule_id, deleted_by, deleted_by_role, None
             )
 
             # 確認記錄了警告日誌
@@ -1067,7 +1230,7 @@ class TestScheduleService:
 
                 # 驗證 CRUD 層被正確呼叫
                 mock_delete.assert_called_once_with(
-                    mock_db, schedule_id, deleted_by, deleted_by_role
+                    mock_db, schedule_id, deleted_by, deleted_by_role, None
                 )
                 mock_get.assert_called_once_with(mock_db, schedule_id)
 
@@ -1097,7 +1260,7 @@ class TestScheduleService:
 
             # 驗證 CRUD 層被正確呼叫
             mock_delete.assert_called_once_with(
-                mock_db, schedule_id, deleted_by, deleted_by_role
+                mock_db, schedule_id, deleted_by, deleted_by_role, None
             )
 
             # 確認記錄了警告日誌
@@ -1131,10 +1294,209 @@ class TestScheduleService:
 
             # 驗證 CRUD 層被正確呼叫
             mock_delete.assert_called_once_with(
-                mock_db, schedule_id, deleted_by, deleted_by_role
+                mock_db, schedule_id, deleted_by, deleted_by_role, None
             )
 
             # 確認記錄了錯誤日誌
             mock_logger.error.assert_called_once_with(
                 f"時段 {schedule_id} 刪除時發生未知錯誤: {unknown_result}"
             )
+
+    @patch('app.services.schedule.logger')
+    def test_delete_schedules_by_filter(self, mock_logger, service, mock_db):
+        """測試依條件批次刪除時段 - 回傳刪除數量。"""
+        # GIVEN：準備批次刪除條件
+        dates = [date(2024, 1, 15), date(2024, 1, 16)]
+
+        # 模擬 CRUD 層批次刪除返回刪除數量
+        with patch.object(
+            service.schedule_crud, 'delete_schedules_by_filter', return_value=3
+        ) as mock_delete:
+            # WHEN：批次刪除時段
+            result = service.delete_schedules_by_filter(
+                mock_db,
+                1,
+                dates,
+                ScheduleStatusEnum.AVAILABLE,
+                deleted_by=1,
+                deleted_by_role=UserRoleEnum.GIVER,
+            )
+
+            # THEN：驗證 CRUD 層被正確呼叫，並回傳刪除數量
+            mock_delete.assert_called_once_with(
+                mock_db,
+                1,
+                dates,
+                ScheduleStatusEnum.AVAILABLE,
+                1,
+                UserRoleEnum.GIVER,
+            )
+            assert result == 3
+
+    # ===== 批次操作 =====
+    def create_operation(self, start_hour: int) -> ScheduleBatchCreateOperation:
+        """建立批次操作：在 2024-01-15 建立一小時的時段。"""
+        return ScheduleBatchCreateOperation(
+            op="create",
+            schedule=ScheduleBase(
+                giver_id=1,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(start_hour, 0),
+                end_time=time(start_hour + 1, 0),
+            ),
+        )
+
+    def test_execute_batch(self, service, db_session):
+        """測試批次操作 - 依序執行，後面的操作看得到前面的寫入，連續建立合併執行。"""
+        # GIVEN：資料庫中 9:00-10:00 的時段，先移到 13:00 再於原時間建立新時段
+        existing = self.add_existing_schedule(
+            db_session,
+            giver_id=1,
+            date=date(2024, 1, 15),
+            start_time=time(9, 0),
+            end_time=time(10, 0),
+        )
+        existing_id = existing.id
+        operations = [
+            ScheduleBatchUpdateOperation(
+                op="update",
+                schedule_id=existing_id,
+                schedule=ScheduleUpdateBase(
+                    start_time=time(13, 0), end_time=time(14, 0)
+                ),
+                version=1,
+            ),
+            self.create_operation(9),
+            self.create_operation(10),
+            ScheduleBatchDeleteOperation(op="delete", schedule_id=existing_id),
+        ]
+
+        # WHEN：執行批次操作
+        with patch.object(
+            service, "create_schedules", wraps=service.create_schedules
+        ) as mock_create:
+            results = service.execute_batch(
+                db_session, operations, 1, UserRoleEnum.GIVER
+            )
+
+        # THEN：兩個連續的建立操作只呼叫一次，刪除操作的結果為 None
+        mock_create.assert_called_once()
+        assert len(mock_create.call_args.args[1]) == 2
+        assert [r.start_time if r else None for r in results] == [
+            time(13, 0),
+            time(9, 0),
+            time(10, 0),
+            None,
+        ]
+        remaining = db_session.query(Schedule).filter(Schedule.deleted_at.is_(None))
+        assert sorted(s.start_time for s in remaining) == [time(9, 0), time(10, 0)]
+
+    def test_execute_batch_rolls_back_on_error(self, service, db_session):
+        """測試批次操作 - 任一操作失敗時整批回滾，錯誤詳情指出失敗的操作。"""
+        # GIVEN：建立時段後刪除不存在的時段
+        operations = [
+            self.create_operation(9),
+            ScheduleBatchDeleteOperation(op="delete", schedule_id=99999),
+        ]
+
+        # WHEN：執行批次操作
+        with pytest.raises(ScheduleNotFoundError) as exc_info:
+            service.execute_batch(db_session, operations, 1, UserRoleEnum.GIVER)
+
+        # THEN：錯誤詳情包含失敗的操作索引，建立的時段沒有寫入
+        assert exc_info.value.details["operation_indexes"] == [1]
+        assert db_session.query(Schedule).count() == 0
+
+
+class TestAsyncScheduleService:
+    """時段服務層測試類別（非同步版本）。"""
+
+    @pytest.fixture
+    def service(self):
+        """建立非同步服務實例。"""
+        return AsyncScheduleService()
+
+    @pytest.fixture
+    def giver_schedules(self):
+        """建立 Giver 提供的兩個不重疊時段。"""
+        return [
+            ScheduleBase(
+                giver_id=1,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(9, 0),
+                end_time=time(10, 0),
+            ),
+            ScheduleBase(
+                giver_id=1,
+                schedule_date=date(2024, 1, 15),
+                start_time=time(10, 0),
+                end_time=time(11, 0),
+            ),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_create_and_list_schedules(
+        self, service, async_db_session, giver_schedules
+    ):
+        """測試非同步建立與查詢時段。"""
+        # WHEN：建立時段後查詢列表
+        created = await service.create_schedules(
+            async_db_session, giver_schedules, 1, UserRoleEnum.GIVER
+        )
+        listed = await service.list_schedules(async_db_session, giver_id=1)
+
+        # THEN：沿用同步服務的狀態規則，且查詢得到剛建立的時段
+        assert len(created) == 2
+        assert all(s.status == ScheduleStatusEnum.AVAILABLE for s in created)
+        assert {s.id for s in listed} == {s.id for s in created}
+
+    @pytest.mark.asyncio
+    async def test_create_schedules_overlap_error(
+        self, service, async_db_session, giver_schedules
+    ):
+        """測試非同步建立時段 - 與現有時段重疊。"""
+        # GIVEN：已建立第一個時段
+        await service.create_schedules(
+            async_db_session, giver_schedules[:1], 1, UserRoleEnum.GIVER
+        )
+
+        # WHEN & THEN：建立重疊時段時拋出重疊錯誤
+        overlapping = ScheduleBase(
+            giver_id=1,
+            schedule_date=date(2024, 1, 15),
+            start_time=time(9, 30),
+            end_time=time(10, 30),
+        )
+        with pytest.raises(ScheduleOverlapError):
+            await service.create_schedules(
+                async_db_session, [overlapping], 1, UserRoleEnum.GIVER
+            )
+
+    @pytest.mark.asyncio
+    async def test_update_get_and_delete_schedule(
+        self, service, async_db_session, giver_schedules
+    ):
+        """測試非同步更新、查詢與刪除時段。"""
+        # GIVEN：已建立時段
+        created = await service.create_schedules(
+            async_db_session, giver_schedules[:1], 1, UserRoleEnum.GIVER
+        )
+        schedule_id = created[0].id
+
+        # WHEN：更新備註後查詢
+        await service.update_schedule(
+            async_db_session, schedule_id, 1, UserRoleEnum.GIVER, note="已更新"
+        )
+        fetched = await service.get_schedule(async_db_session, schedule_id)
+
+        # THEN：取得更新後的資料
+        assert fetched.note == "已更新"
+
+        # WHEN：刪除後再查詢
+        assert await service.delete_schedule(
+            async_db_session, schedule_id, 1, UserRoleEnum.GIVER
+        )
+
+        # THEN：已刪除的時段視為不存在
+        with pytest.raises(ScheduleNotFoundError):
+            await service.get_schedule(async_db_session, schedule_id)
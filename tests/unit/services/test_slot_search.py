@@ -0,0 +1,168 @@
+"""空檔搜尋演算法測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, time
+import random
+from unittest.mock import patch
+
+# ===== 本地模組 =====
+from app.crud.interval_index import ScheduleInterval
+from app.enums.models import ScheduleStatusEnum
+from app.services.slot_search import (
+    FreeWindow,
+    search_free_windows,
+    SLOT_MINUTES,
+)
+
+DAY = date(2024, 12, 25)
+AVAILABLE = ScheduleStatusEnum.AVAILABLE
+ACCEPTED = ScheduleStatusEnum.ACCEPTED
+
+
+def _interval(giver_id, start, end, status=AVAILABLE, day=DAY):
+    """建立時段區間。"""
+    return ScheduleInterval(None, giver_id, day, start, end, status)
+
+
+def _minutes(value: time) -> int:
+    """將時間轉換成當天的分鐘數。"""
+    return value.hour * 60 + value.minute
+
+
+def _reference(intervals, givers, days, start, end, duration, mode):
+    """逐分鐘檢查的參考實作：回傳 {(giver_id, 日期): 最早視窗開始的分鐘}。"""
+    expected = {}
+    for giver_id in givers:
+        for day in days:
+            rows = [i for i in intervals if i.giver_id == giver_id and i.date == day]
+            for minute in range(start, end - duration + 1, SLOT_MINUTES):
+                window = range(minute, minute + duration)
+                occupied = any(
+                    _minutes(i.start_time) < minute + duration
+                    and _minutes(i.end_time) > minute
+                    for i in rows
+                    if mode == "free" or i.status != AVAILABLE
+                )
+                covered = mode == "free" or all(
+                    any(
+                        _minutes(i.start_time) <= m < _minutes(i.end_time)
+                        for i in rows
+                        if i.status == AVAILABLE
+                    )
+                    for m in window
+                )
+                if covered and not occupied:
+                    expected[(giver_id, day)] = minute
+                    break
+    return expected
+
+
+class TestSearchFreeWindows:
+    """空檔搜尋測試。"""
+
+    def test_available_windows_split_by_booking(self):
+        """測試可預約時段被已接受的時段切開，只回報足夠長的視窗。"""
+        # GIVEN：Giver 1 於 09:00–12:00 可預約，但 09:30–10:30 已接受
+        intervals = [
+            _interval(1, time(9), time(12)),
+            _interval(1, time(9, 30), time(10, 30), ACCEPTED),
+        ]
+
+        # WHEN：搜尋 60 分鐘視窗
+        results = search_free_windows(intervals, DAY, DAY, time(8), time(18), 60)
+
+        # THEN：最早的視窗在預約之後
+        assert len(results) == 1
+        assert results[0].windows == [FreeWindow(DAY, time(10, 30), time(11, 30))]
+
+    def test_conservative_rounding(self):
+        """測試不在時格邊界的時間：可預約時段向內取整，佔用時段向外取整。"""
+        # GIVEN：Giver 1 可預約 09:10–10:10（向內取整後只有 45 分鐘）；
+        # Giver 2 可預約 09:00–11:00，但 09:50–10:05 已接受（向外取整佔用 09:45–10:15）
+        intervals = [
+            _interval(1, time(9, 10), time(10, 10)),
+            _interval(2, time(9), time(11)),
+            _interval(2, time(9, 50), time(10, 5), ACCEPTED),
+        ]
+
+        # WHEN：搜尋 45 分鐘與 50 分鐘視窗
+        short = search_free_windows(intervals, DAY, DAY, time(8), time(18), 45)
+        long = search_free_windows(intervals, DAY, DAY, time(8), time(18), 50)
+
+        # THEN：45 分鐘兩個 Giver 都符合；50 分鐘向上取整為 60 分鐘後都不符合
+        assert [r.giver_id for r in short] == [1, 2]
+        assert short[1].windows == [FreeWindow(DAY, time(9), time(9, 45))]
+        assert long == []
+
+    def test_free_mode_and_limit(self):
+        """測試 free 模式：指定的 Giver 即使沒有時段也會搜尋，並以 limit 限制數量。"""
+        # GIVEN：Giver 1 於 09:00–17:00 有草稿時段
+        intervals = [_interval(1, time(9), time(17), ScheduleStatusEnum.DRAFT)]
+
+        # WHEN：在 09:00–17:00 搜尋 Giver 1、2、3 完全空白的視窗
+        results = search_free_windows(
+            intervals,
+            DAY,
+            date(2024, 12, 26),
+            time(9),
+            time(17),
+            30,
+            mode="free",
+            giver_ids=[3, 1, 2],
+            limit=1,
+        )
+
+        # THEN：只回傳第一個符合的 Giver，Giver 1 只有 12/26 空白
+        assert [r.giver_id for r in results] == [1]
+        assert results[0].windows == [
+            FreeWindow(date(2024, 12, 26), time(9), time(9, 30))
+        ]
+
+    def test_matches_reference_across_chunks(self):
+        """測試隨機資料的結果與逐分鐘的參考實作相同，且不受分塊大小影響。"""
+        # GIVEN：隨機產生 12 個 Giver 3 天的時段（同一天內不重疊）
+        rng = random.Random(20)
+        days = [date(2024, 12, d) for d in (24, 25, 26)]
+        statuses = [AVAILABLE, AVAILABLE, ACCEPTED, ScheduleStatusEnum.PENDING]
+        intervals = []
+        for giver_id in range(1, 13):
+            for day in days:
+                minute = 8 * 60
+                while minute < 20 * 60:
+                    minute += rng.choice([0, 15, 30, 60])
+                    length = rng.choice([15, 30, 45, 60, 120])
+                    intervals.append(
+                        _interval(
+                            giver_id,
+                            time(minute // 60, minute % 60),
+                            time((minute + length) // 60, (minute + length) % 60),
+                            rng.choice(statuses),
+                            day,
+                        )
+                    )
+                    minute += length
+
+        for mode in ("available", "free"):
+            # WHEN：以 5 個 Giver 為一塊搜尋 10:00–18:00 的 45 分鐘視窗
+            with patch("app.services.slot_search.CHUNK_GIVERS", 5):
+                results = search_free_windows(
+                    intervals,
+                    days[0],
+                    days[-1],
+                    time(10),
+                    time(18),
+                    45,
+                    mode=mode,
+                    giver_ids=range(1, 13),
+                )
+
+            # THEN：與參考實作相同
+            actual = {
+                (r.giver_id, w.date): _minutes(w.start_time)
+                for r in results
+                for w in r.windows
+            }
+            expected = _reference(
+                intervals, range(1, 13), days, 10 * 60, 18 * 60, 45, mode
+            )
+            assert actual and actual == expected
@@ -0,0 +1,104 @@
+"""ETag 工具測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import datetime, timezone
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.utils.etag import (
+    format_list_etag,
+    format_schedule_etag,
+    if_none_match_matches,
+    not_modified_since,
+    parse_if_match,
+)
+
+
+class TestScheduleETag:
+    """時段 ETag 工具函式測試。"""
+
+    def test_format_and_parse_round_trip(self):
+        """測試 ETag 格式化後可由 If-Match 解析回相同的版本號。"""
+        # WHEN：格式化版本號後再解析
+        etag = format_schedule_etag(3)
+
+        # THEN：得到強 ETag 與相同的版本號
+        assert etag == '"3"'
+        assert parse_if_match(etag) == 3
+
+    @pytest.mark.parametrize("if_match", [None, "*", " * "])
+    def test_parse_without_version(self, if_match):
+        """測試未提供 If-Match 或使用萬用字元時不檢查版本。"""
+        # WHEN & THEN：解析結果為 None
+        assert parse_if_match(if_match) is None
+
+    @pytest.mark.parametrize(
+        "if_match",
+        [
+            'W/"3"',  # 弱 ETag：If-Match 使用強比較
+            "3",  # 缺少引號
+            '"3", "4"',  # 多個 ETag
+            '"abc"',  # 不是版本號
+        ],
+    )
+    def test_parse_invalid_if_match(self, if_match):
+        """測試無效的 If-Match 拋出 ValueError。"""
+        # WHEN & THEN：解析無效的標頭
+        with pytest.raises(ValueError):
+            parse_if_match(if_match)
+
+
+class TestConditionalGet:
+    """條件式 GET 標頭判斷測試。"""
+
+    @pytest.mark.parametrize(
+        "if_none_match,expected",
+        [
+            (None, False),
+            ('"abc"', True),
+            ('W/"abc"', True),  # 弱比較忽略 W/ 前綴
+            ('"old", "abc"', True),
+            ("*", True),
+            ('"old"', False),
+        ],
+    )
+    def test_if_none_match(self, if_none_match, expected):
+        """測試 If-None-Match 以弱比較比對 ETag 清單。"""
+        # WHEN & THEN：與目前的 ETag "abc" 比對
+        assert if_none_match_matches(if_none_match, '"abc"') is expected
+
+    @pytest.mark.parametrize(
+        "if_modified_since,expected",
+        [
+            (None, False),
+            ("Tue, 01 Oct 2024 08:00:00 GMT", True),  # 與最後修改時間相同
+            ("Tue, 01 Oct 2024 09:00:00 GMT", True),
+            ("Tue, 01 Oct 2024 07:59:59 GMT", False),
+            ("not a date", False),
+        ],
+    )
+    def test_not_modified_since(self, if_modified_since, expected):
+        """測試 If-Modified-Since 不早於最後修改時間時視為未修改，格式無效時忽略。"""
+        # GIVEN：最後修改時間
+        last_modified = datetime(2024, 10, 1, 8, 0, 0, tzinfo=timezone.utc)
+
+        # WHEN & THEN：比對 If-Modified-Since
+        assert not_modified_since(if_modified_since, last_modified) is expected
+
+    def test_format_list_etag(self):
+        """測試列表 ETag 為弱 ETag，驗證器或回應變體不同時 ETag 也不同。"""
+        # GIVEN：時段列表的驗證器
+        validator = (3, 10, datetime(2024, 10, 1, 8, 0), 5)
+
+        # WHEN：以相同與不同的驗證器、回應格式建立 ETag
+        etag = format_list_etag(validator, "application/json", None)
+
+        # THEN：相同輸入產生相同 ETag
+        assert etag.startswith('W/"')
+        assert etag == format_list_etag(validator, "application/json", None)
+        assert etag != format_list_etag(validator, "application/msgpack", None)
+        assert etag != format_list_etag(
+            (3, 10, datetime(2024, 10, 1, 8, 0), 6), "application/json", None
+        )
@@ -0,0 +1,115 @@
+"""稀疏欄位工具測試。"""
+
+# ===== 標準函式庫 =====
+from datetime import date, datetime, time
+from types import SimpleNamespace
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.enums.models import ScheduleStatusEnum, UserRoleEnum
+from app.schemas import ScheduleResponse
+from app.utils.fieldsets import (
+    parse_schedule_fieldset,
+    SCHEDULE_FIELDS,
+    schedule_projection_model,
+    schedule_rows_to_dicts,
+    ScheduleFieldset,
+)
+
+
+class TestScheduleFieldset:
+    """時段稀疏欄位工具函式測試。"""
+
+    def test_parse_without_parameters(self):
+        """測試未提供 fields、include 時回傳 None（使用完整回應）。"""
+        # WHEN & THEN：解析結果為 None
+        assert parse_schedule_fieldset(None, None) is None
+
+    def test_parse_fields_and_include(self):
+        """測試解析欄位與關聯：去除空白與重複，依固定順序排列。"""
+        # WHEN：解析順序不同、含空白與重複的參數
+        fieldset = parse_schedule_fieldset("start_time, date,id,date", "taker,giver,")
+
+        # THEN：依回應欄位與關聯的定義順序排列
+        assert fieldset == ScheduleFieldset(
+            ("id", "date", "start_time"), ("giver", "taker")
+        )
+
+    def test_parse_include_only(self):
+        """測試只提供 include 時回傳所有欄位。"""
+        # WHEN & THEN：fields 為 None 表示所有欄位
+        assert parse_schedule_fieldset(None, "giver") == ScheduleFieldset(
+            None, ("giver",)
+        )
+
+    @pytest.mark.parametrize(
+        "fields,include",
+        [
+            ("id,password", None),  # 不存在的欄位
+            ("schedule_date", None),  # 只接受回應中的名稱 date
+            (",", None),  # 沒有任何欄位
+            (None, "giver,owner"),  # 不存在的關聯
+        ],
+    )
+    def test_parse_invalid(self, fields, include):
+        """測試無效的欄位或關聯拋出 ValueError。"""
+        # WHEN & THEN：解析無效的參數
+        with pytest.raises(ValueError):
+            parse_schedule_fieldset(fields, include)
+
+    def test_projection_model_dumps_selected_fields(self):
+        """測試投影模型只輸出指定的欄位與關聯，且相同組合重複使用同一個模型。"""
+        # GIVEN：只選擇部分欄位並附加 Giver
+        fieldset = ScheduleFieldset(("id", "date", "start_time"), ("giver",))
+        schedule = SimpleNamespace(
+            id=1,
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            giver=SimpleNamespace(id=2, name="王零一"),
+        )
+
+        # WHEN：以投影模型序列化
+        model = schedule_projection_model(fieldset)
+        data = model.model_validate(schedule).model_dump(mode="json", by_alias=True)
+
+        # THEN：只包含指定的欄位，日期使用回應的別名 date
+        assert data == {
+            "id": 1,
+            "date": "2024-01-01",
+            "start_time": "09:00:00",
+            "giver": {"id": 2, "name": "王零一"},
+        }
+        assert schedule_projection_model(fieldset) is model
+
+    def test_rows_to_dicts_matches_response_model(self):
+        """測試 Core 資料列轉換結果與 ScheduleResponse 的 JSON 輸出相同。"""
+        # GIVEN：包含所有回應欄位的資料列
+        values = {name: None for name in SCHEDULE_FIELDS}
+        values.update(
+            id=1,
+            giver_id=2,
+            status=ScheduleStatusEnum.AVAILABLE,
+            date=date(2024, 1, 1),
+            start_time=time(9, 0),
+            end_time=time(10, 30),
+            created_at=datetime(2023, 12, 31, 8, 0, 5),
+            created_by=2,
+            created_by_role=UserRoleEnum.GIVER,
+            updated_at=datetime(2023, 12, 31, 8, 0, 5, 120000),
+            version=1,
+        )
+        row = SimpleNamespace(_mapping=values, **values)
+
+        # WHEN：轉換所有欄位與指定的欄位
+        data = schedule_rows_to_dicts([row])
+        partial = schedule_rows_to_dicts([row], ("id", "end_time"))
+
+        # THEN：與回應模型的 JSON 輸出一致，指定欄位時只輸出該欄位
+        expected = ScheduleResponse.model_validate(row).model_dump(
+            mode="json", by_alias=True
+        )
+        assert data == [expected]
+        assert list(data[0]) == list(expected)
+        assert partial == [{"id": 1, "end_time": "10:30:00"}]
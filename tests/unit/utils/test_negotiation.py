@@ -0,0 +1,99 @@
+"""回應格式內容協商工具測試。"""
+
+# ===== 第三方套件 =====
+import msgpack
+import orjson
+import pytest
+
+# ===== 本地模組 =====
+from app.utils.negotiation import (
+    COLUMNAR_MEDIA_TYPE,
+    encode_ndjson,
+    JSON_MEDIA_TYPE,
+    MSGPACK_MEDIA_TYPE,
+    negotiate_media_type,
+    render_response,
+    to_columnar,
+)
+
+AVAILABLE = (JSON_MEDIA_TYPE, MSGPACK_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE)
+
+
+class TestNegotiation:
+    """內容協商工具函式測試。"""
+
+    @pytest.mark.parametrize(
+        "accept,expected",
+        [
+            (None, JSON_MEDIA_TYPE),  # 未提供 Accept 使用預設格式
+            ("*/*", JSON_MEDIA_TYPE),
+            ("application/*", JSON_MEDIA_TYPE),
+            ("application/msgpack", MSGPACK_MEDIA_TYPE),
+            ("application/x-msgpack", MSGPACK_MEDIA_TYPE),  # 別名
+            ("Application/MsgPack", MSGPACK_MEDIA_TYPE),  # 不分大小寫
+            (COLUMNAR_MEDIA_TYPE, COLUMNAR_MEDIA_TYPE),
+            # q 值較高者優先
+            ("application/json;q=0.5, application/msgpack", MSGPACK_MEDIA_TYPE),
+            # 明確的範圍優先於萬用字元：JSON 被排除，其餘格式同分時依偏好順序
+            ("application/json;q=0, */*", MSGPACK_MEDIA_TYPE),
+            ("text/html, */*;q=0.1", JSON_MEDIA_TYPE),
+            ("text/html", None),  # 沒有可接受的格式
+            ("application/msgpack;q=0", None),
+        ],
+    )
+    def test_negotiate_media_type(self, accept, expected):
+        """測試依 Accept 標頭選擇回應格式。"""
+        # WHEN & THEN：選出預期的媒體類型
+        assert negotiate_media_type(accept, AVAILABLE) == expected
+
+    def test_to_columnar(self):
+        """測試欄式格式：欄位名稱只出現一次，每筆資料為一列值。"""
+        # GIVEN：兩筆時段
+        items = [
+            {"id": 1, "date": "2024-01-01", "note": None},
+            {"id": 2, "date": "2024-01-02", "note": "備註"},
+        ]
+
+        # WHEN：轉換成欄式格式
+        data = to_columnar(items, ("id", "date", "note"))
+
+        # THEN：依欄位順序排列每列的值
+        assert data == {
+            "columns": ["id", "date", "note"],
+            "rows": [[1, "2024-01-01", None], [2, "2024-01-02", "備註"]],
+        }
+
+    @pytest.mark.parametrize(
+        "media_type,decode",
+        [
+            (JSON_MEDIA_TYPE, orjson.loads),
+            (MSGPACK_MEDIA_TYPE, msgpack.unpackb),
+            (COLUMNAR_MEDIA_TYPE, orjson.loads),
+        ],
+    )
+    def test_render_response(self, media_type, decode):
+        """測試以選定格式編碼回應，並加上 Vary: Accept。"""
+        # GIVEN：已序列化的資料
+        data = [{"id": 1, "note": "備註"}]
+
+        # WHEN：編碼回應
+        response = render_response(data, media_type, {"X-Next-Cursor": "abc"})
+
+        # THEN：內容可還原，保留額外標頭
+        assert decode(response.body) == data
+        assert response.media_type == media_type
+        assert response.headers["Vary"] == "Accept"
+        assert response.headers["X-Next-Cursor"] == "abc"
+
+    def test_encode_ndjson(self):
+        """測試 NDJSON 編碼：每筆一行 JSON，以換行結尾。"""
+        # WHEN：編碼兩筆資料
+        body = encode_ndjson([{"id": 1}, {"id": 2, "note": "備註"}])
+
+        # THEN：每行可獨立解析
+        lines = body.split(b"\n")
+        assert lines[-1] == b""
+        assert [orjson.loads(line) for line in lines[:-1]] == [
+            {"id": 1},
+            {"id": 2, "note": "備註"},
+        ]
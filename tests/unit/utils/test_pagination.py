@@ -0,0 +1,51 @@
+"""鍵集分頁游標測試。"""
+
+# ===== 標準函式庫 =====
+import base64
+from datetime import date, time
+from types import SimpleNamespace
+
+# ===== 第三方套件 =====
+import pytest
+
+# ===== 本地模組 =====
+from app.utils.pagination import (
+    decode_schedule_cursor,
+    encode_schedule_cursor,
+    ScheduleCursor,
+)
+
+
+class TestSchedulePagination:
+    """時段分頁游標工具函式測試。"""
+
+    def test_encode_decode_round_trip(self):
+        """測試游標編碼後可解碼回相同的排序鍵。"""
+        # GIVEN：一個時段的排序鍵
+        schedule = SimpleNamespace(
+            date=date(2024, 1, 15), start_time=time(9, 30), id=42
+        )
+
+        # WHEN：編碼後再解碼
+        cursor = encode_schedule_cursor(schedule)
+        decoded = decode_schedule_cursor(cursor)
+
+        # THEN：得到相同的排序鍵，且游標可直接放入 URL
+        assert decoded == ScheduleCursor(date(2024, 1, 15), time(9, 30), 42)
+        assert "=" not in cursor
+
+    @pytest.mark.parametrize(
+        "invalid_cursor",
+        [
+            "not-a-cursor",  # 不是 base64 編碼的 JSON
+            base64.urlsafe_b64encode(b"[1, 2]").decode(),  # 欄位數量錯誤
+            base64.urlsafe_b64encode(b'["2024-01-15", "09:30:00", "42"]').decode(),
+            base64.urlsafe_b64encode(b'["2024-13-45", "09:30:00", 42]').decode(),
+            base64.urlsafe_b64encode(b"42").decode(),  # 不是陣列
+        ],
+    )
+    def test_decode_invalid_cursor(self, invalid_cursor):
+        """測試無效的游標拋出 ValueError。"""
+        # WHEN & THEN：解碼無效的游標
+        with pytest.raises(ValueError):
+            decode_schedule_cursor(invalid_cursor)